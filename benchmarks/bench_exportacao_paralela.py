@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark da exportação de tarefas para CSV
+
+Compara a exportação sequencial (um único csv.DictWriter) com a exportação
+particionada em um pool de processos (gt_exportar_tarefas_particionado).
+A coluna "principal" mede o trabalho serial do processo principal na
+exportação particionada (extrair e serializar as linhas brutas); o ganho
+máximo, com núcleos suficientes, é sequencial / principal.
+
+Uso:
+    python benchmarks/bench_exportacao_paralela.py [N ...]
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils
+from utils import log_configurar
+from modules.tarefa import tarefa_criar, tarefa_registrar, tarefa_listar_todas, tarefa_snapshot
+from modules.gerenciamento_tarefas import (
+    gt_exportar_tarefas_csv, gt_exportar_tarefas_particionado, _linha_bruta_exportacao
+)
+
+TAMANHOS_PADRAO = [100_000, 1_000_000]
+
+def registrar_tarefas(n):
+    """Registra n tarefas em memória, sem carregar nem salvar os arquivos de dados"""
+    base = datetime.now()
+    for i in range(n - len(tarefa_listar_todas())):
+        tarefa_registrar(tarefa_criar(f"Tarefa {i}", "Descrição da tarefa", 1, base + timedelta(minutes=i)))
+
+def medir(funcao):
+    """Retorna o tempo (s) de uma execução"""
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+def main():
+    tamanhos = [int(arg) for arg in sys.argv[1:]] or TAMANHOS_PADRAO
+    gt = {'inicializado': True}
+    nucleos = os.cpu_count() or 1
+
+    # Registra apenas avisos e erros: o log de cada tarefa criada e exportada
+    # é escrito depois, pela thread de log, e se misturaria aos resultados
+    log_configurar(nivel='AVISO', niveis_modulo={})
+
+    print("=" * 60)
+    print(f"BENCHMARK: EXPORTAÇÃO CSV SEQUENCIAL x PARALELA ({nucleos} núcleos)")
+    print("=" * 60)
+    print(f"{'N':>10} {'sequencial (s)':>16} {'paralela (s)':>14} {'ganho':>8} {'principal (s)':>15} {'máximo':>8}")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        # A exportação sequencial grava em EXPORT_DIR; redireciona para o temporário
+        utils.EXPORT_DIR = diretorio
+        for n in tamanhos:
+            registrar_tarefas(n)
+            sequencial = medir(lambda: gt_exportar_tarefas_csv(gt, "sequencial.csv"))
+            paralela = medir(lambda: gt_exportar_tarefas_particionado(
+                gt, "paralela.csv", 'id', nucleos, concatenar=True, diretorio=diretorio
+            ))
+            principal = medir(lambda: pickle.dumps([_linha_bruta_exportacao(tarefa) for tarefa in tarefa_snapshot().tarefas],
+                                                   pickle.HIGHEST_PROTOCOL))
+            print(f"{n:>10} {sequencial:>16.2f} {paralela:>14.2f} {sequencial / paralela:>7.1f}x "
+                  f"{principal:>15.2f} {sequencial / principal:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
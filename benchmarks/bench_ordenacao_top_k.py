@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark da listagem ordenada de tarefas (top-k)
+
+Compara a ordenação completa (sorted + fatia) com a seleção via heap usada
+por tarefa_listar_ordenadas quando k é muito menor que N.
+
+Uso:
+    python benchmarks/bench_ordenacao_top_k.py [N ...]
+"""
+
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import log_configurar
+from modules.tarefa import tarefa_criar, tarefa_listar_ordenadas
+
+TAMANHOS_PADRAO = [10_000, 100_000]
+VALORES_K = [10, 50, 500]
+REPETICOES = 5
+
+def gerar_tarefas(n):
+    """Cria n tarefas em memória (sem registrar) com prazos aleatórios"""
+    base = datetime.now()
+    return [
+        tarefa_criar(f"Tarefa {i}", "Descrição", 1, base + timedelta(minutes=random.randint(0, 10**6)))
+        for i in range(n)
+    ]
+
+def medir(funcao):
+    """Retorna o melhor tempo (ms) entre as repetições"""
+    return min(timeit.repeat(funcao, number=1, repeat=REPETICOES)) * 1000
+
+def main():
+    tamanhos = [int(arg) for arg in sys.argv[1:]] or TAMANHOS_PADRAO
+    
+    # Registra apenas avisos e erros: o log de cada tarefa criada é escrito
+    # depois, pela thread de log, e se misturaria aos resultados
+    log_configurar(nivel='AVISO', niveis_modulo={})
+    
+    print("=" * 60)
+    print("BENCHMARK: ORDENAÇÃO TOP-K DE TAREFAS POR PRAZO")
+    print("=" * 60)
+    print(f"{'N':>10} {'k':>6} {'sorted (ms)':>14} {'heap (ms)':>12} {'ganho':>8}")
+    
+    for n in tamanhos:
+        tarefas = gerar_tarefas(n)
+        chave = lambda tarefa: tarefa['prazo']
+        for k in VALORES_K:
+            tempo_sorted = medir(lambda: sorted(tarefas, key=chave)[:k])
+            tempo_heap = medir(lambda: tarefa_listar_ordenadas('prazo', k, tarefas=tarefas))
+            print(f"{n:>10} {k:>6} {tempo_sorted:>14.2f} {tempo_heap:>12.2f} {tempo_sorted / tempo_heap:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,8 @@ USUARIOS_FILE = "usuarios.json"
 TAGS_FILE = "tags.json"
 TIMES_FILE = "times.json"
 TAREFAS_FILE = "tarefas.json"
+ROLLUPS_TAREFAS_FILE = "rollups_tarefas.json"
+JOBS_FILE = "jobs.json"
 
 # Configurações da aplicação web
 WEB_HOST = "0.0.0.0"
@@ -49,6 +51,56 @@ MAX_EMAIL_LENGTH = 200
 MAX_TITULO_LENGTH = 200
 MAX_DESCRICAO_LENGTH = 1000
 MAX_COR_LENGTH = 7  # #RRGGBB
+MAX_OPERACOES_LOTE = 50000  # Operações por requisição em lote
+MAX_SUBREQUISICOES_BATCH = 50  # Sub-requisições por chamada a POST /api/batch
+TAMANHO_LOTE_IMPORTACAO = 1000  # Linhas validadas e registradas por lote na importação
+TAMANHO_BLOCO_EXPORTACAO = 64 * 1024  # Caracteres por bloco enviado na exportação em fluxo
+TAMANHO_BLOCO_PARTICAO = 50000  # Linhas enviadas por vez a um processo na exportação particionada
+MAX_PONTOS_SERIE_TEMPORAL = 10000  # Intervalos retornados por consulta de série temporal
+
+# Agendador de prazos
+RESOLUCAO_AGENDADOR = 1.0  # Segundos entre avanços da roda de temporizadores
+ANTECEDENCIA_PRAZO_PROXIMO = 24 * 60 * 60  # Segundos antes do prazo para o aviso de prazo próximo
+
+# Cache de respostas da API web
+MAX_BYTES_CACHE_RESPOSTAS = 32 * 1024 * 1024  # Bytes de JSON codificado mantidos em memória
+MAX_BYTES_CACHE_FRAGMENTOS = 16 * 1024 * 1024  # Bytes dos fragmentos JSON das tarefas mantidos em memória
+MIN_BYTES_COMPRESSAO = 1024  # Respostas menores são enviadas sem compressão
+NIVEL_COMPRESSAO = 6  # Nível gzip/deflate das respostas da API (1 = mais rápido, 9 = menor)
+
+# Métricas da API web (GET /api/metrics)
+LATENCIA_MINIMA_METRICAS = 0.0001  # Limite (s) do primeiro intervalo do histograma de latência
+DECADAS_LATENCIA_METRICAS = 6  # Décadas cobertas pelo histograma (0,1 ms a 100 s), com 9 intervalos cada
+
+# API assíncrona (gerenciamento_tarefas_async)
+THREADS_EXECUTOR_ASYNC = 4  # Threads que executam persistência, exportação e importação fora do loop de eventos
+
+# Fila de jobs em segundo plano (job)
+THREADS_JOBS = 2  # Jobs executados ao mesmo tempo (os demais aguardam na fila)
+MAX_JOBS_HISTORICO = 500  # Jobs encerrados mantidos para consulta (os mais antigos são descartados)
+INTERVALO_PERSISTENCIA_JOBS = 1.0  # Segundos mínimos entre gravações do progresso dos jobs
+
+# Fluxo de eventos de alteração (eventos)
+MAX_EVENTOS_ASSINANTE = 1000  # Eventos pendentes por cliente; além disso, são descartados e o cliente recebe 'reset'
+MAX_EVENTOS_HISTORICO = 1000  # Eventos recentes mantidos para retomar uma conexão (Last-Event-ID)
+MAX_ALTERACOES_SINCRONIZACAO = 10000  # Entidades no registro de alterações da sincronização incremental (GET /api/sync)
+INTERVALO_VERIFICACAO_EVENTOS = 0.5  # Segundos entre verificações de alterações em usuários, tags e times
+INTERVALO_BATIMENTO_EVENTOS = 15.0  # Segundos sem eventos até o envio de um batimento (mantém a conexão aberta)
+TEMPO_CONEXAO_EVENTOS_WSGI = 60.0  # Duração de cada conexão no servidor WSGI (o navegador reconecta em seguida)
+MAX_CONEXOES_EVENTOS_WSGI = 4  # Conexões simultâneas por processo WSGI (cada uma ocupa uma thread do pool)
+
+# Registro de operações (utils.log_operacao)
+NIVEL_LOG = "INFO"  # Nível mínimo registrado: DEPURACAO, INFO, AVISO, ERRO ou DESATIVADO
+NIVEIS_LOG_MODULO = {}  # Nível por módulo, ex.: {"Agendador": "AVISO", "Tarefa": "DESATIVADO"}
+AMOSTRAGEM_LOG = {}  # Operações frequentes registradas 1 a cada N, ex.: {"Tarefa: Status alterado": 100}
+FORMATO_LOG = "texto"  # "texto" (legível) ou "json" (um objeto por linha, para coletores de log)
+LOG_ASSINCRONO = True  # Registros escritos por uma thread em segundo plano (False: escrita imediata)
+MAX_REGISTROS_BUFFER_LOG = 10000  # Registros aguardando escrita; com o buffer cheio, os mais antigos são descartados
+INTERVALO_DESCARGA_LOG = 0.2  # Segundos entre escritas do buffer na saída padrão
+
+# Servidor web de produção
+THREADS_SERVIDOR_WEB = 16  # Threads que atendem as requisições em paralelo
+TEMPO_LIMITE_REPLICACAO = 5.0  # Segundos que uma escrita aguarda a aplicação das suas alterações (modo pré-fork)
 
 # Formatos de data
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
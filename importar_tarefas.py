@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Importação de tarefas em lote (linha de comando)
+
+Importa tarefas de um arquivo JSONL ou CSV para o sistema, lendo o arquivo
+sob demanda e registrando as tarefas em lotes. Ao final, os dados são salvos
+nos arquivos JSON (gt_finalizar).
+
+Uso:
+    python importar_tarefas.py tarefas.jsonl
+    python importar_tarefas.py tarefas.csv --lote 5000
+"""
+
+import argparse
+import os
+import sys
+
+# Adiciona o diretório atual ao path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import TAMANHO_LOTE_IMPORTACAO
+from utils import log_configurar
+from modules.gerenciamento_tarefas import (
+    gt_inicializar, gt_finalizar, gt_importar_tarefas_arquivo, FORMATOS_IMPORTACAO
+)
+
+def exibir_progresso(resumo):
+    """Exibe o progresso parcial da importação"""
+    print(f"   ⏳ {resumo['read']} linhas lidas, {resumo['imported']} importadas, "
+          f"{resumo['failed']} falhas ({resumo['rows_per_second']} linhas/s)", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Importa tarefas de um arquivo JSONL ou CSV")
+    parser.add_argument("arquivo", help="Arquivo JSONL ou CSV a importar")
+    parser.add_argument("--formato", choices=FORMATOS_IMPORTACAO, help="Formato do arquivo (padrão: pela extensão)")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE_IMPORTACAO, help="Linhas registradas por lote")
+    parser.add_argument("--verboso", action="store_true", help="Exibe o log de cada operação")
+    args = parser.parse_args()
+    
+    # O log por operação é suprimido por padrão para não dominar o tempo de
+    # importação (apenas avisos e erros são registrados)
+    if not args.verboso:
+        log_configurar(nivel='AVISO', niveis_modulo={})
+    
+    print(f"📥 Importando {args.arquivo}...")
+    gt = gt_inicializar()
+    if gt is None:
+        print("❌ Falha ao inicializar o sistema GT", file=sys.stderr)
+        return 1
+    resumo = gt_importar_tarefas_arquivo(gt, args.arquivo, args.formato, args.lote, exibir_progresso)
+    
+    if resumo is None:
+        print("❌ Falha na importação", file=sys.stderr)
+        return 1
+    
+    gt_finalizar(gt)
+    
+    print(f"✅ {resumo['imported']} tarefas importadas de {resumo['read']} linhas "
+          f"em {resumo['seconds']}s ({resumo['rows_per_second']} linhas/s)")
+    for erro in resumo['errors']:
+        print(f"   ⚠️  Linha {erro['line']}: {erro['error']}")
+    if resumo['failed'] > len(resumo['errors']):
+        print(f"   ... e mais {resumo['failed'] - len(resumo['errors'])} falhas")
+    return 0 if resumo['failed'] == 0 else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,5 +7,9 @@ Este pacote contém todos os módulos principais do sistema:
 - time: Módulo de gerenciamento de times
 - tarefa: Módulo de gerenciamento de tarefas
 - gerenciamento_tarefas: Módulo de orquestração
+- gerenciamento_tarefas_async: Fachada assíncrona (asyncio) do módulo de orquestração
+- agendador: Agendador de prazos (avisos de prazo próximo e tarefas atrasadas)
+- job: Fila local de jobs em segundo plano (exportação, importação, salvamento)
+- eventos: Fluxo de eventos de alteração (tarefas, usuários, tags e times)
 """
 
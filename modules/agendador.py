@@ -0,0 +1,409 @@
+"""
+Módulo Agendador de Prazos
+
+Este módulo é responsável por acompanhar os prazos das tarefas registradas e
+avisar quando um prazo está próximo ou foi ultrapassado, sem percorrer todas
+as tarefas a cada verificação.
+
+Os prazos ficam em uma roda de temporizadores hierárquica: cada nível tem 64
+posições, e cada posição de um nível cobre 64 vezes o tempo de uma posição do
+nível anterior. Agendar e cancelar custam O(1), e cada avanço da roda processa
+apenas a posição atual (as posições dos níveis superiores são redistribuídas
+quando o nível inferior completa uma volta).
+
+Funções principais:
+- agendador_inicializar: Agenda as tarefas registradas e inicia a thread do agendador
+- agendador_finalizar: Para a thread e descarta os agendamentos
+- agendador_avancar: Processa os prazos vencidos até o instante informado
+- agendador_adicionar_callback / agendador_remover_callback: Funções avisadas a cada evento
+- agendador_tarefas_atrasadas: Conjunto dos IDs das tarefas com prazo vencido
+- agendador_esta_atrasada: Verifica se uma tarefa está atrasada
+- agendador_versao: Versão do conjunto de atrasadas (muda a cada alteração)
+
+O agendamento acompanha as tarefas pelos observadores do módulo Tarefa:
+alterações de prazo e status reagendam a tarefa, e tarefas concluídas,
+canceladas ou removidas deixam de ser acompanhadas.
+"""
+
+from typing import Optional, List, Dict, Any, Callable, Set, Tuple
+import itertools
+import math
+import threading
+import time as relogio
+import sys
+import os
+
+__all__ = [
+    "EVENTO_PRAZO_PROXIMO",
+    "EVENTO_ATRASADA",
+    "agendador_inicializar",
+    "agendador_finalizar",
+    "agendador_avancar",
+    "agendador_adicionar_callback",
+    "agendador_remover_callback",
+    "agendador_tarefas_atrasadas",
+    "agendador_esta_atrasada",
+    "agendador_versao"
+]
+
+# Adiciona o diretório raiz ao path se não estiver lá
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from config import SUCESSO, ERRO, RESOLUCAO_AGENDADOR, ANTECEDENCIA_PRAZO_PROXIMO
+from utils import log_operacao
+from modules.tarefa import (
+    StatusTarefa, tarefa_listar_todas, tarefa_get_id, tarefa_get_prazo, tarefa_get_status,
+    tarefa_adicionar_observador, tarefa_remover_observador, tarefa_lock_registro
+)
+
+# Eventos enviados aos callbacks
+EVENTO_PRAZO_PROXIMO = 'due_soon'
+EVENTO_ATRASADA = 'overdue'
+
+# Status que encerram o acompanhamento do prazo
+_STATUS_ENCERRADOS = (StatusTarefa.TAREFA_CONCLUIDA, StatusTarefa.TAREFA_CANCELADA)
+
+# Geometria da roda: 5 níveis de 64 posições cobrem 64^5 avanços (~34 anos com 1s)
+_BITS_NIVEL = 6
+_POSICOES = 1 << _BITS_NIVEL
+_MASCARA = _POSICOES - 1
+_NIVEIS = 5
+
+# Estrutura encapsulada: cada posição guarda {(tarefa_id, evento): avanço de disparo}
+_rodas: List[List[Dict[Tuple[int, str], int]]] = [
+    [{} for _ in range(_POSICOES)] for _ in range(_NIVEIS)
+]
+
+# Posição (nível, índice) de cada agendamento, para cancelamento em O(1)
+_posicoes: Dict[Tuple[int, str], Tuple[int, int]] = {}
+
+# Avanço atual da roda (instante / RESOLUCAO_AGENDADOR)
+_avanco_atual = 0
+
+# Tarefas com prazo vencido e ainda não encerradas
+_atrasadas: Set[int] = set()
+
+# Tarefas cujo aviso de atraso já foi emitido. Não é descartado ao finalizar,
+# para que a reinicialização do agendador não repita os avisos; a tarefa sai
+# do conjunto quando deixa de estar atrasada ou é removida
+_notificadas: Set[int] = set()
+
+# Versão do conjunto de atrasadas: muda com as alterações das tarefas e quando
+# um prazo vence no avanço da roda (o que não altera a versão do módulo Tarefa)
+_contador_versao = itertools.count(1)
+_versao = 0
+
+# Eventos que já venceram ao serem agendados, entregues no próximo avanço
+_eventos_pendentes: List[Tuple[str, int]] = []
+
+# Funções avisadas a cada evento: callback(evento, tarefa_id)
+_callbacks: List[Callable[[str, int], None]] = []
+
+# Protege a roda e o conjunto de atrasadas (nunca é mantido durante os callbacks)
+_lock = threading.Lock()
+
+_thread: Optional[threading.Thread] = None
+_parar = threading.Event()
+
+def _avanco_do_instante(instante: float) -> int:
+    """Converte um instante (segundos desde a época) no avanço da roda que o contém."""
+    return math.ceil(instante / RESOLUCAO_AGENDADOR)
+
+def _inserir(chave: Tuple[int, str], avanco: int) -> None:
+    """Insere um agendamento na posição correspondente ao seu avanço de disparo."""
+    delta = max(avanco - _avanco_atual, 0)
+    nivel = 0
+    while nivel < _NIVEIS - 1 and delta >= 1 << (_BITS_NIVEL * (nivel + 1)):
+        nivel += 1
+    indice = (avanco >> (_BITS_NIVEL * nivel)) & _MASCARA
+    _rodas[nivel][indice][chave] = avanco
+    _posicoes[chave] = (nivel, indice)
+
+def _cancelar(tarefa_id: int) -> None:
+    """Remove os agendamentos de uma tarefa."""
+    for evento in (EVENTO_PRAZO_PROXIMO, EVENTO_ATRASADA):
+        posicao = _posicoes.pop((tarefa_id, evento), None)
+        if posicao is not None:
+            nivel, indice = posicao
+            del _rodas[nivel][indice][(tarefa_id, evento)]
+
+def _agendar_tarefa(tarefa: Dict[str, Any]) -> None:
+    """
+    (Re)agenda os avisos de uma tarefa conforme seu prazo e status atuais.
+    Deve ser chamada com _lock adquirido.
+    """
+    tarefa_id = tarefa_get_id(tarefa)
+    if tarefa_id is None:
+        return
+    
+    _cancelar(tarefa_id)
+    prazo = tarefa_get_prazo(tarefa)
+    if prazo is None or tarefa_get_status(tarefa) in _STATUS_ENCERRADOS:
+        _atrasadas.discard(tarefa_id)
+        _notificadas.discard(tarefa_id)
+        return
+    
+    avanco_prazo = _avanco_do_instante(prazo.timestamp())
+    if avanco_prazo <= _avanco_atual:
+        # Prazo já vencido: entra no conjunto imediatamente (avisada uma única vez)
+        _atrasadas.add(tarefa_id)
+        if tarefa_id not in _notificadas:
+            _notificadas.add(tarefa_id)
+            _eventos_pendentes.append((EVENTO_ATRASADA, tarefa_id))
+        return
+    
+    _atrasadas.discard(tarefa_id)
+    _notificadas.discard(tarefa_id)
+    _inserir((tarefa_id, EVENTO_ATRASADA), avanco_prazo)
+    
+    avanco_aviso = avanco_prazo - _avanco_do_instante(ANTECEDENCIA_PRAZO_PROXIMO)
+    if avanco_aviso <= _avanco_atual:
+        _eventos_pendentes.append((EVENTO_PRAZO_PROXIMO, tarefa_id))
+    else:
+        _inserir((tarefa_id, EVENTO_PRAZO_PROXIMO), avanco_aviso)
+
+def _ao_alterar_tarefa(evento: str, tarefa: Optional[Dict[str, Any]]) -> None:
+    """Observador do módulo Tarefa: mantém a roda sincronizada com as alterações."""
+    global _versao
+    with _lock:
+        _versao = next(_contador_versao)
+        if evento == 'recarregadas':
+            _sincronizar()
+        elif evento == 'removida':
+            tarefa_id = tarefa_get_id(tarefa)
+            _cancelar(tarefa_id)
+            _atrasadas.discard(tarefa_id)
+            _notificadas.discard(tarefa_id)
+        else:
+            _agendar_tarefa(tarefa)
+
+def _sincronizar() -> None:
+    """
+    Reagenda todas as tarefas registradas. Deve ser chamada com _lock adquirido.
+    Tarefas que já foram avisadas como atrasadas não geram um novo evento.
+    """
+    for nivel in _rodas:
+        for posicao in nivel:
+            posicao.clear()
+    _posicoes.clear()
+    
+    registradas = set()
+    for tarefa in tarefa_listar_todas():
+        if tarefa:
+            registradas.add(tarefa_get_id(tarefa))
+            _agendar_tarefa(tarefa)
+    _atrasadas.intersection_update(registradas)
+    _notificadas.intersection_update(registradas)
+
+def _descartar_pendentes() -> None:
+    """
+    Descarta os eventos ainda não entregues; os avisos de atraso descartados
+    voltam a ser emitidos na próxima sincronização. Deve ser chamada com _lock adquirido.
+    """
+    _notificadas.difference_update(
+        tarefa_id for evento, tarefa_id in _eventos_pendentes if evento == EVENTO_ATRASADA
+    )
+    _eventos_pendentes.clear()
+
+def _redistribuir(nivel: int) -> None:
+    """Move os agendamentos da posição atual de um nível para os níveis inferiores."""
+    indice = (_avanco_atual >> (_BITS_NIVEL * nivel)) & _MASCARA
+    posicao = _rodas[nivel][indice]
+    _rodas[nivel][indice] = {}
+    for chave, avanco in posicao.items():
+        _inserir(chave, avanco)
+
+def agendador_avancar(instante: Optional[float] = None) -> int:
+    """
+    Avança a roda até o instante informado, disparando os eventos vencidos.
+    
+    Chamada periodicamente pela thread do agendador; pode ser chamada
+    diretamente quando a thread não é utilizada.
+    
+    Args:
+        instante (float, optional): Segundos desde a época (padrão: agora)
+    
+    Returns:
+        int: Quantidade de eventos disparados
+    """
+    global _avanco_atual, _versao
+    
+    alvo = _avanco_do_instante(relogio.time() if instante is None else instante)
+    with _lock:
+        disparados = _eventos_pendentes[:]
+        _eventos_pendentes.clear()
+        
+        while _avanco_atual < alvo:
+            _avanco_atual += 1
+            # Ao completar uma volta de um nível, redistribui a posição atual do nível superior
+            nivel = 1
+            while nivel < _NIVEIS and (_avanco_atual & ((1 << (_BITS_NIVEL * nivel)) - 1)) == 0:
+                _redistribuir(nivel)
+                nivel += 1
+            
+            posicao = _rodas[0][_avanco_atual & _MASCARA]
+            if not posicao:
+                continue
+            _rodas[0][_avanco_atual & _MASCARA] = {}
+            for chave in posicao:
+                del _posicoes[chave]
+                tarefa_id, evento = chave
+                if evento == EVENTO_ATRASADA:
+                    _atrasadas.add(tarefa_id)
+                    _notificadas.add(tarefa_id)
+                    _versao = next(_contador_versao)
+                disparados.append((evento, tarefa_id))
+        
+        callbacks = list(_callbacks)
+    
+    if disparados:
+        atrasadas = sum(1 for evento, _ in disparados if evento == EVENTO_ATRASADA)
+        log_operacao("Agendador", "Prazos processados",
+                     f"Próximos: {len(disparados) - atrasadas}, Atrasadas: {atrasadas}")
+    
+    for evento, tarefa_id in disparados:
+        for callback in callbacks:
+            try:
+                callback(evento, tarefa_id)
+            except Exception as e:
+                log_operacao("Agendador", "Erro no callback", f"Evento: {evento}, Falha: {str(e)}")
+    
+    return len(disparados)
+
+def _executar() -> None:
+    """Laço da thread do agendador."""
+    while not _parar.wait(RESOLUCAO_AGENDADOR):
+        try:
+            agendador_avancar()
+        except Exception as e:
+            log_operacao("Agendador", "Erro ao avançar", f"Falha: {str(e)}")
+
+def agendador_inicializar(iniciar_thread: bool = True) -> int:
+    """
+    Agenda as tarefas registradas, passa a acompanhar suas alterações e,
+    opcionalmente, inicia a thread que avança a roda a cada RESOLUCAO_AGENDADOR
+    segundos. Pode ser chamada novamente para ressincronizar.
+    
+    Args:
+        iniciar_thread (bool): Se True, inicia a thread do agendador
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    global _avanco_atual, _thread, _versao
+    
+    try:
+        # Adquire o lock do registro antes do da roda, na mesma ordem dos observadores
+        with tarefa_lock_registro(), _lock:
+            _avanco_atual = _avanco_do_instante(relogio.time())
+            _descartar_pendentes()
+            _sincronizar()
+            _versao = next(_contador_versao)
+            tarefa_remover_observador(_ao_alterar_tarefa)
+            tarefa_adicionar_observador(_ao_alterar_tarefa)
+        
+        if iniciar_thread and (_thread is None or not _thread.is_alive()):
+            _parar.clear()
+            _thread = threading.Thread(target=_executar, name="agendador-prazos", daemon=True)
+            _thread.start()
+        
+        log_operacao("Agendador", "Inicializado", f"Agendadas: {len(_posicoes)}, Atrasadas: {len(_atrasadas)}")
+        return SUCESSO
+    
+    except Exception as e:
+        log_operacao("Agendador", "Erro ao inicializar", f"Falha: {str(e)}")
+        return ERRO
+
+def agendador_finalizar() -> None:
+    """
+    Para a thread do agendador, deixa de acompanhar as tarefas e descarta os agendamentos.
+    
+    As tarefas já avisadas como atrasadas são mantidas, de modo que uma nova
+    inicialização não repete os avisos.
+    """
+    global _thread, _versao
+    
+    _parar.set()
+    if _thread is not None and _thread is not threading.current_thread():
+        _thread.join()
+    _thread = None
+    
+    tarefa_remover_observador(_ao_alterar_tarefa)
+    with _lock:
+        for nivel in _rodas:
+            for posicao in nivel:
+                posicao.clear()
+        _posicoes.clear()
+        _atrasadas.clear()
+        _descartar_pendentes()
+        _versao = next(_contador_versao)
+
+def agendador_adicionar_callback(callback: Callable[[str, int], None]) -> int:
+    """
+    Registra uma função a ser avisada dos eventos de prazo.
+    
+    A função recebe o evento (EVENTO_PRAZO_PROXIMO ou EVENTO_ATRASADA) e o ID
+    da tarefa, e é chamada na thread do agendador.
+    
+    Args:
+        callback (Callable): Função callback(evento, tarefa_id)
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro (nulo ou já registrado)
+    """
+    with _lock:
+        if callback is None or callback in _callbacks:
+            log_operacao("Agendador", "Erro ao adicionar callback", "Callback nulo ou já registrado")
+            return ERRO
+        _callbacks.append(callback)
+    return SUCESSO
+
+def agendador_remover_callback(callback: Callable[[str, int], None]) -> int:
+    """
+    Remove uma função registrada com agendador_adicionar_callback.
+    
+    Args:
+        callback (Callable): Função a remover
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro (não registrado)
+    """
+    with _lock:
+        if callback not in _callbacks:
+            return ERRO
+        _callbacks.remove(callback)
+    return SUCESSO
+
+def agendador_tarefas_atrasadas() -> Set[int]:
+    """
+    Obtém os IDs das tarefas com prazo vencido e ainda não concluídas ou canceladas.
+    
+    Returns:
+        Set[int]: Cópia do conjunto de tarefas atrasadas
+    """
+    with _lock:
+        return set(_atrasadas)
+
+def agendador_versao() -> int:
+    """
+    Obtém a versão atual do conjunto de tarefas atrasadas.
+    
+    Returns:
+        int: Versão do conjunto de atrasadas
+    """
+    return _versao
+
+def agendador_esta_atrasada(tarefa_id: int) -> bool:
+    """
+    Verifica se uma tarefa está com o prazo vencido.
+    
+    Args:
+        tarefa_id (int): ID da tarefa
+    
+    Returns:
+        bool: True se a tarefa está atrasada
+    """
+    return tarefa_id in _atrasadas
@@ -0,0 +1,471 @@
+"""
+Módulo de Eventos de Alteração
+
+Este módulo é responsável por publicar um evento compacto a cada alteração
+das estruturas encapsuladas (tarefas, usuários, tags e times), para que os
+clientes apliquem as diferenças em vez de baixar as listagens novamente.
+
+Cada evento informa a entidade, o ID, a operação ('created', 'updated',
+'deleted' ou 'reset'), os campos alterados com seus novos valores e a versão
+da estrutura após a alteração. As tarefas são acompanhadas pelos
+observadores do módulo Tarefa: os campos alterados são obtidos comparando a
+cópia somente leitura anterior com a nova (ver tarefa_buscar_congelada).
+Usuários, tags e times são pequenos e verificados periodicamente pela versão
+de cada estrutura, comparando as entidades com as da verificação anterior.
+
+Cada assinante tem uma fila limitada (MAX_EVENTOS_ASSINANTE): a publicação
+nunca espera por um cliente lento; se a fila enche, os eventos pendentes são
+descartados e o assinante recebe um evento 'reset' (deve recarregar as
+listagens). Os eventos recentes (MAX_EVENTOS_HISTORICO) permitem retomar uma
+conexão a partir do último evento recebido.
+
+A sequência dos eventos é também a versão global usada na sincronização
+incremental: um registro de alterações limitado (MAX_ALTERACOES_SINCRONIZACAO)
+guarda, para cada entidade alterada, a sequência e a operação da última
+alteração (as remoções permanecem como marcas). Clientes que ficaram para trás
+além do registro devem obter a fotografia completa.
+
+Funções principais:
+- eventos_inicializar / eventos_finalizar: Iniciam e encerram o acompanhamento das alterações
+- eventos_assinar / eventos_cancelar_assinatura: Criam e removem um assinante
+- eventos_obter: Retira os eventos pendentes de um assinante (sem esperar)
+- eventos_aguardar: Aguarda e retira os eventos pendentes de um assinante
+- eventos_verificar_registros: Publica as alterações de usuários, tags e times
+- eventos_qtd_assinantes: Quantidade de assinantes ativos
+- eventos_alteracoes_desde: Entidades alteradas após uma versão global
+"""
+
+from typing import Optional, List, Dict, Any, Callable, Mapping
+from collections import deque, OrderedDict
+from datetime import datetime
+from enum import Enum
+import itertools
+import threading
+import time as relogio
+import sys
+import os
+
+__all__ = [
+    "OPERACOES_EVENTO",
+    "eventos_inicializar",
+    "eventos_finalizar",
+    "eventos_assinar",
+    "eventos_cancelar_assinatura",
+    "eventos_obter",
+    "eventos_aguardar",
+    "eventos_verificar_registros",
+    "eventos_qtd_assinantes",
+    "eventos_alteracoes_desde"
+]
+
+# Adiciona o diretório raiz ao path se não estiver lá
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from config import (
+    SUCESSO, ERRO, MAX_EVENTOS_ASSINANTE, MAX_EVENTOS_HISTORICO, INTERVALO_VERIFICACAO_EVENTOS,
+    MAX_ALTERACOES_SINCRONIZACAO
+)
+from utils import log_operacao
+from modules.tarefa import (
+    tarefa_snapshot, tarefa_buscar_congelada, tarefa_versao, tarefa_lock_registro,
+    tarefa_adicionar_observador, tarefa_remover_observador
+)
+from modules.usuario import usuario_listar_todos, usuario_versao
+from modules.tag import tag_listar_todas, tag_versao
+from modules.team import time_listar_todos, time_versao
+
+# Operações informadas nos eventos ('reset': o cliente deve recarregar as listagens)
+OPERACOES_EVENTO = ('created', 'updated', 'deleted', 'reset')
+
+# Estruturas verificadas periodicamente, por entidade: (versão, listagem)
+_REGISTROS_VERIFICADOS = {
+    'user': (usuario_versao, usuario_listar_todos),
+    'tag': (tag_versao, tag_listar_todas),
+    'team': (time_versao, time_listar_todos),
+}
+
+# Identifica a inicialização (e o processo, no modo pré-fork) nas sequências
+# dos eventos: definida em eventos_inicializar, após o fork dos processos
+_INSTANCIA = ''
+
+# Estado do acompanhamento: sequência do último evento, eventos recentes e assinantes
+_lock = threading.Lock()
+_sequencia = 0
+_historico: deque = deque(maxlen=MAX_EVENTOS_HISTORICO)
+_assinantes: Dict[int, Dict[str, Any]] = {}
+_contador_assinaturas = itertools.count(1)
+_iniciado = False
+
+# Registro de alterações: (entidade, ID) -> (sequência, operação), da mais
+# antiga para a mais recente; versões anteriores ao piso exigem a fotografia completa
+_alteracoes: 'OrderedDict[tuple, tuple]' = OrderedDict()
+_piso_alteracoes = 0
+
+# Última cópia conhecida de cada tarefa (as cópias somente leitura do módulo Tarefa)
+_tarefas_conhecidas: Dict[int, Mapping[str, Any]] = {}
+
+# Entidades e versões da verificação anterior de usuários, tags e times
+_lock_verificacao = threading.Lock()
+_copias_registros: Dict[str, Dict[int, Dict[str, Any]]] = {}
+_versoes_registros: Dict[str, int] = {}
+
+# Thread da verificação periódica
+_thread_verificacao: Optional[threading.Thread] = None
+_parar = threading.Event()
+
+def _valor(valor: Any) -> Any:
+    """Converte o valor de um campo para JSON (como nas respostas da API)."""
+    if isinstance(valor, Enum):
+        return valor.value
+    if isinstance(valor, datetime):
+        return str(valor)
+    if isinstance(valor, (list, tuple)):
+        return list(valor)
+    return valor
+
+def _evento_reset() -> Dict[str, Any]:
+    """Evento que instrui o cliente a recarregar as listagens. Executada com _lock adquirido."""
+    return {'seq': f'{_INSTANCIA}-{_sequencia}', 'entity': None, 'op': 'reset', 'id': None,
+            'fields': [], 'data': {}, 'version': None}
+
+def _publicar(entidade: Optional[str], operacao: str, entidade_id: Optional[int],
+              dados: Dict[str, Any], versao: Optional[int]) -> None:
+    """Publica um evento para todos os assinantes, sem esperar por nenhum deles."""
+    global _sequencia, _piso_alteracoes
+    avisos = []
+    with _lock:
+        _sequencia += 1
+        if entidade_id is not None:
+            chave = (entidade, entidade_id)
+            _alteracoes.pop(chave, None)
+            _alteracoes[chave] = (_sequencia, operacao)
+            if len(_alteracoes) > MAX_ALTERACOES_SINCRONIZACAO:
+                _, (sequencia, _) = _alteracoes.popitem(last=False)
+                _piso_alteracoes = sequencia
+        elif operacao == 'reset':
+            _alteracoes.clear()
+            _piso_alteracoes = _sequencia
+        evento = {
+            'seq': f'{_INSTANCIA}-{_sequencia}',
+            'entity': entidade,
+            'op': operacao,
+            'id': entidade_id,
+            'fields': list(dados),
+            'data': dados,
+            'version': versao
+        }
+        _historico.append(evento)
+        for assinante in _assinantes.values():
+            fila = assinante['fila']
+            if assinante['transbordou']:
+                continue
+            if len(fila) >= MAX_EVENTOS_ASSINANTE:
+                # Cliente lento: descarta os pendentes e o instrui a recarregar
+                fila.clear()
+                assinante['transbordou'] = True
+            else:
+                fila.append(evento)
+            assinante['sinal'].set()
+            if assinante['aviso'] is not None:
+                avisos.append(assinante['aviso'])
+    
+    for aviso in avisos:
+        try:
+            aviso()
+        except Exception as e:
+            log_operacao("Eventos", "Erro ao avisar assinante", str(e))
+
+def _observar_tarefa(evento: str, tarefa: Optional[Dict[str, Any]]) -> None:
+    """
+    Observador do módulo Tarefa: publica a tarefa registrada, alterada ou
+    removida. Executada com o lock das tarefas adquirido.
+    """
+    if evento == 'recarregadas':
+        _tarefas_conhecidas.clear()
+        _tarefas_conhecidas.update((t['id'], t) for t in tarefa_snapshot().tarefas)
+        _publicar('task', 'reset', None, {}, tarefa_versao())
+        return
+    
+    tarefa_id = tarefa['id']
+    if evento == 'removida':
+        _tarefas_conhecidas.pop(tarefa_id, None)
+        _publicar('task', 'deleted', tarefa_id, {}, tarefa_versao())
+        return
+    
+    nova = tarefa_buscar_congelada(tarefa_id)
+    if nova is None:
+        return
+    anterior = _tarefas_conhecidas.get(tarefa_id)
+    _tarefas_conhecidas[tarefa_id] = nova
+    if evento == 'registrada' or anterior is None:
+        _publicar('task', 'created', tarefa_id, {campo: _valor(v) for campo, v in nova.items()}, tarefa_versao())
+        return
+    
+    dados = {campo: _valor(v) for campo, v in nova.items() if anterior.get(campo) != v}
+    if dados:
+        _publicar('task', 'updated', tarefa_id, dados, tarefa_versao())
+
+def _copias(entidades: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Copia as entidades (ignorando as destruídas) com os valores convertidos para JSON."""
+    return {
+        entidade['id']: {campo: _valor(v) for campo, v in entidade.items()}
+        for entidade in entidades if 'id' in entidade
+    }
+
+def _verificar_periodicamente() -> None:
+    """Thread da verificação periódica de usuários, tags e times."""
+    while not _parar.wait(INTERVALO_VERIFICACAO_EVENTOS):
+        try:
+            eventos_verificar_registros()
+        except Exception as e:
+            log_operacao("Eventos", "Erro na verificação", str(e))
+
+def eventos_verificar_registros() -> int:
+    """
+    Publica as alterações de usuários, tags e times desde a verificação
+    anterior (as estruturas sem mudança de versão não são percorridas).
+    
+    Returns:
+        int: Quantidade de eventos publicados
+    """
+    publicados = 0
+    with _lock_verificacao:
+        for entidade, (versao, listar) in _REGISTROS_VERIFICADOS.items():
+            atual = versao()
+            if _versoes_registros.get(entidade) == atual:
+                continue
+            _versoes_registros[entidade] = atual
+            anteriores = _copias_registros.get(entidade, {})
+            copias = _copias(listar())
+            _copias_registros[entidade] = copias
+            
+            for entidade_id, copia in copias.items():
+                anterior = anteriores.get(entidade_id)
+                if anterior is None:
+                    _publicar(entidade, 'created', entidade_id, copia, atual)
+                    publicados += 1
+                    continue
+                dados = {campo: v for campo, v in copia.items() if anterior.get(campo) != v}
+                if dados:
+                    _publicar(entidade, 'updated', entidade_id, dados, atual)
+                    publicados += 1
+            for entidade_id in anteriores.keys() - copias.keys():
+                _publicar(entidade, 'deleted', entidade_id, {}, atual)
+                publicados += 1
+    return publicados
+
+def eventos_inicializar() -> int:
+    """
+    Inicia o acompanhamento das alterações: registra o observador das
+    tarefas, guarda o estado atual de cada estrutura e inicia a thread da
+    verificação periódica. Chamadas repetidas não têm efeito.
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    global _iniciado, _thread_verificacao, _INSTANCIA, _sequencia, _piso_alteracoes
+    with _lock_verificacao:
+        if _iniciado:
+            return SUCESSO
+        try:
+            # A sequência parte do relógio (microssegundos): as versões globais
+            # continuam crescendo entre reinícios e versões antigas ficam abaixo do piso
+            with _lock:
+                _INSTANCIA = f'{os.getpid():x}{relogio.time_ns():x}'
+                _sequencia = relogio.time_ns() // 1000
+                _piso_alteracoes = _sequencia
+                _historico.clear()
+                _alteracoes.clear()
+            for entidade, (versao, listar) in _REGISTROS_VERIFICADOS.items():
+                _versoes_registros[entidade] = versao()
+                _copias_registros[entidade] = _copias(listar())
+            
+            # O estado inicial e o registro do observador ocorrem sob o lock das
+            # tarefas: nenhuma alteração fica entre os dois
+            with tarefa_lock_registro():
+                _tarefas_conhecidas.clear()
+                _tarefas_conhecidas.update((t['id'], t) for t in tarefa_snapshot().tarefas)
+                tarefa_adicionar_observador(_observar_tarefa)
+            
+            _parar.clear()
+            _thread_verificacao = threading.Thread(target=_verificar_periodicamente, name="eventos", daemon=True)
+            _thread_verificacao.start()
+            _iniciado = True
+            log_operacao("Eventos", "Inicializado", f"Tarefas acompanhadas: {len(_tarefas_conhecidas)}")
+            return SUCESSO
+        except Exception as e:
+            log_operacao("Eventos", "Erro ao inicializar", str(e))
+            return ERRO
+
+def eventos_finalizar() -> None:
+    """
+    Encerra o acompanhamento das alterações e todas as assinaturas (os
+    assinantes em espera são acordados e recebem None).
+    """
+    global _iniciado, _thread_verificacao
+    with _lock_verificacao:
+        if not _iniciado:
+            return
+        tarefa_remover_observador(_observar_tarefa)
+        _parar.set()
+        thread, _thread_verificacao = _thread_verificacao, None
+        _iniciado = False
+    
+    if thread is not None:
+        thread.join()
+    
+    with _lock:
+        assinantes = list(_assinantes.values())
+        _assinantes.clear()
+        _tarefas_conhecidas.clear()
+    for assinante in assinantes:
+        assinante['sinal'].set()
+        if assinante['aviso'] is not None:
+            try:
+                assinante['aviso']()
+            except Exception:
+                pass
+    log_operacao("Eventos", "Finalizado", f"Assinaturas encerradas: {len(assinantes)}")
+
+def eventos_assinar(ultimo_evento: Optional[str] = None,
+                    aviso: Optional[Callable[[], None]] = None) -> Optional[int]:
+    """
+    Cria um assinante dos eventos (iniciando o acompanhamento, se necessário).
+    
+    Com ultimo_evento (a 'seq' do último evento recebido em uma conexão
+    anterior), os eventos posteriores ainda mantidos são entregues primeiro;
+    se não estiverem mais disponíveis (ou forem de outro processo), o
+    assinante recebe um evento 'reset'.
+    
+    Args:
+        ultimo_evento (str, optional): Sequência do último evento recebido
+        aviso (Callable, optional): Chamada a cada novo evento, na thread que o
+            publicou (ex.: para acordar um loop de eventos com call_soon_threadsafe)
+    
+    Returns:
+        int ou None: ID da assinatura ou None em caso de erro
+    """
+    if eventos_inicializar() != SUCESSO:
+        return None
+    
+    assinante = {'fila': deque(), 'transbordou': False, 'sinal': threading.Event(), 'aviso': aviso}
+    with _lock:
+        if ultimo_evento:
+            instancia, _, sequencia = ultimo_evento.rpartition('-')
+            disponivel = (instancia == _INSTANCIA and sequencia.isdigit()
+                          and int(sequencia) <= _sequencia
+                          and (not _historico or int(_historico[0]['seq'].rpartition('-')[2]) <= int(sequencia) + 1))
+            if disponivel:
+                inicio = int(sequencia)
+                assinante['fila'].extend(e for e in _historico if int(e['seq'].rpartition('-')[2]) > inicio)
+            else:
+                assinante['fila'].append(_evento_reset())
+            if assinante['fila']:
+                assinante['sinal'].set()
+        assinatura_id = next(_contador_assinaturas)
+        _assinantes[assinatura_id] = assinante
+    return assinatura_id
+
+def eventos_cancelar_assinatura(assinatura_id: int) -> int:
+    """
+    Remove um assinante e descarta os eventos pendentes dele.
+    
+    Args:
+        assinatura_id (int): ID da assinatura
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro (assinatura inexistente)
+    """
+    with _lock:
+        assinante = _assinantes.pop(assinatura_id, None)
+    if assinante is None:
+        return ERRO
+    assinante['sinal'].set()
+    return SUCESSO
+
+def eventos_obter(assinatura_id: int) -> Optional[List[Dict[str, Any]]]:
+    """
+    Retira os eventos pendentes de um assinante, sem esperar. Após um
+    descarte por fila cheia, o primeiro evento entregue é um 'reset'.
+    
+    Args:
+        assinatura_id (int): ID da assinatura
+    
+    Returns:
+        List[Dict] ou None: Eventos pendentes (possivelmente vazia) ou None se
+        a assinatura não existe mais
+    """
+    with _lock:
+        assinante = _assinantes.get(assinatura_id)
+        if assinante is None:
+            return None
+        eventos = list(assinante['fila'])
+        assinante['fila'].clear()
+        if assinante['transbordou']:
+            assinante['transbordou'] = False
+            eventos.insert(0, _evento_reset())
+        return eventos
+
+def eventos_aguardar(assinatura_id: int, tempo_limite: Optional[float] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Aguarda eventos para um assinante e os retira (ver eventos_obter).
+    
+    Args:
+        assinatura_id (int): ID da assinatura
+        tempo_limite (float, optional): Segundos máximos de espera
+    
+    Returns:
+        List[Dict] ou None: Eventos pendentes (vazia se o tempo acabou) ou None
+        se a assinatura não existe mais
+    """
+    with _lock:
+        assinante = _assinantes.get(assinatura_id)
+    if assinante is None:
+        return None
+    assinante['sinal'].wait(tempo_limite)
+    assinante['sinal'].clear()
+    return eventos_obter(assinatura_id)
+
+def eventos_qtd_assinantes() -> int:
+    """
+    Obtém a quantidade de assinantes ativos.
+    
+    Returns:
+        int: Quantidade de assinantes
+    """
+    with _lock:
+        return len(_assinantes)
+
+def eventos_alteracoes_desde(versao: Optional[int]) -> Dict[str, Any]:
+    """
+    Obtém as entidades alteradas após uma versão global (a sequência dos
+    eventos), iniciando o acompanhamento, se necessário.
+    
+    Cada entidade aparece uma única vez, com a operação da última alteração
+    ('created', 'updated' ou 'deleted'). Se a versão é anterior ao registro
+    de alterações (cliente muito atrasado, reinício do servidor ou recarga
+    das tarefas) ou desconhecida, 'completo' é True: o cliente deve obter
+    todas as entidades.
+    
+    Args:
+        versao (int, optional): Versão obtida na sincronização anterior (None para a primeira)
+        
+    Returns:
+        Dict: {'versao': versão atual, 'completo': bool,
+               'alteracoes': {entidade: {id: operação}}} (vazio se completo)
+    """
+    eventos_inicializar()
+    with _lock:
+        if versao is None or versao < _piso_alteracoes or versao > _sequencia:
+            return {'versao': _sequencia, 'completo': True, 'alteracoes': {}}
+        
+        alteracoes: Dict[str, Dict[int, str]] = {}
+        # Do fim para o início: o registro está ordenado pela última alteração
+        for (entidade, entidade_id), (sequencia, operacao) in reversed(_alteracoes.items()):
+            if sequencia <= versao:
+                break
+            alteracoes.setdefault(entidade, {})[entidade_id] = operacao
+        return {'versao': _sequencia, 'completo': False, 'alteracoes': alteracoes}
@@ -6,12 +6,21 @@ Este módulo é responsável por orquestrar a lógica de gerenciamento de tarefa
 das demais entidades do sistema (Time, Tarefa, Tag e Usuario).
 
 Funções principais:
-- gt_inicializar: Inicializa o sistema de gerenciamento
+- gt_inicializar: Inicializa o sistema de gerenciamento (e o agendador de prazos)
 - gt_finalizar: Finaliza e libera recursos
 - gt_registrar_time: Registra um time no sistema
 - gt_criar_tarefa: Cria uma nova tarefa
 - gt_remover_tarefa: Remove uma tarefa
 - gt_listar_tarefas_time: Lista tarefas de um time
+- gt_aplicar_lote_tarefas: Aplica um lote de criações, alterações e remoções de tarefas
+- gt_importar_tarefas / gt_importar_tarefas_arquivo: Importam tarefas de JSONL ou CSV, em lotes
+- gt_exportar_tarefas_fluxo: Gera a exportação de tarefas em CSV ou JSONL sob demanda
+- gt_exportar_tarefas_particionado: Exporta tarefas em paralelo, particionadas por ID ou time
+- gt_agregar_tarefas: Conta tarefas agrupadas por status, responsável, tag, time ou semana
+- gt_salvar: Salva os dados de todas as entidades sem finalizar o sistema
+- gt_exportar_tarefas_arquivo: Grava a exportação em fluxo em um arquivo de EXPORT_DIR
+- gt_agendar_exportacao / gt_agendar_importacao_arquivo / gt_agendar_salvamento: Executam
+  as operações demoradas em segundo plano, como jobs (ver módulo job)
 
 Conforme especificação: Este módulo atua como cliente dos módulos Time, Tarefa,
 Tag e Usuario, utilizando suas funções para orquestrar a lógica de gerenciamento.
@@ -22,8 +31,18 @@ WORKFLOW DE PERSISTÊNCIA:
 - Finalização: Salva todos os dados nos JSONs uma única vez usando as estruturas encapsuladas dos módulos
 """
 
-from typing import Optional, List, Dict, Any, Tuple
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Callable, Iterator, Set
+from contextlib import contextmanager, ExitStack
+from datetime import datetime, timedelta
+import csv
+import io
+import json
+import shutil
+from collections import Counter, deque
+from itertools import chain, product
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import time as relogio
 import sys
 import os
 
@@ -33,12 +52,15 @@ root_dir = os.path.dirname(current_dir)
 if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
-from config import SUCESSO, ERRO
-from utils import log_operacao, exportar_para_csv
+from config import SUCESSO, ERRO, MAX_TITULO_LENGTH, MAX_DESCRICAO_LENGTH, MAX_OPERACOES_LOTE, TAMANHO_LOTE_IMPORTACAO, TAMANHO_BLOCO_EXPORTACAO, TAMANHO_BLOCO_PARTICAO, EXPORT_DIR
+from utils import log_operacao, log_ativo, LOG_DEPURACAO, exportar_para_csv
 from modules.usuario import *
 from modules.tag import *
 from modules.team import *
 from modules.tarefa import *
+from modules.agendador import *
+from modules.job import *
+from modules.eventos import *
 
 def gt_inicializar() -> Optional[Dict[str, Any]]:
     """
@@ -58,6 +80,10 @@ def gt_inicializar() -> Optional[Dict[str, Any]]:
         tag_carregar_dados()
         time_carregar_dados()
         tarefa_carregar_dados()
+        job_carregar_dados()
+        
+        # Passa a acompanhar os prazos das tarefas carregadas
+        agendador_inicializar()
         
         # Cria um dicionário vazio para representar o sistema GT
         # (os dados reais estão nas estruturas encapsuladas dos módulos)
@@ -85,6 +111,11 @@ def gt_finalizar(gt: Dict[str, Any]) -> None:
         log_operacao("GerenciamentoTarefas", "Erro ao finalizar", "Ponteiro nulo")
         return
     
+    # Para o acompanhamento de prazos, os jobs em segundo plano e o fluxo de eventos
+    agendador_finalizar()
+    job_finalizar()
+    eventos_finalizar()
+    
     # Salva dados usando as estruturas encapsuladas dos módulos
     usuario_salvar_dados()
     tag_salvar_dados()
@@ -194,7 +225,8 @@ def gt_criar_tarefa(gt: Dict[str, Any], time: Dict[str, Any], titulo: str, descr
         
         # Registra a tarefa usando a estrutura encapsulada do módulo tarefa
         if tarefa_registrar(tarefa) == SUCESSO:
-            log_operacao("GerenciamentoTarefas", "Tarefa criada", f"ID: {tarefa_get_id(tarefa)}, Título: {titulo}")
+            if log_ativo("GerenciamentoTarefas"):
+                log_operacao("GerenciamentoTarefas", "Tarefa criada", f"ID: {tarefa_get_id(tarefa)}, Título: {titulo}")
             return tarefa
         else:
             log_operacao("GerenciamentoTarefas", "Erro ao criar tarefa", "Falha no registro da tarefa")
@@ -235,8 +267,9 @@ def gt_remover_tarefa(gt: Dict[str, Any], tarefa: Dict[str, Any]) -> int:
             return ERRO
         
         # Remove a tarefa da estrutura encapsulada do módulo tarefa
-        # (implementação específica seria necessária no módulo tarefa)
-        # Por enquanto, apenas destrói a tarefa
+        # (tarefas ainda não registradas são apenas destruídas)
+        if tarefa_buscar_por_id(tarefa_id) is tarefa:
+            tarefa_remover(tarefa_id)
         tarefa_destruir(tarefa)
         
         log_operacao("GerenciamentoTarefas", "Tarefa removida", f"ID: {tarefa_id}")
@@ -287,7 +320,10 @@ def gt_listar_tarefas_time(gt: Dict[str, Any], time: Dict[str, Any], qtd_out: Li
         tarefas_time = tarefa_listar_todas()
         
         qtd_out[0] = len(tarefas_time)
-        log_operacao("GerenciamentoTarefas", "Tarefas listadas", f"Time ID: {time_id}, Qtd: {len(tarefas_time)}")
+        # Consulta frequente: registrada apenas no nível de depuração
+        if log_ativo("GerenciamentoTarefas", LOG_DEPURACAO):
+            log_operacao("GerenciamentoTarefas", "Tarefas listadas", f"Time ID: {time_id}, Qtd: {len(tarefas_time)}",
+                         LOG_DEPURACAO)
         return tarefas_time
         
     except Exception as e:
@@ -420,14 +456,161 @@ def gt_listar_todos_times(gt: Dict[str, Any]) -> List[Dict[str, Any]]:
     
     return time_listar_todos()
 
-def gt_exportar_tarefas_csv(gt: Dict[str, Any], nome_arquivo: str) -> bool:
+# Entidades da sincronização incremental: (busca por ID, listagem completa)
+_ENTIDADES_SINCRONIZACAO = {
+    'task': (tarefa_buscar_por_id, tarefa_listar_todas),
+    'user': (usuario_buscar_por_id, usuario_listar_todos),
+    'tag': (tag_buscar_por_id, tag_listar_todas),
+    'team': (time_buscar_por_id, time_listar_todos),
+}
+
+def gt_sincronizar(gt: Dict[str, Any], versao: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Obtém as entidades criadas, alteradas ou removidas após uma versão global,
+    para clientes que mantêm uma cópia local dos dados (ver eventos_alteracoes_desde).
+    
+    O custo é proporcional às entidades alteradas, não ao total de entidades.
+    Se a versão é desconhecida ou anterior ao registro de alterações, todas as
+    entidades são retornadas e 'completo' é True (o cliente descarta a cópia
+    local). Entidades alteradas após a versão retornada podem já aparecer com
+    o novo estado; elas são enviadas de novo na sincronização seguinte.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        versao (int, optional): Versão retornada na sincronização anterior
+        
+    Returns:
+        Dict ou None: {'versao': int, 'completo': bool, 'entidades': {entidade:
+        {'alteradas': [entidades], 'removidas': [IDs]}}} ou None se erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao sincronizar", "Ponteiro GT nulo")
+        return None
+    
+    # Publica as alterações de usuários, tags e times ainda não detectadas pela
+    # verificação periódica, para que entrem nesta sincronização
+    eventos_verificar_registros()
+    
+    # A versão é obtida antes das entidades: o que mudar depois será reenviado
+    alteracoes = eventos_alteracoes_desde(versao)
+    entidades = {}
+    for entidade, (buscar, listar) in _ENTIDADES_SINCRONIZACAO.items():
+        if alteracoes['completo']:
+            # Entidades destruídas permanecem vazias na estrutura até o salvamento
+            entidades[entidade] = {'alteradas': [e for e in listar() if e], 'removidas': []}
+            continue
+        
+        alteradas, removidas = [], []
+        for entidade_id, operacao in alteracoes['alteracoes'].get(entidade, {}).items():
+            atual = buscar(entidade_id) if operacao != 'deleted' else None
+            if atual:
+                alteradas.append(atual)
+            else:
+                removidas.append(entidade_id)
+        entidades[entidade] = {'alteradas': alteradas, 'removidas': removidas}
+    
+    return {'versao': alteracoes['versao'], 'completo': alteracoes['completo'], 'entidades': entidades}
+
+@contextmanager
+def gt_leitura_consistente(gt: Dict[str, Any]) -> Iterator[None]:
+    """
+    Bloco with em que as consultas a tarefas, usuários, tags e times veem um
+    único estado: as alterações aguardam o fim do bloco (outras leituras não).
+    
+    Os locks de leitura são adquiridos na ordem tarefas, usuários, tags e
+    times, a mesma das operações que alteram mais de uma estrutura. O bloco
+    não deve alterar as estruturas (a leitura não pode ser promovida a escrita)
+    e deve ser curto, pois as escritas ficam em espera.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+    """
+    # O fluxo de eventos registra um observador ao iniciar (escrita): é
+    # iniciado antes, caso alguma consulta do bloco dependa dele
+    eventos_inicializar()
+    with ExitStack() as pilha:
+        for lock in (tarefa_lock_registro(), usuario_lock_registro(), tag_lock_registro(), time_lock_registro()):
+            pilha.enter_context(lock.leitura())
+        yield
+
+# Colunas do CSV de exportação (reconhecidas também pela importação)
+CABECALHOS_EXPORTACAO = [
+    'ID', 'Título', 'Descrição', 'Status', 'Usuário Responsável',
+    'Prazo', 'Tags', 'Data Criação', 'Data Modificação'
+]
+
+# Formatos aceitos em gt_exportar_tarefas_fluxo
+FORMATOS_EXPORTACAO = ('csv', 'jsonl')
+
+def _valor_status_exportacao(tarefa: Dict[str, Any]) -> str:
+    """Retorna o status da tarefa como texto."""
+    return tarefa['status'].value if hasattr(tarefa['status'], 'value') else str(tarefa['status'])
+
+def _linha_csv_exportacao(tarefa: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converte uma tarefa em uma linha do CSV de exportação.
+    
+    Args:
+        tarefa (Dict): Tarefa a ser exportada
+        
+    Returns:
+        Dict: Linha indexada por CABECALHOS_EXPORTACAO
+    """
+    return {
+        'ID': tarefa['id'],
+        'Título': tarefa['titulo'],
+        'Descrição': tarefa['descricao'],
+        'Status': _valor_status_exportacao(tarefa),
+        'Usuário Responsável': tarefa['usuario_responsavel_id'],
+        'Prazo': str(tarefa['prazo']),
+        'Tags': ', '.join(map(str, tarefa['tags'])),
+        'Data Criação': str(tarefa['data_criacao']),
+        'Data Modificação': str(tarefa['data_modificacao'])
+    }
+
+def _linha_jsonl_exportacao(tarefa: Dict[str, Any]) -> str:
+    """
+    Converte uma tarefa em uma linha JSONL (com quebra de linha).
+    
+    Args:
+        tarefa (Dict): Tarefa a ser exportada
+        
+    Returns:
+        str: Objeto JSON da tarefa seguido de '\\n'
+    """
+    def iso(data):
+        return data.isoformat() if isinstance(data, datetime) else data
+    
+    return json.dumps({
+        'id': tarefa['id'],
+        'titulo': tarefa['titulo'],
+        'descricao': tarefa['descricao'],
+        'status': _valor_status_exportacao(tarefa),
+        'usuario_responsavel_id': tarefa['usuario_responsavel_id'],
+        'prazo': iso(tarefa['prazo']),
+        'tags': list(tarefa['tags']),
+        'data_criacao': iso(tarefa['data_criacao']),
+        'data_modificacao': iso(tarefa['data_modificacao'])
+    }, ensure_ascii=False) + '\n'
+
+def gt_exportar_tarefas_csv(gt: Dict[str, Any], nome_arquivo: str, paralelo: bool = False,
+                            particionar_por: str = 'id', num_processos: Optional[int] = None,
+                            callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None) -> bool:
     """
     Exporta as tarefas para um arquivo CSV.
-    Usa dados em memória para exportação.
+    Usa dados em memória para exportação, gravando linha a linha.
+    
+    No modo paralelo, as tarefas são particionadas (ver
+    gt_exportar_tarefas_particionado), serializadas em um pool de processos e
+    as partes são concatenadas em nome_arquivo.
     
     Args:
         gt (Dict): Sistema GT em formato dicionário
         nome_arquivo (str): Nome do arquivo CSV
+        paralelo (bool): Se True, usa todos os núcleos disponíveis
+        particionar_por (str): 'id' (faixas de ID) ou 'time' (modo paralelo)
+        num_processos (int, optional): Processos do pool (padrão: núcleos da máquina)
+        callback_progresso (Callable, optional): Recebe o progresso a cada parte concluída
         
     Returns:
         bool: True se exportou com sucesso, False caso contrário
@@ -436,27 +619,22 @@ def gt_exportar_tarefas_csv(gt: Dict[str, Any], nome_arquivo: str) -> bool:
         log_operacao("GerenciamentoTarefas", "Erro ao exportar CSV", "Ponteiro GT nulo")
         return False
     
+    if paralelo:
+        resultado = gt_exportar_tarefas_particionado(
+            gt, nome_arquivo, particionar_por, num_processos,
+            concatenar=True, callback_progresso=callback_progresso
+        )
+        return resultado is not None
+    
     try:
-        # Obtém todas as tarefas da estrutura encapsulada
-        tarefas = tarefa_listar_todas()
+        # Fotografia imutável: a exportação não bloqueia nem é afetada pelas escritas
+        tarefas = tarefa_snapshot().tarefas
         
-        # Prepara os dados para exportação
-        dados_exportacao = []
-        for tarefa in tarefas:
-            dados_exportacao.append({
-                'ID': tarefa['id'],
-                'Título': tarefa['titulo'],
-                'Descrição': tarefa['descricao'],
-                'Status': tarefa['status'].value if hasattr(tarefa['status'], 'value') else str(tarefa['status']),
-                'Usuário Responsável': tarefa['usuario_responsavel_id'],
-                'Prazo': str(tarefa['prazo']),
-                'Tags': ', '.join(map(str, tarefa['tags'])),
-                'Data Criação': str(tarefa['data_criacao']),
-                'Data Modificação': str(tarefa['data_modificacao'])
-            })
+        # Prepara as linhas sob demanda, sem montar a lista completa
+        dados_exportacao = (_linha_csv_exportacao(tarefa) for tarefa in tarefas)
         
         # Exporta para CSV
-        if exportar_para_csv(dados_exportacao, nome_arquivo):
+        if exportar_para_csv(dados_exportacao, nome_arquivo, CABECALHOS_EXPORTACAO):
             log_operacao("GerenciamentoTarefas", "CSV exportado", f"Arquivo: {nome_arquivo}")
             return True
         else:
@@ -467,3 +645,1075 @@ def gt_exportar_tarefas_csv(gt: Dict[str, Any], nome_arquivo: str) -> bool:
         log_operacao("GerenciamentoTarefas", "Erro ao exportar CSV", f"Falha: {str(e)}")
         return False
 
+def _gerar_exportacao(tarefas: Iterable[Dict[str, Any]], formato: str,
+                      tamanho_bloco: int):
+    """
+    Gera os blocos de texto da exportação. A primeira linha é entregue
+    imediatamente; as seguintes são agrupadas em blocos de aproximadamente
+    tamanho_bloco caracteres.
+    """
+    buffer = io.StringIO()
+    escritor = None
+    if formato == 'csv':
+        escritor = csv.DictWriter(buffer, fieldnames=CABECALHOS_EXPORTACAO)
+        escritor.writeheader()
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    
+    total = 0
+    primeiro = True
+    for tarefa in tarefas:
+        if escritor:
+            escritor.writerow(_linha_csv_exportacao(tarefa))
+        else:
+            buffer.write(_linha_jsonl_exportacao(tarefa))
+        total += 1
+        
+        if primeiro or buffer.tell() >= tamanho_bloco:
+            primeiro = False
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    if buffer.tell():
+        yield buffer.getvalue()
+    log_operacao("GerenciamentoTarefas", "Tarefas exportadas", f"Formato: {formato}, Linhas: {total}")
+
+def gt_exportar_tarefas_fluxo(gt: Dict[str, Any], formato: str = 'csv',
+                              tarefas: Optional[Iterable[Dict[str, Any]]] = None,
+                              tamanho_bloco: int = TAMANHO_BLOCO_EXPORTACAO):
+    """
+    Exporta tarefas como um fluxo de blocos de texto em CSV ou JSONL.
+    
+    As linhas são geradas sob demanda, de modo que o consumo de memória não
+    depende da quantidade de tarefas exportadas.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        formato (str): 'csv' ou 'jsonl'
+        tarefas (Iterable[Dict], optional): Tarefas a exportar (padrão: fotografia das registradas, ver tarefa_snapshot)
+        tamanho_bloco (int): Tamanho aproximado, em caracteres, de cada bloco gerado
+        
+    Returns:
+        Iterator[str]: Gerador dos blocos exportados, ou None em caso de erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao exportar tarefas", "Ponteiro GT nulo")
+        return None
+    
+    if formato not in FORMATOS_EXPORTACAO:
+        log_operacao("GerenciamentoTarefas", "Erro ao exportar tarefas", f"Formato inválido: {formato}")
+        return None
+    
+    if tarefas is None:
+        tarefas = tarefa_snapshot().tarefas
+    
+    return _gerar_exportacao(tarefas, formato, max(1, tamanho_bloco))
+
+# Critérios aceitos em gt_exportar_tarefas_particionado
+MODOS_PARTICIONAMENTO = ('id', 'time')
+
+# Método de início dos processos do pool. Sem fork: a exportação é chamada de
+# processos com outras threads em execução (servidor web, jobs), e um filho
+# criado por fork herdaria locks mantidos por elas no instante do fork
+_METODO_INICIO_POOL = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+# As datas das linhas brutas são enviadas como microssegundos desde _EPOCA_EXPORTACAO:
+# serializar um inteiro custa uma fração do que custa serializar um datetime
+_EPOCA_EXPORTACAO = datetime(1970, 1, 1)
+_MICROSSEGUNDO = timedelta(microseconds=1)
+
+def _data_bruta(data: Any) -> Any:
+    """Converte uma data sem fuso em microssegundos desde _EPOCA_EXPORTACAO (outros valores são mantidos)."""
+    try:
+        return (data - _EPOCA_EXPORTACAO) // _MICROSSEGUNDO
+    except TypeError:
+        return data  # None ou data com fuso
+
+def _formatar_data_bruta(valor: Any) -> str:
+    """Formata uma data de _data_bruta como str(datetime)."""
+    return str(_EPOCA_EXPORTACAO + valor * _MICROSSEGUNDO) if type(valor) is int else str(valor)
+
+def _linha_bruta_exportacao(tarefa: Dict[str, Any]) -> tuple:
+    """
+    Extrai os valores exportados de uma tarefa em uma tupla barata de
+    serializar, na ordem de CABECALHOS_EXPORTACAO. É o único trabalho por
+    tarefa do processo principal na exportação particionada; a formatação
+    fica com os processos do pool (ver _formatar_linha_bruta).
+    """
+    return (
+        tarefa['id'], tarefa['titulo'], tarefa['descricao'], tarefa['status'],
+        tarefa['usuario_responsavel_id'], _data_bruta(tarefa['prazo']), tuple(tarefa['tags']),
+        _data_bruta(tarefa['data_criacao']), _data_bruta(tarefa['data_modificacao'])
+    )
+
+def _formatar_linha_bruta(linha: tuple) -> list:
+    """Formata uma linha bruta com os mesmos valores de _linha_csv_exportacao."""
+    tarefa_id, titulo, descricao, status, usuario_id, prazo, tags, criacao, modificacao = linha
+    return [
+        tarefa_id, titulo, descricao, status.value if hasattr(status, 'value') else str(status),
+        usuario_id, _formatar_data_bruta(prazo), ', '.join(map(str, tags)),
+        _formatar_data_bruta(criacao), _formatar_data_bruta(modificacao)
+    ]
+
+def _exportar_particao(caminho: str, linhas: List[tuple], anexar: bool = False) -> Tuple[str, int]:
+    """
+    Escreve um bloco de uma parte do CSV de exportação. Executada nos processos do pool.
+    
+    Args:
+        caminho (str): Caminho do arquivo da parte
+        linhas (List[tuple]): Linhas brutas do bloco (ver _linha_bruta_exportacao)
+        anexar (bool): Se True, acrescenta o bloco à parte; senão, cria a parte com o cabeçalho
+        
+    Returns:
+        Tuple[str, int]: Caminho escrito e quantidade de linhas
+    """
+    with open(caminho, 'a' if anexar else 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        if not anexar:
+            escritor.writerow(CABECALHOS_EXPORTACAO)
+        escritor.writerows(map(_formatar_linha_bruta, linhas))
+    return caminho, len(linhas)
+
+def _particionar_por_id(tarefas: List[Dict[str, Any]], num_particoes: int) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Divide as tarefas, ordenadas por ID, em faixas contíguas de tamanho igual.
+    
+    Returns:
+        List[Tuple[Dict, List[Dict]]]: (descrição da parte, tarefas da parte)
+    """
+    tarefas = sorted(tarefas, key=lambda tarefa: tarefa['id'])
+    tamanho = -(-len(tarefas) // num_particoes) or 1
+    particoes = []
+    for inicio in range(0, len(tarefas), tamanho):
+        faixa = tarefas[inicio:inicio + tamanho]
+        particoes.append(({'id_inicial': faixa[0]['id'], 'id_final': faixa[-1]['id']}, faixa))
+    return particoes
+
+def _particionar_por_time(tarefas: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Agrupa as tarefas pelo time do usuário responsável. Uma tarefa cujo
+    responsável participa de vários times vai para o primeiro deles; as de
+    responsáveis sem time ficam na parte 'sem_time'.
+    
+    Returns:
+        List[Tuple[Dict, List[Dict]]]: (descrição da parte, tarefas da parte)
+    """
+    time_do_usuario = {}
+    nomes_times = {}
+    for time in time_listar_todos():
+        if not time:
+            continue  # time já destruído
+        nomes_times[time['id']] = time['nome']
+        for usuario_id in time['membros']:
+            time_do_usuario.setdefault(usuario_id, time['id'])
+    
+    grupos = {}
+    for tarefa in tarefas:
+        time_id = time_do_usuario.get(tarefa['usuario_responsavel_id'])
+        grupos.setdefault(time_id, []).append(tarefa)
+    
+    return [
+        ({'time_id': time_id, 'time_nome': nomes_times.get(time_id, 'sem_time')}, grupo)
+        for time_id, grupo in grupos.items()
+    ]
+
+def _concatenar_partes(caminhos: List[str], destino: str) -> None:
+    """Concatena as partes em destino, mantendo um único cabeçalho, e as remove."""
+    with open(destino, 'w', newline='', encoding='utf-8') as saida:
+        csv.writer(saida).writerow(CABECALHOS_EXPORTACAO)
+        for caminho in caminhos:
+            with open(caminho, 'r', newline='', encoding='utf-8') as parte:
+                parte.readline()  # cabeçalho da parte
+                shutil.copyfileobj(parte, saida)
+            os.remove(caminho)
+
+def gt_exportar_tarefas_particionado(gt: Dict[str, Any], nome_arquivo: str, particionar_por: str = 'id',
+                                     num_processos: Optional[int] = None, concatenar: bool = False,
+                                     callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                     diretorio: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Exporta as tarefas para CSV em paralelo, particionando-as por faixa de ID
+    ou por time e serializando cada parte em um processo do pool.
+    
+    Os processos do pool não são criados por fork (ver _METODO_INICIO_POOL):
+    cada parte é enviada a eles explicitamente, como linhas brutas. O processo
+    principal apenas extrai essas linhas (tuplas de tipos simples, com as datas
+    em microssegundos, ver _linha_bruta_exportacao) e as serializa; a
+    formatação e a escrita do CSV ocorrem nos processos do pool. Cada parte é
+    enviada em blocos de TAMANHO_BLOCO_PARTICAO linhas, montados só no momento
+    do envio, com no máximo um bloco pendente por parte e num_processos no
+    total: a memória usada com as cópias enviadas não depende da quantidade de
+    tarefas.
+    O script que chama esta função deve proteger o ponto de entrada com
+    if __name__ == '__main__', pois o módulo principal é importado pelos processos.
+    
+    Sem concatenação, são gerados os arquivos '<nome>.part-NNNN.csv' e um
+    manifesto '<nome>.manifest.json' com a descrição de cada parte; com
+    concatenação, as partes são unidas em nome_arquivo.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        nome_arquivo (str): Nome do arquivo CSV (base dos nomes das partes)
+        particionar_por (str): 'id' (faixas de ID) ou 'time'
+        num_processos (int, optional): Processos do pool (padrão: núcleos da máquina)
+        concatenar (bool): Se True, une as partes em um único arquivo
+        callback_progresso (Callable, optional): Recebe {'partes_concluidas',
+            'partes_total', 'linhas', 'linhas_total', 'seconds'} a cada parte concluída
+        diretorio (str, optional): Diretório de saída (padrão: EXPORT_DIR)
+        
+    Returns:
+        Dict: Manifesto da exportação, ou None em caso de erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao exportar CSV", "Ponteiro GT nulo")
+        return None
+    
+    if particionar_por not in MODOS_PARTICIONAMENTO:
+        log_operacao("GerenciamentoTarefas", "Erro ao exportar CSV", f"Particionamento inválido: {particionar_por}")
+        return None
+    
+    try:
+        inicio = relogio.perf_counter()
+        diretorio = diretorio or EXPORT_DIR
+        os.makedirs(diretorio, exist_ok=True)
+        base = os.path.splitext(nome_arquivo)[0]
+        num_processos = max(1, num_processos or os.cpu_count() or 1)
+        
+        tarefas = tarefa_snapshot().tarefas
+        if particionar_por == 'id':
+            particoes = _particionar_por_id(tarefas, num_processos)
+        else:
+            particoes = _particionar_por_time(tarefas)
+        
+        partes = []
+        for numero, (descricao, _) in enumerate(particoes, 1):
+            partes.append(dict(descricao, arquivo=f"{base}.part-{numero:04d}.csv", linhas=0))
+        
+        contexto = multiprocessing.get_context(_METODO_INICIO_POOL)
+        
+        progresso = {'partes_concluidas': 0, 'partes_total': len(partes), 'linhas': 0,
+                     'linhas_total': len(tarefas), 'seconds': 0.0}
+        max_processos = min(num_processos, len(partes) or 1)
+        
+        # Partes sem bloco pendente, a posição do próximo bloco de cada parte
+        # e os blocos pendentes (futuro -> índice da parte)
+        aguardando = deque(range(len(partes)))
+        proximo = [0] * len(partes)
+        pendentes = {}
+        with ProcessPoolExecutor(max_workers=max_processos, mp_context=contexto) as pool:
+            while aguardando or pendentes:
+                while aguardando and len(pendentes) < max_processos:
+                    indice = aguardando.popleft()
+                    posicao = proximo[indice]
+                    proximo[indice] = posicao + TAMANHO_BLOCO_PARTICAO
+                    # Linhas do bloco montadas apenas agora, com um processo livre para recebê-las
+                    linhas = [_linha_bruta_exportacao(tarefa)
+                              for tarefa in particoes[indice][1][posicao:proximo[indice]]]
+                    futuro = pool.submit(_exportar_particao, os.path.join(diretorio, partes[indice]['arquivo']),
+                                         linhas, posicao > 0)
+                    pendentes[futuro] = indice
+                
+                for futuro in wait(pendentes, return_when=FIRST_COMPLETED).done:
+                    indice = pendentes.pop(futuro)
+                    _, qtd = futuro.result()
+                    partes[indice]['linhas'] += qtd
+                    progresso['linhas'] += qtd
+                    if proximo[indice] < len(particoes[indice][1]):
+                        aguardando.append(indice)
+                        continue
+                    progresso['partes_concluidas'] += 1
+                    progresso['seconds'] = round(relogio.perf_counter() - inicio, 3)
+                    if callback_progresso:
+                        callback_progresso(progresso)
+        
+        manifesto = {
+            'arquivo': nome_arquivo,
+            'particionamento': particionar_por,
+            'gerado_em': datetime.now().isoformat(),
+            'total_linhas': progresso['linhas'],
+            'partes': partes
+        }
+        
+        if concatenar:
+            _concatenar_partes([os.path.join(diretorio, parte['arquivo']) for parte in partes],
+                               os.path.join(diretorio, nome_arquivo))
+            manifesto['partes'] = []
+        
+        manifesto['seconds'] = round(relogio.perf_counter() - inicio, 3)
+        if not concatenar:
+            with open(os.path.join(diretorio, f"{base}.manifest.json"), 'w', encoding='utf-8') as arquivo:
+                json.dump(manifesto, arquivo, ensure_ascii=False, indent=2)
+        
+        log_operacao("GerenciamentoTarefas", "CSV exportado em paralelo",
+                     f"Arquivo: {nome_arquivo}, Partes: {len(partes)}, Linhas: {manifesto['total_linhas']}, "
+                     f"{manifesto['seconds']}s")
+        return manifesto
+        
+    except Exception as e:
+        log_operacao("GerenciamentoTarefas", "Erro ao exportar CSV", f"Falha: {str(e)}")
+        return None
+
+# Agrupamentos aceitos em gt_agregar_tarefas; week(campo) aceita os campos de CAMPOS_ORDENACAO
+AGRUPAMENTOS_AGREGACAO = ('status', 'usuario_responsavel_id', 'tag', 'team') + \
+    tuple(f'week({campo})' for campo in CAMPOS_ORDENACAO)
+
+# Resultados de gt_agregar_tarefas, válidos enquanto as versões dos registros não mudarem
+_cache_agregacoes: Dict[Tuple[str, ...], Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+
+def _semana_iso(data: Optional[datetime]) -> Optional[str]:
+    """Retorna a semana ISO de uma data no formato 'AAAA-Www'."""
+    if data is None:
+        return None
+    ano, semana, _ = data.isocalendar()
+    return f"{ano}-W{semana:02d}"
+
+def _extrator_agregacao(agrupamento: str) -> Callable[[Dict[str, Any]], Iterable[Any]]:
+    """
+    Monta a função que extrai os valores de um agrupamento de uma tarefa.
+    
+    Cada extrator retorna uma sequência: tags e times são multivalorados, e a
+    tarefa é contada uma vez em cada valor (ou em None, se não houver nenhum).
+    """
+    if agrupamento == 'status':
+        return lambda tarefa: (_valor_status_exportacao(tarefa),)
+    if agrupamento == 'usuario_responsavel_id':
+        return lambda tarefa: (tarefa['usuario_responsavel_id'],)
+    if agrupamento == 'tag':
+        return lambda tarefa: tarefa['tags'] or (None,)
+    if agrupamento == 'team':
+        # Times de cada usuário, montados uma única vez por agregação
+        times_do_usuario = {}
+        for time in time_listar_todos():
+            if not time:
+                continue  # time já destruído
+            for usuario_id in time['membros']:
+                times_do_usuario.setdefault(usuario_id, []).append(time['id'])
+        return lambda tarefa: times_do_usuario.get(tarefa['usuario_responsavel_id']) or (None,)
+    
+    campo = agrupamento[len('week('):-1]
+    return lambda tarefa: (_semana_iso(tarefa[campo]),)
+
+def gt_agregar_tarefas(gt: Dict[str, Any], agrupamentos: List[str]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Conta as tarefas registradas agrupadas pelos critérios informados.
+    
+    A contagem é feita em uma única passagem pelas tarefas; o agrupamento
+    apenas por status usa as contagens mantidas pelo módulo Tarefa. Os
+    resultados são reaproveitados enquanto as versões dos registros de
+    tarefas e times não mudarem.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        agrupamentos (List[str]): Critérios de AGRUPAMENTOS_AGREGACAO, ex.: ['status', 'tag']
+        
+    Returns:
+        List[Dict]: Um dicionário por grupo, com os valores de cada critério e
+        'count', em ordem decrescente de contagem; None em caso de erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao agregar tarefas", "Ponteiro GT nulo")
+        return None
+    
+    agrupamentos = tuple(agrupamentos or ())
+    invalidos = [a for a in agrupamentos if a not in AGRUPAMENTOS_AGREGACAO]
+    if not agrupamentos or invalidos or len(set(agrupamentos)) != len(agrupamentos):
+        log_operacao("GerenciamentoTarefas", "Erro ao agregar tarefas", f"Agrupamento inválido: {', '.join(agrupamentos)}")
+        return None
+    
+    try:
+        versoes = (tarefa_versao(), time_versao())
+        em_cache = _cache_agregacoes.get(agrupamentos)
+        if em_cache is not None and em_cache[0] == versoes:
+            return em_cache[1]
+        
+        if agrupamentos == ('status',):
+            contagens = Counter({(status.value,): qtd for status, qtd in tarefa_contagem_por_status().items() if qtd})
+        else:
+            # Uma chave por combinação dos valores de cada critério (tags e times
+            # podem gerar várias por tarefa), contadas em uma única passagem
+            extratores = [_extrator_agregacao(a) for a in agrupamentos]
+            contagens = Counter(chain.from_iterable(
+                product(*[extrator(tarefa) for extrator in extratores])
+                for tarefa in tarefa_snapshot().tarefas
+            ))
+        
+        grupos = [
+            dict(zip(agrupamentos, chave), count=qtd)
+            for chave, qtd in sorted(contagens.items(), key=lambda item: (-item[1], str(item[0])))
+        ]
+        _cache_agregacoes[agrupamentos] = (versoes, grupos)
+        return grupos
+        
+    except Exception as e:
+        log_operacao("GerenciamentoTarefas", "Erro ao agregar tarefas", f"Falha: {str(e)}")
+        return None
+
+# Operações aceitas em gt_aplicar_lote_tarefas
+OPERACOES_LOTE = ('create', 'update', 'delete')
+
+# Campos que podem ser alterados por uma operação 'update' em lote
+CAMPOS_ALTERAVEIS_LOTE = ('titulo', 'descricao', 'prazo', 'status', 'tags')
+
+def _parse_prazo(valor) -> Optional[datetime]:
+    """
+    Converte um prazo recebido (datetime ou string ISO 8601) em datetime.
+    
+    Args:
+        valor: Prazo a ser convertido
+        
+    Returns:
+        datetime ou None: Prazo convertido ou None se inválido
+    """
+    if isinstance(valor, datetime):
+        return valor
+    if isinstance(valor, str):
+        try:
+            return datetime.fromisoformat(valor.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return None
+
+def _texto_valido(valor, tamanho_max: int) -> bool:
+    """Verifica se o valor é uma string não vazia dentro do tamanho máximo"""
+    return isinstance(valor, str) and bool(valor.strip()) and len(valor) <= tamanho_max
+
+def _registrada(entidade: Optional[Dict[str, Any]]) -> bool:
+    """Verifica se a entidade encontrada não foi destruída (destruir limpa o dicionário)"""
+    return entidade is not None and 'id' in entidade
+
+def _resolver_tags_lote(tags_ids) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Resolve uma lista de IDs de tags para as tags registradas.
+    
+    Returns:
+        Tuple: (tags resolvidas, None) ou (None, mensagem de erro)
+    """
+    if not isinstance(tags_ids, list):
+        return None, "Campo tags deve ser uma lista de IDs"
+    
+    tags = []
+    for tag_id in dict.fromkeys(tags_ids):
+        tag = tag_buscar_por_id(tag_id)
+        if not _registrada(tag):
+            return None, f"Tag {tag_id} não encontrada"
+        tags.append(tag)
+    return tags, None
+
+def _validar_operacao_lote(operacao: Any,
+                           removidas: Optional[Set[int]] = None) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Valida uma operação do lote e resolve suas referências por busca direta nos
+    registros (sem varrer as listas de usuários, times e tags).
+    
+    Args:
+        operacao (Dict): Operação recebida ({'op': 'create'|'update'|'delete', ...})
+        removidas (Set[int], optional): IDs removidos pelas operações anteriores do
+            lote; uma remoção válida acrescenta o seu
+        
+    Returns:
+        Tuple: (plano pronto para aplicação, None) ou (None, mensagem de erro)
+    """
+    if not isinstance(operacao, dict):
+        return None, "Operação deve ser um objeto"
+    
+    tipo = operacao.get('op')
+    if tipo not in OPERACOES_LOTE:
+        return None, f"Operação inválida. Use: {', '.join(OPERACOES_LOTE)}"
+    
+    if tipo == 'create':
+        for campo in ('titulo', 'descricao', 'usuario_responsavel_id', 'prazo'):
+            if campo not in operacao:
+                return None, f"Campo obrigatório: {campo}"
+        
+        if not _texto_valido(operacao['titulo'], MAX_TITULO_LENGTH):
+            return None, "Título inválido"
+        if not _texto_valido(operacao['descricao'], MAX_DESCRICAO_LENGTH):
+            return None, "Descrição inválida"
+        
+        prazo = _parse_prazo(operacao['prazo'])
+        if prazo is None:
+            return None, "Formato de prazo inválido. Use ISO 8601"
+        
+        usuario = usuario_buscar_por_id(operacao['usuario_responsavel_id'])
+        if not _registrada(usuario):
+            return None, "Usuário responsável não encontrado"
+        
+        tags, erro = _resolver_tags_lote(operacao.get('tags', []))
+        if erro:
+            return None, erro
+        
+        status = None
+        if operacao.get('status') is not None:
+            try:
+                status = StatusTarefa(operacao['status'])
+            except ValueError:
+                return None, "Status inválido"
+        
+        return {'op': tipo, 'titulo': operacao['titulo'], 'descricao': operacao['descricao'],
+                'usuario': usuario, 'tags': tags, 'prazo': prazo, 'status': status}, None
+    
+    if 'id' not in operacao:
+        return None, "Campo obrigatório: id"
+    
+    tarefa = tarefa_buscar_por_id(operacao['id'])
+    if not _registrada(tarefa) or (removidas is not None and tarefa_get_id(tarefa) in removidas):
+        return None, "Tarefa não encontrada"
+    
+    if tipo == 'delete':
+        if removidas is not None:
+            removidas.add(tarefa_get_id(tarefa))
+        return {'op': tipo, 'tarefa': tarefa}, None
+    
+    alteracoes = {}
+    for campo in CAMPOS_ALTERAVEIS_LOTE:
+        if campo not in operacao:
+            continue
+        valor = operacao[campo]
+        if campo == 'titulo' and not _texto_valido(valor, MAX_TITULO_LENGTH):
+            return None, "Título inválido"
+        if campo == 'descricao' and not _texto_valido(valor, MAX_DESCRICAO_LENGTH):
+            return None, "Descrição inválida"
+        if campo == 'prazo':
+            valor = _parse_prazo(valor)
+            if valor is None:
+                return None, "Formato de prazo inválido. Use ISO 8601"
+        if campo == 'status':
+            try:
+                valor = StatusTarefa(valor)
+            except ValueError:
+                return None, "Status inválido"
+        if campo == 'tags':
+            valor, erro = _resolver_tags_lote(valor)
+            if erro:
+                return None, erro
+        alteracoes[campo] = valor
+    
+    if not alteracoes:
+        return None, f"Nenhum campo para alterar. Use: {', '.join(CAMPOS_ALTERAVEIS_LOTE)}"
+    
+    return {'op': tipo, 'tarefa': tarefa, 'alteracoes': alteracoes}, None
+
+def _aplicar_operacao_lote(plano: Dict[str, Any]) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Aplica uma operação já validada.
+    
+    Returns:
+        Tuple: (ID da tarefa, None) ou (None, mensagem de erro)
+    """
+    tipo = plano['op']
+    
+    if tipo == 'create':
+        tarefa = tarefa_criar(plano['titulo'], plano['descricao'], plano['usuario'], plano['prazo'])
+        if tarefa is None:
+            return None, "Falha ao criar tarefa"
+        for tag in plano['tags']:
+            tarefa_add_tag(tarefa, tag)
+        if plano['status'] is not None:
+            tarefa_set_status(tarefa, plano['status'])
+        if tarefa_registrar(tarefa) != SUCESSO:
+            return None, "Falha no registro da tarefa"
+        return tarefa_get_id(tarefa), None
+    
+    tarefa = plano['tarefa']
+    tarefa_id = tarefa_get_id(tarefa)
+    # A tarefa pode ter sido removida por uma operação anterior do mesmo lote
+    if tarefa_id is None or tarefa_buscar_por_id(tarefa_id) is not tarefa:
+        return None, "Tarefa não encontrada"
+    
+    if tipo == 'delete':
+        tarefa_remover(tarefa_id)
+        tarefa_destruir(tarefa)
+        return tarefa_id, None
+    
+    setters = {
+        'titulo': tarefa_set_titulo,
+        'descricao': tarefa_set_descricao,
+        'prazo': tarefa_set_prazo,
+        'status': tarefa_set_status
+    }
+    for campo, valor in plano['alteracoes'].items():
+        if campo == 'tags':
+            atuais = tarefa_get_tags_ids(tarefa)
+            novas = {tag_get_id(tag) for tag in valor}
+            for tag_id in atuais:
+                if tag_id not in novas:
+                    tarefa_remover_tag(tarefa, tag_id)
+            for tag in valor:
+                if tag_get_id(tag) not in atuais:
+                    tarefa_add_tag(tarefa, tag)
+        elif setters[campo](tarefa, valor) != SUCESSO:
+            return None, f"Falha ao alterar {campo}"
+    
+    return tarefa_id, None
+
+def gt_aplicar_lote_tarefas(gt: Dict[str, Any], operacoes: List[Dict[str, Any]],
+                            tudo_ou_nada: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """
+    Aplica um lote de operações de criação, alteração e remoção de tarefas.
+    Operação realizada apenas em memória - não salva no JSON.
+    
+    Todo o lote é validado antes de qualquer alteração, com usuários, times e
+    tags resolvidos por busca direta nos registros. As operações válidas são
+    aplicadas, na ordem recebida, com uma única aquisição do lock do registro
+    de tarefas.
+    
+    No modo tudo ou nada, a validação é feita sob esse mesmo lock e considera
+    as remoções das operações anteriores do lote (uma alteração de tarefa
+    removida antes no lote é inválida), de modo que um lote validado é
+    aplicado por inteiro.
+    
+    Cada operação é um dicionário com a chave 'op':
+    - 'create': titulo, descricao, usuario_responsavel_id, prazo; tags e status opcionais
+      (a tarefa não é associada a um time, diferente de gt_criar_tarefa)
+    - 'update': id e os campos a alterar (titulo, descricao, prazo, status, tags)
+    - 'delete': id
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        operacoes (List[Dict]): Operações a serem aplicadas
+        tudo_ou_nada (bool): Se True, nada é aplicado quando alguma operação for inválida
+        
+    Returns:
+        List[Dict] ou None: Resultado por operação ({'index', 'op', 'success', 'id' ou 'error'})
+        ou None em caso de erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao aplicar lote", "Ponteiro GT nulo")
+        return None
+    
+    if not isinstance(operacoes, list):
+        log_operacao("GerenciamentoTarefas", "Erro ao aplicar lote", "Operações devem ser uma lista")
+        return None
+    
+    if len(operacoes) > MAX_OPERACOES_LOTE:
+        log_operacao("GerenciamentoTarefas", "Erro ao aplicar lote", f"Lote muito grande (max {MAX_OPERACOES_LOTE})")
+        return None
+    
+    try:
+        # Valida todo o lote antes de alterar qualquer tarefa (fora do lock no
+        # modo parcial: a aplicação confere se a tarefa ainda está registrada)
+        planos = None if tudo_ou_nada else [_validar_operacao_lote(operacao) for operacao in operacoes]
+        
+        resultados = []
+        with tarefa_lock_registro():
+            if planos is None:
+                removidas = set()
+                planos = [_validar_operacao_lote(operacao, removidas) for operacao in operacoes]
+            invalido = any(erro for _, erro in planos)
+            
+            for indice, (plano, erro) in enumerate(planos):
+                tipo = operacoes[indice].get('op') if isinstance(operacoes[indice], dict) else None
+                if erro is None and tudo_ou_nada and invalido:
+                    erro = "Não aplicada: o lote contém operações inválidas"
+                if erro is None:
+                    tarefa_id, erro = _aplicar_operacao_lote(plano)
+                if erro is None:
+                    resultados.append({'index': indice, 'op': tipo, 'success': True, 'id': tarefa_id})
+                else:
+                    resultados.append({'index': indice, 'op': tipo, 'success': False, 'error': erro})
+        
+        falhas = sum(1 for resultado in resultados if not resultado['success'])
+        log_operacao("GerenciamentoTarefas", "Lote aplicado", f"Operações: {len(resultados)}, Falhas: {falhas}")
+        return resultados
+        
+    except Exception as e:
+        log_operacao("GerenciamentoTarefas", "Erro ao aplicar lote", f"Falha: {str(e)}")
+        return None
+
+# Formatos aceitos pela importação
+FORMATOS_IMPORTACAO = ('jsonl', 'csv')
+
+# Cabeçalhos aceitos na importação (inclusive os gerados por gt_exportar_tarefas_csv),
+# normalizados com casefold
+_CAMPOS_IMPORTACAO = {
+    'titulo': 'titulo', 'título': 'titulo',
+    'descricao': 'descricao', 'descrição': 'descricao',
+    'status': 'status',
+    'prazo': 'prazo',
+    'usuario_responsavel_id': 'usuario_responsavel_id', 'usuário responsável': 'usuario_responsavel_id',
+    'usuario': 'usuario', 'usuário': 'usuario',
+    'tags': 'tags'
+}
+
+# Quantidade máxima de erros detalhados no resumo da importação
+MAX_ERROS_RESUMO = 100
+
+def _mapas_importacao() -> Dict[str, Dict[str, int]]:
+    """
+    Monta os mapas de resolução de nomes usados na importação
+    (email/nome de usuário -> ID e nome de tag -> ID), uma única vez por importação.
+    """
+    usuarios_email = {}
+    usuarios_nome = {}
+    for usuario in usuario_listar_todos():
+        if not usuario:
+            continue  # usuário já destruído
+        usuarios_email[usuario_get_email(usuario).casefold()] = usuario_get_id(usuario)
+        usuarios_nome.setdefault(usuario_get_nome(usuario).casefold(), usuario_get_id(usuario))
+    
+    tags_nome = {}
+    for tag in tag_listar_todas():
+        if not tag:
+            continue  # tag já destruída
+        tags_nome.setdefault(tag_get_nome(tag).casefold(), tag_get_id(tag))
+    
+    return {'usuarios_email': usuarios_email, 'usuarios_nome': usuarios_nome, 'tags_nome': tags_nome}
+
+def _linha_para_operacao(linha: Dict[str, Any], mapas: Dict[str, Dict[str, int]]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Converte uma linha importada em uma operação 'create' de gt_aplicar_lote_tarefas,
+    resolvendo usuário e tags informados por nome.
+    
+    Returns:
+        Tuple: (operação, None) ou (None, mensagem de erro)
+    """
+    if not isinstance(linha, dict):
+        return None, "Linha deve ser um objeto"
+    
+    dados = {}
+    for chave, valor in linha.items():
+        campo = _CAMPOS_IMPORTACAO.get(str(chave).strip().casefold())
+        if campo and valor not in (None, ''):
+            dados[campo] = valor.strip() if isinstance(valor, str) else valor
+    
+    operacao = {'op': 'create'}
+    for campo in ('titulo', 'descricao', 'prazo', 'status'):
+        if campo in dados:
+            operacao[campo] = dados[campo]
+    
+    try:
+        if 'usuario_responsavel_id' in dados:
+            operacao['usuario_responsavel_id'] = int(dados['usuario_responsavel_id'])
+        elif 'usuario' in dados:
+            chave = str(dados['usuario']).casefold()
+            usuario_id = mapas['usuarios_email'].get(chave, mapas['usuarios_nome'].get(chave))
+            if usuario_id is None:
+                return None, f"Usuário '{dados['usuario']}' não encontrado"
+            operacao['usuario_responsavel_id'] = usuario_id
+    except (TypeError, ValueError):
+        return None, "ID de usuário deve ser inteiro"
+    
+    tags = dados.get('tags', [])
+    if isinstance(tags, str):
+        tags = [tag for tag in tags.replace(';', ',').split(',') if tag.strip()]
+    if not isinstance(tags, list):
+        return None, "Campo tags deve ser uma lista"
+    
+    operacao['tags'] = []
+    for tag in tags:
+        if isinstance(tag, int) or (isinstance(tag, str) and tag.strip().isdigit()):
+            operacao['tags'].append(int(tag))
+            continue
+        tag_id = mapas['tags_nome'].get(str(tag).strip().casefold())
+        if tag_id is None:
+            return None, f"Tag '{tag}' não encontrada"
+        operacao['tags'].append(tag_id)
+    
+    return operacao, None
+
+def _ler_linhas_importacao(linhas: Iterable[str], formato: str):
+    """
+    Gera (número da linha, linha decodificada ou None, erro) a partir do fluxo de
+    entrada, sem carregá-lo inteiro em memória.
+    """
+    if formato == 'csv':
+        leitor = csv.DictReader(linhas)
+        for linha in leitor:
+            yield leitor.line_num, linha, None
+        return
+    
+    for numero, texto in enumerate(linhas, 1):
+        if not texto.strip():
+            continue
+        try:
+            yield numero, json.loads(texto), None
+        except ValueError as e:
+            yield numero, None, f"JSON inválido: {e}"
+
+def gt_importar_tarefas(gt: Dict[str, Any], linhas: Iterable[str], formato: str,
+                        tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO,
+                        callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Importa tarefas de um fluxo JSONL ou CSV.
+    Operação realizada apenas em memória - não salva no JSON.
+    
+    As linhas são lidas sob demanda, validadas em lotes de tamanho_lote e
+    registradas via gt_aplicar_lote_tarefas, de modo que a memória usada é
+    limitada pelo tamanho do lote. Usuários podem ser informados por ID
+    (usuario_responsavel_id) ou por email/nome (usuario), e tags por ID ou
+    nome; os nomes são resolvidos por mapas montados uma única vez. Os
+    cabeçalhos gerados por gt_exportar_tarefas_csv também são aceitos.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        linhas (Iterable[str]): Fluxo de texto (arquivo aberto, upload, lista de linhas)
+        formato (str): 'jsonl' ou 'csv'
+        tamanho_lote (int): Quantidade de linhas validadas e registradas por lote
+        callback_progresso (Callable, optional): Recebe o resumo parcial após cada lote
+        
+    Returns:
+        Dict ou None: Resumo ('read', 'imported', 'failed', 'errors', 'seconds',
+        'rows_per_second') ou None em caso de erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao importar tarefas", "Ponteiro GT nulo")
+        return None
+    
+    if formato not in FORMATOS_IMPORTACAO:
+        log_operacao("GerenciamentoTarefas", "Erro ao importar tarefas", f"Formato inválido: {formato}")
+        return None
+    
+    tamanho_lote = max(1, min(tamanho_lote, MAX_OPERACOES_LOTE))
+    inicio = relogio.perf_counter()
+    resumo = {'read': 0, 'imported': 0, 'failed': 0, 'errors': [], 'seconds': 0.0, 'rows_per_second': 0.0}
+    
+    def registrar_erro(numero, erro):
+        resumo['failed'] += 1
+        if len(resumo['errors']) < MAX_ERROS_RESUMO:
+            resumo['errors'].append({'line': numero, 'error': erro})
+    
+    def aplicar(lote):
+        operacoes = [operacao for _, operacao in lote]
+        resultados = gt_aplicar_lote_tarefas(gt, operacoes)
+        if resultados is None:
+            for numero, _ in lote:
+                registrar_erro(numero, "Falha ao aplicar lote")
+            return
+        for (numero, _), resultado in zip(lote, resultados):
+            if resultado['success']:
+                resumo['imported'] += 1
+            else:
+                registrar_erro(numero, resultado['error'])
+    
+    def atualizar_tempos():
+        decorrido = relogio.perf_counter() - inicio
+        resumo['seconds'] = round(decorrido, 3)
+        if decorrido > 0:
+            resumo['rows_per_second'] = round(resumo['read'] / decorrido, 1)
+    
+    try:
+        mapas = _mapas_importacao()
+        lote = []
+        for numero, linha, erro in _ler_linhas_importacao(linhas, formato):
+            resumo['read'] += 1
+            if erro is None:
+                operacao, erro = _linha_para_operacao(linha, mapas)
+            if erro is not None:
+                registrar_erro(numero, erro)
+                continue
+            
+            lote.append((numero, operacao))
+            if len(lote) >= tamanho_lote:
+                aplicar(lote)
+                lote = []
+                atualizar_tempos()
+                if callback_progresso:
+                    callback_progresso(resumo)
+        
+        if lote:
+            aplicar(lote)
+        atualizar_tempos()
+        if callback_progresso and (lote or resumo['read'] % tamanho_lote):
+            callback_progresso(resumo)
+        
+        log_operacao("GerenciamentoTarefas", "Tarefas importadas",
+                     f"Lidas: {resumo['read']}, Importadas: {resumo['imported']}, "
+                     f"Falhas: {resumo['failed']}, {resumo['rows_per_second']} linhas/s")
+        return resumo
+        
+    except Exception as e:
+        log_operacao("GerenciamentoTarefas", "Erro ao importar tarefas", f"Falha: {str(e)}")
+        return None
+
+def gt_importar_tarefas_arquivo(gt: Dict[str, Any], caminho: str, formato: Optional[str] = None,
+                                tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO,
+                                callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Importa tarefas de um arquivo local JSONL ou CSV (ver gt_importar_tarefas).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        caminho (str): Caminho do arquivo
+        formato (str, optional): 'jsonl' ou 'csv' (padrão: deduzido da extensão)
+        tamanho_lote (int): Quantidade de linhas validadas e registradas por lote
+        callback_progresso (Callable, optional): Recebe o resumo parcial após cada lote
+        
+    Returns:
+        Dict ou None: Resumo da importação ou None em caso de erro
+    """
+    if formato is None:
+        extensao = os.path.splitext(caminho)[1].lower().lstrip('.')
+        formato = 'jsonl' if extensao in ('jsonl', 'ndjson') else extensao
+    
+    try:
+        with open(caminho, 'r', newline='', encoding='utf-8-sig') as arquivo:
+            return gt_importar_tarefas(gt, arquivo, formato, tamanho_lote, callback_progresso)
+    except OSError as e:
+        log_operacao("GerenciamentoTarefas", "Erro ao importar tarefas", f"Falha ao abrir {caminho}: {str(e)}")
+        return None
+
+def gt_salvar(gt: Dict[str, Any]) -> bool:
+    """
+    Salva os dados de todas as entidades nos JSONs sem finalizar o sistema.
+    Reescreve os arquivos a partir das estruturas em memória, descartando
+    das gravações as entidades removidas desde o último salvamento.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        
+    Returns:
+        bool: True se todos os dados foram salvos, False caso contrário
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao salvar", "Ponteiro GT nulo")
+        return False
+    
+    salvos = [usuario_salvar_dados(), tag_salvar_dados(), time_salvar_dados(), tarefa_salvar_dados()]
+    if all(salvos):
+        log_operacao("GerenciamentoTarefas", "Dados salvos", "Todas as entidades")
+        return True
+    log_operacao("GerenciamentoTarefas", "Erro ao salvar", "Falha na persistência de alguma entidade")
+    return False
+
+def gt_exportar_tarefas_arquivo(gt: Dict[str, Any], nome_arquivo: str, formato: str = 'csv',
+                                callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                diretorio: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Exporta as tarefas para um arquivo CSV ou JSONL, gravando
+    os blocos de gt_exportar_tarefas_fluxo à medida que são gerados.
+    
+    As tarefas exportadas são as da fotografia do início da exportação (ver
+    tarefa_snapshot). Se a exportação falhar ou for interrompida (por uma
+    exceção levantada pelo callback), o arquivo parcial é removido.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        nome_arquivo (str): Nome do arquivo de saída (sem caminho)
+        formato (str): 'csv' ou 'jsonl'
+        callback_progresso (Callable, optional): Recebe {'linhas', 'linhas_total',
+            'seconds'} a cada bloco gravado
+        diretorio (str, optional): Diretório de saída (padrão: EXPORT_DIR)
+        
+    Returns:
+        Dict ou None: {'arquivo', 'formato', 'total_linhas', 'seconds'} ou None em caso de erro
+    """
+    tarefas = tarefa_snapshot().tarefas
+    progresso = {'linhas': 0, 'linhas_total': len(tarefas), 'seconds': 0.0}
+    
+    def contar(tarefas):
+        for tarefa in tarefas:
+            progresso['linhas'] += 1
+            yield tarefa
+    
+    blocos = gt_exportar_tarefas_fluxo(gt, formato, contar(tarefas))
+    if blocos is None:
+        return None
+    
+    diretorio = diretorio or EXPORT_DIR
+    caminho = os.path.join(diretorio, os.path.basename(nome_arquivo))
+    inicio = relogio.perf_counter()
+    try:
+        os.makedirs(diretorio, exist_ok=True)
+        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+            for bloco in blocos:
+                arquivo.write(bloco)
+                progresso['seconds'] = round(relogio.perf_counter() - inicio, 3)
+                if callback_progresso:
+                    callback_progresso(progresso)
+        
+        log_operacao("GerenciamentoTarefas", "Arquivo exportado",
+                     f"Arquivo: {nome_arquivo}, Linhas: {progresso['linhas']}")
+        return {
+            'arquivo': os.path.basename(nome_arquivo),
+            'formato': formato,
+            'total_linhas': progresso['linhas'],
+            'seconds': round(relogio.perf_counter() - inicio, 3)
+        }
+        
+    except Exception as e:
+        blocos.close()
+        if os.path.exists(caminho):
+            os.remove(caminho)
+        log_operacao("GerenciamentoTarefas", "Erro ao exportar arquivo", f"Arquivo: {nome_arquivo}, Falha: {str(e)}")
+        return None
+
+def gt_agendar_exportacao(gt: Dict[str, Any], nome_arquivo: str, formato: str = 'csv',
+                          diretorio: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Agenda a exportação das tarefas para um arquivo (ver
+    gt_exportar_tarefas_arquivo) como um job em segundo plano.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        nome_arquivo (str): Nome do arquivo de saída (sem caminho)
+        formato (str): 'csv' ou 'jsonl'
+        diretorio (str, optional): Diretório de saída (padrão: EXPORT_DIR)
+        
+    Returns:
+        Dict ou None: Job submetido ou None em caso de erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao agendar exportação", "Ponteiro GT nulo")
+        return None
+    
+    if formato not in FORMATOS_EXPORTACAO:
+        log_operacao("GerenciamentoTarefas", "Erro ao agendar exportação", f"Formato inválido: {formato}")
+        return None
+    
+    return job_submeter(
+        'exportacao',
+        lambda progresso: gt_exportar_tarefas_arquivo(gt, nome_arquivo, formato, progresso, diretorio),
+        {'arquivo': os.path.basename(nome_arquivo), 'formato': formato}
+    )
+
+def gt_agendar_importacao_arquivo(gt: Dict[str, Any], caminho: str, formato: Optional[str] = None,
+                                  tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO,
+                                  remover_arquivo: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Agenda a importação de um arquivo JSONL ou CSV (ver
+    gt_importar_tarefas_arquivo) como um job em segundo plano. O cancelamento
+    ocorre entre dois lotes: os lotes já registrados permanecem.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        caminho (str): Caminho do arquivo
+        formato (str, optional): 'jsonl' ou 'csv' (padrão: deduzido da extensão)
+        tamanho_lote (int): Quantidade de linhas validadas e registradas por lote
+        remover_arquivo (bool): Se True, remove o arquivo ao fim do job (uploads temporários)
+        
+    Returns:
+        Dict ou None: Job submetido ou None em caso de erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao agendar importação", "Ponteiro GT nulo")
+        return None
+    
+    def remover():
+        if os.path.exists(caminho):
+            os.remove(caminho)
+    
+    return job_submeter(
+        'importacao',
+        lambda progresso: gt_importar_tarefas_arquivo(gt, caminho, formato, tamanho_lote, progresso),
+        {'formato': formato, 'tamanho_lote': tamanho_lote},
+        remover if remover_arquivo else None
+    )
+
+def gt_agendar_salvamento(gt: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Agenda o salvamento dos dados de todas as entidades (ver gt_salvar) como
+    um job em segundo plano.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        
+    Returns:
+        Dict ou None: Job submetido ou None em caso de erro
+    """
+    if gt is None:
+        log_operacao("GerenciamentoTarefas", "Erro ao agendar salvamento", "Ponteiro GT nulo")
+        return None
+    
+    return job_submeter('salvamento', lambda progresso: {'salvo': True} if gt_salvar(gt) else None)
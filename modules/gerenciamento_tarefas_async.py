@@ -0,0 +1,390 @@
+"""
+Módulo de Gerenciamento de Tarefas - API assíncrona
+
+Fachada asyncio das funções gt_* de gerenciamento_tarefas, para uso em
+servidores ASGI e outros clientes com loop de eventos.
+
+As operações leves (registro, criação, remoção e listagens em memória) são
+executadas diretamente no loop: duram microssegundos e apenas adquirem os
+locks das estruturas encapsuladas por instantes. As operações demoradas
+(persistência, lotes, agregações, exportação e importação) são executadas em
+um pool de threads dedicado, sem bloquear o loop de eventos.
+
+Funções principais:
+- gt_inicializar_async / gt_finalizar_async: Carregam e salvam os dados no executor
+- gt_registrar_time_async / gt_registrar_usuario_async / gt_registrar_tag_async: Registros
+- gt_criar_tarefa_async / gt_remover_tarefa_async: Criação e remoção de tarefas
+- gt_listar_*_async: Listagens em memória
+- gt_aplicar_lote_tarefas_async / gt_agregar_tarefas_async: Lotes e agregações no executor
+- gt_exportar_tarefas_*_async: Exportações no executor (a em fluxo gera os blocos sob demanda)
+- gt_importar_tarefas_async / gt_importar_tarefas_arquivo_async: Importações no executor
+
+Os callbacks de progresso das exportações e importações são chamados na
+thread do executor, não no loop de eventos.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterable, Iterator, AsyncIterator, Callable
+import sys
+import os
+
+# Adiciona o diretório raiz ao path se não estiver lá
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from config import THREADS_EXECUTOR_ASYNC, TAMANHO_BLOCO_EXPORTACAO, TAMANHO_LOTE_IMPORTACAO
+from modules.gerenciamento_tarefas import (
+    gt_inicializar, gt_finalizar, gt_registrar_time, gt_criar_tarefa, gt_remover_tarefa,
+    gt_listar_tarefas_time, gt_registrar_usuario, gt_registrar_tag, gt_listar_todas_tarefas,
+    gt_listar_todos_usuarios, gt_listar_todas_tags, gt_listar_todos_times,
+    gt_aplicar_lote_tarefas, gt_agregar_tarefas, gt_exportar_tarefas_csv,
+    gt_exportar_tarefas_fluxo, gt_exportar_tarefas_particionado,
+    gt_importar_tarefas, gt_importar_tarefas_arquivo
+)
+
+__all__ = [
+    "gt_inicializar_async",
+    "gt_finalizar_async",
+    "gt_registrar_time_async",
+    "gt_registrar_usuario_async",
+    "gt_registrar_tag_async",
+    "gt_criar_tarefa_async",
+    "gt_remover_tarefa_async",
+    "gt_listar_tarefas_time_async",
+    "gt_listar_todas_tarefas_async",
+    "gt_listar_todos_usuarios_async",
+    "gt_listar_todas_tags_async",
+    "gt_listar_todos_times_async",
+    "gt_aplicar_lote_tarefas_async",
+    "gt_agregar_tarefas_async",
+    "gt_exportar_tarefas_csv_async",
+    "gt_exportar_tarefas_particionado_async",
+    "gt_exportar_tarefas_fluxo_async",
+    "gt_importar_tarefas_async",
+    "gt_importar_tarefas_arquivo_async"
+]
+
+# Pool de threads das operações demoradas (criado no primeiro uso e
+# encerrado por gt_finalizar_async)
+_executor: Optional[ThreadPoolExecutor] = None
+_lock_executor = threading.Lock()
+
+# Marca o fim de um iterador consumido no executor
+_FIM = object()
+
+def _obter_executor() -> ThreadPoolExecutor:
+    """Obtém o pool de threads das operações demoradas, criando-o se necessário."""
+    global _executor
+    with _lock_executor:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=THREADS_EXECUTOR_ASYNC, thread_name_prefix="gt-async")
+        return _executor
+
+async def _no_executor(funcao: Callable, *args, **kwargs):
+    """Executa a função no pool de threads e aguarda o resultado sem bloquear o loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_obter_executor(), functools.partial(funcao, *args, **kwargs))
+
+async def _iterar_no_executor(iterador: Iterator[str]) -> AsyncIterator[str]:
+    """Consome um iterador síncrono no pool de threads, um item por vez."""
+    loop = asyncio.get_running_loop()
+    executor = _obter_executor()
+    while True:
+        item = await loop.run_in_executor(executor, next, iterador, _FIM)
+        if item is _FIM:
+            return
+        yield item
+
+async def gt_inicializar_async() -> Optional[Dict[str, Any]]:
+    """
+    Inicializa o sistema de gerenciamento (ver gt_inicializar), carregando os
+    dados no executor.
+    
+    Returns:
+        Dict ou None: Sistema GT em formato dicionário ou None se erro
+    """
+    return await _no_executor(gt_inicializar)
+
+async def gt_finalizar_async(gt: Dict[str, Any]) -> None:
+    """
+    Finaliza o sistema (ver gt_finalizar), salvando os dados no executor, e
+    encerra o pool de threads da API assíncrona.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+    """
+    global _executor
+    await _no_executor(gt_finalizar, gt)
+    with _lock_executor:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+async def gt_registrar_time_async(gt: Dict[str, Any], time: Dict[str, Any]) -> int:
+    """
+    Registra um time no sistema (ver gt_registrar_time).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        time (Dict): Time a ser registrado
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    return gt_registrar_time(gt, time)
+
+async def gt_registrar_usuario_async(gt: Dict[str, Any], usuario: Dict[str, Any]) -> int:
+    """
+    Registra um usuário no sistema (ver gt_registrar_usuario).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        usuario (Dict): Usuário a ser registrado
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    return gt_registrar_usuario(gt, usuario)
+
+async def gt_registrar_tag_async(gt: Dict[str, Any], tag: Dict[str, Any]) -> int:
+    """
+    Registra uma tag no sistema (ver gt_registrar_tag).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        tag (Dict): Tag a ser registrada
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    return gt_registrar_tag(gt, tag)
+
+async def gt_criar_tarefa_async(gt: Dict[str, Any], time: Dict[str, Any], titulo: str, descricao: str,
+                                usuario: Dict[str, Any], tags: List, qtd_tags: int,
+                                prazo: datetime) -> Optional[Dict[str, Any]]:
+    """
+    Cria uma nova tarefa no sistema (ver gt_criar_tarefa).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        time (Dict): Time em formato dicionário
+        titulo (str): Título da tarefa
+        descricao (str): Descrição da tarefa
+        usuario (Dict): Usuário responsável
+        tags (List): Lista de tags
+        qtd_tags (int): Quantidade de tags
+        prazo (datetime): Prazo da tarefa
+    
+    Returns:
+        Dict ou None: Tarefa criada ou None em caso de erro
+    """
+    return gt_criar_tarefa(gt, time, titulo, descricao, usuario, tags, qtd_tags, prazo)
+
+async def gt_remover_tarefa_async(gt: Dict[str, Any], tarefa: Dict[str, Any]) -> int:
+    """
+    Remove uma tarefa do sistema (ver gt_remover_tarefa).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        tarefa (Dict): Tarefa a ser removida
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    return gt_remover_tarefa(gt, tarefa)
+
+async def gt_listar_tarefas_time_async(gt: Dict[str, Any], time: Dict[str, Any],
+                                       qtd_out: List[int]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Lista as tarefas de um time (ver gt_listar_tarefas_time).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        time (Dict): Time em formato dicionário
+        qtd_out (List[int]): Lista para retornar a quantidade de tarefas
+    
+    Returns:
+        List[Dict] ou None: Tarefas do time ou None em caso de erro
+    """
+    return gt_listar_tarefas_time(gt, time, qtd_out)
+
+async def gt_listar_todas_tarefas_async(gt: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Lista todas as tarefas do sistema (ver gt_listar_todas_tarefas).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+    
+    Returns:
+        List[Dict]: Lista de todas as tarefas
+    """
+    return gt_listar_todas_tarefas(gt)
+
+async def gt_listar_todos_usuarios_async(gt: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Lista todos os usuários do sistema (ver gt_listar_todos_usuarios).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+    
+    Returns:
+        List[Dict]: Lista de todos os usuários
+    """
+    return gt_listar_todos_usuarios(gt)
+
+async def gt_listar_todas_tags_async(gt: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Lista todas as tags do sistema (ver gt_listar_todas_tags).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+    
+    Returns:
+        List[Dict]: Lista de todas as tags
+    """
+    return gt_listar_todas_tags(gt)
+
+async def gt_listar_todos_times_async(gt: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Lista todos os times do sistema (ver gt_listar_todos_times).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+    
+    Returns:
+        List[Dict]: Lista de todos os times
+    """
+    return gt_listar_todos_times(gt)
+
+async def gt_aplicar_lote_tarefas_async(gt: Dict[str, Any], operacoes: List[Dict[str, Any]],
+                                        tudo_ou_nada: bool = False) -> Optional[List[Dict[str, Any]]]:
+    """
+    Aplica um lote de operações sobre tarefas no executor (ver gt_aplicar_lote_tarefas).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        operacoes (List[Dict]): Operações do lote
+        tudo_ou_nada (bool): Se True, nenhuma operação é aplicada quando alguma falha
+    
+    Returns:
+        List[Dict] ou None: Resultado de cada operação ou None em caso de erro
+    """
+    return await _no_executor(gt_aplicar_lote_tarefas, gt, operacoes, tudo_ou_nada)
+
+async def gt_agregar_tarefas_async(gt: Dict[str, Any], agrupamentos: List[str]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Conta as tarefas agrupadas pelos critérios informados, no executor (ver gt_agregar_tarefas).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        agrupamentos (List[str]): Critérios de agrupamento
+    
+    Returns:
+        List[Dict] ou None: Grupos com a contagem ou None em caso de erro
+    """
+    return await _no_executor(gt_agregar_tarefas, gt, agrupamentos)
+
+async def gt_exportar_tarefas_csv_async(gt: Dict[str, Any], nome_arquivo: str, paralelo: bool = False,
+                                        particionar_por: str = 'id', num_processos: Optional[int] = None,
+                                        callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None) -> bool:
+    """
+    Exporta as tarefas para um arquivo CSV no executor (ver gt_exportar_tarefas_csv).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        nome_arquivo (str): Nome do arquivo CSV
+        paralelo (bool): Se True, usa todos os núcleos disponíveis
+        particionar_por (str): 'id' ou 'time' (modo paralelo)
+        num_processos (int, optional): Processos do pool (padrão: núcleos da máquina)
+        callback_progresso (Callable, optional): Recebe o progresso a cada parte concluída
+    
+    Returns:
+        bool: True se exportou com sucesso, False caso contrário
+    """
+    return await _no_executor(gt_exportar_tarefas_csv, gt, nome_arquivo, paralelo,
+                              particionar_por, num_processos, callback_progresso)
+
+async def gt_exportar_tarefas_particionado_async(gt: Dict[str, Any], nome_arquivo: str, particionar_por: str = 'id',
+                                                 num_processos: Optional[int] = None, concatenar: bool = False,
+                                                 callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                                 diretorio: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Exporta as tarefas em partes paralelas no executor (ver gt_exportar_tarefas_particionado).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        nome_arquivo (str): Nome do arquivo CSV
+        particionar_por (str): 'id' ou 'time'
+        num_processos (int, optional): Processos do pool (padrão: núcleos da máquina)
+        concatenar (bool): Se True, concatena as partes em nome_arquivo
+        callback_progresso (Callable, optional): Recebe o progresso a cada parte concluída
+        diretorio (str, optional): Diretório de destino (padrão: EXPORT_DIR)
+    
+    Returns:
+        Dict ou None: Manifesto da exportação ou None em caso de erro
+    """
+    return await _no_executor(gt_exportar_tarefas_particionado, gt, nome_arquivo, particionar_por,
+                              num_processos, concatenar, callback_progresso, diretorio)
+
+async def gt_exportar_tarefas_fluxo_async(gt: Dict[str, Any], formato: str = 'csv',
+                                          tarefas: Optional[Iterable[Dict[str, Any]]] = None,
+                                          tamanho_bloco: int = TAMANHO_BLOCO_EXPORTACAO) -> Optional[AsyncIterator[str]]:
+    """
+    Exporta tarefas como um fluxo assíncrono de blocos de texto em CSV ou JSONL
+    (ver gt_exportar_tarefas_fluxo). Cada bloco é gerado no executor.
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        formato (str): 'csv' ou 'jsonl'
+        tarefas (Iterable[Dict], optional): Tarefas a exportar (padrão: fotografia das registradas)
+        tamanho_bloco (int): Tamanho aproximado, em caracteres, de cada bloco gerado
+    
+    Returns:
+        AsyncIterator[str]: Gerador assíncrono dos blocos, ou None em caso de erro
+    """
+    blocos = gt_exportar_tarefas_fluxo(gt, formato, tarefas, tamanho_bloco)
+    if blocos is None:
+        return None
+    return _iterar_no_executor(blocos)
+
+async def gt_importar_tarefas_async(gt: Dict[str, Any], linhas: Iterable[str], formato: str,
+                                    tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO,
+                                    callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Importa tarefas de um fluxo JSONL ou CSV no executor (ver gt_importar_tarefas).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        linhas (Iterable[str]): Linhas a importar
+        formato (str): 'jsonl' ou 'csv'
+        tamanho_lote (int): Linhas validadas e registradas por lote
+        callback_progresso (Callable, optional): Recebe o progresso a cada lote
+    
+    Returns:
+        Dict ou None: Resumo da importação ou None em caso de erro
+    """
+    return await _no_executor(gt_importar_tarefas, gt, linhas, formato, tamanho_lote, callback_progresso)
+
+async def gt_importar_tarefas_arquivo_async(gt: Dict[str, Any], caminho: str, formato: Optional[str] = None,
+                                            tamanho_lote: int = TAMANHO_LOTE_IMPORTACAO,
+                                            callback_progresso: Optional[Callable[[Dict[str, Any]], None]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Importa tarefas de um arquivo local JSONL ou CSV no executor (ver gt_importar_tarefas_arquivo).
+    
+    Args:
+        gt (Dict): Sistema GT em formato dicionário
+        caminho (str): Caminho do arquivo
+        formato (str, optional): 'jsonl' ou 'csv' (padrão: deduzido da extensão)
+        tamanho_lote (int): Linhas validadas e registradas por lote
+        callback_progresso (Callable, optional): Recebe o progresso a cada lote
+    
+    Returns:
+        Dict ou None: Resumo da importação ou None em caso de erro
+    """
+    return await _no_executor(gt_importar_tarefas_arquivo, gt, caminho, formato, tamanho_lote, callback_progresso)
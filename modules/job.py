@@ -0,0 +1,462 @@
+"""
+Módulo de Jobs (fila local de trabalhos em segundo plano)
+
+Este módulo é responsável por executar operações demoradas (exportação,
+importação e salvamento dos dados) fora da thread da requisição. Cada job é
+executado em um pool fixo de threads; o estado de todos os jobs (status,
+progresso, resultado e erro) é mantido em memória e persistido em DATA_DIR a
+cada mudança de status e, no máximo, a cada INTERVALO_PERSISTENCIA_JOBS
+segundos durante o progresso.
+
+Funções principais:
+- job_submeter: Enfileira uma função para execução em segundo plano
+- job_cancelar: Cancela um job pendente ou solicita o cancelamento de um em execução
+- job_obter / job_listar_todos: Consultam os jobs registrados
+- job_to_dict: Converte o job para dicionário (persistência e API)
+- job_carregar_dados / job_salvar_dados: Persistência do estado dos jobs
+- job_finalizar: Cancela os jobs ativos, encerra o pool e salva o estado
+- job_adicionar_observador / job_remover_observador: Notificação de mudanças de status e progresso
+
+A função de um job recebe um callback de progresso; após um pedido de
+cancelamento, a próxima chamada do callback levanta JobCancelado, de modo que
+o cancelamento ocorre entre duas etapas da operação (o que já foi feito
+permanece feito, como os lotes já registrados de uma importação).
+
+Conforme especificação: O módulo não conhece nem depende dos outros módulos.
+As operações executadas são fornecidas pelo módulo de orquestração.
+"""
+
+from typing import Optional, List, Dict, Any, Callable
+from concurrent.futures import ThreadPoolExecutor, Future
+from datetime import datetime
+from enum import Enum
+import copy
+import threading
+import time as relogio
+import sys
+import os
+
+#Encapsulamento
+__all__ = [
+    "StatusJob",
+    "JobCancelado",
+    "job_submeter",
+    "job_cancelar",
+    "job_obter",
+    "job_listar_todos",
+    "job_to_dict",
+    "job_carregar_dados",
+    "job_salvar_dados",
+    "job_finalizar",
+    "job_adicionar_observador",
+    "job_remover_observador"
+]
+
+# Adiciona o diretório raiz ao path se não estiver lá
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from config import SUCESSO, ERRO, JOBS_FILE, THREADS_JOBS, MAX_JOBS_HISTORICO, INTERVALO_PERSISTENCIA_JOBS
+from utils import gerar_id_unico, log_operacao, formatar_data, parse_data, carregar_json, salvar_json, LockLeituraEscrita
+
+class StatusJob(Enum):
+    """Enumeração dos possíveis status de um job"""
+    JOB_PENDENTE = "pendente"
+    JOB_EXECUTANDO = "executando"
+    JOB_CONCLUIDO = "concluido"
+    JOB_FALHOU = "falhou"
+    JOB_CANCELADO = "cancelado"
+
+# Status de jobs que ainda não terminaram
+_STATUS_ATIVOS = (StatusJob.JOB_PENDENTE, StatusJob.JOB_EXECUTANDO)
+
+class JobCancelado(Exception):
+    """Levantada pelo callback de progresso de um job com cancelamento solicitado"""
+
+# Estrutura encapsulada com os jobs registrados, em ordem de submissão
+_jobs_registrados: Dict[int, Dict[str, Any]] = {}
+
+# Futuros do pool dos jobs ainda não iniciados (permitem cancelar antes da execução)
+_futuros: Dict[int, Future] = {}
+
+# Funções de finalização dos jobs ativos, executadas no término (qualquer que seja o status)
+_finalizacoes: Dict[int, Callable[[], None]] = {}
+
+# Lock de leitura e escrita da estrutura encapsulada
+_lock_registro = LockLeituraEscrita()
+
+# Pool de threads dos jobs (criado na primeira submissão e encerrado por job_finalizar)
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Serializa as gravações do arquivo de jobs (a mais recente é sempre a última gravada)
+_lock_arquivo = threading.Lock()
+_ultima_gravacao = 0.0
+
+# Funções notificadas a cada mudança de status ou progresso: observador(evento, job),
+# em que o evento é o novo status ('pendente', 'executando', ...) ou 'progresso'
+_observadores: List[Callable[[str, Dict[str, Any]], None]] = []
+
+def job_to_dict(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converte o job para dicionário (para persistência e para a API).
+    
+    Args:
+        job (Dict): Job em formato dicionário
+    
+    Returns:
+        Dict: Representação do job em dicionário
+    """
+    return {
+        'id': job['id'],
+        'tipo': job['tipo'],
+        'status': job['status'].value,
+        'parametros': job['parametros'],
+        'progresso': job['progresso'],
+        'resultado': job['resultado'],
+        'erro': job['erro'],
+        'cancelamento_solicitado': job['cancelamento_solicitado'],
+        'data_criacao': formatar_data(job['data_criacao']),
+        'data_inicio': formatar_data(job['data_inicio']) if job['data_inicio'] else None,
+        'data_fim': formatar_data(job['data_fim']) if job['data_fim'] else None
+    }
+
+def _job_from_dict(dados: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Cria um job a partir do dicionário persistido, ou None se inválido."""
+    try:
+        return {
+            'id': dados['id'],
+            'tipo': dados['tipo'],
+            'status': StatusJob(dados['status']),
+            'parametros': dados.get('parametros') or {},
+            'progresso': dados.get('progresso') or {},
+            'resultado': dados.get('resultado'),
+            'erro': dados.get('erro'),
+            'cancelamento_solicitado': dados.get('cancelamento_solicitado', False),
+            'data_criacao': parse_data(dados['data_criacao']),
+            'data_inicio': parse_data(dados['data_inicio']) if dados.get('data_inicio') else None,
+            'data_fim': parse_data(dados['data_fim']) if dados.get('data_fim') else None
+        }
+    except Exception as e:
+        log_operacao("Job", "Erro ao criar job a partir de dict", str(e))
+        return None
+
+def _notificar(evento: str, job: Dict[str, Any]) -> None:
+    """Notifica os observadores, fora do lock da estrutura encapsulada."""
+    for observador in list(_observadores):
+        try:
+            observador(evento, job)
+        except Exception as e:
+            log_operacao("Job", "Erro no observador", f"Evento: {evento}, Falha: {str(e)}")
+
+def _gravar_estado(forcar: bool = True) -> bool:
+    """
+    Grava o estado de todos os jobs em DATA_DIR. Sem forcar, a gravação é
+    ignorada se a anterior ocorreu há menos de INTERVALO_PERSISTENCIA_JOBS.
+    """
+    global _ultima_gravacao
+    with _lock_arquivo:
+        agora = relogio.monotonic()
+        if not forcar and agora - _ultima_gravacao < INTERVALO_PERSISTENCIA_JOBS:
+            return True
+        _ultima_gravacao = agora
+        with _lock_registro.leitura():
+            dados_jobs = {str(jid): job_to_dict(job) for jid, job in _jobs_registrados.items()}
+        return salvar_json(dados_jobs, JOBS_FILE)
+
+def _encerrar(job: Dict[str, Any], status: StatusJob, resultado: Any = None, erro: Optional[str] = None) -> None:
+    """Registra o término do job, persiste o estado e notifica os observadores."""
+    with _lock_registro:
+        job['status'] = status
+        job['resultado'] = resultado
+        job['erro'] = erro
+        job['data_fim'] = datetime.now()
+        _futuros.pop(job['id'], None)
+        finalizacao = _finalizacoes.pop(job['id'], None)
+    if finalizacao is not None:
+        try:
+            finalizacao()
+        except Exception as e:
+            log_operacao("Job", "Erro na finalização", f"ID: {job['id']}, Falha: {str(e)}")
+    _gravar_estado()
+    log_operacao("Job", "Job encerrado", f"ID: {job['id']}, Tipo: {job['tipo']}, Status: {status.value}")
+    _notificar(status.value, job)
+
+def _executar(job: Dict[str, Any], funcao: Callable[[Callable[[Dict[str, Any]], None]], Any]) -> None:
+    """Executa a função do job em uma thread do pool, registrando progresso e resultado."""
+    with _lock_registro:
+        _futuros.pop(job['id'], None)
+        if job['status'] is not StatusJob.JOB_PENDENTE:
+            return
+        cancelado = job['cancelamento_solicitado']
+        if not cancelado:
+            job['status'] = StatusJob.JOB_EXECUTANDO
+            job['data_inicio'] = datetime.now()
+    if cancelado:
+        _encerrar(job, StatusJob.JOB_CANCELADO)
+        return
+    _gravar_estado()
+    _notificar(StatusJob.JOB_EXECUTANDO.value, job)
+
+    def progresso(dados: Dict[str, Any]) -> None:
+        if job['cancelamento_solicitado']:
+            raise JobCancelado(f"Job {job['id']} cancelado")
+        with _lock_registro:
+            job['progresso'] = copy.deepcopy(dados)
+        _gravar_estado(forcar=False)
+        _notificar('progresso', job)
+    
+    try:
+        resultado = funcao(progresso)
+        erro = None if resultado is not None else "Falha na execução (ver log)"
+    except JobCancelado:
+        resultado, erro = None, None
+    except Exception as e:
+        resultado, erro = None, str(e)
+    
+    # Funções que tratam as próprias exceções retornam None ao serem interrompidas:
+    # o pedido de cancelamento prevalece sobre a falha
+    if job['cancelamento_solicitado']:
+        _encerrar(job, StatusJob.JOB_CANCELADO)
+    elif erro is not None:
+        _encerrar(job, StatusJob.JOB_FALHOU, erro=erro)
+    else:
+        _encerrar(job, StatusJob.JOB_CONCLUIDO, resultado=resultado)
+
+def _descartar_historico() -> None:
+    """Remove os jobs encerrados mais antigos além de MAX_JOBS_HISTORICO. Executada com o lock adquirido."""
+    excedente = len(_jobs_registrados) - MAX_JOBS_HISTORICO
+    if excedente <= 0:
+        return
+    antigos = [jid for jid, job in _jobs_registrados.items() if job['status'] not in _STATUS_ATIVOS]
+    for jid in antigos[:excedente]:
+        del _jobs_registrados[jid]
+
+# Funções de gerenciamento das estruturas encapsuladas
+
+def job_carregar_dados() -> None:
+    """
+    Carrega o estado dos jobs do arquivo JSON para a estrutura encapsulada.
+    
+    Jobs que estavam pendentes ou em execução quando o processo terminou não
+    podem ser retomados (a função executada não é persistida) e são marcados
+    como falhos.
+    """
+    try:
+        dados_jobs = carregar_json(JOBS_FILE)
+        interrompidos = 0
+        with _lock_registro:
+            if dados_jobs:
+                for job_data in dados_jobs.values():
+                    job = _job_from_dict(job_data)
+                    # Jobs já registrados (reinicialização no mesmo processo) são mantidos
+                    if job is None or job['id'] in _jobs_registrados:
+                        continue
+                    if job['status'] in _STATUS_ATIVOS:
+                        job['status'] = StatusJob.JOB_FALHOU
+                        job['erro'] = "Interrompido pelo encerramento do servidor"
+                        job['data_fim'] = job['data_fim'] or datetime.now()
+                        interrompidos += 1
+                    _jobs_registrados[job['id']] = job
+        
+        log_operacao("Job", "Dados carregados", f"Total de jobs: {len(_jobs_registrados)}, Interrompidos: {interrompidos}")
+    
+    except Exception as e:
+        log_operacao("Job", "Erro ao carregar dados", str(e))
+
+def job_salvar_dados() -> bool:
+    """
+    Salva o estado de todos os jobs no arquivo JSON.
+    
+    Returns:
+        bool: True se salvou com sucesso, False caso contrário
+    """
+    try:
+        if _gravar_estado():
+            log_operacao("Job", "Dados salvos", f"Total de jobs: {len(_jobs_registrados)}")
+            return True
+        else:
+            log_operacao("Job", "Erro ao salvar dados", "Falha na persistência")
+            return False
+    
+    except Exception as e:
+        log_operacao("Job", "Erro ao salvar dados", str(e))
+        return False
+
+def job_finalizar() -> None:
+    """
+    Cancela os jobs ativos, aguarda o término dos que estão em execução
+    (até a próxima chamada do callback de progresso), encerra o pool de
+    threads e salva o estado dos jobs.
+    """
+    global _executor
+    with _lock_registro:
+        executor, _executor = _executor, None
+        for job in _jobs_registrados.values():
+            if job['status'] in _STATUS_ATIVOS:
+                job['cancelamento_solicitado'] = True
+    
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    # Jobs cujo futuro foi cancelado no encerramento do pool não chegaram a executar
+    with _lock_registro:
+        pendentes = [job for job in _jobs_registrados.values() if job['status'] is StatusJob.JOB_PENDENTE]
+    for job in pendentes:
+        _encerrar(job, StatusJob.JOB_CANCELADO)
+    
+    job_salvar_dados()
+
+def job_adicionar_observador(observador: Callable[[str, Dict[str, Any]], None]) -> int:
+    """
+    Registra uma função a ser notificada a cada mudança de status ou progresso
+    de um job.
+    
+    A função recebe o evento (o novo status ou 'progresso') e o job, e é
+    chamada na thread que fez a alteração, sem locks do módulo adquiridos.
+    
+    Args:
+        observador (Callable): Função observador(evento, job)
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro (nulo ou já registrado)
+    """
+    if observador is None or observador in _observadores:
+        log_operacao("Job", "Erro ao adicionar observador", "Observador nulo ou já registrado")
+        return ERRO
+    
+    with _lock_registro:
+        _observadores.append(observador)
+    return SUCESSO
+
+def job_remover_observador(observador: Callable[[str, Dict[str, Any]], None]) -> int:
+    """
+    Remove uma função registrada com job_adicionar_observador.
+    
+    Args:
+        observador (Callable): Função a remover
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro (não registrado)
+    """
+    with _lock_registro:
+        if observador not in _observadores:
+            return ERRO
+        _observadores.remove(observador)
+    return SUCESSO
+
+# Funções da interface pública
+
+def job_submeter(tipo: str, funcao: Callable[[Callable[[Dict[str, Any]], None]], Any],
+                 parametros: Optional[Dict[str, Any]] = None,
+                 finalizacao: Optional[Callable[[], None]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Registra um job e o enfileira para execução em segundo plano.
+    
+    A função recebe o callback de progresso (que aceita um dicionário
+    serializável em JSON) e retorna o resultado do job, também serializável;
+    retornar None ou levantar uma exceção marca o job como falho.
+    
+    Args:
+        tipo (str): Tipo do job (ex.: 'exportacao')
+        funcao (Callable): Função funcao(progresso) executada no pool
+        parametros (Dict, optional): Parâmetros informados, mantidos para consulta
+        finalizacao (Callable, optional): Executada no término do job, mesmo se
+            cancelado antes de iniciar (ex.: remoção de arquivos temporários)
+    
+    Returns:
+        Dict ou None: Job registrado (status 'pendente') ou None em caso de erro
+    """
+    global _executor
+    if not tipo or funcao is None:
+        log_operacao("Job", "Erro ao submeter", "Tipo ou função nulos")
+        return None
+    
+    try:
+        job = {
+            'id': gerar_id_unico(),
+            'tipo': tipo,
+            'status': StatusJob.JOB_PENDENTE,
+            'parametros': dict(parametros or {}),
+            'progresso': {},
+            'resultado': None,
+            'erro': None,
+            'cancelamento_solicitado': False,
+            'data_criacao': datetime.now(),
+            'data_inicio': None,
+            'data_fim': None
+        }
+        with _lock_registro:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=THREADS_JOBS, thread_name_prefix="job")
+            _jobs_registrados[job['id']] = job
+            if finalizacao is not None:
+                _finalizacoes[job['id']] = finalizacao
+            _descartar_historico()
+            # O futuro é registrado antes de a execução poder começar (ela também adquire o lock)
+            _futuros[job['id']] = _executor.submit(_executar, job, funcao)
+        
+        _gravar_estado()
+        log_operacao("Job", "Job submetido", f"ID: {job['id']}, Tipo: {tipo}")
+        _notificar(StatusJob.JOB_PENDENTE.value, job)
+        return job
+    
+    except Exception as e:
+        log_operacao("Job", "Erro ao submeter", f"Falha: {str(e)}")
+        return None
+
+def job_cancelar(job_id: int) -> int:
+    """
+    Cancela um job. Jobs pendentes são cancelados imediatamente; nos jobs em
+    execução, o cancelamento é solicitado e ocorre na próxima chamada do
+    callback de progresso.
+    
+    Args:
+        job_id (int): ID do job
+    
+    Returns:
+        int: 0 para sucesso, -1 para erro (job inexistente ou já encerrado)
+    """
+    with _lock_registro:
+        job = _jobs_registrados.get(job_id)
+        if job is None or job['status'] not in _STATUS_ATIVOS:
+            log_operacao("Job", "Erro ao cancelar", f"Job {job_id} inexistente ou encerrado")
+            return ERRO
+        job['cancelamento_solicitado'] = True
+        futuro = _futuros.get(job_id)
+        imediato = futuro is not None and futuro.cancel()
+    
+    log_operacao("Job", "Cancelamento solicitado", f"ID: {job_id}")
+    if imediato:
+        _encerrar(job, StatusJob.JOB_CANCELADO)
+    else:
+        _gravar_estado()
+    return SUCESSO
+
+def job_obter(job_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Obtém um job registrado pelo ID.
+    
+    Args:
+        job_id (int): ID do job
+    
+    Returns:
+        Dict ou None: Job em formato dicionário ou None se não estiver registrado
+    """
+    with _lock_registro.leitura():
+        return _jobs_registrados.get(job_id)
+
+def job_listar_todos(limite: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Lista os jobs registrados, dos mais recentes para os mais antigos.
+    
+    Args:
+        limite (int, optional): Quantidade máxima de jobs retornados
+    
+    Returns:
+        List[Dict]: Jobs em formato dicionário
+    """
+    with _lock_registro.leitura():
+        jobs = list(reversed(_jobs_registrados.values()))
+    return jobs[:limite] if limite is not None else jobs
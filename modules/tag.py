@@ -19,11 +19,18 @@ ESTRUTURAS ENCAPSULADAS:
 - tag_carregar_dados: Carrega tags dos arquivos JSON
 - tag_salvar_dados: Salva tags nos arquivos JSON
 - tag_registrar: Registra uma tag no sistema
+- tag_remover: Remove uma tag do sistema
 - tag_listar_todas: Lista todas as tags registradas
+- tag_qtd_registradas: Quantidade de tags registradas
+- tag_buscar_por_id / tag_buscar_por_ids: Obtêm tags registradas pelo ID
+- tag_versao: Versão da estrutura encapsulada (muda a cada alteração)
+- tag_lock_registro: Lock de leitura e escrita da estrutura encapsulada (para leituras consistentes)
+- tag_aplicar_replica: Aplica alterações feitas em outro processo (modo pré-fork)
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from datetime import datetime
+import itertools
 import sys
 import os
 
@@ -41,7 +48,14 @@ __all__ = [
     "tag_carregar_dados",
     "tag_salvar_dados",
     "tag_registrar",
-    "tag_listar_todas"
+    "tag_remover",
+    "tag_listar_todas",
+    "tag_qtd_registradas",
+    "tag_buscar_por_id",
+    "tag_buscar_por_ids",
+    "tag_versao",
+    "tag_lock_registro",
+    "tag_aplicar_replica"
 ]
 
 # Adiciona o diretório raiz ao path se não estiver lá
@@ -51,11 +65,28 @@ if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
 from config import SUCESSO, ERRO, validar_cor_hex, MAX_NOME_LENGTH, MAX_COR_LENGTH, TAGS_FILE
-from utils import gerar_id_unico, validar_string_nao_vazia, log_operacao, formatar_data, carregar_json, salvar_json
+from utils import (
+    gerar_id_unico, validar_string_nao_vazia, log_operacao, formatar_data, carregar_json, salvar_json,
+    LockLeituraEscrita
+)
 
 # Estrutura encapsulada para armazenar todas as tags registradas
 _tags_registradas: Dict[int, Dict[str, Any]] = {}
 
+# Versão da estrutura encapsulada, renovada a cada registro ou alteração de tag
+# (nome e cor); itertools.count garante incrementos atômicos
+_contador_versao = itertools.count(1)
+_versao_registro = 0
+
+def _registro_alterado() -> None:
+    """Renova a versão da estrutura encapsulada após uma alteração."""
+    global _versao_registro
+    _versao_registro = next(_contador_versao)
+
+# Lock de leitura e escrita da estrutura encapsulada: registros e alterações
+# são serializados e as listagens podem ocorrer em paralelo
+_lock_registro = LockLeituraEscrita()
+
 def _criar_tag_dict(nome: str, cor: str) -> Dict[str, Any]:
     """
     Cria um dicionário representando uma tag.
@@ -127,11 +158,13 @@ def tag_carregar_dados() -> None:
     """
     try:
         dados_tags = carregar_json(TAGS_FILE)
-        if dados_tags:
-            for tag_data in dados_tags.values():
-                tag = tag_from_dict(tag_data)
-                if tag:
-                    _tags_registradas[tag['id']] = tag
+        with _lock_registro:
+            if dados_tags:
+                for tag_data in dados_tags.values():
+                    tag = tag_from_dict(tag_data)
+                    if tag:
+                        _tags_registradas[tag['id']] = tag
+                        _registro_alterado()
         
         log_operacao("Tag", "Dados carregados", f"Total de tags: {len(_tags_registradas)}")
                     
@@ -147,7 +180,8 @@ def tag_salvar_dados() -> bool:
         bool: True se salvou com sucesso, False caso contrário
     """
     try:
-        dados_tags = {str(tid): tag_to_dict(tag) for tid, tag in _tags_registradas.items()}
+        with _lock_registro.leitura():
+            dados_tags = {str(tid): tag_to_dict(tag) for tid, tag in _tags_registradas.items()}
         if salvar_json(dados_tags, TAGS_FILE):
             log_operacao("Tag", "Dados salvos", f"Total de tags: {len(_tags_registradas)}")
             return True
@@ -179,13 +213,15 @@ def tag_registrar(tag: Dict[str, Any]) -> int:
             log_operacao("Tag", "Erro ao registrar", "ID da tag inválido")
             return ERRO
         
-        # Verifica se a tag já está registrada
-        if tag_id in _tags_registradas:
-            log_operacao("Tag", "Erro ao registrar", f"Tag {tag_id} já registrada")
-            return ERRO
-        
-        # Registra a tag
-        _tags_registradas[tag_id] = tag
+        with _lock_registro:
+            # Verifica se a tag já está registrada
+            if tag_id in _tags_registradas:
+                log_operacao("Tag", "Erro ao registrar", f"Tag {tag_id} já registrada")
+                return ERRO
+            
+            # Registra a tag
+            _tags_registradas[tag_id] = tag
+            _registro_alterado()
         log_operacao("Tag", "Tag registrada", f"ID: {tag_id}")
         return SUCESSO
         
@@ -193,6 +229,90 @@ def tag_registrar(tag: Dict[str, Any]) -> int:
         log_operacao("Tag", "Erro ao registrar", f"Falha: {str(e)}")
         return ERRO
 
+def tag_remover(tag_id: int) -> int:
+    """
+    Remove uma tag da estrutura encapsulada.
+    
+    Args:
+        tag_id (int): ID da tag a ser removida
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro (tag não registrada)
+    """
+    with _lock_registro:
+        if _tags_registradas.pop(tag_id, None) is None:
+            log_operacao("Tag", "Erro ao remover", f"Tag {tag_id} não registrada")
+            return ERRO
+        _registro_alterado()
+    
+    log_operacao("Tag", "Tag removida", f"ID: {tag_id}")
+    return SUCESSO
+
+def tag_aplicar_replica(dados: Dict[int, Optional[Dict[str, Any]]], completo: bool = False) -> int:
+    """
+    Aplica à estrutura encapsulada as tags alteradas em outro processo (no modo
+    pré-fork, o processo escritor envia as alterações aos processos de leitura).
+    
+    Tags já registradas são atualizadas no lugar, preservando as referências
+    mantidas por quem as consultou.
+    
+    Args:
+        dados (Dict[int, Dict]): Dados das tags por ID (None remove a tag)
+        completo (bool): Se True, dados contém todas as tags e as ausentes são removidas
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    try:
+        with _lock_registro:
+            if completo:
+                for tag_id in [tag_id for tag_id in _tags_registradas if tag_id not in dados]:
+                    del _tags_registradas[tag_id]
+            
+            for tag_id, tag_dados in dados.items():
+                if tag_dados is None:
+                    _tags_registradas.pop(tag_id, None)
+                    continue
+                tag = tag_from_dict(tag_dados)
+                if tag is None:
+                    continue
+                registrada = _tags_registradas.get(tag_id)
+                if registrada is None:
+                    _tags_registradas[tag_id] = tag
+                else:
+                    registrada.clear()
+                    registrada.update(tag)
+            _registro_alterado()
+        return SUCESSO
+        
+    except Exception as e:
+        log_operacao("Tag", "Erro ao aplicar réplica", f"Falha: {str(e)}")
+        return ERRO
+
+def tag_versao() -> int:
+    """
+    Obtém a versão atual da estrutura encapsulada.
+    
+    A versão muda a cada registro de tag ou alteração de nome ou cor,
+    permitindo que resultados derivados sejam reaproveitados enquanto ela não mudar.
+    
+    Returns:
+        int: Versão da estrutura encapsulada
+    """
+    return _versao_registro
+
+def tag_lock_registro() -> LockLeituraEscrita:
+    """
+    Obtém o lock de leitura e escrita da estrutura encapsulada.
+    
+    leitura() obtém uma visão consistente de várias consultas: as alterações
+    aguardam o fim do bloco, sem bloquear outras leituras.
+    
+    Returns:
+        LockLeituraEscrita: Lock da estrutura encapsulada
+    """
+    return _lock_registro
+
 def tag_listar_todas() -> List[Dict[str, Any]]:
     """
     Lista todas as tags registradas na estrutura encapsulada.
@@ -200,7 +320,46 @@ def tag_listar_todas() -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: Lista de todas as tags em formato dicionário
     """
-    return list(_tags_registradas.values())
+    with _lock_registro.leitura():
+        return list(_tags_registradas.values())
+
+def tag_qtd_registradas() -> int:
+    """
+    Obtém a quantidade de tags registradas, sem copiar a estrutura encapsulada.
+    
+    Returns:
+        int: Quantidade de tags registradas
+    """
+    return len(_tags_registradas)
+
+def tag_buscar_por_id(tag_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Obtém uma tag registrada pelo ID, com acesso direto à estrutura encapsulada.
+    
+    Args:
+        tag_id (int): ID da tag
+        
+    Returns:
+        Dict ou None: Tag em formato dicionário ou None se não estiver registrada (ou tiver sido destruída)
+    """
+    with _lock_registro.leitura():
+        # Entidades destruídas permanecem no registro como dicionários vazios
+        return _tags_registradas.get(tag_id) or None
+
+def tag_buscar_por_ids(ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Obtém várias tags registradas pelos IDs, na ordem informada.
+    IDs não registrados ou de entidades destruídas são ignorados.
+    
+    Args:
+        ids (Iterable[int]): IDs das tags
+        
+    Returns:
+        List[Dict]: Tags encontradas em formato dicionário
+    """
+    with _lock_registro.leitura():
+        entidades = (_tags_registradas.get(tag_id) for tag_id in ids)
+        return [entidade for entidade in entidades if entidade]
 
 # Funções da interface pública (conforme especificação)
 
@@ -264,7 +423,9 @@ def tag_destruir(tag: Dict[str, Any]) -> None:
     
     log_operacao("Tag", "Destruída", f"ID: {tag['id']}")
     # Em Python, o garbage collector cuida da liberação de memória
-    tag.clear()
+    with _lock_registro:
+        tag.clear()
+        _registro_alterado()
 
 def tag_set_nome(tag: Dict[str, Any], novo_nome: str) -> int:
     """
@@ -294,9 +455,11 @@ def tag_set_nome(tag: Dict[str, Any], novo_nome: str) -> int:
         return ERRO
     
     try:
-        nome_antigo = tag['nome']
-        tag['nome'] = novo_nome.strip()
-        tag['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            nome_antigo = tag['nome']
+            tag['nome'] = novo_nome.strip()
+            tag['data_modificacao'] = datetime.now()
+            _registro_alterado()
         
         log_operacao("Tag", "Nome alterado", f"ID: {tag['id']}, '{nome_antigo}' -> '{novo_nome}'")
         return SUCESSO
@@ -333,9 +496,11 @@ def tag_set_cor(tag: Dict[str, Any], nova_cor: str) -> int:
         return ERRO
     
     try:
-        cor_antiga = tag['cor']
-        tag['cor'] = nova_cor.upper()
-        tag['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            cor_antiga = tag['cor']
+            tag['cor'] = nova_cor.upper()
+            tag['data_modificacao'] = datetime.now()
+            _registro_alterado()
         
         log_operacao("Tag", "Cor alterada", f"ID: {tag['id']}, '{cor_antiga}' -> '{nova_cor}'")
         return SUCESSO
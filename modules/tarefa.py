@@ -19,12 +19,26 @@ ESTRUTURAS ENCAPSULADAS:
 - tarefa_carregar_dados: Carrega tarefas dos arquivos JSON
 - tarefa_salvar_dados: Salva tarefas nos arquivos JSON
 - tarefa_registrar: Registra uma tarefa no sistema
+- tarefa_remover: Remove uma tarefa do sistema
+- tarefa_aplicar_replica: Aplica alterações feitas em outro processo (modo pré-fork)
+- tarefa_lock_registro: Lock de leitura e escrita da estrutura encapsulada (para operações em lote)
+- tarefa_snapshot: Fotografia imutável e versionada das tarefas registradas (leitura sem lock)
+- tarefa_buscar_congelada: Cópia somente leitura de uma tarefa registrada (a mesma da fotografia)
 - tarefa_listar_todas: Lista todas as tarefas registradas
+- tarefa_qtd_registradas: Quantidade de tarefas registradas
+- tarefa_buscar_por_id / tarefa_buscar_por_ids: Obtêm tarefas registradas pelo ID
+- tarefa_listar_ordenadas: Lista as primeiras tarefas segundo um campo de data
+- tarefa_versao: Versão da estrutura encapsulada (muda a cada alteração)
+- tarefa_contagem_por_status: Contagem mantida de tarefas registradas por status
+- tarefa_serie_temporal: Série de tarefas criadas ou concluídas por hora ou dia
+- tarefa_adicionar_observador / tarefa_remover_observador: Notificação de alterações
 """
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterable, Callable, Mapping, NamedTuple, Tuple
+from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
+import heapq
 import sys
 import os
 
@@ -50,7 +64,26 @@ __all__ = [
     "tarefa_carregar_dados",
     "tarefa_salvar_dados",
     "tarefa_registrar",
+    "tarefa_remover",
+    "tarefa_aplicar_replica",
+    "tarefa_lock_registro",
+    "tarefa_snapshot",
+    "SnapshotTarefas",
+    "tarefa_buscar_congelada",
     "tarefa_listar_todas",
+    "tarefa_qtd_registradas",
+    "tarefa_buscar_por_id",
+    "tarefa_buscar_por_ids",
+    "tarefa_listar_ordenadas",
+    "CAMPOS_ORDENACAO",
+    "tarefa_versao",
+    "tarefa_contagem_por_status",
+    "tarefa_serie_temporal",
+    "tarefa_adicionar_observador",
+    "tarefa_remover_observador",
+    "EVENTOS_OBSERVADOR",
+    "METRICAS_SERIE_TEMPORAL",
+    "INTERVALOS_SERIE_TEMPORAL",
     "tarefa_set_titulo",
     "tarefa_set_descricao",
     "tarefa_set_prazo"
@@ -62,12 +95,58 @@ root_dir = os.path.dirname(current_dir)
 if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
-from config import SUCESSO, ERRO, MAX_TITULO_LENGTH, MAX_DESCRICAO_LENGTH, TAREFAS_FILE
-from utils import gerar_id_unico, validar_string_nao_vazia, log_operacao, formatar_data, carregar_json, salvar_json
+from config import (
+    SUCESSO, ERRO, MAX_TITULO_LENGTH, MAX_DESCRICAO_LENGTH, TAREFAS_FILE,
+    ROLLUPS_TAREFAS_FILE, MAX_PONTOS_SERIE_TEMPORAL
+)
+from utils import (
+    gerar_id_unico, validar_string_nao_vazia, log_operacao, log_ativo, formatar_data, carregar_json, salvar_json,
+    LockLeituraEscrita
+)
 
 # Estrutura encapsulada para armazenar todas as tarefas registradas
 _tarefas_registradas: Dict[int, Dict[str, Any]] = {}
 
+# Lock de leitura e escrita da estrutura encapsulada: as alterações são
+# serializadas (escrita reentrante) e as listagens podem ocorrer em paralelo
+_lock_registro = LockLeituraEscrita()
+
+# Versão da estrutura encapsulada, incrementada a cada registro, remoção ou
+# alteração de tarefa registrada (usada como chave de cache pelos consumidores)
+_versao_registro = 0
+
+# Cópia somente leitura de cada tarefa registrada, substituída a cada alteração
+# da tarefa (as fotografias guardam estas cópias, nunca as tarefas vivas)
+_tarefas_congeladas: Dict[int, Mapping[str, Any]] = {}
+
+# Contagem de tarefas registradas por status, mantida a cada alteração
+_contagem_status: Dict["StatusTarefa", int] = {}
+
+# Eventos enviados aos observadores: tarefa registrada, removida, alterada ou
+# todas as tarefas recarregadas (neste caso, a tarefa enviada é None)
+EVENTOS_OBSERVADOR = ('registrada', 'removida', 'alterada', 'recarregadas')
+
+# Funções notificadas a cada alteração da estrutura encapsulada
+_observadores: List[Callable[[str, Optional[Dict[str, Any]]], None]] = []
+
+# Métricas e intervalos das séries temporais pré-agregadas
+METRICAS_SERIE_TEMPORAL = ('created', 'completed')
+INTERVALOS_SERIE_TEMPORAL = ('hour', 'day')
+
+# Formato da chave de cada intervalo (ordem lexicográfica = ordem cronológica)
+_FORMATOS_INTERVALO = {'hour': '%Y-%m-%dT%H:00', 'day': '%Y-%m-%d'}
+_PASSOS_INTERVALO = {'hour': timedelta(hours=1), 'day': timedelta(days=1)}
+
+# Contagens por intervalo ({métrica: {intervalo: {chave: quantidade}}}), mantidas
+# a cada criação e conclusão de tarefa registrada e persistidas com as tarefas
+_rollups: Dict[str, Dict[str, Dict[str, int]]] = {
+    metrica: {intervalo: {} for intervalo in INTERVALOS_SERIE_TEMPORAL}
+    for metrica in METRICAS_SERIE_TEMPORAL
+}
+
+# Campos de data pelos quais as tarefas podem ser ordenadas
+CAMPOS_ORDENACAO = ('prazo', 'data_criacao', 'data_modificacao')
+
 class StatusTarefa(Enum):
     """Enumeração dos possíveis status de uma tarefa"""
     TAREFA_ABERTA = "aberta"
@@ -75,6 +154,107 @@ class StatusTarefa(Enum):
     TAREFA_CONCLUIDA = "concluida"
     TAREFA_CANCELADA = "cancelada"
 
+class SnapshotTarefas(NamedTuple):
+    """Fotografia imutável das tarefas registradas em uma versão da estrutura"""
+    versao: int
+    tarefas: Tuple[Mapping[str, Any], ...]
+
+# Última fotografia publicada (substituída por inteiro, nunca alterada)
+_snapshot = SnapshotTarefas(0, ())
+
+def _congelar(tarefa: Dict[str, Any]) -> Mapping[str, Any]:
+    """Cria a cópia somente leitura de uma tarefa (com as tags em tupla)."""
+    return MappingProxyType(dict(tarefa, tags=tuple(tarefa['tags'])))
+
+def _registro_alterado(tarefa: Optional[Dict[str, Any]] = None, entrou: bool = False,
+                       saiu: bool = False, status_anterior: Optional[StatusTarefa] = None) -> None:
+    """
+    Atualiza a versão e as contagens mantidas após uma alteração.
+    
+    Alterações em tarefas não registradas são ignoradas. Deve ser chamada com
+    _lock_registro adquirido.
+    
+    Args:
+        tarefa (Dict, optional): Tarefa alterada (None para alterações em massa)
+        entrou (bool): Se a tarefa acabou de ser registrada
+        saiu (bool): Se a tarefa acabou de ser removida
+        status_anterior (StatusTarefa, optional): Status antes de tarefa_set_status
+    """
+    global _versao_registro
+    
+    if tarefa is not None and not saiu and _tarefas_registradas.get(tarefa.get('id')) is not tarefa:
+        return
+    
+    _versao_registro += 1
+    if tarefa is None:
+        _tarefas_congeladas.clear()
+        _tarefas_congeladas.update((tarefa_id, _congelar(t)) for tarefa_id, t in _tarefas_registradas.items() if t)
+        _notificar_observadores('recarregadas', None)
+        return
+    
+    if saiu:
+        _tarefas_congeladas.pop(tarefa['id'], None)
+    else:
+        _tarefas_congeladas[tarefa['id']] = _congelar(tarefa)
+    
+    status = tarefa['status']
+    concluida = StatusTarefa.TAREFA_CONCLUIDA
+    if entrou:
+        _contagem_status[status] = _contagem_status.get(status, 0) + 1
+        _contar_rollup('created', tarefa['data_criacao'])
+        if status == concluida:
+            _contar_rollup('completed', tarefa['data_modificacao'])
+    elif saiu:
+        _contagem_status[status] = _contagem_status.get(status, 0) - 1
+    elif status_anterior is not None and status_anterior != status:
+        _contagem_status[status_anterior] = _contagem_status.get(status_anterior, 0) - 1
+        _contagem_status[status] = _contagem_status.get(status, 0) + 1
+        if status == concluida:
+            _contar_rollup('completed', tarefa['data_modificacao'])
+    
+    _notificar_observadores('registrada' if entrou else 'removida' if saiu else 'alterada', tarefa)
+
+def _notificar_observadores(evento: str, tarefa: Optional[Dict[str, Any]]) -> None:
+    """
+    Notifica os observadores de uma alteração. Executada com _lock_registro
+    adquirido: os observadores devem ser rápidos e não podem esperar por
+    outras threads que alterem tarefas.
+    """
+    for observador in list(_observadores):
+        try:
+            observador(evento, tarefa)
+        except Exception as e:
+            log_operacao("Tarefa", "Erro ao notificar observador", f"Evento: {evento}, Falha: {str(e)}")
+
+def _contar_rollup(metrica: str, data: Optional[datetime]) -> None:
+    """Conta um evento da métrica nos intervalos de hora e dia da data informada."""
+    if not isinstance(data, datetime):
+        return
+    for intervalo, formato in _FORMATOS_INTERVALO.items():
+        contagens = _rollups[metrica][intervalo]
+        chave = data.strftime(formato)
+        contagens[chave] = contagens.get(chave, 0) + 1
+
+def _reconstruir_rollups() -> None:
+    """
+    Reconstrói as séries a partir das tarefas registradas (quando não há
+    séries persistidas). Tarefas concluídas contam na data da última alteração.
+    """
+    for intervalos in _rollups.values():
+        for contagens in intervalos.values():
+            contagens.clear()
+    for tarefa in _tarefas_registradas.values():
+        _contar_rollup('created', tarefa['data_criacao'])
+        if tarefa['status'] == StatusTarefa.TAREFA_CONCLUIDA:
+            _contar_rollup('completed', tarefa['data_modificacao'])
+
+def _recalcular_contagens() -> None:
+    """Recalcula as contagens mantidas a partir da estrutura encapsulada."""
+    _contagem_status.clear()
+    for tarefa in _tarefas_registradas.values():
+        _contagem_status[tarefa['status']] = _contagem_status.get(tarefa['status'], 0) + 1
+    _registro_alterado()
+
 def _criar_tarefa_dict(titulo: str, descricao: str, usuario_responsavel, prazo: datetime) -> Dict[str, Any]:
     """
     Cria um dicionário representando uma tarefa.
@@ -117,7 +297,7 @@ def tarefa_to_dict(tarefa: Dict[str, Any]) -> Dict[str, Any]:
         'usuario_responsavel_id': tarefa['usuario_responsavel_id'],
         'prazo': formatar_data(tarefa['prazo']),
         'status': tarefa['status'].value if isinstance(tarefa['status'], StatusTarefa) else tarefa['status'],
-        'tags': tarefa['tags'].copy(),
+        'tags': list(tarefa['tags']),
         'data_criacao': formatar_data(tarefa['data_criacao']),
         'data_modificacao': formatar_data(tarefa['data_modificacao'])
     }
@@ -168,11 +348,22 @@ def tarefa_carregar_dados() -> None:
     """
     try:
         dados_tarefas = carregar_json(TAREFAS_FILE)
-        if dados_tarefas:
-            for tarefa_data in dados_tarefas.values():
-                tarefa = tarefa_from_dict(tarefa_data)
-                if tarefa:
-                    _tarefas_registradas[tarefa['id']] = tarefa
+        with _lock_registro:
+            if dados_tarefas:
+                for tarefa_data in dados_tarefas.values():
+                    tarefa = tarefa_from_dict(tarefa_data)
+                    if tarefa:
+                        _tarefas_registradas[tarefa['id']] = tarefa
+            _recalcular_contagens()
+            
+            dados_rollups = carregar_json(ROLLUPS_TAREFAS_FILE)
+            if dados_rollups:
+                for metrica, intervalos in _rollups.items():
+                    for intervalo, contagens in intervalos.items():
+                        contagens.clear()
+                        contagens.update(dados_rollups.get(metrica, {}).get(intervalo, {}))
+            else:
+                _reconstruir_rollups()
         
         log_operacao("Tarefa", "Dados carregados", f"Total de tarefas: {len(_tarefas_registradas)}")
                     
@@ -188,8 +379,13 @@ def tarefa_salvar_dados() -> bool:
         bool: True se salvou com sucesso, False caso contrário
     """
     try:
-        dados_tarefas = {str(tid): tarefa_to_dict(tarefa) for tid, tarefa in _tarefas_registradas.items()}
-        if salvar_json(dados_tarefas, TAREFAS_FILE):
+        with _lock_registro.leitura():
+            dados_tarefas = {str(tid): tarefa_to_dict(tarefa) for tid, tarefa in _tarefas_registradas.items()}
+            dados_rollups = {
+                metrica: {intervalo: dict(contagens) for intervalo, contagens in intervalos.items()}
+                for metrica, intervalos in _rollups.items()
+            }
+        if salvar_json(dados_tarefas, TAREFAS_FILE) and salvar_json(dados_rollups, ROLLUPS_TAREFAS_FILE):
             log_operacao("Tarefa", "Dados salvos", f"Total de tarefas: {len(_tarefas_registradas)}")
             return True
         else:
@@ -220,20 +416,263 @@ def tarefa_registrar(tarefa: Dict[str, Any]) -> int:
             log_operacao("Tarefa", "Erro ao registrar", "ID da tarefa inválido")
             return ERRO
         
-        # Verifica se a tarefa já está registrada
-        if tarefa_id in _tarefas_registradas:
-            log_operacao("Tarefa", "Erro ao registrar", f"Tarefa {tarefa_id} já registrada")
+        with _lock_registro:
+            # Verifica se a tarefa já está registrada
+            if tarefa_id in _tarefas_registradas:
+                log_operacao("Tarefa", "Erro ao registrar", f"Tarefa {tarefa_id} já registrada")
+                return ERRO
+            
+            # Registra a tarefa
+            _tarefas_registradas[tarefa_id] = tarefa
+            _registro_alterado(tarefa, entrou=True)
+        if log_ativo("Tarefa"):
+            log_operacao("Tarefa", "Tarefa registrada", f"ID: {tarefa_id}")
+        return SUCESSO
+        
+    except Exception as e:
+        log_operacao("Tarefa", "Erro ao registrar", f"Falha: {str(e)}")
+        return ERRO
+
+def tarefa_remover(tarefa_id: int) -> int:
+    """
+    Remove uma tarefa da estrutura encapsulada.
+    
+    Args:
+        tarefa_id (int): ID da tarefa a ser removida
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro (tarefa não registrada)
+    """
+    with _lock_registro:
+        tarefa = _tarefas_registradas.pop(tarefa_id, None)
+        if tarefa is None:
+            log_operacao("Tarefa", "Erro ao remover", f"Tarefa {tarefa_id} não registrada")
             return ERRO
+        _registro_alterado(tarefa, saiu=True)
+    
+    log_operacao("Tarefa", "Tarefa removida", f"ID: {tarefa_id}")
+    return SUCESSO
+
+def tarefa_aplicar_replica(dados: Dict[int, Optional[Dict[str, Any]]], completo: bool = False) -> int:
+    """
+    Aplica à estrutura encapsulada as tarefas alteradas em outro processo (no
+    modo pré-fork, o processo escritor envia as alterações aos processos de leitura).
+    
+    Tarefas já registradas são atualizadas no lugar, preservando as referências
+    mantidas por quem as consultou. Contagens, séries temporais e observadores
+    são atualizados como nas alterações locais.
+    
+    Args:
+        dados (Dict[int, Dict]): Dados das tarefas por ID (None remove a tarefa)
+        completo (bool): Se True, dados contém todas as tarefas e as ausentes são removidas
         
-        # Registra a tarefa
-        _tarefas_registradas[tarefa_id] = tarefa
-        log_operacao("Tarefa", "Tarefa registrada", f"ID: {tarefa_id}")
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    try:
+        with _lock_registro:
+            if completo:
+                for tarefa_id in [tarefa_id for tarefa_id in _tarefas_registradas if tarefa_id not in dados]:
+                    _registro_alterado(_tarefas_registradas.pop(tarefa_id), saiu=True)
+            
+            for tarefa_id, tarefa_dados in dados.items():
+                registrada = _tarefas_registradas.get(tarefa_id)
+                if tarefa_dados is None:
+                    if registrada is not None:
+                        del _tarefas_registradas[tarefa_id]
+                        _registro_alterado(registrada, saiu=True)
+                    continue
+                tarefa = tarefa_from_dict(tarefa_dados)
+                if tarefa is None:
+                    continue
+                if registrada is None:
+                    _tarefas_registradas[tarefa_id] = tarefa
+                    _registro_alterado(tarefa, entrou=True)
+                else:
+                    status_anterior = registrada['status']
+                    registrada.clear()
+                    registrada.update(tarefa)
+                    _registro_alterado(registrada, status_anterior=status_anterior)
         return SUCESSO
         
     except Exception as e:
-        log_operacao("Tarefa", "Erro ao registrar", f"Falha: {str(e)}")
+        log_operacao("Tarefa", "Erro ao aplicar réplica", f"Falha: {str(e)}")
         return ERRO
 
+def tarefa_lock_registro() -> LockLeituraEscrita:
+    """
+    Obtém o lock de leitura e escrita da estrutura encapsulada.
+    
+    Usado em um bloco with, adquire a escrita: permite que operações em lote
+    registrem e removam várias tarefas com uma única aquisição do lock (a
+    escrita é reentrante). leitura() obtém uma visão consistente de várias
+    consultas sem bloquear outras leituras.
+    
+    Returns:
+        LockLeituraEscrita: Lock da estrutura encapsulada
+    """
+    return _lock_registro
+
+def tarefa_snapshot() -> SnapshotTarefas:
+    """
+    Obtém a fotografia imutável das tarefas registradas na versão atual.
+    
+    As tarefas da fotografia são cópias somente leitura, substituídas a cada
+    alteração da tarefa original: percorrê-las dispensa o lock, não bloqueia
+    as escritas e não é afetado por elas (exportações longas e listagens veem
+    sempre uma versão consistente). A fotografia é montada uma vez por versão,
+    na primeira consulta após uma alteração.
+    
+    As tarefas obtidas não podem ser alteradas; para alterar, use as tarefas
+    de tarefa_buscar_por_id ou tarefa_listar_todas.
+    
+    Returns:
+        SnapshotTarefas: Versão e tupla das tarefas (somente leitura)
+    """
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot.versao == _versao_registro:
+        return snapshot
+    
+    with _lock_registro.leitura():
+        snapshot = SnapshotTarefas(_versao_registro, tuple(_tarefas_congeladas.values()))
+    # Leitores concorrentes podem montar a mesma versão; só uma mais nova é publicada
+    if snapshot.versao > _snapshot.versao:
+        _snapshot = snapshot
+    return snapshot
+
+def tarefa_buscar_congelada(tarefa_id: int) -> Optional[Mapping[str, Any]]:
+    """
+    Obtém a cópia somente leitura de uma tarefa registrada, a mesma que compõe
+    a fotografia (ver tarefa_snapshot). A cópia não muda: cada alteração da
+    tarefa gera uma nova, de modo que cópias obtidas em momentos diferentes
+    podem ser comparadas para saber quais campos mudaram.
+    
+    Args:
+        tarefa_id (int): ID da tarefa
+        
+    Returns:
+        Mapping ou None: Cópia somente leitura ou None se não estiver registrada (ou tiver sido destruída)
+    """
+    with _lock_registro.leitura():
+        return _tarefas_congeladas.get(tarefa_id)
+
+def tarefa_adicionar_observador(observador: Callable[[str, Optional[Dict[str, Any]]], None]) -> int:
+    """
+    Registra uma função a ser notificada a cada registro, remoção ou alteração
+    de tarefa registrada.
+    
+    A função recebe o evento (ver EVENTOS_OBSERVADOR) e a tarefa, e é chamada
+    na thread que fez a alteração, com o lock da estrutura encapsulada adquirido.
+    
+    Args:
+        observador (Callable): Função observador(evento, tarefa)
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro (nulo ou já registrado)
+    """
+    if observador is None or observador in _observadores:
+        log_operacao("Tarefa", "Erro ao adicionar observador", "Observador nulo ou já registrado")
+        return ERRO
+    
+    with _lock_registro:
+        _observadores.append(observador)
+    return SUCESSO
+
+def tarefa_remover_observador(observador: Callable[[str, Optional[Dict[str, Any]]], None]) -> int:
+    """
+    Remove uma função registrada com tarefa_adicionar_observador.
+    
+    Args:
+        observador (Callable): Função a remover
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro (não registrado)
+    """
+    with _lock_registro:
+        if observador not in _observadores:
+            return ERRO
+        _observadores.remove(observador)
+    return SUCESSO
+
+def tarefa_versao() -> int:
+    """
+    Obtém a versão atual da estrutura encapsulada.
+    
+    A versão muda a cada registro, remoção ou alteração de uma tarefa
+    registrada, permitindo que resultados derivados sejam reaproveitados
+    enquanto ela não mudar.
+    
+    Returns:
+        int: Versão da estrutura encapsulada
+    """
+    return _versao_registro
+
+def tarefa_contagem_por_status() -> Dict[StatusTarefa, int]:
+    """
+    Obtém a quantidade de tarefas registradas por status, mantida a cada
+    alteração (sem percorrer as tarefas).
+    
+    Returns:
+        Dict[StatusTarefa, int]: Quantidade de tarefas para cada status
+    """
+    with _lock_registro.leitura():
+        return {status: _contagem_status.get(status, 0) for status in StatusTarefa}
+
+def tarefa_serie_temporal(metrica: str, intervalo: str, inicio: Optional[datetime] = None,
+                          fim: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Obtém a quantidade de tarefas criadas ('created') ou concluídas
+    ('completed') por hora ou dia, a partir das contagens mantidas (sem
+    percorrer as tarefas).
+    
+    Os intervalos sem eventos entre inicio e fim são preenchidos com zero.
+    
+    Args:
+        metrica (str): 'created' ou 'completed'
+        intervalo (str): 'hour' ou 'day'
+        inicio (datetime, optional): Início do período (padrão: primeiro intervalo com eventos)
+        fim (datetime, optional): Fim do período, inclusive (padrão: último intervalo com eventos)
+        
+    Returns:
+        List[Dict]: {'bucket': chave do intervalo, 'count': quantidade}, em ordem cronológica
+        
+    Raises:
+        ValueError: Se a métrica, o intervalo ou o período forem inválidos
+    """
+    if metrica not in METRICAS_SERIE_TEMPORAL:
+        raise ValueError(f"Métrica inválida. Use: {', '.join(METRICAS_SERIE_TEMPORAL)}")
+    if intervalo not in INTERVALOS_SERIE_TEMPORAL:
+        raise ValueError(f"Intervalo inválido. Use: {', '.join(INTERVALOS_SERIE_TEMPORAL)}")
+    
+    formato = _FORMATOS_INTERVALO[intervalo]
+    with _lock_registro.leitura():
+        contagens = dict(_rollups[metrica][intervalo])
+    
+    if inicio is None or fim is None:
+        if not contagens:
+            return []
+        if inicio is None:
+            inicio = datetime.strptime(min(contagens), formato)
+        if fim is None:
+            fim = datetime.strptime(max(contagens), formato)
+    
+    # Alinha o início ao começo do intervalo (as chaves não têm fuso horário)
+    atual = datetime.strptime(inicio.strftime(formato), formato)
+    fim = fim.replace(tzinfo=None)
+    if fim < atual:
+        raise ValueError("Período inválido: fim anterior ao início")
+    passo = _PASSOS_INTERVALO[intervalo]
+    if (fim - atual) // passo >= MAX_PONTOS_SERIE_TEMPORAL:
+        raise ValueError(f"Período muito longo: máximo de {MAX_PONTOS_SERIE_TEMPORAL} intervalos")
+    
+    serie = []
+    while atual <= fim:
+        chave = atual.strftime(formato)
+        serie.append({'bucket': chave, 'count': contagens.get(chave, 0)})
+        atual += passo
+    return serie
+
 def tarefa_listar_todas() -> List[Dict[str, Any]]:
     """
     Lista todas as tarefas registradas na estrutura encapsulada.
@@ -241,7 +680,84 @@ def tarefa_listar_todas() -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: Lista de todas as tarefas em formato dicionário
     """
-    return list(_tarefas_registradas.values())
+    with _lock_registro.leitura():
+        return list(_tarefas_registradas.values())
+
+def tarefa_qtd_registradas() -> int:
+    """
+    Obtém a quantidade de tarefas registradas, sem copiar a estrutura encapsulada.
+    
+    Returns:
+        int: Quantidade de tarefas registradas
+    """
+    return len(_tarefas_registradas)
+
+def tarefa_buscar_por_id(tarefa_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Obtém uma tarefa registrada pelo ID, com acesso direto à estrutura encapsulada.
+    
+    Args:
+        tarefa_id (int): ID da tarefa
+        
+    Returns:
+        Dict ou None: Tarefa em formato dicionário ou None se não estiver registrada (ou tiver sido destruída)
+    """
+    with _lock_registro.leitura():
+        # Entidades destruídas permanecem no registro como dicionários vazios
+        return _tarefas_registradas.get(tarefa_id) or None
+
+def tarefa_buscar_por_ids(ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Obtém várias tarefas registradas pelos IDs, na ordem informada.
+    IDs não registrados ou de entidades destruídas são ignorados.
+    
+    Args:
+        ids (Iterable[int]): IDs das tarefas
+        
+    Returns:
+        List[Dict]: Tarefas encontradas em formato dicionário
+    """
+    with _lock_registro.leitura():
+        entidades = (_tarefas_registradas.get(tarefa_id) for tarefa_id in ids)
+        return [entidade for entidade in entidades if entidade]
+
+def tarefa_listar_ordenadas(campo: str, limite: Optional[int] = None, decrescente: bool = False,
+                            tarefas: Optional[Iterable[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """
+    Lista as tarefas ordenadas por um campo de data.
+    
+    Com limite, seleciona apenas as k primeiras via heap (O(N log k)) em vez
+    de ordenar todo o conjunto. Tarefas sem valor no campo ficam por último.
+    
+    Args:
+        campo (str): Campo de ordenação (um dos CAMPOS_ORDENACAO)
+        limite (int, optional): Quantidade máxima de tarefas retornadas
+        decrescente (bool): Ordena do maior para o menor valor
+        tarefas (Iterable[Dict], optional): Conjunto candidato (padrão: todas as registradas)
+        
+    Returns:
+        List[Dict]: Tarefas ordenadas (vazia se o campo for inválido)
+    """
+    if campo not in CAMPOS_ORDENACAO:
+        log_operacao("Tarefa", "Erro ao ordenar", f"Campo de ordenação inválido: {campo}")
+        return []
+    
+    tarefas = tarefa_listar_todas() if tarefas is None else list(tarefas)
+    
+    def selecionar(chave):
+        if limite is None:
+            return sorted(tarefas, key=chave, reverse=decrescente)
+        if decrescente:
+            return heapq.nlargest(limite, tarefas, key=chave)
+        return heapq.nsmallest(limite, tarefas, key=chave)
+    
+    try:
+        ausente = datetime.min if decrescente else datetime.max
+        return selecionar(lambda tarefa: tarefa[campo] or ausente)
+    except TypeError:
+        # Datas com e sem fuso horário misturadas: compara por timestamp
+        ausente = float('-inf') if decrescente else float('inf')
+        return selecionar(lambda tarefa: tarefa[campo].timestamp() if tarefa[campo] else ausente)
 
 # Funções da interface pública (conforme especificação)
 
@@ -299,7 +815,8 @@ def tarefa_criar(titulo: str, descricao: str, usuario_responsavel, prazo: dateti
     try:
         # Cria a tarefa
         tarefa = _criar_tarefa_dict(titulo.strip(), descricao.strip(), usuario_responsavel, prazo)
-        log_operacao("Tarefa", "Criada com sucesso", f"ID: {tarefa['id']}, Título: {titulo}")
+        if log_ativo("Tarefa"):
+            log_operacao("Tarefa", "Criada com sucesso", f"ID: {tarefa['id']}, Título: {titulo}")
         return tarefa
         
     except Exception as e:
@@ -353,11 +870,14 @@ def tarefa_set_status(tarefa: Dict[str, Any], status: StatusTarefa) -> int:
         return ERRO
     
     try:
-        status_antigo = tarefa['status']
-        tarefa['status'] = status
-        tarefa['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            status_antigo = tarefa['status']
+            tarefa['status'] = status
+            tarefa['data_modificacao'] = datetime.now()
+            _registro_alterado(tarefa, status_anterior=status_antigo)
         
-        log_operacao("Tarefa", "Status alterado", f"ID: {tarefa['id']}, '{status_antigo.value}' -> '{status.value}'")
+        if log_ativo("Tarefa"):
+            log_operacao("Tarefa", "Status alterado", f"ID: {tarefa['id']}, '{status_antigo.value}' -> '{status.value}'")
         return SUCESSO
         
     except Exception as e:
@@ -420,16 +940,19 @@ def tarefa_add_tag(tarefa: Dict[str, Any], tag) -> int:
         else:
             tag_id = tag
         
-        # Verifica se a tag já está na tarefa
-        if tag_id in tarefa['tags']:
-            log_operacao("Tarefa", "Erro ao adicionar tag", f"Tag {tag_id} já está na tarefa")
-            return ERRO
-        
-        # Adiciona a tag à tarefa
-        tarefa['tags'].append(tag_id)
-        tarefa['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            # Verifica se a tag já está na tarefa
+            if tag_id in tarefa['tags']:
+                log_operacao("Tarefa", "Erro ao adicionar tag", f"Tag {tag_id} já está na tarefa")
+                return ERRO
+            
+            # Adiciona a tag à tarefa
+            tarefa['tags'].append(tag_id)
+            tarefa['data_modificacao'] = datetime.now()
+            _registro_alterado(tarefa)
         
-        log_operacao("Tarefa", "Tag adicionada", f"Tarefa ID: {tarefa['id']}, Tag ID: {tag_id}")
+        if log_ativo("Tarefa"):
+            log_operacao("Tarefa", "Tag adicionada", f"Tarefa ID: {tarefa['id']}, Tag ID: {tag_id}")
         return SUCESSO
         
     except Exception as e:
@@ -604,7 +1127,7 @@ def tarefa_get_tags_ids(tarefa: Dict[str, Any]) -> List[int]:
         return []
     
     try:
-        return tarefa['tags'].copy()
+        return list(tarefa['tags'])
     except Exception as e:
         log_operacao("Tarefa", "Erro ao obter tags", f"Falha: {str(e)}")
         return []
@@ -637,14 +1160,15 @@ def tarefa_remover_tag(tarefa: Dict[str, Any], tag) -> int:
         else:
             tag_id = tag
         
-        # Verifica se a tag está na tarefa
-        if tag_id not in tarefa['tags']:
-            log_operacao("Tarefa", "Erro ao remover tag", f"Tag {tag_id} não está na tarefa")
-            return ERRO
-        
-        # Remove a tag da tarefa
-        tarefa['tags'].remove(tag_id)
-        tarefa['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            # Verifica se a tag está na tarefa
+            if tag_id not in tarefa['tags']:
+                log_operacao("Tarefa", "Erro ao remover tag", f"Tag {tag_id} não está na tarefa")
+                return ERRO
+            # Remove a tag da tarefa
+            tarefa['tags'].remove(tag_id)
+            tarefa['data_modificacao'] = datetime.now()
+            _registro_alterado(tarefa)
         
         log_operacao("Tarefa", "Tag removida", f"Tarefa ID: {tarefa['id']}, Tag ID: {tag_id}")
         return SUCESSO
@@ -678,8 +1202,10 @@ def tarefa_set_titulo(tarefa: Dict[str, Any], novo_titulo: str) -> int:
     
     try:
         titulo_antigo = tarefa['titulo']
-        tarefa['titulo'] = novo_titulo.strip()
-        tarefa['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            tarefa['titulo'] = novo_titulo.strip()
+            tarefa['data_modificacao'] = datetime.now()
+            _registro_alterado(tarefa)
         
         log_operacao("Tarefa", "Título alterado", f"ID: {tarefa['id']}, '{titulo_antigo}' -> '{novo_titulo}'")
         return SUCESSO
@@ -713,8 +1239,10 @@ def tarefa_set_descricao(tarefa: Dict[str, Any], nova_descricao: str) -> int:
     
     try:
         descricao_antiga = tarefa['descricao']
-        tarefa['descricao'] = nova_descricao.strip()
-        tarefa['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            tarefa['descricao'] = nova_descricao.strip()
+            tarefa['data_modificacao'] = datetime.now()
+            _registro_alterado(tarefa)
         
         log_operacao("Tarefa", "Descrição alterada", f"ID: {tarefa['id']}, '{descricao_antiga}' -> '{nova_descricao}'")
         return SUCESSO
@@ -748,8 +1276,10 @@ def tarefa_set_prazo(tarefa: Dict[str, Any], novo_prazo: datetime) -> int:
     
     try:
         prazo_antigo = tarefa['prazo']
-        tarefa['prazo'] = novo_prazo
-        tarefa['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            tarefa['prazo'] = novo_prazo
+            tarefa['data_modificacao'] = datetime.now()
+            _registro_alterado(tarefa)
         
         log_operacao("Tarefa", "Prazo alterado", f"ID: {tarefa['id']}, '{prazo_antigo}' -> '{novo_prazo}'")
         return SUCESSO
@@ -20,11 +20,18 @@ ESTRUTURAS ENCAPSULADAS:
 - time_carregar_dados: Carrega times dos arquivos JSON
 - time_salvar_dados: Salva times nos arquivos JSON
 - time_registrar: Registra um time no sistema
+- time_remover: Remove um time do sistema
 - time_listar_todos: Lista todos os times registrados
+- time_qtd_registrados: Quantidade de times registrados
+- time_buscar_por_id / time_buscar_por_ids: Obtêm times registrados pelo ID
+- time_versao: Versão da estrutura encapsulada (muda a cada alteração)
+- time_lock_registro: Lock de leitura e escrita da estrutura encapsulada (para leituras consistentes)
+- time_aplicar_replica: Aplica alterações feitas em outro processo (modo pré-fork)
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from datetime import datetime
+import itertools
 import sys
 import os
 
@@ -43,7 +50,14 @@ __all__ = [
     "time_carregar_dados",
     "time_salvar_dados",
     "time_registrar",
-    "time_listar_todos"
+    "time_remover",
+    "time_listar_todos",
+    "time_qtd_registrados",
+    "time_buscar_por_id",
+    "time_buscar_por_ids",
+    "time_versao",
+    "time_lock_registro",
+    "time_aplicar_replica"
 ]
 
 # Adiciona o diretório raiz ao path se não estiver lá
@@ -53,11 +67,28 @@ if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
 from config import SUCESSO, ERRO, MAX_NOME_LENGTH, TIMES_FILE
-from utils import gerar_id_unico, validar_string_nao_vazia, log_operacao, formatar_data, carregar_json, salvar_json
+from utils import (
+    gerar_id_unico, validar_string_nao_vazia, log_operacao, formatar_data, carregar_json, salvar_json,
+    LockLeituraEscrita
+)
 
 # Estrutura encapsulada para armazenar todos os times registrados
 _times_registrados: Dict[int, Dict[str, Any]] = {}
 
+# Versão da estrutura encapsulada, renovada a cada registro ou alteração de
+# time (nome e membros); itertools.count garante incrementos atômicos
+_contador_versao = itertools.count(1)
+_versao_registro = 0
+
+def _registro_alterado() -> None:
+    """Renova a versão da estrutura encapsulada após uma alteração."""
+    global _versao_registro
+    _versao_registro = next(_contador_versao)
+
+# Lock de leitura e escrita da estrutura encapsulada: registros e alterações
+# são serializados e as listagens podem ocorrer em paralelo
+_lock_registro = LockLeituraEscrita()
+
 def _criar_time_dict(nome: str) -> Dict[str, Any]:
     """
     Cria um dicionário representando um time.
@@ -128,11 +159,13 @@ def time_carregar_dados() -> None:
     """
     try:
         dados_times = carregar_json(TIMES_FILE)
-        if dados_times:
-            for time_data in dados_times.values():
-                time = time_from_dict(time_data)
-                if time:
-                    _times_registrados[time['id']] = time
+        with _lock_registro:
+            if dados_times:
+                for time_data in dados_times.values():
+                    time = time_from_dict(time_data)
+                    if time:
+                        _times_registrados[time['id']] = time
+                        _registro_alterado()
         
         log_operacao("Time", "Dados carregados", f"Total de times: {len(_times_registrados)}")
                     
@@ -148,7 +181,8 @@ def time_salvar_dados() -> bool:
         bool: True se salvou com sucesso, False caso contrário
     """
     try:
-        dados_times = {str(tid): time_to_dict(time) for tid, time in _times_registrados.items()}
+        with _lock_registro.leitura():
+            dados_times = {str(tid): time_to_dict(time) for tid, time in _times_registrados.items()}
         if salvar_json(dados_times, TIMES_FILE):
             log_operacao("Time", "Dados salvos", f"Total de times: {len(_times_registrados)}")
             return True
@@ -180,13 +214,15 @@ def time_registrar(time: Dict[str, Any]) -> int:
             log_operacao("Time", "Erro ao registrar", "ID do time inválido")
             return ERRO
         
-        # Verifica se o time já está registrado
-        if time_id in _times_registrados:
-            log_operacao("Time", "Erro ao registrar", f"Time {time_id} já registrado")
-            return ERRO
-        
-        # Registra o time
-        _times_registrados[time_id] = time
+        with _lock_registro:
+            # Verifica se o time já está registrado
+            if time_id in _times_registrados:
+                log_operacao("Time", "Erro ao registrar", f"Time {time_id} já registrado")
+                return ERRO
+            
+            # Registra o time
+            _times_registrados[time_id] = time
+            _registro_alterado()
         log_operacao("Time", "Time registrado", f"ID: {time_id}")
         return SUCESSO
         
@@ -194,6 +230,90 @@ def time_registrar(time: Dict[str, Any]) -> int:
         log_operacao("Time", "Erro ao registrar", f"Falha: {str(e)}")
         return ERRO
 
+def time_remover(time_id: int) -> int:
+    """
+    Remove um time da estrutura encapsulada.
+    
+    Args:
+        time_id (int): ID do time a ser removido
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro (time não registrado)
+    """
+    with _lock_registro:
+        if _times_registrados.pop(time_id, None) is None:
+            log_operacao("Time", "Erro ao remover", f"Time {time_id} não registrado")
+            return ERRO
+        _registro_alterado()
+    
+    log_operacao("Time", "Time removido", f"ID: {time_id}")
+    return SUCESSO
+
+def time_aplicar_replica(dados: Dict[int, Optional[Dict[str, Any]]], completo: bool = False) -> int:
+    """
+    Aplica à estrutura encapsulada os times alterados em outro processo (no modo
+    pré-fork, o processo escritor envia as alterações aos processos de leitura).
+    
+    Times já registrados são atualizados no lugar, preservando as referências
+    mantidas por quem os consultou.
+    
+    Args:
+        dados (Dict[int, Dict]): Dados dos times por ID (None remove o time)
+        completo (bool): Se True, dados contém todos os times e os ausentes são removidos
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    try:
+        with _lock_registro:
+            if completo:
+                for time_id in [time_id for time_id in _times_registrados if time_id not in dados]:
+                    del _times_registrados[time_id]
+            
+            for time_id, time_dados in dados.items():
+                if time_dados is None:
+                    _times_registrados.pop(time_id, None)
+                    continue
+                time = time_from_dict(time_dados)
+                if time is None:
+                    continue
+                registrado = _times_registrados.get(time_id)
+                if registrado is None:
+                    _times_registrados[time_id] = time
+                else:
+                    registrado.clear()
+                    registrado.update(time)
+            _registro_alterado()
+        return SUCESSO
+        
+    except Exception as e:
+        log_operacao("Time", "Erro ao aplicar réplica", f"Falha: {str(e)}")
+        return ERRO
+
+def time_versao() -> int:
+    """
+    Obtém a versão atual da estrutura encapsulada.
+    
+    A versão muda a cada registro de time ou alteração de nome ou membros,
+    permitindo que resultados derivados sejam reaproveitados enquanto ela não mudar.
+    
+    Returns:
+        int: Versão da estrutura encapsulada
+    """
+    return _versao_registro
+
+def time_lock_registro() -> LockLeituraEscrita:
+    """
+    Obtém o lock de leitura e escrita da estrutura encapsulada.
+    
+    leitura() obtém uma visão consistente de várias consultas: as alterações
+    aguardam o fim do bloco, sem bloquear outras leituras.
+    
+    Returns:
+        LockLeituraEscrita: Lock da estrutura encapsulada
+    """
+    return _lock_registro
+
 def time_listar_todos() -> List[Dict[str, Any]]:
     """
     Lista todos os times registrados na estrutura encapsulada.
@@ -201,7 +321,46 @@ def time_listar_todos() -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: Lista de todos os times em formato dicionário
     """
-    return list(_times_registrados.values())
+    with _lock_registro.leitura():
+        return list(_times_registrados.values())
+
+def time_qtd_registrados() -> int:
+    """
+    Obtém a quantidade de times registrados, sem copiar a estrutura encapsulada.
+    
+    Returns:
+        int: Quantidade de times registrados
+    """
+    return len(_times_registrados)
+
+def time_buscar_por_id(time_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Obtém um time registrado pelo ID, com acesso direto à estrutura encapsulada.
+    
+    Args:
+        time_id (int): ID do time
+        
+    Returns:
+        Dict ou None: Time em formato dicionário ou None se não estiver registrado
+    """
+    with _lock_registro.leitura():
+        # Entidades destruídas permanecem no registro como dicionários vazios
+        return _times_registrados.get(time_id) or None
+
+def time_buscar_por_ids(ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Obtém vários times registrados pelos IDs, na ordem informada.
+    IDs não registrados ou de entidades destruídas são ignorados.
+    
+    Args:
+        ids (Iterable[int]): IDs dos times
+        
+    Returns:
+        List[Dict]: Times encontrados em formato dicionário
+    """
+    with _lock_registro.leitura():
+        entidades = (_times_registrados.get(time_id) for time_id in ids)
+        return [entidade for entidade in entidades if entidade]
 
 # Funções da interface pública (conforme especificação)
 
@@ -256,7 +415,9 @@ def time_destruir(time: Dict[str, Any]) -> None:
     
     log_operacao("Time", "Destruído", f"ID: {time['id']}")
     # Em Python, o garbage collector cuida da liberação de memória
-    time.clear()
+    with _lock_registro:
+        time.clear()
+        _registro_alterado()
 
 def time_adicionar_usuario(time: Dict[str, Any], usuario) -> int:
     """
@@ -291,14 +452,16 @@ def time_adicionar_usuario(time: Dict[str, Any], usuario) -> int:
         else:
             usuario_id = usuario
         
-        # Verifica se o usuário já está no time
-        if usuario_id in time['membros']:
-            log_operacao("Time", "Erro ao adicionar usuário", f"Usuário {usuario_id} já está no time")
-            return ERRO
-        
-        # Adiciona o usuário ao time
-        time['membros'].append(usuario_id)
-        time['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            # Verifica se o usuário já está no time
+            if usuario_id in time['membros']:
+                log_operacao("Time", "Erro ao adicionar usuário", f"Usuário {usuario_id} já está no time")
+                return ERRO
+            
+            # Adiciona o usuário ao time
+            time['membros'].append(usuario_id)
+            _registro_alterado()
+            time['data_modificacao'] = datetime.now()
         
         log_operacao("Time", "Usuário adicionado", f"Time ID: {time['id']}, Usuário ID: {usuario_id}")
         return SUCESSO
@@ -340,14 +503,16 @@ def time_remover_usuario(time: Dict[str, Any], usuario) -> int:
         else:
             usuario_id = usuario
         
-        # Verifica se o usuário está no time
-        if usuario_id not in time['membros']:
-            log_operacao("Time", "Erro ao remover usuário", f"Usuário {usuario_id} não está no time")
-            return ERRO
-        
-        # Remove o usuário do time
-        time['membros'].remove(usuario_id)
-        time['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            # Verifica se o usuário está no time
+            if usuario_id not in time['membros']:
+                log_operacao("Time", "Erro ao remover usuário", f"Usuário {usuario_id} não está no time")
+                return ERRO
+            
+            # Remove o usuário do time
+            time['membros'].remove(usuario_id)
+            _registro_alterado()
+            time['data_modificacao'] = datetime.now()
         
         log_operacao("Time", "Usuário removido", f"Time ID: {time['id']}, Usuário ID: {usuario_id}")
         return SUCESSO
@@ -466,9 +631,11 @@ def time_set_nome(time: Dict[str, Any], novo_nome: str) -> int:
         return ERRO
     
     try:
-        nome_antigo = time['nome']
-        time['nome'] = novo_nome.strip()
-        time['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            nome_antigo = time['nome']
+            time['nome'] = novo_nome.strip()
+            _registro_alterado()
+            time['data_modificacao'] = datetime.now()
         
         log_operacao("Time", "Nome alterado", f"ID: {time['id']}, '{nome_antigo}' -> '{novo_nome}'")
         return SUCESSO
@@ -20,11 +20,18 @@ ESTRUTURAS ENCAPSULADAS:
 - usuario_carregar_dados: Carrega usuários dos arquivos JSON
 - usuario_salvar_dados: Salva usuários nos arquivos JSON
 - usuario_registrar: Registra um usuário no sistema
+- usuario_remover: Remove um usuário do sistema
 - usuario_listar_todos: Lista todos os usuários registrados
+- usuario_qtd_registrados: Quantidade de usuários registrados
+- usuario_buscar_por_id / usuario_buscar_por_ids: Obtêm usuários registrados pelo ID
+- usuario_versao: Versão da estrutura encapsulada (muda a cada alteração)
+- usuario_lock_registro: Lock de leitura e escrita da estrutura encapsulada (para leituras consistentes)
+- usuario_aplicar_replica: Aplica alterações feitas em outro processo (modo pré-fork)
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from datetime import datetime
+import itertools
 import sys
 import os
 
@@ -43,7 +50,14 @@ __all__ = [
     "usuario_carregar_dados",
     "usuario_salvar_dados",
     "usuario_registrar",
-    "usuario_listar_todos"
+    "usuario_remover",
+    "usuario_listar_todos",
+    "usuario_qtd_registrados",
+    "usuario_buscar_por_id",
+    "usuario_buscar_por_ids",
+    "usuario_versao",
+    "usuario_lock_registro",
+    "usuario_aplicar_replica"
 ]
 
 # Adiciona o diretório raiz ao path se não estiver lá
@@ -53,11 +67,28 @@ if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
 from config import SUCESSO, ERRO, validar_email, MAX_NOME_LENGTH, MAX_EMAIL_LENGTH, USUARIOS_FILE
-from utils import gerar_id_unico, validar_string_nao_vazia, log_operacao, formatar_data, carregar_json, salvar_json
+from utils import (
+    gerar_id_unico, validar_string_nao_vazia, log_operacao, formatar_data, carregar_json, salvar_json,
+    LockLeituraEscrita
+)
 
 # Estrutura encapsulada para armazenar todos os usuários registrados
 _usuarios_registrados: Dict[int, Dict[str, Any]] = {}
 
+# Versão da estrutura encapsulada, renovada a cada registro ou alteração de usuário
+# (nome e email); itertools.count garante incrementos atômicos
+_contador_versao = itertools.count(1)
+_versao_registro = 0
+
+def _registro_alterado() -> None:
+    """Renova a versão da estrutura encapsulada após uma alteração."""
+    global _versao_registro
+    _versao_registro = next(_contador_versao)
+
+# Lock de leitura e escrita da estrutura encapsulada: registros e alterações
+# são serializados e as listagens podem ocorrer em paralelo
+_lock_registro = LockLeituraEscrita()
+
 def _criar_usuario_dict(nome: str, email: str) -> Dict[str, Any]:
     """
     Cria um dicionário representando um usuário.
@@ -129,11 +160,13 @@ def usuario_carregar_dados() -> None:
     """
     try:
         dados_usuarios = carregar_json(USUARIOS_FILE)
-        if dados_usuarios:
-            for user_data in dados_usuarios.values():
-                usuario = usuario_from_dict(user_data)
-                if usuario:
-                    _usuarios_registrados[usuario['id']] = usuario
+        with _lock_registro:
+            if dados_usuarios:
+                for user_data in dados_usuarios.values():
+                    usuario = usuario_from_dict(user_data)
+                    if usuario:
+                        _usuarios_registrados[usuario['id']] = usuario
+                        _registro_alterado()
         
         log_operacao("Usuario", "Dados carregados", f"Total de usuários: {len(_usuarios_registrados)}")
                     
@@ -149,7 +182,8 @@ def usuario_salvar_dados() -> bool:
         bool: True se salvou com sucesso, False caso contrário
     """
     try:
-        dados_usuarios = {str(uid): usuario_to_dict(user) for uid, user in _usuarios_registrados.items()}
+        with _lock_registro.leitura():
+            dados_usuarios = {str(uid): usuario_to_dict(user) for uid, user in _usuarios_registrados.items()}
         if salvar_json(dados_usuarios, USUARIOS_FILE):
             log_operacao("Usuario", "Dados salvos", f"Total de usuários: {len(_usuarios_registrados)}")
             return True
@@ -181,13 +215,15 @@ def usuario_registrar(usuario: Dict[str, Any]) -> int:
             log_operacao("Usuario", "Erro ao registrar", "ID do usuário inválido")
             return ERRO
         
-        # Verifica se o usuário já está registrado
-        if usuario_id in _usuarios_registrados:
-            log_operacao("Usuario", "Erro ao registrar", f"Usuário {usuario_id} já registrado")
-            return ERRO
-        
-        # Registra o usuário
-        _usuarios_registrados[usuario_id] = usuario
+        with _lock_registro:
+            # Verifica se o usuário já está registrado
+            if usuario_id in _usuarios_registrados:
+                log_operacao("Usuario", "Erro ao registrar", f"Usuário {usuario_id} já registrado")
+                return ERRO
+            
+            # Registra o usuário
+            _usuarios_registrados[usuario_id] = usuario
+            _registro_alterado()
         log_operacao("Usuario", "Usuário registrado", f"ID: {usuario_id}")
         return SUCESSO
         
@@ -195,6 +231,90 @@ def usuario_registrar(usuario: Dict[str, Any]) -> int:
         log_operacao("Usuario", "Erro ao registrar", f"Falha: {str(e)}")
         return ERRO
 
+def usuario_remover(usuario_id: int) -> int:
+    """
+    Remove um usuário da estrutura encapsulada.
+    
+    Args:
+        usuario_id (int): ID do usuário a ser removido
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro (usuário não registrado)
+    """
+    with _lock_registro:
+        if _usuarios_registrados.pop(usuario_id, None) is None:
+            log_operacao("Usuario", "Erro ao remover", f"Usuário {usuario_id} não registrado")
+            return ERRO
+        _registro_alterado()
+    
+    log_operacao("Usuario", "Usuário removido", f"ID: {usuario_id}")
+    return SUCESSO
+
+def usuario_aplicar_replica(dados: Dict[int, Optional[Dict[str, Any]]], completo: bool = False) -> int:
+    """
+    Aplica à estrutura encapsulada os usuários alterados em outro processo (no modo
+    pré-fork, o processo escritor envia as alterações aos processos de leitura).
+    
+    Usuários já registrados são atualizados no lugar, preservando as referências
+    mantidas por quem os consultou.
+    
+    Args:
+        dados (Dict[int, Dict]): Dados dos usuários por ID (None remove o usuário)
+        completo (bool): Se True, dados contém todos os usuários e os ausentes são removidos
+        
+    Returns:
+        int: 0 para sucesso, -1 para erro
+    """
+    try:
+        with _lock_registro:
+            if completo:
+                for usuario_id in [usuario_id for usuario_id in _usuarios_registrados if usuario_id not in dados]:
+                    del _usuarios_registrados[usuario_id]
+            
+            for usuario_id, usuario_dados in dados.items():
+                if usuario_dados is None:
+                    _usuarios_registrados.pop(usuario_id, None)
+                    continue
+                usuario = usuario_from_dict(usuario_dados)
+                if usuario is None:
+                    continue
+                registrado = _usuarios_registrados.get(usuario_id)
+                if registrado is None:
+                    _usuarios_registrados[usuario_id] = usuario
+                else:
+                    registrado.clear()
+                    registrado.update(usuario)
+            _registro_alterado()
+        return SUCESSO
+        
+    except Exception as e:
+        log_operacao("Usuario", "Erro ao aplicar réplica", f"Falha: {str(e)}")
+        return ERRO
+
+def usuario_versao() -> int:
+    """
+    Obtém a versão atual da estrutura encapsulada.
+    
+    A versão muda a cada registro de usuário ou alteração de nome ou email,
+    permitindo que resultados derivados sejam reaproveitados enquanto ela não mudar.
+    
+    Returns:
+        int: Versão da estrutura encapsulada
+    """
+    return _versao_registro
+
+def usuario_lock_registro() -> LockLeituraEscrita:
+    """
+    Obtém o lock de leitura e escrita da estrutura encapsulada.
+    
+    leitura() obtém uma visão consistente de várias consultas: as alterações
+    aguardam o fim do bloco, sem bloquear outras leituras.
+    
+    Returns:
+        LockLeituraEscrita: Lock da estrutura encapsulada
+    """
+    return _lock_registro
+
 def usuario_listar_todos() -> List[Dict[str, Any]]:
     """
     Lista todos os usuários registrados na estrutura encapsulada.
@@ -202,7 +322,46 @@ def usuario_listar_todos() -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: Lista de todos os usuários em formato dicionário
     """
-    return list(_usuarios_registrados.values())
+    with _lock_registro.leitura():
+        return list(_usuarios_registrados.values())
+
+def usuario_qtd_registrados() -> int:
+    """
+    Obtém a quantidade de usuários registrados, sem copiar a estrutura encapsulada.
+    
+    Returns:
+        int: Quantidade de usuários registrados
+    """
+    return len(_usuarios_registrados)
+
+def usuario_buscar_por_id(usuario_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Obtém um usuário registrado pelo ID, com acesso direto à estrutura encapsulada.
+    
+    Args:
+        usuario_id (int): ID do usuário
+        
+    Returns:
+        Dict ou None: Usuário em formato dicionário ou None se não estiver registrado
+    """
+    with _lock_registro.leitura():
+        # Entidades destruídas permanecem no registro como dicionários vazios
+        return _usuarios_registrados.get(usuario_id) or None
+
+def usuario_buscar_por_ids(ids: Iterable[int]) -> List[Dict[str, Any]]:
+    """
+    Obtém vários usuários registrados pelos IDs, na ordem informada.
+    IDs não registrados ou de entidades destruídas são ignorados.
+    
+    Args:
+        ids (Iterable[int]): IDs dos usuários
+        
+    Returns:
+        List[Dict]: Usuários encontrados em formato dicionário
+    """
+    with _lock_registro.leitura():
+        entidades = (_usuarios_registrados.get(usuario_id) for usuario_id in ids)
+        return [entidade for entidade in entidades if entidade]
 
 # Funções da interface pública (conforme especificação)
 
@@ -271,7 +430,9 @@ def usuario_destruir(usuario: Dict[str, Any]) -> None:
     log_operacao("Usuario", "Destruído", f"ID: {usuario['id']}")
     # Em Python, o garbage collector cuida da liberação de memória
     # Mas podemos limpar as referências explicitamente se necessário
-    usuario.clear()
+    with _lock_registro:
+        usuario.clear()
+        _registro_alterado()
 
 def usuario_set_email(usuario: Dict[str, Any], novo_email: str) -> int:
     """
@@ -305,9 +466,11 @@ def usuario_set_email(usuario: Dict[str, Any], novo_email: str) -> int:
         return ERRO
     
     try:
-        email_antigo = usuario['email']
-        usuario['email'] = novo_email.strip().lower()
-        usuario['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            email_antigo = usuario['email']
+            usuario['email'] = novo_email.strip().lower()
+            usuario['data_modificacao'] = datetime.now()
+            _registro_alterado()
         
         log_operacao("Usuario", "Email alterado", f"ID: {usuario['id']}, '{email_antigo}' -> '{novo_email}'")
         return SUCESSO
@@ -344,9 +507,11 @@ def usuario_set_nome(usuario: Dict[str, Any], novo_nome: str) -> int:
         return ERRO
     
     try:
-        nome_antigo = usuario['nome']
-        usuario['nome'] = novo_nome.strip()
-        usuario['data_modificacao'] = datetime.now()
+        with _lock_registro:
+            nome_antigo = usuario['nome']
+            usuario['nome'] = novo_nome.strip()
+            usuario['data_modificacao'] = datetime.now()
+            _registro_alterado()
         
         log_operacao("Usuario", "Nome alterado", f"ID: {usuario['id']}, '{nome_antigo}' -> '{novo_nome}'")
         return SUCESSO
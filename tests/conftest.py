@@ -0,0 +1,34 @@
+"""
+Configuração compartilhada dos testes (pytest)
+
+Redireciona a persistência para uma cópia temporária de data/, para que os
+testes que chamam gt_finalizar não alterem os arquivos reais do sistema
+(o mesmo cuidado que tests/run_tests.py tem ao fazer backup dos dados).
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+# Adiciona o diretório raiz ao path para importar os módulos
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils
+from config import DATA_DIR
+
+@pytest.fixture(autouse=True, scope="session")
+def diretorio_dados_temporario(tmp_path_factory):
+    """Usa uma cópia temporária de data/ durante toda a sessão de testes"""
+    destino = tmp_path_factory.mktemp("data")
+    if os.path.isdir(DATA_DIR):
+        for nome in os.listdir(DATA_DIR):
+            caminho = os.path.join(DATA_DIR, nome)
+            if os.path.isfile(caminho):
+                shutil.copy2(caminho, destino / nome)
+    
+    original = utils.DATA_DIR
+    utils.DATA_DIR = str(destino)
+    yield destino
+    utils.DATA_DIR = original
@@ -17,7 +17,10 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Importa configurações
-from config import DATA_DIR, BACKUP_DIR, USUARIOS_FILE, TAGS_FILE, TIMES_FILE, TAREFAS_FILE
+from config import DATA_DIR, BACKUP_DIR, USUARIOS_FILE, TAGS_FILE, TIMES_FILE, TAREFAS_FILE, ROLLUPS_TAREFAS_FILE, JOBS_FILE
+
+# Lista, no diretório de backup, dos arquivos que não existiam antes dos testes
+ARQUIVO_AUSENTES = "ausentes.json"
 
 def fazer_backup_dados():
     """
@@ -38,8 +41,11 @@ def fazer_backup_dados():
             (USUARIOS_FILE, "usuarios.json"),
             (TAGS_FILE, "tags.json"),
             (TIMES_FILE, "times.json"),
-            (TAREFAS_FILE, "tarefas.json")
+            (TAREFAS_FILE, "tarefas.json"),
+            (ROLLUPS_TAREFAS_FILE, "rollups_tarefas.json"),
+            (JOBS_FILE, "jobs.json")
         ]
+        ausentes = []
         
         for arquivo_origem, nome_backup in arquivos_dados:
             caminho_origem = os.path.join(DATA_DIR, arquivo_origem)
@@ -49,10 +55,12 @@ def fazer_backup_dados():
                 shutil.copy2(caminho_origem, caminho_backup)
                 print(f"✅ Backup criado: {nome_backup}")
             else:
-                # Cria arquivo vazio se não existir
-                with open(caminho_backup, 'w') as f:
-                    json.dump({}, f)
-                print(f"✅ Arquivo vazio criado: {nome_backup}")
+                # Arquivo inexistente: anotado para ser removido na restauração
+                ausentes.append(nome_backup)
+                print(f"✅ Arquivo ausente anotado: {nome_backup}")
+        
+        with open(os.path.join(backup_path, ARQUIVO_AUSENTES), 'w') as f:
+            json.dump(ausentes, f)
         
         print(f"📦 Backup completo criado em: {backup_path}")
         return timestamp
@@ -84,14 +92,27 @@ def restaurar_dados(timestamp):
             ("usuarios.json", USUARIOS_FILE),
             ("tags.json", TAGS_FILE),
             ("times.json", TIMES_FILE),
-            ("tarefas.json", TAREFAS_FILE)
+            ("tarefas.json", TAREFAS_FILE),
+            ("rollups_tarefas.json", ROLLUPS_TAREFAS_FILE),
+            ("jobs.json", JOBS_FILE)
         ]
         
+        # Arquivos que não existiam antes dos testes
+        caminho_ausentes = os.path.join(backup_path, ARQUIVO_AUSENTES)
+        ausentes = []
+        if os.path.exists(caminho_ausentes):
+            with open(caminho_ausentes) as f:
+                ausentes = json.load(f)
+        
         for nome_backup, arquivo_destino in arquivos_dados:
             caminho_backup = os.path.join(backup_path, nome_backup)
             caminho_destino = os.path.join(DATA_DIR, arquivo_destino)
             
-            if os.path.exists(caminho_backup):
+            if nome_backup in ausentes:
+                if os.path.exists(caminho_destino):
+                    os.remove(caminho_destino)
+                    print(f"🗑️  Arquivo criado pelos testes removido: {arquivo_destino}")
+            elif os.path.exists(caminho_backup):
                 shutil.copy2(caminho_backup, caminho_destino)
                 print(f"✅ Dados restaurados: {arquivo_destino}")
             else:
@@ -147,10 +168,17 @@ def executar_todos_testes():
         # Lista de módulos de teste
         modulos_teste = [
             'test_gerenciamento_tarefas',
+            'test_gerenciamento_tarefas_async',
             'test_tarefa', 
             'test_usuario',
             'test_tag',
-            'test_time'
+            'test_time',
+            'test_agendador',
+            'test_concorrencia',
+            'test_job',
+            'test_eventos',
+            'test_log',
+            'test_rotas'
         ]
         
         total_passed = 0
@@ -0,0 +1,266 @@
+"""
+Testes unitários para o módulo Agendador de Prazos
+
+Os testes avançam a roda de temporizadores manualmente (sem a thread do
+agendador), informando instantes futuros a agendador_avancar.
+
+Testes implementados:
+1. Aviso de prazo próximo e de tarefa atrasada no instante do prazo
+2. Tarefa registrada com prazo vencido entra imediatamente no conjunto de atrasadas
+3. Alteração de prazo reagenda e retira a tarefa das atrasadas
+4. Conclusão e remoção encerram o acompanhamento
+5. Callbacks nulos ou duplicados
+6. Reinicialização não repete o aviso de tarefas já atrasadas
+"""
+
+import unittest
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+# Adiciona o diretório pai ao path para importar os módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.agendador import (
+    agendador_inicializar, agendador_finalizar, agendador_avancar,
+    agendador_adicionar_callback, agendador_remover_callback,
+    agendador_tarefas_atrasadas, agendador_esta_atrasada,
+    EVENTO_PRAZO_PROXIMO, EVENTO_ATRASADA
+)
+from modules.tarefa import (
+    tarefa_criar, tarefa_destruir, tarefa_registrar, tarefa_remover, tarefa_get_id,
+    tarefa_set_prazo, tarefa_set_status, StatusTarefa
+)
+from modules.usuario import usuario_criar, usuario_destruir
+from config import ANTECEDENCIA_PRAZO_PROXIMO
+
+def setup_test_environment():
+    """
+    Preparação comum para os testes.
+    """
+    usuario_teste = usuario_criar("João Silva", "joao@email.com")
+    eventos = []
+    callback = lambda evento, tarefa_id: eventos.append((evento, tarefa_id))
+    agendador_inicializar(iniciar_thread=False)
+    agendador_adicionar_callback(callback)
+    
+    return usuario_teste, eventos, callback
+
+def cleanup_test_environment(usuario_teste, callback, tarefas):
+    """
+    Limpeza comum após os testes.
+    """
+    for tarefa in tarefas:
+        if tarefa:
+            tarefa_remover(tarefa_get_id(tarefa))
+            tarefa_destruir(tarefa)
+    agendador_remover_callback(callback)
+    agendador_finalizar()
+    if usuario_teste:
+        usuario_destruir(usuario_teste)
+
+def eventos_das_tarefas(eventos, tarefas):
+    """Eventos das tarefas do teste (ignora tarefas registradas por outros módulos de teste)"""
+    ids = {tarefa_get_id(tarefa) for tarefa in tarefas}
+    return [evento for evento in eventos if evento[1] in ids]
+
+def criar_tarefa_registrada(usuario, prazo):
+    """Cria e registra uma tarefa com o prazo informado"""
+    tarefa = tarefa_criar("Tarefa com prazo", "Descrição", usuario, prazo)
+    tarefa_registrar(tarefa)
+    return tarefa
+
+def test_01_avisos_prazo_proximo_e_atrasada():
+    """
+    Teste 1: Aviso de prazo próximo e de tarefa atrasada no instante do prazo
+    """
+    # Setup
+    usuario_teste, eventos, callback = setup_test_environment()
+    tarefas = []
+    
+    try:
+        # Preparação
+        agora = time.time()
+        prazo = datetime.fromtimestamp(agora) + timedelta(seconds=ANTECEDENCIA_PRAZO_PROXIMO + 120)
+        tarefa = criar_tarefa_registrada(usuario_teste, prazo)
+        tarefas.append(tarefa)
+        tarefa_id = tarefa_get_id(tarefa)
+        
+        # Executa a operação e verifica
+        agendador_avancar(agora + 60)
+        assert eventos_das_tarefas(eventos, tarefas) == [], "Nenhum evento antes da antecedência configurada"
+        
+        agendador_avancar(agora + 180)
+        assert (EVENTO_PRAZO_PROXIMO, tarefa_id) in eventos, "Aviso de prazo próximo deve ser disparado"
+        assert not agendador_esta_atrasada(tarefa_id), "Tarefa ainda não está atrasada"
+        
+        agendador_avancar(prazo.timestamp() - 1)
+        assert (EVENTO_ATRASADA, tarefa_id) not in eventos, "Tarefa não deve ser atrasada antes do prazo"
+        
+        agendador_avancar(prazo.timestamp() + 1)
+        assert (EVENTO_ATRASADA, tarefa_id) in eventos, "Tarefa deve ser atrasada após o prazo"
+        assert tarefa_id in agendador_tarefas_atrasadas(), "Tarefa deve estar no conjunto de atrasadas"
+        assert eventos.count((EVENTO_ATRASADA, tarefa_id)) == 1, "Evento deve ser disparado uma única vez"
+    finally:
+        cleanup_test_environment(usuario_teste, callback, tarefas)
+
+def test_02_prazo_vencido_ao_registrar():
+    """
+    Teste 2: Tarefa registrada com prazo vencido entra imediatamente no conjunto de atrasadas
+    """
+    # Setup
+    usuario_teste, eventos, callback = setup_test_environment()
+    tarefas = []
+    
+    try:
+        # Executa a operação
+        tarefa = criar_tarefa_registrada(usuario_teste, datetime.now() - timedelta(days=1))
+        tarefas.append(tarefa)
+        tarefa_id = tarefa_get_id(tarefa)
+        
+        # Verificações
+        assert agendador_esta_atrasada(tarefa_id), "Tarefa vencida deve estar atrasada imediatamente"
+        agendador_avancar()
+        assert eventos_das_tarefas(eventos, tarefas) == [(EVENTO_ATRASADA, tarefa_id)], "Evento deve ser entregue no próximo avanço"
+    finally:
+        cleanup_test_environment(usuario_teste, callback, tarefas)
+
+def test_03_alteracao_prazo_reagenda():
+    """
+    Teste 3: Alteração de prazo reagenda e retira a tarefa das atrasadas
+    """
+    # Setup
+    usuario_teste, eventos, callback = setup_test_environment()
+    tarefas = []
+    
+    try:
+        # Preparação
+        tarefa = criar_tarefa_registrada(usuario_teste, datetime.now() - timedelta(hours=1))
+        tarefas.append(tarefa)
+        tarefa_id = tarefa_get_id(tarefa)
+        assert agendador_esta_atrasada(tarefa_id), "Tarefa vencida deve estar atrasada"
+        
+        # Executa a operação
+        novo_prazo = datetime.now() + timedelta(days=7)
+        tarefa_set_prazo(tarefa, novo_prazo)
+        
+        # Verificações
+        assert not agendador_esta_atrasada(tarefa_id), "Novo prazo deve retirar a tarefa das atrasadas"
+        agendador_avancar(novo_prazo.timestamp() + 1)
+        assert agendador_esta_atrasada(tarefa_id), "Tarefa deve ser atrasada no novo prazo"
+    finally:
+        cleanup_test_environment(usuario_teste, callback, tarefas)
+
+def test_04_conclusao_e_remocao_encerram_acompanhamento():
+    """
+    Teste 4: Conclusão e remoção encerram o acompanhamento
+    """
+    # Setup
+    usuario_teste, eventos, callback = setup_test_environment()
+    tarefas = []
+    
+    try:
+        # Preparação
+        vencida = criar_tarefa_registrada(usuario_teste, datetime.now() - timedelta(hours=1))
+        futura = criar_tarefa_registrada(usuario_teste, datetime.now() + timedelta(hours=1))
+        tarefas.extend([vencida, futura])
+        agendador_avancar()
+        eventos.clear()
+        
+        # Executa a operação
+        tarefa_set_status(vencida, StatusTarefa.TAREFA_CONCLUIDA)
+        tarefa_remover(tarefa_get_id(futura))
+        
+        # Verificações
+        assert not agendador_esta_atrasada(tarefa_get_id(vencida)), "Tarefa concluída não deve estar atrasada"
+        agendador_avancar(time.time() + 2 * 60 * 60)
+        assert eventos_das_tarefas(eventos, tarefas) == [], "Tarefa removida não deve gerar eventos"
+        
+        tarefa_set_status(vencida, StatusTarefa.TAREFA_EM_PROGRESSO)
+        assert agendador_esta_atrasada(tarefa_get_id(vencida)), "Tarefa reaberta volta a ser acompanhada"
+    finally:
+        cleanup_test_environment(usuario_teste, callback, tarefas)
+
+def test_05_callbacks_invalidos():
+    """
+    Teste 5: Callbacks nulos ou duplicados
+    """
+    # Setup
+    usuario_teste, eventos, callback = setup_test_environment()
+    
+    try:
+        # Verificações
+        assert agendador_adicionar_callback(None) == -1, "Callback nulo deve retornar erro"
+        assert agendador_adicionar_callback(callback) == -1, "Callback duplicado deve retornar erro"
+        assert agendador_remover_callback(lambda e, t: None) == -1, "Callback não registrado deve retornar erro"
+    finally:
+        cleanup_test_environment(usuario_teste, callback, [])
+
+def test_06_reinicializacao_nao_repete_atrasadas():
+    """
+    Teste 6: Reinicialização não repete o aviso de tarefas já atrasadas
+    """
+    # Setup
+    usuario_teste, eventos, callback = setup_test_environment()
+    tarefas = []
+    
+    try:
+        # Preparação: aviso de atraso entregue
+        tarefa = criar_tarefa_registrada(usuario_teste, datetime.now() - timedelta(hours=1))
+        tarefas.append(tarefa)
+        tarefa_id = tarefa_get_id(tarefa)
+        agendador_avancar()
+        assert eventos_das_tarefas(eventos, tarefas) == [(EVENTO_ATRASADA, tarefa_id)], "Aviso deve ser entregue"
+        
+        # Executa a operação
+        agendador_finalizar()
+        agendador_inicializar(iniciar_thread=False)
+        agendador_avancar()
+        
+        # Verificações
+        assert agendador_esta_atrasada(tarefa_id), "Tarefa continua atrasada após a reinicialização"
+        assert eventos_das_tarefas(eventos, tarefas) == [(EVENTO_ATRASADA, tarefa_id)], \
+            "Reinicialização não deve repetir o aviso"
+        
+        # Tarefa que volta a atrasar após novo prazo é avisada novamente
+        tarefa_set_prazo(tarefa, datetime.now() + timedelta(days=1))
+        tarefa_set_prazo(tarefa, datetime.now() - timedelta(minutes=1))
+        agendador_avancar()
+        assert eventos_das_tarefas(eventos, tarefas).count((EVENTO_ATRASADA, tarefa_id)) == 2, \
+            "Novo atraso deve gerar um novo aviso"
+    finally:
+        cleanup_test_environment(usuario_teste, callback, tarefas)
+
+# Lista de todos os testes para execução
+def run_all_tests():
+    """
+    Executa todos os testes do módulo
+    """
+    tests = [
+        test_01_avisos_prazo_proximo_e_atrasada,
+        test_02_prazo_vencido_ao_registrar,
+        test_03_alteracao_prazo_reagenda,
+        test_04_conclusao_e_remocao_encerram_acompanhamento,
+        test_05_callbacks_invalidos,
+        test_06_reinicializacao_nao_repete_atrasadas
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}: PASSED")
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: FAILED - {str(e)}")
+            failed += 1
+    
+    print(f"\n📊 RESULTADOS: {passed} passed, {failed} failed")
+    return failed == 0
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    exit(0 if success else 1)
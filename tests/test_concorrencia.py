@@ -0,0 +1,371 @@
+"""
+Testes de concorrência das estruturas encapsuladas
+
+Exercitam o LockLeituraEscrita e os registros de tarefas e usuários com várias
+threads simultâneas, verificando que as leituras ocorrem em paralelo e que as
+escritas permanecem atômicas (linearizáveis) sob carga.
+
+Testes implementados:
+1. Leituras simultâneas não se bloqueiam
+2. Escrita exclusiva, reentrante e sem promoção de leitura
+3. Escritor não sofre inanição sob leitura contínua
+4. Listagens consistentes durante registros, remoções e alterações concorrentes
+5. Registro concorrente do mesmo usuário aceito uma única vez
+6. Exportação pela fotografia não bloqueia nem é afetada pelas escritas
+7. Inclusão concorrente da mesma tag em uma tarefa aceita uma única vez
+"""
+
+import unittest
+import sys
+import os
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Adiciona o diretório pai ao path para importar os módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import LockLeituraEscrita
+from modules.tarefa import (
+    tarefa_criar, tarefa_destruir, tarefa_registrar, tarefa_remover, tarefa_get_id,
+    tarefa_set_status, tarefa_add_tag, tarefa_remover_tag, tarefa_listar_todas, tarefa_buscar_por_ids, tarefa_contagem_por_status,
+    tarefa_lock_registro, tarefa_snapshot, StatusTarefa
+)
+from modules.gerenciamento_tarefas import gt_exportar_tarefas_fluxo
+from modules.usuario import usuario_criar, usuario_destruir, usuario_registrar, usuario_listar_todos
+from config import SUCESSO
+
+# Intervalo de troca de threads reduzido durante os testes de carga, para
+# aumentar as intercalações entre leitores e escritores
+INTERVALO_TROCA = 1e-5
+
+def executar_threads(alvos, tempo_limite=30):
+    """
+    Executa as funções em threads simultâneas e propaga a primeira exceção.
+    """
+    erros = []
+    
+    def executar(alvo):
+        try:
+            alvo()
+        except BaseException as e:
+            erros.append(e)
+    
+    threads = [threading.Thread(target=executar, args=(alvo,)) for alvo in alvos]
+    intervalo_original = sys.getswitchinterval()
+    sys.setswitchinterval(INTERVALO_TROCA)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(tempo_limite)
+    finally:
+        sys.setswitchinterval(intervalo_original)
+    
+    assert not any(thread.is_alive() for thread in threads), "Threads não terminaram (possível deadlock)"
+    if erros:
+        raise erros[0]
+
+def test_01_leituras_simultaneas():
+    """
+    Teste 1: Leituras simultâneas não se bloqueiam
+    """
+    # Preparação
+    lock = LockLeituraEscrita()
+    leitores = 4
+    barreira = threading.Barrier(leitores, timeout=5)
+    
+    def ler():
+        with lock.leitura():
+            # Só passa da barreira se todos os leitores estiverem dentro do lock
+            barreira.wait()
+    
+    # Executa a operação e verifica
+    executar_threads([ler] * leitores)
+
+def test_02_escrita_exclusiva_e_reentrante():
+    """
+    Teste 2: Escrita exclusiva, reentrante e sem promoção de leitura
+    """
+    # Preparação
+    lock = LockLeituraEscrita()
+    entrou = threading.Event()
+    
+    def ler():
+        with lock.leitura():
+            entrou.set()
+    
+    # Escrita reentrante; a thread escritora também pode ler
+    with lock.escrita():
+        with lock:
+            with lock.leitura():
+                pass
+        leitor = threading.Thread(target=ler)
+        leitor.start()
+        assert not entrou.wait(0.2), "Leitura não pode ocorrer durante a escrita"
+    leitor.join(5)
+    assert entrou.is_set(), "Leitura deve ocorrer após a escrita"
+    
+    # Leitura não pode ser promovida a escrita
+    with lock.leitura():
+        try:
+            lock.adquirir_escrita()
+            assert False, "Promoção de leitura para escrita deve falhar"
+        except RuntimeError:
+            pass
+    
+    # Lock liberado: outra thread consegue escrever
+    escreveu = threading.Event()
+    
+    def escrever():
+        with lock.escrita():
+            escreveu.set()
+    
+    executar_threads([escrever])
+    assert escreveu.is_set(), "Escrita deve ocorrer com o lock livre"
+
+def test_03_escritor_sem_inanicao():
+    """
+    Teste 3: Escritor não sofre inanição sob leitura contínua
+    """
+    # Preparação
+    lock = LockLeituraEscrita()
+    parar = threading.Event()
+    escritas = []
+    
+    def ler():
+        while not parar.is_set():
+            with lock.leitura():
+                time.sleep(0.001)
+    
+    def escrever():
+        for _ in range(20):
+            inicio = time.perf_counter()
+            with lock.escrita():
+                escritas.append(time.perf_counter() - inicio)
+        parar.set()
+    
+    # Executa a operação
+    try:
+        executar_threads([ler] * 4 + [escrever])
+    finally:
+        parar.set()
+    
+    # Verificações
+    assert len(escritas) == 20, "Todas as escritas devem ser concluídas"
+    assert max(escritas) < 1, "Escritor não deve esperar indefinidamente pelos leitores"
+
+def test_04_listagens_consistentes_sob_carga():
+    """
+    Teste 4: Listagens consistentes durante registros, remoções e alterações concorrentes
+    """
+    # Preparação
+    usuario_teste = usuario_criar("João Silva", "joao@email.com")
+    prazo = datetime.now() + timedelta(days=7)
+    escritores = 4
+    operacoes = 100
+    registradas = [[] for _ in range(escritores)]
+    parar = threading.Event()
+    leituras = []
+    
+    def escrever(indice):
+        def executar():
+            tarefas = registradas[indice]
+            for i in range(operacoes):
+                tarefa = tarefa_criar(f"Tarefa {indice}-{i}", "Descrição", usuario_teste, prazo)
+                assert tarefa_registrar(tarefa) == SUCESSO, "Registro concorrente deve ser aceito"
+                tarefas.append(tarefa)
+                tarefa_set_status(tarefa, StatusTarefa.TAREFA_EM_PROGRESSO)
+                if i % 3 == 0:
+                    removida = tarefas.pop(0)
+                    assert tarefa_remover(tarefa_get_id(removida)) == SUCESSO, "Remoção deve ser aceita"
+                    tarefa_destruir(removida)
+        return executar
+    
+    def ler():
+        while not parar.is_set():
+            # Listagem e contagens lidas na mesma seção de leitura devem concordar
+            with tarefa_lock_registro().leitura():
+                tarefas = tarefa_listar_todas()
+                contagem = tarefa_contagem_por_status()
+                ids = [tarefa_get_id(tarefa) for tarefa in tarefas]
+            assert len(tarefas) == sum(contagem.values()), "Listagem e contagem divergentes"
+            assert len(set(ids)) == len(ids), "Listagem não pode repetir tarefas"
+            leituras.append(len(tarefas))
+    
+    def escrever_e_parar():
+        try:
+            executar_threads([escrever(indice) for indice in range(escritores)])
+        finally:
+            parar.set()
+    
+    antes = len(tarefa_listar_todas())
+    try:
+        # Executa a operação
+        executar_threads([escrever_e_parar] + [ler] * 4, tempo_limite=60)
+        
+        # Verificações
+        restantes = [tarefa for tarefas in registradas for tarefa in tarefas]
+        assert leituras, "Leitores devem ter executado durante as escritas"
+        assert len(tarefa_listar_todas()) == antes + len(restantes), "Total final deve refletir todas as operações"
+        assert len(tarefa_buscar_por_ids(tarefa_get_id(t) for t in restantes)) == len(restantes), \
+            "Todas as tarefas restantes devem estar registradas"
+    finally:
+        for tarefas in registradas:
+            for tarefa in tarefas:
+                tarefa_remover(tarefa_get_id(tarefa))
+                tarefa_destruir(tarefa)
+        usuario_destruir(usuario_teste)
+
+def test_05_registro_concorrente_unico():
+    """
+    Teste 5: Registro concorrente do mesmo usuário aceito uma única vez
+    """
+    # Preparação
+    usuario = usuario_criar("Maria Santos", "maria@email.com")
+    resultados = []
+    barreira = threading.Barrier(8, timeout=5)
+    
+    def registrar():
+        barreira.wait()
+        resultados.append(usuario_registrar(usuario))
+    
+    try:
+        # Executa a operação
+        executar_threads([registrar] * 8)
+        
+        # Verificações
+        assert resultados.count(SUCESSO) == 1, "Apenas um registro concorrente deve ser aceito"
+        assert sum(1 for u in usuario_listar_todos() if u is usuario) == 1, "Usuário deve estar registrado uma vez"
+    finally:
+        usuario_destruir(usuario)
+
+def test_06_exportacao_durante_escritas():
+    """
+    Teste 6: Exportação pela fotografia não bloqueia nem é afetada pelas escritas
+    """
+    # Preparação
+    usuario_teste = usuario_criar("João Silva", "joao@email.com")
+    prazo = datetime.now() + timedelta(days=7)
+    tarefas = [tarefa_criar(f"Tarefa exportada {i}", "Descrição", usuario_teste, prazo) for i in range(50)]
+    for tarefa in tarefas:
+        tarefa_registrar(tarefa)
+    ids = {tarefa_get_id(tarefa) for tarefa in tarefas}
+    
+    try:
+        # Exportação iniciada antes das escritas e pausada no primeiro bloco
+        snapshot = tarefa_snapshot()
+        blocos = gt_exportar_tarefas_fluxo({}, 'jsonl', snapshot.tarefas, tamanho_bloco=1)
+        exportado = [next(blocos)]
+        
+        def escrever():
+            for tarefa in tarefas:
+                tarefa_set_status(tarefa, StatusTarefa.TAREFA_CONCLUIDA)
+                tarefa_add_tag(tarefa, 7)
+        
+        # Executa a operação: as escritas terminam com a exportação em andamento
+        executar_threads([escrever], tempo_limite=5)
+        exportado.extend(blocos)
+        
+        # Verificações
+        linhas = [json.loads(linha) for linha in ''.join(exportado).splitlines()]
+        exportadas = [linha for linha in linhas if linha['id'] in ids]
+        assert len(linhas) == len(snapshot.tarefas), "Exportação deve conter toda a fotografia"
+        assert len(exportadas) == len(tarefas), "Tarefas registradas antes da fotografia devem ser exportadas"
+        assert all(linha['status'] == 'aberta' and linha['tags'] == [] for linha in exportadas), \
+            "Exportação não pode ver escritas posteriores à fotografia"
+        atuais = [t for t in tarefa_snapshot().tarefas if t['id'] in ids]
+        assert all(t['status'] == StatusTarefa.TAREFA_CONCLUIDA and t['tags'] == (7,) for t in atuais), \
+            "Nova fotografia deve refletir as escritas"
+    finally:
+        for tarefa in tarefas:
+            tarefa_remover(tarefa_get_id(tarefa))
+            tarefa_destruir(tarefa)
+        usuario_destruir(usuario_teste)
+
+def test_07_tag_concorrente_unica():
+    """
+    Teste 7: Inclusão concorrente da mesma tag em uma tarefa aceita uma única vez
+    """
+    # Preparação
+    usuario_teste = usuario_criar("João Silva", "joao@email.com")
+    tarefa = tarefa_criar("Tarefa com tag concorrente", "Descrição", usuario_teste, datetime.now() + timedelta(days=7))
+    resultados = []
+    barreira = threading.Barrier(8, timeout=5)
+    
+    def incluir():
+        barreira.wait()
+        resultados.append(tarefa_add_tag(tarefa, 7))
+    
+    try:
+        # Executa a operação
+        executar_threads([incluir] * 8)
+        
+        # Verificações
+        assert resultados.count(SUCESSO) == 1, "Apenas uma inclusão concorrente deve ser aceita"
+        assert tarefa['tags'] == [7], "Tag deve constar uma única vez na tarefa"
+    finally:
+        tarefa_destruir(tarefa)
+        usuario_destruir(usuario_teste)
+
+def test_08_remocao_tag_concorrente_unica():
+    """
+    Teste 8: Remoção concorrente da mesma tag de uma tarefa aceita uma única vez
+    """
+    # Preparação
+    usuario_teste = usuario_criar("João Silva", "joao@email.com")
+    tarefa = tarefa_criar("Tarefa com remoção concorrente", "Descrição", usuario_teste, datetime.now() + timedelta(days=7))
+    tarefa_add_tag(tarefa, 7)
+    resultados = []
+    barreira = threading.Barrier(8, timeout=5)
+    
+    def remover():
+        barreira.wait()
+        resultados.append(tarefa_remover_tag(tarefa, 7))
+    
+    try:
+        # Executa a operação
+        executar_threads([remover] * 8)
+        
+        # Verificações
+        assert resultados.count(SUCESSO) == 1, "Apenas uma remoção concorrente deve ser aceita"
+        assert tarefa['tags'] == [], "Tag deve ter sido removida da tarefa"
+    finally:
+        tarefa_destruir(tarefa)
+        usuario_destruir(usuario_teste)
+
+# Lista de todos os testes para execução
+def run_all_tests():
+    """
+    Executa todos os testes do módulo
+    """
+    tests = [
+        test_01_leituras_simultaneas,
+        test_02_escrita_exclusiva_e_reentrante,
+        test_03_escritor_sem_inanicao,
+        test_04_listagens_consistentes_sob_carga,
+        test_05_registro_concorrente_unico,
+        test_06_exportacao_durante_escritas,
+        test_07_tag_concorrente_unica,
+        test_08_remocao_tag_concorrente_unica
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}: PASSED")
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: FAILED - {str(e)}")
+            failed += 1
+    
+    print(f"\n📊 RESULTADOS: {passed} passed, {failed} failed")
+    return failed == 0
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    exit(0 if success else 1)
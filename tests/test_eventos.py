@@ -0,0 +1,312 @@
+"""
+Testes unitários para o módulo Eventos (fluxo de eventos de alteração)
+
+Testes implementados:
+1. Eventos de criação, alteração e remoção de tarefas com os campos alterados
+2. Alterações de usuários, tags e times publicadas pela verificação de versões
+3. Descarte dos eventos de um assinante lento (reset)
+4. Retomada a partir do último evento recebido
+5. Cancelamento da assinatura e espera por eventos
+6. Registro de alterações limitado da sincronização incremental
+"""
+
+import unittest
+import threading
+import sys
+import os
+import json
+from datetime import datetime, timedelta
+
+# Adiciona o diretório pai ao path para importar os módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import MAX_EVENTOS_ASSINANTE
+from modules.eventos import (
+    eventos_inicializar, eventos_finalizar, eventos_assinar, eventos_cancelar_assinatura,
+    eventos_obter, eventos_aguardar, eventos_verificar_registros, eventos_qtd_assinantes,
+    eventos_alteracoes_desde
+)
+import modules.eventos as modulo_eventos
+from modules.usuario import usuario_criar, usuario_destruir, usuario_registrar, usuario_set_nome
+from modules.team import time_criar, time_destruir, time_registrar
+from modules.tarefa import (
+    tarefa_criar, tarefa_registrar, tarefa_remover, tarefa_destruir,
+    tarefa_set_titulo, tarefa_set_status, tarefa_get_id, tarefa_versao, StatusTarefa
+)
+
+def setup_test_environment():
+    """
+    Preparação comum para os testes.
+    """
+    eventos_inicializar()
+    usuario_teste = usuario_criar("João Silva", "joao@email.com")
+    prazo_teste = datetime.now() + timedelta(days=7)
+    
+    return usuario_teste, prazo_teste
+
+def cleanup_test_environment(usuario_teste):
+    """
+    Limpeza comum após os testes.
+    """
+    if usuario_teste:
+        usuario_destruir(usuario_teste)
+    eventos_finalizar()
+
+def eventos_da_tarefa(assinatura_id, tarefa_id):
+    """
+    Retira os eventos pendentes e mantém apenas os da tarefa informada.
+    """
+    return [e for e in eventos_obter(assinatura_id) if e['entity'] == 'task' and e['id'] == tarefa_id]
+
+def test_01_eventos_de_tarefas():
+    """
+    Teste 1: Eventos de criação, alteração e remoção de tarefas com os campos alterados
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    assinatura_id = eventos_assinar()
+    tarefa = tarefa_criar("Tarefa com eventos", "Descrição", usuario_teste, prazo_teste)
+    
+    try:
+        # Executa a operação: registro
+        tarefa_registrar(tarefa)
+        tarefa_id = tarefa_get_id(tarefa)
+        criacao = eventos_da_tarefa(assinatura_id, tarefa_id)
+        
+        # Verificações
+        assert [e['op'] for e in criacao] == ['created'], "Registro deve publicar um evento 'created'"
+        assert criacao[0]['data']['titulo'] == "Tarefa com eventos", "Criação deve conter a tarefa completa"
+        assert criacao[0]['data']['status'] == 'aberta', "Status deve ser convertido para o valor"
+        assert criacao[0]['version'] == tarefa_versao(), "Evento deve informar a versão da estrutura"
+        json.dumps(criacao)
+        
+        # Executa a operação: alterações
+        tarefa_set_titulo(tarefa, "Tarefa alterada")
+        tarefa_set_status(tarefa, StatusTarefa.TAREFA_EM_PROGRESSO)
+        alteracoes = eventos_da_tarefa(assinatura_id, tarefa_id)
+        
+        # Verificações: apenas os campos alterados
+        assert [e['op'] for e in alteracoes] == ['updated', 'updated'], "Cada alteração deve publicar um evento"
+        assert alteracoes[0]['data'].get('titulo') == "Tarefa alterada", "Evento deve conter o novo título"
+        assert 'descricao' not in alteracoes[0]['fields'], "Campos não alterados não devem ser enviados"
+        assert alteracoes[1]['data'].get('status') == 'em_progresso', "Evento deve conter o novo status"
+        
+        # Executa a operação: remoção
+        tarefa_remover(tarefa_get_id(tarefa))
+        remocao = eventos_da_tarefa(assinatura_id, tarefa_id)
+        assert [e['op'] for e in remocao] == ['deleted'], "Remoção deve publicar um evento 'deleted'"
+        assert remocao[0]['data'] == {}, "Remoção não deve conter campos"
+    finally:
+        eventos_cancelar_assinatura(assinatura_id)
+        tarefa_destruir(tarefa)
+        cleanup_test_environment(usuario_teste)
+
+def test_02_registros_verificados():
+    """
+    Teste 2: Alterações de usuários, tags e times publicadas pela verificação de versões
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    usuario_registrar(usuario_teste)
+    eventos_verificar_registros()
+    assinatura_id = eventos_assinar()
+    time_teste = None
+    
+    try:
+        # Executa a operação
+        usuario_set_nome(usuario_teste, "João Souza")
+        time_teste = time_criar("Equipe de Eventos")
+        time_registrar(time_teste)
+        eventos_verificar_registros()
+        eventos = eventos_obter(assinatura_id)
+        
+        # Verificações
+        usuario = [e for e in eventos if e['entity'] == 'user' and e['id'] == usuario_teste['id']]
+        assert usuario and usuario[0]['op'] == 'updated', "Alteração do usuário deve ser publicada"
+        assert usuario[0]['data'] == {'nome': "João Souza", 'data_modificacao': usuario[0]['data']['data_modificacao']}, \
+            "Evento deve conter apenas os campos alterados"
+        assert any(e['entity'] == 'team' and e['op'] == 'created' and e['id'] == time_teste['id'] for e in eventos), \
+            "Criação do time deve ser publicada"
+        assert eventos_verificar_registros() == 0, "Estruturas sem nova versão não devem publicar eventos"
+        
+        # Executa a operação: remoção
+        time_id = time_teste['id']
+        time_destruir(time_teste)
+        time_teste = None
+        eventos_verificar_registros()
+        assert any(e['entity'] == 'team' and e['op'] == 'deleted' and e['id'] == time_id
+                   for e in eventos_obter(assinatura_id)), "Remoção do time deve ser publicada"
+    finally:
+        eventos_cancelar_assinatura(assinatura_id)
+        if time_teste:
+            time_destruir(time_teste)
+        cleanup_test_environment(usuario_teste)
+
+def test_03_assinante_lento():
+    """
+    Teste 3: Descarte dos eventos de um assinante lento (reset)
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    lento = eventos_assinar()
+    tarefa = tarefa_criar("Tarefa muito alterada", "Descrição", usuario_teste, prazo_teste)
+    
+    try:
+        # Executa a operação: mais alterações que a fila comporta
+        tarefa_registrar(tarefa)
+        for i in range(MAX_EVENTOS_ASSINANTE + 5):
+            tarefa_set_titulo(tarefa, f"Título {i}")
+        rapido = eventos_assinar()
+        tarefa_set_titulo(tarefa, "Título final")
+        
+        # Verificações
+        eventos = eventos_obter(lento)
+        assert eventos[0]['op'] == 'reset', "Assinante lento deve receber 'reset' primeiro"
+        assert len(eventos) <= MAX_EVENTOS_ASSINANTE + 1, "Fila do assinante deve ser limitada"
+        assert eventos_obter(lento) == [], "Reset deve ser entregue uma única vez"
+        assert [e['data'].get('titulo') for e in eventos_obter(rapido)] == ["Título final"], \
+            "Outros assinantes não devem ser afetados"
+        tarefa_remover(tarefa_get_id(tarefa))
+    finally:
+        eventos_cancelar_assinatura(lento)
+        eventos_cancelar_assinatura(rapido)
+        tarefa_destruir(tarefa)
+        cleanup_test_environment(usuario_teste)
+
+def test_04_retomada():
+    """
+    Teste 4: Retomada a partir do último evento recebido
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    primeira = eventos_assinar()
+    tarefa = tarefa_criar("Tarefa retomada", "Descrição", usuario_teste, prazo_teste)
+    
+    try:
+        # Preparação: a primeira conexão recebe o registro e cai
+        tarefa_registrar(tarefa)
+        ultimo = eventos_obter(primeira)[-1]['seq']
+        eventos_cancelar_assinatura(primeira)
+        tarefa_set_titulo(tarefa, "Alterada durante a queda")
+        
+        # Executa a operação
+        retomada = eventos_assinar(ultimo)
+        desconhecida = eventos_assinar("outro-processo-1")
+        
+        # Verificações
+        assert [e['data'].get('titulo') for e in eventos_obter(retomada)] == ["Alterada durante a queda"], \
+            "Retomada deve entregar apenas os eventos perdidos"
+        assert [e['op'] for e in eventos_obter(desconhecida)] == ['reset'], \
+            "Sequência desconhecida deve receber 'reset'"
+        eventos_cancelar_assinatura(retomada)
+        eventos_cancelar_assinatura(desconhecida)
+        tarefa_remover(tarefa_get_id(tarefa))
+    finally:
+        tarefa_destruir(tarefa)
+        cleanup_test_environment(usuario_teste)
+
+def test_05_cancelamento_e_espera():
+    """
+    Teste 5: Cancelamento da assinatura e espera por eventos
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    avisos = []
+    assinatura_id = eventos_assinar(aviso=lambda: avisos.append(True))
+    tarefa = tarefa_criar("Tarefa aguardada", "Descrição", usuario_teste, prazo_teste)
+    
+    try:
+        # Executa a operação: registro em outra thread enquanto o assinante aguarda
+        assert eventos_aguardar(assinatura_id, 0.01) == [], "Sem eventos, a espera deve terminar vazia"
+        threading.Timer(0.05, tarefa_registrar, args=(tarefa,)).start()
+        eventos = eventos_aguardar(assinatura_id, 5)
+        
+        # Verificações
+        assert eventos and eventos[0]['op'] == 'created', "Espera deve terminar com o novo evento"
+        assert avisos, "Aviso do assinante deve ser chamado"
+        assert eventos_qtd_assinantes() == 1, "Deve haver um assinante ativo"
+        assert eventos_cancelar_assinatura(assinatura_id) == 0, "Cancelamento deve ter sucesso"
+        assert eventos_cancelar_assinatura(assinatura_id) == -1, "Assinatura cancelada deve retornar erro"
+        assert eventos_obter(assinatura_id) is None, "Assinatura cancelada não deve ter eventos"
+        assert eventos_aguardar(assinatura_id, 0.01) is None, "Espera em assinatura cancelada deve retornar None"
+        tarefa_remover(tarefa_get_id(tarefa))
+    finally:
+        tarefa_destruir(tarefa)
+        cleanup_test_environment(usuario_teste)
+
+def test_06_registro_de_alteracoes():
+    """
+    Teste 6: Registro de alterações limitado da sincronização incremental
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    tarefas = [tarefa_criar(f"Registrada {i}", "Descrição", usuario_teste, prazo_teste) for i in range(3)]
+    limite_original = modulo_eventos.MAX_ALTERACOES_SINCRONIZACAO
+    
+    try:
+        # Executa a operação: cada tarefa é registrada e alterada
+        inicio = eventos_alteracoes_desde(None)['versao']
+        for tarefa in tarefas:
+            tarefa_registrar(tarefa)
+            tarefa_set_titulo(tarefa, "Alterada")
+        tarefa_remover(tarefa_get_id(tarefas[0]))
+        alteracoes = eventos_alteracoes_desde(inicio)
+        
+        # Verificações: uma entrada por entidade, com a última operação
+        assert not alteracoes['completo'], "Versão recente não deve exigir a fotografia"
+        assert alteracoes['alteracoes']['task'] == {
+            tarefa_get_id(tarefas[0]): 'deleted',
+            tarefa_get_id(tarefas[1]): 'updated',
+            tarefa_get_id(tarefas[2]): 'updated'
+        }, "Registro deve manter a última operação de cada tarefa (remoções como marcas)"
+        assert eventos_alteracoes_desde(alteracoes['versao'])['alteracoes'] == {}, \
+            "Nada deve ser retornado após a versão atual"
+        
+        # Executa a operação: registro cheio descarta as entradas mais antigas
+        modulo_eventos.MAX_ALTERACOES_SINCRONIZACAO = 2
+        tarefa_set_titulo(tarefas[1], "Alterada de novo")
+        tarefa_set_titulo(tarefas[2], "Alterada de novo")
+        assert eventos_alteracoes_desde(inicio)['completo'], "Versão anterior ao piso deve exigir a fotografia"
+        assert not eventos_alteracoes_desde(alteracoes['versao'])['completo'], \
+            "Versões cobertas pelo registro continuam incrementais"
+        
+        for tarefa in tarefas[1:]:
+            tarefa_remover(tarefa_get_id(tarefa))
+    finally:
+        modulo_eventos.MAX_ALTERACOES_SINCRONIZACAO = limite_original
+        for tarefa in tarefas:
+            tarefa_destruir(tarefa)
+        cleanup_test_environment(usuario_teste)
+
+# Lista de todos os testes para execução
+def run_all_tests():
+    """
+    Executa todos os testes do módulo
+    """
+    tests = [
+        test_01_eventos_de_tarefas,
+        test_02_registros_verificados,
+        test_03_assinante_lento,
+        test_04_retomada,
+        test_05_cancelamento_e_espera,
+        test_06_registro_de_alteracoes
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}: PASSED")
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: FAILED - {str(e)}")
+            failed += 1
+    
+    print(f"\n📊 RESULTADOS: {passed} passed, {failed} failed")
+    return failed == 0
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    exit(0 if success else 1)
@@ -20,21 +20,31 @@ Testes implementados (conforme especificação):
 import unittest
 import sys
 import os
-from datetime import datetime, timedelta
+import json
+import csv
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
 
 # Adiciona o diretório pai ao path para importar os módulos
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from modules import gerenciamento_tarefas
 from modules.gerenciamento_tarefas import (
     gt_inicializar, gt_finalizar, gt_registrar_time, gt_criar_tarefa,
     gt_remover_tarefa, gt_listar_tarefas_time, gt_registrar_usuario,
     gt_registrar_tag, gt_listar_todas_tarefas, gt_listar_todos_usuarios,
-    gt_listar_todas_tags, gt_listar_todos_times
+    gt_listar_todas_tags, gt_listar_todos_times, gt_aplicar_lote_tarefas,
+    gt_importar_tarefas, gt_exportar_tarefas_fluxo, gt_exportar_tarefas_particionado,
+    gt_agregar_tarefas, gt_sincronizar, gt_leitura_consistente
+)
+from modules.usuario import usuario_criar, usuario_destruir, usuario_set_nome, usuario_remover
+from modules.tag import tag_criar, tag_destruir, tag_remover
+from modules.team import time_criar, time_destruir, time_adicionar_usuario
+from modules.tarefa import (
+    tarefa_get_titulo, tarefa_get_id, tarefa_buscar_por_id, tarefa_get_tags_ids,
+    tarefa_set_status, tarefa_set_titulo, StatusTarefa
 )
-from modules.usuario import usuario_criar, usuario_destruir
-from modules.tag import tag_criar, tag_destruir
-from modules.team import time_criar, time_destruir
-from modules.tarefa import tarefa_get_titulo, tarefa_get_id
 
 def setup_test_environment():
     """
@@ -459,6 +469,372 @@ def test_15_persistencia_dados():
     finally:
         cleanup_test_environment(gt, usuario_teste, time_teste, tag_teste)
 
+def test_16_lote_tarefas():
+    """
+    Teste 16: Aplicação de um lote misto de operações sobre tarefas
+    """
+    # Setup
+    gt, usuario_teste, time_teste, tag_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        gt_registrar_usuario(gt, usuario_teste)
+        gt_registrar_tag(gt, tag_teste)
+        usuario_id = usuario_teste['id']
+        tag_id = tag_teste['id']
+        
+        criacoes = [
+            {'op': 'create', 'titulo': f"Tarefa em lote {i}", 'descricao': "Descrição",
+             'usuario_responsavel_id': usuario_id, 'prazo': prazo_teste.isoformat(), 'tags': [tag_id]}
+            for i in range(3)
+        ]
+        criacoes.append({'op': 'create', 'titulo': "Sem usuário", 'descricao': "Descrição",
+                         'usuario_responsavel_id': -1, 'prazo': prazo_teste.isoformat()})
+        
+        # Executa a operação
+        resultados = gt_aplicar_lote_tarefas(gt, criacoes)
+        
+        # Verificações
+        assert [r['success'] for r in resultados] == [True, True, True, False], "Apenas a última criação deve falhar"
+        ids = [r['id'] for r in resultados[:3]]
+        assert len(set(ids)) == 3, "Cada tarefa criada em lote deve ter ID único"
+        assert tarefa_get_tags_ids(tarefa_buscar_por_id(ids[0])) == [tag_id], "Tags da criação devem ser aplicadas"
+        
+        tag_nova = tag_criar("Lote Nova", "#0000FF")
+        gt_registrar_tag(gt, tag_nova)
+        resultados = gt_aplicar_lote_tarefas(gt, [
+            {'op': 'update', 'id': ids[0], 'titulo': "Alterada", 'tags': [tag_nova['id']]},
+            {'op': 'delete', 'id': ids[1]},
+            {'op': 'delete', 'id': ids[1]}
+        ])
+        assert [r['success'] for r in resultados] == [True, True, False], "Segunda remoção da mesma tarefa deve falhar"
+        assert tarefa_get_titulo(tarefa_buscar_por_id(ids[0])) == "Alterada", "Título deve ser alterado"
+        assert tarefa_get_tags_ids(tarefa_buscar_por_id(ids[0])) == [tag_nova['id']], "Tags devem ser substituídas"
+        
+        # Tags e usuários destruídos (ainda presentes no registro) são rejeitados
+        tag_nova_id = tag_nova['id']
+        tag_destruir(tag_nova)
+        usuario_excluido = usuario_criar("Excluído Lote", "excluido.lote@email.com")
+        gt_registrar_usuario(gt, usuario_excluido)
+        usuario_excluido_id = usuario_excluido['id']
+        usuario_destruir(usuario_excluido)
+        resultados = gt_aplicar_lote_tarefas(gt, [
+            {'op': 'update', 'id': ids[2], 'tags': [tag_id, tag_nova_id]},
+            {'op': 'create', 'titulo': "Tag excluída", 'descricao': "Descrição",
+             'usuario_responsavel_id': usuario_id, 'prazo': prazo_teste.isoformat(), 'tags': [tag_nova_id]},
+            {'op': 'create', 'titulo': "Usuário excluído", 'descricao': "Descrição",
+             'usuario_responsavel_id': usuario_excluido_id, 'prazo': prazo_teste.isoformat()}
+        ])
+        assert [r['error'] for r in resultados] == [f"Tag {tag_nova_id} não encontrada", f"Tag {tag_nova_id} não encontrada",
+                                                    "Usuário responsável não encontrado"], "Entidades destruídas devem ser rejeitadas"
+        assert tarefa_get_tags_ids(tarefa_buscar_por_id(ids[2])) == [tag_id], "Tags não devem ser alteradas"
+        tag_remover(tag_nova_id)
+        usuario_remover(usuario_excluido_id)
+        assert tarefa_buscar_por_id(ids[1]) is None, "Tarefa removida não deve estar registrada"
+        
+        # Lote inválido em modo tudo ou nada não altera nada
+        resultados = gt_aplicar_lote_tarefas(gt, [{'op': 'delete', 'id': ids[2]}, {'op': 'invalida'}], True)
+        assert not any(r['success'] for r in resultados), "Nenhuma operação deve ser aplicada"
+        assert tarefa_buscar_por_id(ids[2]) is not None, "Tarefa não deve ser removida"
+        
+        # Alteração de tarefa removida antes no mesmo lote invalida o lote inteiro
+        resultados = gt_aplicar_lote_tarefas(gt, [
+            {'op': 'delete', 'id': ids[2]},
+            {'op': 'update', 'id': ids[2], 'titulo': "Após remoção"}
+        ], True)
+        assert [r['success'] for r in resultados] == [False, False], "Nenhuma operação deve ser aplicada"
+        assert resultados[1]['error'] == "Tarefa não encontrada", "Alteração deve ver a remoção anterior do lote"
+        assert tarefa_buscar_por_id(ids[2]) is not None, "Tarefa não deve ser removida"
+        assert tarefa_get_titulo(tarefa_buscar_por_id(ids[2])) != "Após remoção", "Tarefa não deve ser alterada"
+        
+        gt_aplicar_lote_tarefas(gt, [{'op': 'delete', 'id': tarefa_id} for tarefa_id in (ids[0], ids[2])])
+    finally:
+        cleanup_test_environment(gt, usuario_teste, time_teste, tag_teste)
+
+def test_17_importacao_tarefas():
+    """
+    Teste 17: Importação de tarefas de fluxos JSONL e CSV em lotes
+    """
+    # Setup
+    gt, usuario_teste, time_teste, tag_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        gt_registrar_usuario(gt, usuario_teste)
+        tag_importacao = tag_criar("Importação Teste", "#00FF00")
+        gt_registrar_tag(gt, tag_importacao)
+        prazo = prazo_teste.isoformat()
+        tag_id = tag_importacao['id']
+        usuario_id = usuario_teste['id']
+        
+        linhas_jsonl = [
+            f'{{"titulo": "Importada 1", "descricao": "D", "usuario": "joao@email.com", "prazo": "{prazo}", "tags": ["importação teste"]}}\n',
+            f'{{"titulo": "Importada 2", "descricao": "D", "usuario": "Ninguém", "prazo": "{prazo}"}}\n',
+            'não é json\n',
+            f'{{"titulo": "Importada 3", "descricao": "D", "usuario_responsavel_id": {usuario_id}, "prazo": "{prazo}", "status": "concluida"}}\n'
+        ]
+        linhas_csv = [
+            "Título,Descrição,Status,Usuário Responsável,Prazo,Tags\n",
+            f"Importada 4,D,aberta,{usuario_id},{prazo},{tag_id}\n"
+        ]
+        progresso = []
+        
+        # Executa a operação
+        resumo_jsonl = gt_importar_tarefas(gt, linhas_jsonl, 'jsonl', 2, progresso.append)
+        resumo_csv = gt_importar_tarefas(gt, linhas_csv, 'csv')
+        
+        # Verificações
+        assert resumo_jsonl['read'] == 4 and resumo_jsonl['imported'] == 2, "Duas linhas JSONL devem ser importadas"
+        assert [erro['line'] for erro in resumo_jsonl['errors']] == [2, 3], "Erros devem indicar as linhas"
+        assert len(progresso) >= 1, "Progresso deve ser reportado"
+        assert resumo_csv['imported'] == 1, "Linha CSV no formato da exportação deve ser importada"
+        assert gt_importar_tarefas(gt, [], 'xml') is None, "Formato inválido deve retornar None"
+        
+        importadas = [t for t in gt_listar_todas_tarefas(gt) if tarefa_get_titulo(t).startswith("Importada")]
+        assert len(importadas) == 3, "Tarefas importadas devem estar registradas"
+        assert all(tarefa_get_tags_ids(t) == [tag_id] for t in importadas if tarefa_get_titulo(t) != "Importada 3"), \
+            "Tags devem ser resolvidas por nome ou ID"
+        
+        gt_aplicar_lote_tarefas(gt, [{'op': 'delete', 'id': tarefa_get_id(t)} for t in importadas])
+        tag_destruir(tag_importacao)
+    finally:
+        cleanup_test_environment(gt, usuario_teste, time_teste, tag_teste)
+
+def test_18_exportacao_fluxo():
+    """
+    Teste 18: Exportação de tarefas em fluxo (CSV e JSONL)
+    """
+    # Setup
+    gt, usuario_teste, time_teste, tag_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        gt_registrar_time(gt, time_teste)
+        gt_registrar_usuario(gt, usuario_teste)
+        tarefas = [gt_criar_tarefa(gt, time_teste, f"Exportada {i}", "Descrição",
+                                   usuario_teste, [], 0, prazo_teste)
+                   for i in range(3)]
+        
+        # Executa a operação
+        blocos_csv = list(gt_exportar_tarefas_fluxo(gt, 'csv', tarefas, 1))
+        blocos_jsonl = list(gt_exportar_tarefas_fluxo(gt, 'jsonl', tarefas))
+        
+        # Verificações
+        assert blocos_csv[0].startswith("ID,Título,"), "Primeiro bloco CSV deve ser o cabeçalho"
+        assert len(blocos_csv) == 4, "Cada linha deve gerar um bloco com tamanho de bloco mínimo"
+        assert len(blocos_jsonl) == 2, "Primeira linha JSONL deve ser entregue isoladamente"
+        linhas = ''.join(blocos_jsonl).splitlines()
+        assert [json.loads(linha)['titulo'] for linha in linhas] == ["Exportada 0", "Exportada 1", "Exportada 2"], \
+            "Linhas JSONL devem conter as tarefas na ordem recebida"
+        assert gt_exportar_tarefas_fluxo(gt, 'xml') is None, "Formato inválido deve retornar None"
+        assert gt_exportar_tarefas_fluxo(None, 'csv') is None, "GT nulo deve retornar None"
+        
+        for tarefa in tarefas:
+            gt_remover_tarefa(gt, tarefa)
+    finally:
+        cleanup_test_environment(gt, usuario_teste, time_teste, tag_teste)
+
+def test_19_exportacao_particionada():
+    """
+    Teste 19: Exportação paralela particionada por ID e por time
+    """
+    # Setup
+    gt, usuario_teste, time_teste, tag_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        gt_registrar_time(gt, time_teste)
+        gt_registrar_usuario(gt, usuario_teste)
+        time_adicionar_usuario(time_teste, usuario_teste)
+        tarefas = [gt_criar_tarefa(gt, time_teste, f"Particionada {i}", "Descrição",
+                                   usuario_teste, [], 0, prazo_teste)
+                   for i in range(5)]
+        total = len(gt_listar_todas_tarefas(gt))
+        progresso = []
+        
+        with tempfile.TemporaryDirectory() as diretorio:
+            # Executa a operação (partes enviadas aos processos em blocos de 2 linhas)
+            tamanho_bloco = gerenciamento_tarefas.TAMANHO_BLOCO_PARTICAO
+            gerenciamento_tarefas.TAMANHO_BLOCO_PARTICAO = 2
+            try:
+                manifesto = gt_exportar_tarefas_particionado(
+                    gt, "dump.csv", 'id', 2, callback_progresso=lambda p: progresso.append(dict(p)),
+                    diretorio=diretorio
+                )
+            finally:
+                gerenciamento_tarefas.TAMANHO_BLOCO_PARTICAO = tamanho_bloco
+            manifesto_time = gt_exportar_tarefas_particionado(
+                gt, "dump_times.csv", 'time', 2, concatenar=True, diretorio=diretorio
+            )
+            
+            # Verificações
+            assert manifesto is not None, "Exportação particionada deve retornar o manifesto"
+            assert len(manifesto['partes']) == 2, "Deve haver uma parte por processo"
+            assert manifesto['total_linhas'] == total, "Todas as tarefas devem ser exportadas"
+            assert progresso[-1]['partes_concluidas'] == 2, "Progresso deve contar as partes concluídas"
+            assert os.path.exists(os.path.join(diretorio, "dump.manifest.json")), "Manifesto deve ser gravado"
+            
+            ids_partes = []
+            for parte in manifesto['partes']:
+                with open(os.path.join(diretorio, parte['arquivo']), newline='', encoding='utf-8') as arquivo:
+                    ids_parte = [int(linha['ID']) for linha in csv.DictReader(arquivo)]
+                assert len(ids_parte) == parte['linhas'], "Blocos devem ser acrescentados à parte"
+                ids_partes.extend(ids_parte)
+            assert ids_partes == sorted(ids_partes), "Partes devem cobrir faixas contíguas de ID"
+            assert len(set(ids_partes)) == total, "Cada tarefa deve ser exportada uma única vez"
+            
+            with open(os.path.join(diretorio, "dump_times.csv"), newline='', encoding='utf-8') as arquivo:
+                linhas = list(csv.DictReader(arquivo))
+            assert len(linhas) == total, "Arquivo concatenado deve conter todas as tarefas"
+            assert manifesto_time['total_linhas'] == total, "Particionamento por time deve cobrir todas as tarefas"
+            sequencial = list(csv.DictReader(''.join(gt_exportar_tarefas_fluxo(gt, 'csv')).splitlines()))
+            assert sorted(linhas, key=lambda linha: linha['ID']) == sorted(sequencial, key=lambda linha: linha['ID']), \
+                "Exportação paralela deve gerar as mesmas linhas da sequencial"
+        
+        # Datas das linhas brutas (enviadas como inteiros) formatadas como na exportação sequencial
+        for data in (datetime(2024, 3, 1, 12, 30, 5, 123456), datetime(1969, 7, 20, 20, 17),
+                     datetime(2024, 3, 1, tzinfo=timezone.utc), None):
+            tarefa_data = dict(tarefas[0], prazo=data, data_criacao=data)
+            assert gerenciamento_tarefas._formatar_linha_bruta(gerenciamento_tarefas._linha_bruta_exportacao(tarefa_data)) == \
+                list(gerenciamento_tarefas._linha_csv_exportacao(tarefa_data).values()), \
+                f"Data {data!r} deve ser exportada igual nas duas exportações"
+        
+        assert gt_exportar_tarefas_particionado(gt, "x.csv", 'tag') is None, "Particionamento inválido deve retornar None"
+        
+        for tarefa in tarefas:
+            gt_remover_tarefa(gt, tarefa)
+    finally:
+        cleanup_test_environment(gt, usuario_teste, time_teste, tag_teste)
+
+def test_20_agregacao_tarefas():
+    """
+    Teste 20: Agregação de tarefas por status, tag, time e semana do prazo
+    """
+    # Setup
+    gt, usuario_teste, time_teste, tag_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        gt_registrar_time(gt, time_teste)
+        gt_registrar_usuario(gt, usuario_teste)
+        gt_registrar_tag(gt, tag_teste)
+        time_adicionar_usuario(time_teste, usuario_teste)
+        tarefas = [gt_criar_tarefa(gt, time_teste, f"Agregada {i}", "Descrição",
+                                   usuario_teste, [tag_teste] if i < 2 else [], 1 if i < 2 else 0, prazo_teste)
+                   for i in range(3)]
+        
+        # Executa a operação
+        por_time_tag = gt_agregar_tarefas(gt, ['team', 'tag'])
+        por_status = gt_agregar_tarefas(gt, ['status'])
+        
+        # Verificações
+        grupos = {(g['team'], g['tag']): g['count'] for g in por_time_tag}
+        assert grupos[(time_teste['id'], tag_teste['id'])] == 2, "Tarefas com a tag devem ser contadas no time"
+        assert grupos[(time_teste['id'], None)] == 1, "Tarefas sem tag devem ser contadas em None"
+        assert sum(g['count'] for g in por_status) == len(gt_listar_todas_tarefas(gt)), \
+            "Agrupamento por status deve cobrir todas as tarefas"
+        assert gt_agregar_tarefas(gt, ['status']) is por_status, "Resultado deve vir do cache sem alterações"
+        
+        tarefa_set_status(tarefas[0], StatusTarefa.TAREFA_CONCLUIDA)
+        atualizado = gt_agregar_tarefas(gt, ['status'])
+        assert atualizado is not por_status, "Alteração deve invalidar o cache"
+        assert any(g['status'] == 'concluida' for g in atualizado), "Nova contagem deve refletir a alteração"
+        
+        semanas = gt_agregar_tarefas(gt, ['week(prazo)'])
+        semana_prazo = f"{prazo_teste.isocalendar()[0]}-W{prazo_teste.isocalendar()[1]:02d}"
+        assert any(g['week(prazo)'] == semana_prazo and g['count'] >= 3 for g in semanas), \
+            "Tarefas devem ser agrupadas pela semana ISO do prazo"
+        assert gt_agregar_tarefas(gt, ['prioridade']) is None, "Agrupamento inválido deve retornar None"
+        
+        for tarefa in tarefas:
+            gt_remover_tarefa(gt, tarefa)
+    finally:
+        cleanup_test_environment(gt, usuario_teste, time_teste, tag_teste)
+
+def test_21_sincronizacao_incremental():
+    """
+    Teste 21: Sincronização incremental a partir de uma versão global
+    """
+    # Setup
+    gt, usuario_teste, time_teste, tag_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação: primeira sincronização (completa)
+        gt_registrar_usuario(gt, usuario_teste)
+        mantida = gt_criar_tarefa(gt, time_teste, "Sincronizada", "Descrição", usuario_teste, [], 0, prazo_teste)
+        removida = gt_criar_tarefa(gt, time_teste, "Removida", "Descrição", usuario_teste, [], 0, prazo_teste)
+        removida_id = tarefa_get_id(removida)
+        completa = gt_sincronizar(gt)
+        
+        # Verificações
+        assert completa['completo'], "Sem versão, a sincronização deve ser completa"
+        assert any(t is mantida for t in completa['entidades']['task']['alteradas']), "Fotografia deve conter as tarefas"
+        assert any(u is usuario_teste for u in completa['entidades']['user']['alteradas']), "Fotografia deve conter os usuários"
+        
+        # Executa a operação: alterações após a versão
+        tarefa_set_titulo(mantida, "Sincronizada alterada")
+        tarefa_set_titulo(mantida, "Sincronizada duas vezes")
+        gt_remover_tarefa(gt, removida)
+        usuario_set_nome(usuario_teste, "João Sincronizado")
+        delta = gt_sincronizar(gt, completa['versao'])
+        
+        # Verificações: apenas as entidades alteradas, uma vez cada
+        assert not delta['completo'], "Versão recente deve retornar apenas as alterações"
+        assert delta['versao'] > completa['versao'], "Versão deve avançar com as alterações"
+        tarefas = delta['entidades']['task']
+        assert [tarefa_get_id(t) for t in tarefas['alteradas']] == [tarefa_get_id(mantida)], \
+            "Tarefa alterada deve aparecer uma única vez"
+        assert tarefas['removidas'] == [removida_id], "Tarefa removida deve aparecer como marca"
+        assert [u['id'] for u in delta['entidades']['user']['alteradas']] == [usuario_teste['id']], \
+            "Usuário alterado deve ser enviado"
+        assert delta['entidades']['tag'] == {'alteradas': [], 'removidas': []}, "Tags sem alteração não devem ser enviadas"
+        
+        # Sem novas alterações, a resposta é vazia; versões desconhecidas exigem a fotografia
+        vazia = gt_sincronizar(gt, delta['versao'])
+        assert not vazia['completo'] and all(not e['alteradas'] and not e['removidas']
+                                             for e in vazia['entidades'].values()), "Nada deve ser enviado sem alterações"
+        assert gt_sincronizar(gt, delta['versao'] + 10 ** 9)['completo'], "Versão futura deve exigir a fotografia"
+        assert gt_sincronizar(gt, 0)['completo'], "Versão anterior ao registro deve exigir a fotografia"
+        assert gt_sincronizar(None, 0) is None, "GT nulo deve retornar None"
+        
+        gt_remover_tarefa(gt, mantida)
+    finally:
+        cleanup_test_environment(gt, usuario_teste, time_teste, tag_teste)
+
+def test_22_leitura_consistente():
+    """
+    Teste 22: Alterações aguardam o fim de um bloco de leitura consistente
+    """
+    # Setup
+    gt, usuario_teste, time_teste, tag_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        tarefa = gt_criar_tarefa(gt, time_teste, "Fixada", "Descrição", usuario_teste, [], 0, prazo_teste)
+        alterada = threading.Event()
+        
+        def alterar():
+            tarefa_set_titulo(tarefa, "Alterada")
+            alterada.set()
+        
+        # Executa a operação: alteração concorrente dentro do bloco
+        with gt_leitura_consistente(gt):
+            escritor = threading.Thread(target=alterar)
+            escritor.start()
+            assert not alterada.wait(0.2), "Alteração deve aguardar o fim do bloco"
+            assert tarefa_get_titulo(tarefa) == "Fixada", "Leituras do bloco devem ver o mesmo estado"
+            qtd = [0]
+            assert gt_listar_tarefas_time(gt, time_teste, qtd) and qtd[0] >= 1, "Consultas devem funcionar dentro do bloco"
+        
+        # Verificações
+        escritor.join(5)
+        assert alterada.is_set(), "Alteração deve ser aplicada após o bloco"
+        assert tarefa_get_titulo(tarefa) == "Alterada", "Título deve refletir a alteração"
+        
+        gt_remover_tarefa(gt, tarefa)
+    finally:
+        cleanup_test_environment(gt, usuario_teste, time_teste, tag_teste)
+
 # Lista de todos os testes para execução
 def run_all_tests():
     """
@@ -479,7 +855,14 @@ def run_all_tests():
         test_12_registro_tag_valida,
         test_13_operacoes_com_gt_nulo,
         test_14_criacao_tarefa_multiplas_tags,
-        test_15_persistencia_dados
+        test_15_persistencia_dados,
+        test_16_lote_tarefas,
+        test_17_importacao_tarefas,
+        test_18_exportacao_fluxo,
+        test_19_exportacao_particionada,
+        test_20_agregacao_tarefas,
+        test_21_sincronizacao_incremental,
+        test_22_leitura_consistente
     ]
     
     passed = 0
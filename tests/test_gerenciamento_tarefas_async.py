@@ -0,0 +1,212 @@
+"""
+Testes unitários para a API assíncrona do Gerenciamento de Tarefas
+
+Testes implementados:
+1. Inicialização e finalização assíncronas
+2. Criação, listagem e remoção de tarefas no loop de eventos
+3. Exportação em fluxo assíncrona equivalente à síncrona
+4. Importação no executor sem bloquear o loop de eventos
+"""
+
+import unittest
+import asyncio
+import threading
+import sys
+import os
+import json
+from datetime import datetime, timedelta
+
+# Adiciona o diretório pai ao path para importar os módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.gerenciamento_tarefas_async import (
+    gt_inicializar_async, gt_finalizar_async, gt_registrar_time_async, gt_registrar_usuario_async,
+    gt_criar_tarefa_async, gt_remover_tarefa_async, gt_listar_todas_tarefas_async,
+    gt_listar_tarefas_time_async, gt_exportar_tarefas_fluxo_async, gt_importar_tarefas_async,
+    gt_aplicar_lote_tarefas_async
+)
+from modules.gerenciamento_tarefas import gt_exportar_tarefas_fluxo
+from modules.usuario import usuario_criar, usuario_destruir
+from modules.team import time_criar, time_destruir
+from modules.tarefa import tarefa_get_id, tarefa_get_titulo, tarefa_buscar_por_id
+
+def setup_test_environment():
+    """
+    Preparação comum para os testes (executada dentro do loop de eventos).
+    """
+    usuario_teste = usuario_criar("João Silva", "joao@email.com")
+    time_teste = time_criar("Equipe Assíncrona")
+    prazo_teste = datetime.now() + timedelta(days=7)
+    
+    return usuario_teste, time_teste, prazo_teste
+
+def cleanup_test_environment(usuario_teste, time_teste):
+    """
+    Limpeza comum após os testes.
+    """
+    if usuario_teste:
+        usuario_destruir(usuario_teste)
+    if time_teste:
+        time_destruir(time_teste)
+
+def test_01_inicializacao_finalizacao_async():
+    """
+    Teste 1: Inicialização e finalização assíncronas
+    """
+    async def executar():
+        gt = await gt_inicializar_async()
+        assert gt is not None, "GT deve ser inicializado no executor"
+        await gt_finalizar_async(gt)
+        assert gt == {}, "GT deve ser finalizado"
+        
+        # Após a finalização, o executor é recriado sob demanda
+        gt = await gt_inicializar_async()
+        assert gt is not None, "GT deve poder ser reinicializado"
+        await gt_finalizar_async(gt)
+    
+    asyncio.run(executar())
+
+def test_02_crud_tarefas_async():
+    """
+    Teste 2: Criação, listagem e remoção de tarefas no loop de eventos
+    """
+    async def executar():
+        gt = await gt_inicializar_async()
+        usuario_teste, time_teste, prazo_teste = setup_test_environment()
+        try:
+            # Preparação
+            assert await gt_registrar_time_async(gt, time_teste) == 0, "Time deve ser registrado"
+            assert await gt_registrar_usuario_async(gt, usuario_teste) == 0, "Usuário deve ser registrado"
+            
+            # Executa a operação
+            tarefa = await gt_criar_tarefa_async(gt, time_teste, "Tarefa assíncrona", "Descrição",
+                                                 usuario_teste, [], 0, prazo_teste)
+            
+            # Verificações
+            assert tarefa is not None, "Tarefa deve ser criada"
+            assert tarefa_buscar_por_id(tarefa_get_id(tarefa)) is tarefa, "Tarefa deve estar registrada"
+            assert any(t is tarefa for t in await gt_listar_todas_tarefas_async(gt)), "Listagem deve conter a tarefa"
+            qtd = [0]
+            assert await gt_listar_tarefas_time_async(gt, time_teste, qtd) is not None and qtd[0] >= 1, \
+                "Listagem do time deve informar a quantidade"
+            assert await gt_remover_tarefa_async(gt, tarefa) == 0, "Tarefa deve ser removida"
+            assert await gt_criar_tarefa_async(gt, None, "T", "D", usuario_teste, [], 0, prazo_teste) is None, \
+                "Time nulo deve retornar None"
+        finally:
+            cleanup_test_environment(usuario_teste, time_teste)
+            await gt_finalizar_async(gt)
+    
+    asyncio.run(executar())
+
+def test_03_exportacao_fluxo_async():
+    """
+    Teste 3: Exportação em fluxo assíncrona equivalente à síncrona
+    """
+    async def executar():
+        gt = await gt_inicializar_async()
+        usuario_teste, time_teste, prazo_teste = setup_test_environment()
+        try:
+            # Preparação
+            await gt_registrar_usuario_async(gt, usuario_teste)
+            tarefas = [await gt_criar_tarefa_async(gt, time_teste, f"Exportada {i}", "Descrição",
+                                                   usuario_teste, [], 0, prazo_teste)
+                       for i in range(3)]
+            
+            # Executa a operação
+            blocos = await gt_exportar_tarefas_fluxo_async(gt, 'jsonl', tarefas, 1)
+            assincronos = [bloco async for bloco in blocos]
+            
+            # Verificações
+            assert assincronos == list(gt_exportar_tarefas_fluxo(gt, 'jsonl', tarefas, 1)), \
+                "Blocos devem ser iguais aos da exportação síncrona"
+            titulos = [json.loads(linha)['titulo'] for linha in ''.join(assincronos).splitlines()]
+            assert titulos == ["Exportada 0", "Exportada 1", "Exportada 2"], "Linhas devem seguir a ordem recebida"
+            assert await gt_exportar_tarefas_fluxo_async(gt, 'xml') is None, "Formato inválido deve retornar None"
+            
+            for tarefa in tarefas:
+                await gt_remover_tarefa_async(gt, tarefa)
+        finally:
+            cleanup_test_environment(usuario_teste, time_teste)
+            await gt_finalizar_async(gt)
+    
+    asyncio.run(executar())
+
+def test_04_importacao_no_executor():
+    """
+    Teste 4: Importação no executor sem bloquear o loop de eventos
+    """
+    async def executar():
+        gt = await gt_inicializar_async()
+        usuario_teste, time_teste, prazo_teste = setup_test_environment()
+        try:
+            # Preparação
+            await gt_registrar_usuario_async(gt, usuario_teste)
+            prazo = prazo_teste.isoformat()
+            linhas = [
+                f'{{"titulo": "Importada async {i}", "descricao": "D", "usuario_responsavel_id": {usuario_teste["id"]}, "prazo": "{prazo}"}}\n'
+                for i in range(5)
+            ]
+            threads_progresso = []
+            
+            def progresso(_):
+                threads_progresso.append(threading.current_thread())
+            
+            batidas = []
+            
+            async def batimento():
+                while True:
+                    batidas.append(1)
+                    await asyncio.sleep(0)
+            
+            # Executa a operação com outra corrotina ativa no loop
+            tarefa_batimento = asyncio.ensure_future(batimento())
+            resumo = await gt_importar_tarefas_async(gt, linhas, 'jsonl', 2, progresso)
+            tarefa_batimento.cancel()
+            
+            # Verificações
+            assert resumo['imported'] == 5, "Todas as linhas devem ser importadas"
+            assert batidas, "Loop de eventos deve continuar ativo durante a importação"
+            assert threads_progresso and threading.main_thread() not in threads_progresso, \
+                "Importação deve ser executada no executor"
+            
+            importadas = [t for t in await gt_listar_todas_tarefas_async(gt)
+                          if tarefa_get_titulo(t).startswith("Importada async")]
+            assert len(importadas) == 5, "Tarefas importadas devem estar registradas"
+            resultados = await gt_aplicar_lote_tarefas_async(gt, [{'op': 'delete', 'id': tarefa_get_id(t)} for t in importadas])
+            assert all(r['success'] for r in resultados), "Lote de remoção deve ser aplicado no executor"
+        finally:
+            cleanup_test_environment(usuario_teste, time_teste)
+            await gt_finalizar_async(gt)
+    
+    asyncio.run(executar())
+
+# Lista de todos os testes para execução
+def run_all_tests():
+    """
+    Executa todos os testes do módulo
+    """
+    tests = [
+        test_01_inicializacao_finalizacao_async,
+        test_02_crud_tarefas_async,
+        test_03_exportacao_fluxo_async,
+        test_04_importacao_no_executor
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}: PASSED")
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: FAILED - {str(e)}")
+            failed += 1
+    
+    print(f"\n📊 RESULTADOS: {passed} passed, {failed} failed")
+    return failed == 0
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    exit(0 if success else 1)
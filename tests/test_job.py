@@ -0,0 +1,247 @@
+"""
+Testes unitários para o módulo Job (fila de jobs em segundo plano)
+
+Testes implementados:
+1. Submissão e conclusão de um job com progresso
+2. Jobs que falham (retorno None ou exceção)
+3. Cancelamento de jobs pendentes, em execução e encerrados
+4. Persistência do estado e jobs interrompidos pelo encerramento
+5. Exportação e importação agendadas pelo módulo de orquestração
+"""
+
+import unittest
+import threading
+import time as relogio
+import tempfile
+import sys
+import os
+import json
+from datetime import datetime, timedelta
+
+# Adiciona o diretório pai ao path para importar os módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import THREADS_JOBS, JOBS_FILE
+from utils import salvar_json, carregar_json
+from modules.job import (
+    StatusJob, job_submeter, job_cancelar, job_obter, job_listar_todos, job_to_dict,
+    job_carregar_dados, job_salvar_dados, job_finalizar
+)
+from modules.gerenciamento_tarefas import (
+    gt_inicializar, gt_finalizar, gt_registrar_usuario, gt_criar_tarefa, gt_remover_tarefa,
+    gt_listar_todas_tarefas, gt_agendar_exportacao, gt_agendar_importacao_arquivo
+)
+from modules.usuario import usuario_criar, usuario_destruir
+from modules.team import time_criar, time_destruir
+from modules.tarefa import tarefa_get_titulo
+
+def aguardar_termino(job, limite=10.0):
+    """
+    Aguarda o job deixar os status pendente e em execução.
+    """
+    fim = relogio.monotonic() + limite
+    while job['status'] in (StatusJob.JOB_PENDENTE, StatusJob.JOB_EXECUTANDO):
+        assert relogio.monotonic() < fim, "Job deve terminar dentro do tempo limite"
+        relogio.sleep(0.01)
+    return job
+
+def test_01_submissao_e_conclusao():
+    """
+    Teste 1: Submissão e conclusão de um job com progresso
+    """
+    # Preparação
+    threads = []
+
+    def funcao(progresso):
+        threads.append(threading.current_thread())
+        for i in range(3):
+            progresso({'etapa': i + 1, 'total': 3})
+        return {'valor': 42}
+    
+    # Executa a operação
+    job = job_submeter('teste', funcao, {'origem': 'test_01'})
+    
+    # Verificações
+    assert job is not None, "Job deve ser submetido"
+    assert job_obter(job['id']) is job, "Job deve estar registrado"
+    aguardar_termino(job)
+    assert job['status'] is StatusJob.JOB_CONCLUIDO, "Job deve ser concluído"
+    assert job['resultado'] == {'valor': 42}, "Resultado deve ser registrado"
+    assert job['progresso'] == {'etapa': 3, 'total': 3}, "Último progresso deve ser registrado"
+    assert threads and threading.main_thread() not in threads, "Job deve ser executado no pool"
+    assert job_listar_todos(1)[0] is job, "Listagem deve começar pelo job mais recente"
+    
+    dados = job_to_dict(job)
+    assert dados['status'] == 'concluido' and dados['parametros'] == {'origem': 'test_01'}, \
+        "Conversão deve expor status e parâmetros"
+    json.dumps(dados)
+    assert job_submeter('', funcao) is None, "Tipo vazio deve retornar None"
+
+def test_02_jobs_que_falham():
+    """
+    Teste 2: Jobs que falham (retorno None ou exceção)
+    """
+    # Executa a operação
+    sem_resultado = job_submeter('teste', lambda progresso: None)
+    com_excecao = job_submeter('teste', lambda progresso: 1 / 0)
+    aguardar_termino(sem_resultado)
+    aguardar_termino(com_excecao)
+    
+    # Verificações
+    assert sem_resultado['status'] is StatusJob.JOB_FALHOU, "Retorno None deve marcar o job como falho"
+    assert com_excecao['status'] is StatusJob.JOB_FALHOU, "Exceção deve marcar o job como falho"
+    assert 'division' in com_excecao['erro'], "Erro deve ser registrado"
+
+def test_03_cancelamento():
+    """
+    Teste 3: Cancelamento de jobs pendentes, em execução e encerrados
+    """
+    # Preparação: ocupa todas as threads do pool
+    liberar = threading.Event()
+    iniciados = threading.Semaphore(0)
+    finalizados = []
+
+    def bloquear(progresso):
+        iniciados.release()
+        liberar.wait(10)
+        progresso({'etapa': 1})
+        return {'ok': True}
+    
+    ocupantes = [job_submeter('teste', bloquear) for _ in range(THREADS_JOBS)]
+    for _ in ocupantes:
+        assert iniciados.acquire(timeout=10), "Jobs ocupantes devem iniciar"
+    pendente = job_submeter('teste', bloquear, finalizacao=lambda: finalizados.append(True))
+    
+    try:
+        # Executa a operação: pendente é cancelado sem executar
+        assert job_cancelar(pendente['id']) == 0, "Cancelamento de pendente deve ter sucesso"
+        assert pendente['status'] is StatusJob.JOB_CANCELADO, "Job pendente deve ser cancelado imediatamente"
+        assert finalizados == [True], "Finalização deve ser executada mesmo sem execução"
+        
+        # Em execução: cancelado na próxima chamada do callback de progresso
+        assert job_cancelar(ocupantes[0]['id']) == 0, "Cancelamento em execução deve ser solicitado"
+    finally:
+        liberar.set()
+    
+    # Verificações
+    aguardar_termino(ocupantes[0])
+    aguardar_termino(ocupantes[1])
+    assert ocupantes[0]['status'] is StatusJob.JOB_CANCELADO, "Job em execução deve ser cancelado"
+    assert ocupantes[0]['resultado'] is None, "Job cancelado não deve ter resultado"
+    assert ocupantes[1]['status'] is StatusJob.JOB_CONCLUIDO, "Demais jobs devem ser concluídos"
+    assert job_cancelar(ocupantes[1]['id']) == -1, "Job encerrado não pode ser cancelado"
+    assert job_cancelar(-1) == -1, "Job inexistente deve retornar erro"
+
+def test_04_persistencia():
+    """
+    Teste 4: Persistência do estado e jobs interrompidos pelo encerramento
+    """
+    # Preparação
+    job = aguardar_termino(job_submeter('teste', lambda progresso: {'ok': True}))
+    assert job_salvar_dados(), "Estado deve ser salvo"
+    dados = carregar_json(JOBS_FILE)
+    assert dados[str(job['id'])]['status'] == 'concluido', "Arquivo deve conter o job concluído"
+    
+    # Simula um job em execução quando o processo terminou
+    interrompido = dict(dados[str(job['id'])], id=job['id'] + 1, status='executando', data_fim=None)
+    dados[str(interrompido['id'])] = interrompido
+    salvar_json(dados, JOBS_FILE)
+    
+    # Executa a operação
+    job_carregar_dados()
+    
+    # Verificações
+    carregado = job_obter(interrompido['id'])
+    assert carregado is not None, "Job persistido deve ser carregado"
+    assert carregado['status'] is StatusJob.JOB_FALHOU, "Job interrompido deve ser marcado como falho"
+    assert carregado['erro'], "Motivo da interrupção deve ser registrado"
+    assert job_obter(job['id'])['resultado'] == {'ok': True}, "Resultado deve ser recarregado"
+    
+    # O pool é recriado sob demanda após a finalização
+    job_finalizar()
+    assert aguardar_termino(job_submeter('teste', lambda progresso: {}))['status'] is StatusJob.JOB_CONCLUIDO, \
+        "Jobs devem ser aceitos após a finalização"
+
+def test_05_exportacao_importacao_agendadas():
+    """
+    Teste 5: Exportação e importação agendadas pelo módulo de orquestração
+    """
+    # Setup
+    gt = gt_inicializar()
+    usuario_teste = usuario_criar("João Silva", "joao@email.com")
+    time_teste = time_criar("Equipe de Jobs")
+    prazo = datetime.now() + timedelta(days=7)
+    
+    try:
+        # Preparação
+        gt_registrar_usuario(gt, usuario_teste)
+        tarefas = [gt_criar_tarefa(gt, time_teste, f"Job {i}", "Descrição", usuario_teste, [], 0, prazo)
+                   for i in range(3)]
+        total = len(gt_listar_todas_tarefas(gt))
+        
+        with tempfile.TemporaryDirectory() as diretorio:
+            # Executa a operação: exportação
+            exportacao = aguardar_termino(gt_agendar_exportacao(gt, "dump.jsonl", 'jsonl', diretorio))
+            
+            # Verificações
+            assert exportacao['status'] is StatusJob.JOB_CONCLUIDO, "Exportação deve ser concluída"
+            assert exportacao['resultado']['total_linhas'] == total, "Todas as tarefas devem ser exportadas"
+            assert exportacao['progresso']['linhas'] == total, "Progresso deve contar as linhas"
+            with open(os.path.join(diretorio, "dump.jsonl"), encoding='utf-8') as arquivo:
+                assert len(arquivo.readlines()) == total, "Arquivo deve conter uma linha por tarefa"
+            assert gt_agendar_exportacao(gt, "dump.xml", 'xml', diretorio) is None, "Formato inválido deve retornar None"
+            
+            # Executa a operação: importação de um arquivo temporário
+            caminho = os.path.join(diretorio, "entrada.jsonl")
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                for i in range(4):
+                    arquivo.write(json.dumps({'titulo': f"Importada job {i}", 'descricao': "D",
+                                              'usuario_responsavel_id': usuario_teste['id'],
+                                              'prazo': prazo.isoformat()}) + '\n')
+            importacao = aguardar_termino(gt_agendar_importacao_arquivo(gt, caminho, None, 2, remover_arquivo=True))
+            
+            # Verificações
+            assert importacao['status'] is StatusJob.JOB_CONCLUIDO, "Importação deve ser concluída"
+            assert importacao['resultado']['imported'] == 4, "Todas as linhas devem ser importadas"
+            assert not os.path.exists(caminho), "Arquivo temporário deve ser removido"
+        
+        importadas = [t for t in gt_listar_todas_tarefas(gt) if tarefa_get_titulo(t).startswith("Importada job")]
+        assert len(importadas) == 4, "Tarefas importadas devem estar registradas"
+        for tarefa in tarefas + importadas:
+            gt_remover_tarefa(gt, tarefa)
+    finally:
+        usuario_destruir(usuario_teste)
+        time_destruir(time_teste)
+        gt_finalizar(gt)
+
+# Lista de todos os testes para execução
+def run_all_tests():
+    """
+    Executa todos os testes do módulo
+    """
+    tests = [
+        test_01_submissao_e_conclusao,
+        test_02_jobs_que_falham,
+        test_03_cancelamento,
+        test_04_persistencia,
+        test_05_exportacao_importacao_agendadas
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}: PASSED")
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: FAILED - {str(e)}")
+            failed += 1
+    
+    print(f"\n📊 RESULTADOS: {passed} passed, {failed} failed")
+    return failed == 0
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    exit(0 if success else 1)
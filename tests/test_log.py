@@ -0,0 +1,186 @@
+"""
+Testes unitários para o registro de operações (utils.log_operacao)
+
+Testes implementados:
+1. Níveis: limiar padrão, nível por módulo e desativação de um módulo
+2. Amostragem de operações frequentes
+3. Formato estruturado (JSON por linha)
+4. Buffer circular: descarte dos registros mais antigos quando cheio
+"""
+
+import io
+import json
+import sys
+import os
+from collections import deque
+
+# Adiciona o diretório pai ao path para importar os módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils
+from utils import (
+    log_operacao, log_configurar, log_ativo, log_descarregar, log_estatisticas,
+    LOG_DEPURACAO, LOG_INFO, LOG_AVISO, LOG_ERRO
+)
+from config import NIVEL_LOG, NIVEIS_LOG_MODULO, AMOSTRAGEM_LOG, FORMATO_LOG, LOG_ASSINCRONO
+
+def capturar_saida(executar):
+    """
+    Executa a função e retorna as linhas de log escritas por ela.
+    """
+    log_descarregar()
+    saida_original = sys.stdout
+    sys.stdout = saida = io.StringIO()
+    try:
+        executar()
+        log_descarregar()
+    finally:
+        sys.stdout = saida_original
+    return [linha for linha in saida.getvalue().splitlines() if 'TesteLog' in linha]
+
+def restaurar_configuracao():
+    """
+    Restaura a configuração de config.py.
+    """
+    log_configurar(NIVEL_LOG, NIVEIS_LOG_MODULO, AMOSTRAGEM_LOG, FORMATO_LOG, LOG_ASSINCRONO)
+
+def test_01_niveis_por_modulo():
+    """
+    Teste 01: Registros abaixo do nível do módulo são descartados
+    """
+    try:
+        # Preparação: padrão INFO, módulo de teste apenas com erros
+        log_configurar(nivel='INFO', niveis_modulo={'TesteLog': 'ERRO'})
+        
+        def registrar():
+            log_operacao("TesteLog", "Criado", "ID: 1")
+            log_operacao("TesteLog", "Erro ao criar", "Nome inválido")
+            log_operacao("TesteLog", "Limite próximo", "90%", LOG_AVISO)
+        
+        # Executa a operação
+        linhas = capturar_saida(registrar)
+        
+        # Verificações
+        assert len(linhas) == 1 and 'Erro ao criar - Nome inválido' in linhas[0], "Apenas o erro deve ser registrado"
+        assert 'ERRO TesteLog' in linhas[0], "Linha deve indicar o nível"
+        assert log_ativo("TesteLog", LOG_ERRO) and not log_ativo("TesteLog", LOG_INFO), "log_ativo deve seguir o módulo"
+        assert log_ativo("OutroModulo", LOG_INFO) and not log_ativo("OutroModulo", LOG_DEPURACAO), \
+            "Demais módulos devem seguir o padrão"
+        
+        # Módulo desativado não registra nem erros
+        log_configurar(niveis_modulo={'TesteLog': 'DESATIVADO'})
+        assert capturar_saida(lambda: log_operacao("TesteLog", "Erro ao criar")) == [], "Módulo desativado não deve registrar"
+        
+        try:
+            log_configurar(nivel='VERBOSO')
+            assert False, "Nível inválido deve ser rejeitado"
+        except ValueError:
+            pass
+    finally:
+        restaurar_configuracao()
+
+def test_02_amostragem():
+    """
+    Teste 02: Operações amostradas são registradas 1 a cada N ocorrências
+    """
+    try:
+        # Preparação
+        log_configurar(nivel='INFO', niveis_modulo={}, amostragem={'TesteLog: Frequente': 10})
+        amostrados_antes = log_estatisticas()['amostrados']
+        
+        def registrar():
+            for i in range(25):
+                log_operacao("TesteLog", "Frequente", f"Ocorrência: {i}")
+            log_operacao("TesteLog", "Rara")
+        
+        # Executa a operação
+        linhas = capturar_saida(registrar)
+        
+        # Verificações
+        frequentes = [linha for linha in linhas if 'Frequente' in linha]
+        assert len(frequentes) == 3, "Devem ser registradas as ocorrências 0, 10 e 20"
+        assert 'Ocorrência: 0' in frequentes[0] and '(1 a cada 10)' in frequentes[0], "Linha deve indicar a amostragem"
+        assert any('Rara' in linha for linha in linhas), "Operações sem amostragem devem ser sempre registradas"
+        assert log_estatisticas()['amostrados'] - amostrados_antes == 22, "Ocorrências omitidas devem ser contadas"
+    finally:
+        restaurar_configuracao()
+
+def test_03_formato_json():
+    """
+    Teste 03: Formato estruturado com um objeto JSON por linha
+    """
+    try:
+        # Preparação
+        log_configurar(nivel='DEPURACAO', niveis_modulo={}, formato='json')
+        
+        # Executa a operação
+        linhas = capturar_saida(lambda: log_operacao("TesteLog", "Consulta", "Qtd: 3", LOG_DEPURACAO))
+        
+        # Verificações
+        assert len(linhas) == 1, "Um registro deve gerar uma linha"
+        registro = json.loads(linhas[0])
+        assert registro['nivel'] == 'DEPURACAO' and registro['modulo'] == 'TesteLog', "Campos devem ser estruturados"
+        assert registro['operacao'] == 'Consulta' and registro['detalhes'] == 'Qtd: 3', "Operação e detalhes devem ser mantidos"
+        assert registro['pid'] == os.getpid() and 'ts' in registro, "Registro deve ter processo e instante"
+    finally:
+        restaurar_configuracao()
+
+def test_04_buffer_circular():
+    """
+    Teste 04: Com o buffer cheio, os registros mais antigos são descartados
+    """
+    buffer_original = utils._buffer_log
+    try:
+        # Preparação: buffer pequeno, com a escrita bloqueada
+        log_configurar(nivel='INFO', niveis_modulo={}, assincrono=True)
+        log_descarregar()
+        descartados_antes = log_estatisticas()['descartados']
+        
+        def registrar():
+            with utils._lock_escrita_log:
+                utils._buffer_log = deque(maxlen=5)
+                for i in range(8):
+                    log_operacao("TesteLog", "Enfileirado", f"Ordem: {i}")
+                assert log_estatisticas()['pendentes'] == 5, "Buffer deve manter apenas a capacidade"
+        
+        # Executa a operação
+        linhas = capturar_saida(registrar)
+        
+        # Verificações
+        assert [linha.rsplit(' ', 1)[1] for linha in linhas] == ['3', '4', '5', '6', '7'], \
+            "Devem ser escritos os registros mais recentes, em ordem"
+        assert log_estatisticas()['descartados'] - descartados_antes == 3, "Registros descartados devem ser contados"
+    finally:
+        utils._buffer_log = buffer_original
+        restaurar_configuracao()
+
+# Lista de todos os testes para execução
+def run_all_tests():
+    """
+    Executa todos os testes do módulo
+    """
+    tests = [
+        test_01_niveis_por_modulo,
+        test_02_amostragem,
+        test_03_formato_json,
+        test_04_buffer_circular
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}: PASSED")
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: FAILED - {str(e)}")
+            failed += 1
+    
+    print(f"\n📊 RESULTADOS: {passed} passed, {failed} failed")
+    return failed == 0
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    exit(0 if success else 1)
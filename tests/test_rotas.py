@@ -0,0 +1,281 @@
+"""
+Testes das rotas da API web (cliente de testes do Flask)
+
+Este arquivo exercita as rotas HTTP de ponta a ponta, sem subir um servidor:
+as requisições passam pelos blueprints, pelo middleware de compressão e
+pelas conversões para JSON, como em produção.
+
+Testes implementados:
+1. Lookup e ?ids= de usuários, tags e times ignoram entidades destruídas
+2. Sub-requisições do /api/batch com Accept-Encoding recebem o corpo em JSON
+3. ?expand= ignora o responsável e as tags já excluídos
+4. Listagens de tarefas e usuários são codificadas sem espaços, como o jsonify
+5. Métodos desconhecidos não criam novas séries de métricas
+6. Entidades excluídas pela API deixam de contar no medidor dos registros
+"""
+
+import atexit
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Adiciona o diretório raiz e o da aplicação web ao path para importar os módulos
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(RAIZ)
+sys.path.append(os.path.join(RAIZ, 'web', 'task_manager_web'))
+
+from modules.usuario import usuario_remover
+from modules.tag import tag_remover
+from modules.team import time_remover
+from modules.tarefa import tarefa_remover
+
+def criar_cliente():
+    """
+    Importa a aplicação (inicializando o sistema GT) e cria um cliente de testes.
+    
+    A importação é adiada até o primeiro teste, para que os dados sejam lidos
+    do diretório temporário configurado em conftest.py; a finalização
+    automática da aplicação é desfeita, pois salvaria os dados de teste.
+    """
+    from src.main import app, finalizar_gt
+    atexit.unregister(finalizar_gt)
+    return app.test_client()
+
+def test_01_lookup_ignora_entidades_destruidas():
+    """
+    Teste 1: Lookup e ?ids= de usuários, tags e times ignoram entidades destruídas
+    
+    Esperado: a entidade excluída aparece em 'missing' no lookup e não aparece
+    (nem como null) na listagem por IDs
+    """
+    cliente = criar_cliente()
+    colecoes = [
+        ('users', {'nome': 'Rota Lookup', 'email': 'rota.lookup@email.com'}, usuario_remover),
+        ('tags', {'nome': 'rota-lookup', 'cor': '#123456'}, tag_remover),
+        ('teams', {'nome': 'Time Rota Lookup'}, time_remover)
+    ]
+    
+    for colecao, dados, remover in colecoes:
+        # Preparação
+        ativo_id = cliente.post(f'/api/{colecao}', json=dados).get_json()['data']['id']
+        excluido_id = cliente.post(f'/api/{colecao}', json=dados).get_json()['data']['id']
+        
+        try:
+            assert cliente.delete(f'/api/{colecao}/{excluido_id}').status_code == 200, \
+                f"Exclusão em /api/{colecao} deve ser aceita"
+            
+            # Executa as operações
+            lookup = cliente.post(f'/api/{colecao}/lookup', json={'ids': [ativo_id, excluido_id]})
+            listagem = cliente.get(f'/api/{colecao}?ids={ativo_id},{excluido_id}')
+            por_id = cliente.get(f'/api/{colecao}/{excluido_id}')
+            
+            # Verificações
+            assert lookup.status_code == 200, f"Lookup de /api/{colecao} deve responder 200"
+            corpo = lookup.get_json()
+            assert [item['id'] for item in corpo['data']] == [ativo_id], "Lookup deve retornar apenas a entidade ativa"
+            assert corpo['missing'] == [excluido_id], "Entidade excluída deve constar em 'missing'"
+            
+            assert listagem.status_code == 200, f"?ids= de /api/{colecao} deve responder 200"
+            corpo = listagem.get_json()
+            assert corpo['count'] == 1, "?ids= deve contar apenas a entidade ativa"
+            assert [item['id'] for item in corpo['data']] == [ativo_id], "?ids= não deve incluir null"
+            
+            assert por_id.status_code == 404, "Entidade excluída não deve ser encontrada pelo ID"
+        finally:
+            # Limpeza
+            cliente.delete(f'/api/{colecao}/{ativo_id}')
+            remover(ativo_id)
+            remover(excluido_id)
+
+def test_02_batch_ignora_accept_encoding():
+    """
+    Teste 2: Sub-requisições do /api/batch com Accept-Encoding recebem o corpo em JSON
+    
+    Esperado: a sub-resposta (grande o bastante para ser comprimida) não é
+    comprimida e o lote inteiro responde 200
+    """
+    cliente = criar_cliente()
+    ids = [
+        cliente.post('/api/users', json={'nome': f'Batch Usuário {i}', 'email': f'batch.{i}@email.com'}).get_json()['data']['id']
+        for i in range(20)
+    ]
+    
+    try:
+        # Executa a operação
+        resposta = cliente.post('/api/batch', json=[{
+            'method': 'GET',
+            'path': f'/api/users?ids={",".join(map(str, ids))}',
+            'headers': {'Accept-Encoding': 'gzip'}
+        }])
+        
+        # Verificações
+        assert resposta.status_code == 200, "Lote deve responder 200"
+        sub = resposta.get_json()['data'][0]
+        assert sub['status'] == 200, "Sub-requisição deve responder 200"
+        assert 'Content-Encoding' not in sub['headers'], "Sub-resposta não deve ser comprimida"
+        assert sub['body']['count'] == len(ids), "Corpo da sub-resposta deve ser o JSON da listagem"
+    finally:
+        # Limpeza
+        for usuario_id in ids:
+            cliente.delete(f'/api/users/{usuario_id}')
+            usuario_remover(usuario_id)
+
+def test_03_expand_ignora_relacoes_excluidas():
+    """
+    Teste 3: ?expand= ignora o responsável e as tags já excluídos
+    
+    Esperado: listagem e consulta por ID respondem 200, sem entradas com
+    id nulo em 'included'; a tag ainda existente continua incorporada
+    """
+    cliente = criar_cliente()
+    usuario_id = cliente.post('/api/users', json={'nome': 'Expand Excluído', 'email': 'expand@email.com'}).get_json()['data']['id']
+    time_id = cliente.post('/api/teams', json={'nome': 'Time Expand'}).get_json()['data']['id']
+    tag_ativa_id = cliente.post('/api/tags', json={'nome': 'expand-ativa', 'cor': '#00FF00'}).get_json()['data']['id']
+    tag_excluida_id = cliente.post('/api/tags', json={'nome': 'expand-excluida', 'cor': '#FF0000'}).get_json()['data']['id']
+    tarefa_id = cliente.post('/api/tasks', json={
+        'titulo': 'Tarefa Expand', 'descricao': 'Descrição', 'usuario_responsavel_id': usuario_id,
+        'time_id': time_id, 'tags': [tag_ativa_id, tag_excluida_id],
+        'prazo': (datetime.now() + timedelta(days=7)).isoformat()
+    }).get_json()['data']['id']
+    
+    try:
+        cliente.delete(f'/api/users/{usuario_id}')
+        cliente.delete(f'/api/tags/{tag_excluida_id}')
+        
+        # Executa as operações
+        listagem = cliente.get(f'/api/tasks?ids={tarefa_id}&expand=usuario,tags')
+        por_id = cliente.get(f'/api/tasks/{tarefa_id}?expand=usuario,tags')
+        
+        # Verificações
+        for resposta in (listagem, por_id):
+            assert resposta.status_code == 200, "?expand= deve responder 200"
+            incluidos = resposta.get_json()['included']
+            assert incluidos['usuario'] == [], "Responsável excluído não deve ser incorporado"
+            assert [tag['id'] for tag in incluidos['tags']] == [tag_ativa_id], "Apenas a tag ativa deve ser incorporada"
+    finally:
+        # Limpeza
+        cliente.delete(f'/api/tasks/{tarefa_id}')
+        tarefa_remover(tarefa_id)
+        cliente.delete(f'/api/tags/{tag_ativa_id}')
+        cliente.delete(f'/api/teams/{time_id}')
+        usuario_remover(usuario_id)
+        time_remover(time_id)
+        for tag_id in (tag_ativa_id, tag_excluida_id):
+            tag_remover(tag_id)
+
+def test_04_listagens_compactas():
+    """
+    Teste 4: Listagens de tarefas e usuários são codificadas sem espaços, como o jsonify
+    """
+    cliente = criar_cliente()
+    usuario_id = cliente.post('/api/users', json={'nome': 'Compacto', 'email': 'compacto@email.com'}).get_json()['data']['id']
+    time_id = cliente.post('/api/teams', json={'nome': 'Time Compacto'}).get_json()['data']['id']
+    tarefa_id = cliente.post('/api/tasks', json={
+        'titulo': 'Tarefa compacta', 'descricao': 'Descrição', 'usuario_responsavel_id': usuario_id,
+        'time_id': time_id, 'prazo': (datetime.now() + timedelta(days=7)).isoformat()
+    }).get_json()['data']['id']
+    
+    try:
+        # Executa as operações
+        respostas = [
+            cliente.get(f'/api/tasks?ids={tarefa_id}'),
+            cliente.get(f'/api/tasks?ids={tarefa_id}&expand=usuario,team'),
+            cliente.get(f'/api/users?ids={usuario_id}')
+        ]
+        
+        # Verificações
+        for resposta in respostas:
+            assert resposta.status_code == 200, "Listagem deve responder 200"
+            corpo = resposta.get_data()
+            assert b'": ' not in corpo and b', "' not in corpo, "Listagem deve usar separadores compactos"
+            assert resposta.get_json()['count'] == 1, "Listagem deve continuar sendo JSON válido"
+    finally:
+        # Limpeza
+        cliente.delete(f'/api/tasks/{tarefa_id}')
+        tarefa_remover(tarefa_id)
+        cliente.delete(f'/api/users/{usuario_id}')
+        cliente.delete(f'/api/teams/{time_id}')
+        usuario_remover(usuario_id)
+        time_remover(time_id)
+
+def test_05_metricas_metodos_desconhecidos():
+    """
+    Teste 5: Métodos desconhecidos não criam novas séries de métricas
+    
+    Esperado: requisições com métodos inventados são agrupadas em uma única
+    série por rota, com o método 'OTHER'
+    """
+    cliente = criar_cliente()
+    from src import metricas
+    
+    # Executa a operação
+    for i in range(50):
+        cliente.open('/api/health', method=f'X{i}')
+    
+    # Verificações
+    metodos = {metodo for _, metodo in metricas._series}
+    assert metodos <= set(metricas.METODOS_METRICAS) | {'OTHER'}, "Métodos desconhecidos devem ser agrupados"
+    assert sum(1 for _, metodo in metricas._series if metodo == 'OTHER') <= 2, \
+        "Métodos desconhecidos devem ocupar uma série por rota (ou a série sem rota)"
+    assert 'method="OTHER"' in cliente.get('/api/metrics').get_data(as_text=True), "Série agrupada deve ser exposta"
+
+def test_06_metricas_entidades_excluidas():
+    """
+    Teste 6: Entidades excluídas pela API deixam de contar no medidor dos registros
+    """
+    cliente = criar_cliente()
+    
+    def registradas():
+        texto = cliente.get('/api/metrics').get_data(as_text=True)
+        return {linha.split('"')[1]: int(linha.rsplit(' ', 1)[1])
+                for linha in texto.splitlines() if linha.startswith('task_manager_registry_entities{')}
+    
+    colecoes = [
+        ('users', {'nome': 'Métricas Excluído', 'email': 'metricas@email.com'}),
+        ('tags', {'nome': 'metricas-excluida', 'cor': '#123456'}),
+        ('teams', {'nome': 'Time Métricas'})
+    ]
+    antes = registradas()
+    
+    # Executa as operações
+    for colecao, dados in colecoes:
+        entidade_id = cliente.post(f'/api/{colecao}', json=dados).get_json()['data']['id']
+        assert registradas()[colecao] == antes[colecao] + 1, "Criação deve contar no medidor"
+        assert cliente.delete(f'/api/{colecao}/{entidade_id}').status_code == 200, "Exclusão deve ser aceita"
+    
+    # Verificações
+    depois = registradas()
+    for colecao, _ in colecoes:
+        assert depois[colecao] == antes[colecao], f"Exclusão em /api/{colecao} deve descontar o medidor"
+
+def run_all_tests():
+    """
+    Executa todos os testes do módulo
+    """
+    tests = [
+        test_01_lookup_ignora_entidades_destruidas,
+        test_02_batch_ignora_accept_encoding,
+        test_03_expand_ignora_relacoes_excluidas,
+        test_04_listagens_compactas,
+        test_05_metricas_metodos_desconhecidos,
+        test_06_metricas_entidades_excluidas
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}: PASSED")
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test.__name__}: FAILED - {str(e)}")
+            failed += 1
+    
+    print(f"\n📊 RESULTADOS: {passed} passed, {failed} failed")
+    return failed == 0
+
+if __name__ == '__main__':
+    success = run_all_tests()
+    exit(0 if success else 1)
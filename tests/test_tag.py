@@ -25,7 +25,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.tag import (
     tag_criar, tag_destruir, tag_set_nome, tag_set_cor,
-    tag_get_nome, tag_get_cor
+    tag_get_nome, tag_get_cor,
+    tag_registrar, tag_remover, tag_buscar_por_id, tag_buscar_por_ids, tag_versao,
+    tag_to_dict, tag_aplicar_replica, tag_listar_todas, tag_qtd_registradas
 )
 
 def test_01_criacao_tag_valida():
@@ -311,6 +313,92 @@ def test_15_cores_hexadecimais_validas():
         assert tag_get_cor(tag) == cor.upper(), f"Cor deve ser {cor.upper()}"
         tag_destruir(tag)
 
+def test_16_busca_por_id():
+    """
+    Teste 16: Busca de tag registrada por ID
+    """
+    # Preparação
+    tag = tag_criar("Revisão", "#123456")
+    assert tag is not None, "Tag deve ser criada"
+    assert tag_registrar(tag) == 0, "Tag deve ser registrada"
+    tag_id = tag['id']
+    
+    try:
+        # Verificações
+        assert tag_buscar_por_id(tag_id) is tag, "Busca por ID deve retornar a tag registrada"
+        assert tag_buscar_por_id(-1) is None, "ID inexistente deve retornar None"
+        assert tag_buscar_por_ids([-1, tag_id]) == [tag], "IDs inexistentes devem ser ignorados"
+    finally:
+        # Limpeza
+        tag_remover(tag_id)
+        tag_destruir(tag)
+    
+    assert tag_buscar_por_id(tag_id) is None, "Tag removida não deve ser encontrada"
+    assert tag_remover(tag_id) == -1, "Tag não registrada não deve ser removida"
+
+def test_17_versao_registro():
+    """
+    Teste 17: Versão da estrutura encapsulada muda com registro, alteração e destruição
+    """
+    # Preparação
+    tag = tag_criar("Versionada", "#654321")
+    assert tag is not None, "Tag deve ser criada"
+    versao_inicial = tag_versao()
+    
+    # Executa as operações e verifica
+    assert tag_registrar(tag) == 0, "Tag deve ser registrada"
+    versao_registro = tag_versao()
+    assert versao_registro > versao_inicial, "Registro deve alterar a versão"
+    
+    assert tag_set_cor(tag, "#ABCDEF") == 0, "Alteração deve ser aplicada"
+    versao_alteracao = tag_versao()
+    assert versao_alteracao > versao_registro, "Alteração deve alterar a versão"
+    assert tag_versao() == versao_alteracao, "Consulta não deve alterar a versão"
+    
+    tag_destruir(tag)
+    assert tag_versao() > versao_alteracao, "Destruição deve alterar a versão"
+
+def test_18_aplicar_replica():
+    """
+    Teste 18: Réplica de outro processo: alteração incremental, remoção e carga completa
+    """
+    # Preparação
+    tag = tag_criar("Replicada", "#112233")
+    ausente = tag_criar("Ausente", "#445566")
+    assert tag_registrar(tag) == 0 and tag_registrar(ausente) == 0, "Tags devem ser registradas"
+    tag_id, ausente_id = tag['id'], ausente['id']
+    dados_ausente = tag_to_dict(ausente)
+    
+    try:
+        # Alteração incremental: atualiza no lugar e altera a versão
+        versao_inicial = tag_versao()
+        dados = tag_to_dict(tag)
+        dados['cor'] = "#778899"
+        assert tag_aplicar_replica({tag_id: dados}) == 0, "Réplica deve ser aplicada"
+        assert tag_buscar_por_id(tag_id) is tag, "Referência da tag deve ser preservada"
+        assert tag_get_cor(tag) == "#778899", "Alteração deve ser aplicada"
+        assert tag_versao() > versao_inicial, "Réplica deve alterar a versão"
+        
+        # Remoção por None e nova entrada
+        qtd = tag_qtd_registradas()
+        assert tag_aplicar_replica({ausente_id: None}) == 0, "Remoção deve ser aplicada"
+        assert tag_buscar_por_id(ausente_id) is None, "Tag removida não deve estar registrada"
+        assert tag_qtd_registradas() == qtd - 1, "Remoção deve descontar a quantidade registrada"
+        assert tag_aplicar_replica({ausente_id: dados_ausente}) == 0, "Nova tag deve ser aplicada"
+        assert tag_buscar_por_id(ausente_id)['nome'] == ausente['nome'], "Nova tag deve ser registrada"
+        
+        # Carga completa: tags ausentes dos dados são removidas
+        completo = {e['id']: tag_to_dict(e) for e in tag_listar_todas() if e and e['id'] != ausente_id}
+        assert tag_aplicar_replica(completo, completo=True) == 0, "Carga completa deve ser aplicada"
+        assert tag_buscar_por_id(ausente_id) is None, "Tag ausente da carga completa deve ser removida"
+        assert tag_buscar_por_id(tag_id) is tag, "Tags da carga completa devem ser mantidas"
+        assert tag_qtd_registradas() == len(completo), "Registro deve conter apenas as tags da carga"
+    finally:
+        # Limpeza
+        tag_aplicar_replica({tag_id: None, ausente_id: None})
+        tag_destruir(tag)
+        tag_destruir(ausente)
+
 # Lista de todos os testes para execução
 def run_all_tests():
     """
@@ -331,7 +419,10 @@ def run_all_tests():
         test_12_casos_limite_cor_formato_errado,
         test_13_alteracao_tag_nula,
         test_14_consulta_tag_nula,
-        test_15_cores_hexadecimais_validas
+        test_15_cores_hexadecimais_validas,
+        test_16_busca_por_id,
+        test_17_versao_registro,
+        test_18_aplicar_replica
     ]
     
     passed = 0
@@ -30,7 +30,10 @@ from modules.tarefa import (
     tarefa_criar, tarefa_destruir, tarefa_set_status, tarefa_get_status,
     tarefa_add_tag, tarefa_list_tags, tarefa_get_titulo, tarefa_get_descricao,
     tarefa_get_usuario_responsavel_id, tarefa_get_prazo, tarefa_get_id,
-    tarefa_get_tags_ids, tarefa_remover_tag
+    tarefa_get_tags_ids, tarefa_remover_tag, tarefa_listar_ordenadas,
+    tarefa_registrar, tarefa_remover, tarefa_versao, tarefa_contagem_por_status,
+    tarefa_serie_temporal, tarefa_snapshot, tarefa_qtd_registradas,
+    tarefa_to_dict, tarefa_aplicar_replica, tarefa_buscar_por_id, tarefa_listar_todas
 )
 from modules.usuario import usuario_criar, usuario_destruir
 from modules.tag import tag_criar, tag_destruir
@@ -527,6 +530,222 @@ def test_17_todos_status_tarefa():
     finally:
         cleanup_test_environment(usuario_teste)
 
+def test_18_listagem_ordenada_top_k():
+    """
+    Teste 18: Listagem das k primeiras tarefas por prazo
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação - prazos fora de ordem de criação
+        deslocamentos = [5, 1, 9, 3, 7]
+        tarefas = [
+            tarefa_criar(f"Tarefa {d}", "Descrição", usuario_teste, prazo_teste + timedelta(days=d))
+            for d in deslocamentos
+        ]
+        
+        # Executa a operação
+        primeiras = tarefa_listar_ordenadas('prazo', 2, tarefas=tarefas)
+        ultimas = tarefa_listar_ordenadas('prazo', 2, decrescente=True, tarefas=tarefas)
+        todas = tarefa_listar_ordenadas('prazo', tarefas=tarefas)
+        
+        # Verificações
+        assert [tarefa_get_titulo(t) for t in primeiras] == ["Tarefa 1", "Tarefa 3"], "Devem vir os menores prazos"
+        assert [tarefa_get_titulo(t) for t in ultimas] == ["Tarefa 9", "Tarefa 7"], "Devem vir os maiores prazos"
+        assert len(todas) == len(tarefas), "Sem limite todas as tarefas devem ser retornadas"
+        assert tarefa_listar_ordenadas('titulo', 2, tarefas=tarefas) == [], "Campo inválido deve retornar lista vazia"
+        
+        # Limpeza
+        for tarefa in tarefas:
+            tarefa_destruir(tarefa)
+    finally:
+        cleanup_test_environment(usuario_teste)
+
+def test_19_versao_e_contagem_por_status():
+    """
+    Teste 19: Versão do registro e contagens por status mantidas a cada alteração
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        tarefa = tarefa_criar("Tarefa contada", "Descrição", usuario_teste, prazo_teste)
+        avulsa = tarefa_criar("Tarefa avulsa", "Descrição", usuario_teste, prazo_teste)
+        contagem_inicial = tarefa_contagem_por_status()
+        versao_inicial = tarefa_versao()
+        qtd_inicial = tarefa_qtd_registradas()
+        
+        # Executa a operação
+        tarefa_registrar(tarefa)
+        versao_registro = tarefa_versao()
+        contagem_registro = tarefa_contagem_por_status()
+        tarefa_set_status(tarefa, StatusTarefa.TAREFA_CONCLUIDA)
+        contagem_alteracao = tarefa_contagem_por_status()
+        versao_alteracao = tarefa_versao()
+        tarefa_set_status(avulsa, StatusTarefa.TAREFA_CANCELADA)
+        
+        # Verificações
+        aberta, concluida = StatusTarefa.TAREFA_ABERTA, StatusTarefa.TAREFA_CONCLUIDA
+        assert versao_registro > versao_inicial, "Registro deve alterar a versão"
+        assert contagem_registro[aberta] == contagem_inicial[aberta] + 1, "Registro deve contar a tarefa"
+        assert contagem_alteracao[aberta] == contagem_inicial[aberta], "Status anterior deve ser descontado"
+        assert contagem_alteracao[concluida] == contagem_inicial[concluida] + 1, "Novo status deve ser contado"
+        assert versao_alteracao > versao_registro, "Alteração deve alterar a versão"
+        assert tarefa_versao() == versao_alteracao, "Tarefa não registrada não deve alterar a versão"
+        assert tarefa_contagem_por_status() == contagem_alteracao, "Tarefa não registrada não deve ser contada"
+        assert tarefa_qtd_registradas() == qtd_inicial + 1, "Quantidade registrada deve incluir apenas a tarefa registrada"
+        
+        tarefa_remover(tarefa_get_id(tarefa))
+        assert tarefa_contagem_por_status() == contagem_inicial, "Remoção deve descontar a tarefa"
+        assert tarefa_qtd_registradas() == qtd_inicial, "Remoção deve descontar a quantidade registrada"
+        
+        # Limpeza
+        tarefa_destruir(tarefa)
+        tarefa_destruir(avulsa)
+    finally:
+        cleanup_test_environment(usuario_teste)
+
+def test_20_series_temporais():
+    """
+    Teste 20: Séries de tarefas criadas e concluídas mantidas por hora e dia
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        agora = datetime.now()
+        def contagem(metrica, intervalo):
+            serie = tarefa_serie_temporal(metrica, intervalo, agora, datetime.now())
+            return sum(ponto['count'] for ponto in serie)
+        criadas_hora, criadas_dia = contagem('created', 'hour'), contagem('created', 'day')
+        concluidas_dia = contagem('completed', 'day')
+        tarefas = [tarefa_criar(f"Tarefa série {i}", "Descrição", usuario_teste, prazo_teste) for i in range(3)]
+        
+        # Executa a operação
+        for tarefa in tarefas[:2]:
+            tarefa_registrar(tarefa)
+        tarefa_set_status(tarefas[0], StatusTarefa.TAREFA_CONCLUIDA)
+        tarefa_set_status(tarefas[0], StatusTarefa.TAREFA_CONCLUIDA)
+        tarefa_set_status(tarefas[2], StatusTarefa.TAREFA_CONCLUIDA)
+        
+        # Verificações
+        assert contagem('created', 'hour') == criadas_hora + 2, "Apenas tarefas registradas devem ser contadas"
+        assert contagem('created', 'day') == criadas_dia + 2, "Intervalo diário deve acompanhar o horário"
+        assert contagem('completed', 'day') == concluidas_dia + 1, "Conclusão deve ser contada uma única vez"
+        
+        serie = tarefa_serie_temporal('created', 'day', agora - timedelta(days=2), agora)
+        assert [ponto['bucket'] for ponto in serie] == [(agora - timedelta(days=d)).strftime('%Y-%m-%d') for d in (2, 1, 0)], \
+            "Intervalos sem eventos devem ser preenchidos"
+        for metrica, intervalo in (('prioridade', 'day'), ('created', 'minute')):
+            try:
+                tarefa_serie_temporal(metrica, intervalo)
+                assert False, "Métrica ou intervalo inválidos devem gerar ValueError"
+            except ValueError:
+                pass
+        
+        # Limpeza
+        for tarefa in tarefas:
+            tarefa_remover(tarefa_get_id(tarefa))
+            tarefa_destruir(tarefa)
+    finally:
+        cleanup_test_environment(usuario_teste)
+
+def test_21_snapshot_imutavel_e_versionado():
+    """
+    Teste 21: Fotografia das tarefas imutável e atualizada a cada versão
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    
+    try:
+        # Preparação
+        tarefa = tarefa_criar("Tarefa fotografada", "Descrição", usuario_teste, prazo_teste)
+        tarefa_registrar(tarefa)
+        tarefa_id = tarefa_get_id(tarefa)
+        
+        # Executa a operação
+        antes = tarefa_snapshot()
+        assert tarefa_snapshot() is antes, "Sem alterações, a mesma fotografia deve ser reaproveitada"
+        tarefa_set_status(tarefa, StatusTarefa.TAREFA_CONCLUIDA)
+        tarefa_add_tag(tarefa, 42)
+        depois = tarefa_snapshot()
+        
+        # Verificações
+        congelada = next(t for t in antes.tarefas if t['id'] == tarefa_id)
+        assert congelada['status'] == StatusTarefa.TAREFA_ABERTA, "Fotografia anterior não deve ver a alteração"
+        assert congelada['tags'] == (), "Tags da fotografia anterior não devem mudar"
+        atual = next(t for t in depois.tarefas if t['id'] == tarefa_id)
+        assert depois.versao == tarefa_versao() > antes.versao, "Fotografia deve acompanhar a versão"
+        assert atual['status'] == StatusTarefa.TAREFA_CONCLUIDA, "Fotografia nova deve ver a alteração"
+        assert tarefa_get_tags_ids(atual) == [42], "Tags devem ser lidas da fotografia"
+        try:
+            atual['status'] = StatusTarefa.TAREFA_ABERTA
+            assert False, "Tarefa da fotografia deve ser somente leitura"
+        except TypeError:
+            pass
+        
+        tarefa_remover(tarefa_id)
+        assert all(t['id'] != tarefa_id for t in tarefa_snapshot().tarefas), "Tarefa removida não deve constar"
+        
+        # Limpeza
+        tarefa_destruir(tarefa)
+    finally:
+        cleanup_test_environment(usuario_teste)
+
+def test_22_aplicar_replica():
+    """
+    Teste 22: Réplica de outro processo: alteração incremental, remoção e carga completa
+    """
+    # Setup
+    usuario_teste, prazo_teste = setup_test_environment()
+    tarefa = tarefa_criar("Tarefa replicada", "Descrição", usuario_teste, prazo_teste)
+    ausente = tarefa_criar("Tarefa ausente", "Descrição", usuario_teste, prazo_teste)
+    tarefa_registrar(tarefa)
+    tarefa_registrar(ausente)
+    tarefa_id, ausente_id = tarefa_get_id(tarefa), tarefa_get_id(ausente)
+    dados_ausente = tarefa_to_dict(ausente)
+    
+    try:
+        # Alteração incremental: atualiza no lugar, com versão e contagens
+        aberta, concluida = StatusTarefa.TAREFA_ABERTA, StatusTarefa.TAREFA_CONCLUIDA
+        contagem_inicial = tarefa_contagem_por_status()
+        versao_inicial = tarefa_versao()
+        dados = tarefa_to_dict(tarefa)
+        dados['titulo'] = "Tarefa replicada alterada"
+        dados['status'] = concluida.value
+        assert tarefa_aplicar_replica({tarefa_id: dados}) == 0, "Réplica deve ser aplicada"
+        assert tarefa_buscar_por_id(tarefa_id) is tarefa, "Referência da tarefa deve ser preservada"
+        assert tarefa_get_titulo(tarefa) == "Tarefa replicada alterada", "Título deve ser alterado"
+        assert tarefa_versao() > versao_inicial, "Réplica deve alterar a versão"
+        contagem = tarefa_contagem_por_status()
+        assert contagem[aberta] == contagem_inicial[aberta] - 1, "Status anterior deve ser descontado"
+        assert contagem[concluida] == contagem_inicial[concluida] + 1, "Novo status deve ser contado"
+        
+        # Remoção por None e nova entrada
+        qtd = tarefa_qtd_registradas()
+        assert tarefa_aplicar_replica({ausente_id: None}) == 0, "Remoção deve ser aplicada"
+        assert tarefa_buscar_por_id(ausente_id) is None, "Tarefa removida não deve estar registrada"
+        assert tarefa_qtd_registradas() == qtd - 1, "Remoção deve descontar a quantidade registrada"
+        assert tarefa_aplicar_replica({ausente_id: dados_ausente}) == 0, "Nova tarefa deve ser aplicada"
+        assert tarefa_get_titulo(tarefa_buscar_por_id(ausente_id)) == "Tarefa ausente", "Nova tarefa deve ser registrada"
+        
+        # Carga completa: tarefas ausentes dos dados são removidas
+        completo = {tarefa_get_id(t): tarefa_to_dict(t) for t in tarefa_listar_todas()
+                    if t and tarefa_get_id(t) != ausente_id}
+        assert tarefa_aplicar_replica(completo, completo=True) == 0, "Carga completa deve ser aplicada"
+        assert tarefa_buscar_por_id(ausente_id) is None, "Tarefa ausente da carga completa deve ser removida"
+        assert tarefa_buscar_por_id(tarefa_id) is tarefa, "Tarefas da carga completa devem ser mantidas"
+        assert tarefa_qtd_registradas() == len(completo), "Registro deve conter apenas as tarefas da carga"
+    finally:
+        # Limpeza
+        tarefa_aplicar_replica({tarefa_id: None, ausente_id: None})
+        tarefa_destruir(tarefa)
+        tarefa_destruir(ausente)
+        cleanup_test_environment(usuario_teste)
+
 # Lista de todos os testes para execução
 def run_all_tests():
     """
@@ -549,7 +768,12 @@ def run_all_tests():
         test_14_casos_limite_prazo_nulo,
         test_15_multiplas_tags_mesma_tarefa,
         test_16_tag_duplicada,
-        test_17_todos_status_tarefa
+        test_17_todos_status_tarefa,
+        test_18_listagem_ordenada_top_k,
+        test_19_versao_e_contagem_por_status,
+        test_20_series_temporais,
+        test_21_snapshot_imutavel_e_versionado,
+        test_22_aplicar_replica
     ]
     
     passed = 0
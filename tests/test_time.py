@@ -26,7 +26,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.team import (
     time_criar, time_destruir, time_adicionar_usuario, time_remover_usuario,
-    time_qtd_membros, time_get_nome, time_get_id, time_get_membros, time_set_nome
+    time_qtd_membros, time_get_nome, time_get_id, time_get_membros, time_set_nome,
+    time_registrar, time_remover, time_buscar_por_id, time_buscar_por_ids, time_versao,
+    time_to_dict, time_aplicar_replica, time_listar_todos, time_qtd_registrados
 )
 from modules.usuario import usuario_criar, usuario_destruir
 
@@ -355,6 +357,70 @@ def test_13_quantidade_membros_multiplos():
     for usuario in usuarios:
         usuario_destruir(usuario)
 
+def test_14_busca_por_id():
+    """
+    Teste 14: Busca de time registrado por ID
+    """
+    # Preparação
+    time = time_criar("Equipe de Busca")
+    assert time is not None, "Time deve ser criado"
+    assert time_registrar(time) == 0, "Time deve ser registrado"
+    time_id = time['id']
+    
+    try:
+        # Verificações
+        assert time_buscar_por_id(time_id) is time, "Busca por ID deve retornar o time registrado"
+        assert time_buscar_por_id(-1) is None, "ID inexistente deve retornar None"
+        assert time_buscar_por_ids([-1, time_id]) == [time], "IDs inexistentes devem ser ignorados"
+    finally:
+        # Limpeza
+        time_remover(time_id)
+        time_destruir(time)
+    
+    assert time_buscar_por_id(time_id) is None, "Time removido não deve ser encontrado"
+    assert time_remover(time_id) == -1, "Time não registrado não deve ser removido"
+
+def test_15_aplicar_replica():
+    """
+    Teste 15: Réplica de outro processo: alteração incremental, remoção e carga completa
+    """
+    # Preparação
+    time = time_criar("Time Replicado")
+    ausente = time_criar("Time Ausente")
+    assert time_registrar(time) == 0 and time_registrar(ausente) == 0, "Times devem ser registrados"
+    time_id, ausente_id = time['id'], ausente['id']
+    dados_ausente = time_to_dict(ausente)
+    
+    try:
+        # Alteração incremental: atualiza no lugar e altera a versão
+        versao_inicial = time_versao()
+        dados = time_to_dict(time)
+        dados['nome'] = "Time Replicado Alterado"
+        assert time_aplicar_replica({time_id: dados}) == 0, "Réplica deve ser aplicada"
+        assert time_buscar_por_id(time_id) is time, "Referência do time deve ser preservada"
+        assert time_get_nome(time) == "Time Replicado Alterado", "Alteração deve ser aplicada"
+        assert time_versao() > versao_inicial, "Réplica deve alterar a versão"
+        
+        # Remoção por None e nova entrada
+        qtd = time_qtd_registrados()
+        assert time_aplicar_replica({ausente_id: None}) == 0, "Remoção deve ser aplicada"
+        assert time_buscar_por_id(ausente_id) is None, "Time removido não deve estar registrado"
+        assert time_qtd_registrados() == qtd - 1, "Remoção deve descontar a quantidade registrada"
+        assert time_aplicar_replica({ausente_id: dados_ausente}) == 0, "Novo time deve ser aplicado"
+        assert time_buscar_por_id(ausente_id)['nome'] == ausente['nome'], "Novo time deve ser registrado"
+        
+        # Carga completa: times ausentes dos dados são removidos
+        completo = {e['id']: time_to_dict(e) for e in time_listar_todos() if e and e['id'] != ausente_id}
+        assert time_aplicar_replica(completo, completo=True) == 0, "Carga completa deve ser aplicada"
+        assert time_buscar_por_id(ausente_id) is None, "Time ausente da carga completa deve ser removido"
+        assert time_buscar_por_id(time_id) is time, "Times da carga completa devem ser mantidos"
+        assert time_qtd_registrados() == len(completo), "Registro deve conter apenas os times da carga"
+    finally:
+        # Limpeza
+        time_aplicar_replica({time_id: None, ausente_id: None})
+        time_destruir(time)
+        time_destruir(ausente)
+
 # Lista de todos os testes para execução
 def run_all_tests():
     """
@@ -373,7 +439,9 @@ def run_all_tests():
         test_10_adicionar_usuario_duplicado,
         test_11_remover_usuario_inexistente,
         test_12_operacoes_com_ponteiros_nulos,
-        test_13_quantidade_membros_multiplos
+        test_13_quantidade_membros_multiplos,
+        test_14_busca_por_id,
+        test_15_aplicar_replica
     ]
     
     passed = 0
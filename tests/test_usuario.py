@@ -23,7 +23,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from modules.usuario import (
     usuario_criar, usuario_destruir, usuario_set_email,
-    usuario_get_nome, usuario_get_email
+    usuario_get_nome, usuario_get_email,
+    usuario_registrar, usuario_remover, usuario_buscar_por_id, usuario_buscar_por_ids, usuario_versao,
+    usuario_to_dict, usuario_aplicar_replica, usuario_listar_todos, usuario_qtd_registrados
 )
 
 def test_01_criacao_usuario_valido():
@@ -237,6 +239,92 @@ def test_12_consulta_usuario_nulo():
     assert nome is None, "Nome deve ser None para usuário nulo"
     assert email is None, "Email deve ser None para usuário nulo"
 
+def test_13_busca_por_id():
+    """
+    Teste 13: Busca de usuário registrado por ID
+    """
+    # Preparação
+    usuario = usuario_criar("Maria Souza", "maria@email.com")
+    assert usuario is not None, "Usuário deve ser criado"
+    assert usuario_registrar(usuario) == 0, "Usuário deve ser registrado"
+    usuario_id = usuario['id']
+    
+    try:
+        # Verificações
+        assert usuario_buscar_por_id(usuario_id) is usuario, "Busca por ID deve retornar o usuário registrado"
+        assert usuario_buscar_por_id(-1) is None, "ID inexistente deve retornar None"
+        assert usuario_buscar_por_ids([-1, usuario_id]) == [usuario], "IDs inexistentes devem ser ignorados"
+    finally:
+        # Limpeza
+        usuario_remover(usuario_id)
+        usuario_destruir(usuario)
+    
+    assert usuario_buscar_por_id(usuario_id) is None, "Usuário removido não deve ser encontrado"
+    assert usuario_remover(usuario_id) == -1, "Usuário não registrado não deve ser removido"
+
+def test_14_versao_registro():
+    """
+    Teste 14: Versão da estrutura encapsulada muda com registro, alteração e destruição
+    """
+    # Preparação
+    usuario = usuario_criar("Carlos Lima", "carlos@email.com")
+    assert usuario is not None, "Usuário deve ser criado"
+    versao_inicial = usuario_versao()
+    
+    # Executa as operações e verifica
+    assert usuario_registrar(usuario) == 0, "Usuário deve ser registrado"
+    versao_registro = usuario_versao()
+    assert versao_registro > versao_inicial, "Registro deve alterar a versão"
+    
+    assert usuario_set_email(usuario, "carlos.lima@email.com") == 0, "Alteração deve ser aplicada"
+    versao_alteracao = usuario_versao()
+    assert versao_alteracao > versao_registro, "Alteração deve alterar a versão"
+    assert usuario_versao() == versao_alteracao, "Consulta não deve alterar a versão"
+    
+    usuario_destruir(usuario)
+    assert usuario_versao() > versao_alteracao, "Destruição deve alterar a versão"
+
+def test_15_aplicar_replica():
+    """
+    Teste 15: Réplica de outro processo: alteração incremental, remoção e carga completa
+    """
+    # Preparação
+    usuario = usuario_criar("Ana Réplica", "ana.replica@email.com")
+    ausente = usuario_criar("Bruno Ausente", "bruno.ausente@email.com")
+    assert usuario_registrar(usuario) == 0 and usuario_registrar(ausente) == 0, "Usuários devem ser registrados"
+    usuario_id, ausente_id = usuario['id'], ausente['id']
+    dados_ausente = usuario_to_dict(ausente)
+    
+    try:
+        # Alteração incremental: atualiza no lugar e altera a versão
+        versao_inicial = usuario_versao()
+        dados = usuario_to_dict(usuario)
+        dados['email'] = "ana.alterada@email.com"
+        assert usuario_aplicar_replica({usuario_id: dados}) == 0, "Réplica deve ser aplicada"
+        assert usuario_buscar_por_id(usuario_id) is usuario, "Referência do usuário deve ser preservada"
+        assert usuario_get_email(usuario) == "ana.alterada@email.com", "Alteração deve ser aplicada"
+        assert usuario_versao() > versao_inicial, "Réplica deve alterar a versão"
+        
+        # Remoção por None e nova entrada
+        qtd = usuario_qtd_registrados()
+        assert usuario_aplicar_replica({ausente_id: None}) == 0, "Remoção deve ser aplicada"
+        assert usuario_buscar_por_id(ausente_id) is None, "Usuário removido não deve estar registrado"
+        assert usuario_qtd_registrados() == qtd - 1, "Remoção deve descontar a quantidade registrada"
+        assert usuario_aplicar_replica({ausente_id: dados_ausente}) == 0, "Novo usuário deve ser aplicado"
+        assert usuario_buscar_por_id(ausente_id)['nome'] == ausente['nome'], "Novo usuário deve ser registrado"
+        
+        # Carga completa: usuários ausentes dos dados são removidos
+        completo = {e['id']: usuario_to_dict(e) for e in usuario_listar_todos() if e and e['id'] != ausente_id}
+        assert usuario_aplicar_replica(completo, completo=True) == 0, "Carga completa deve ser aplicada"
+        assert usuario_buscar_por_id(ausente_id) is None, "Usuário ausente da carga completa deve ser removido"
+        assert usuario_buscar_por_id(usuario_id) is usuario, "Usuários da carga completa devem ser mantidos"
+        assert usuario_qtd_registrados() == len(completo), "Registro deve conter apenas os usuários da carga"
+    finally:
+        # Limpeza
+        usuario_aplicar_replica({usuario_id: None, ausente_id: None})
+        usuario_destruir(usuario)
+        usuario_destruir(ausente)
+
 # Lista de todos os testes para execução
 def run_all_tests():
     """
@@ -254,7 +342,10 @@ def run_all_tests():
         test_09_casos_limite_email_vazio,
         test_10_casos_limite_email_invalido,
         test_11_modificacao_usuario_nulo,
-        test_12_consulta_usuario_nulo
+        test_12_consulta_usuario_nulo,
+        test_13_busca_por_id,
+        test_14_versao_registro,
+        test_15_aplicar_replica
     ]
     
     passed = 0
@@ -5,27 +5,172 @@ Este módulo contém funções utilitárias que são utilizadas
 por múltiplos módulos do sistema.
 """
 
+import atexit
 import json
 import os
 import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable
 
 # Adiciona o diretório atual ao path se não estiver lá
 current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-from config import DATE_FORMAT, DATA_DIR, criar_diretorios
+from config import (
+    DATE_FORMAT, DATA_DIR, EXPORT_DIR, criar_diretorios, NIVEL_LOG, NIVEIS_LOG_MODULO, AMOSTRAGEM_LOG,
+    FORMATO_LOG, LOG_ASSINCRONO, MAX_REGISTROS_BUFFER_LOG, INTERVALO_DESCARGA_LOG
+)
+
+# Último ID gerado, para garantir IDs estritamente crescentes
+_ultimo_id = 0
+_lock_ids = threading.Lock()
 
 def gerar_id_unico() -> int:
     """
     Gera um ID único baseado no timestamp atual.
     
+    IDs gerados no mesmo microssegundo (por exemplo, em operações em lote)
+    são incrementados para continuarem únicos.
+    
     Returns:
         int: ID único baseado no timestamp
     """
-    return int(datetime.now().timestamp() * 1000000)
+    global _ultimo_id
+    with _lock_ids:
+        novo_id = int(datetime.now().timestamp() * 1000000)
+        if novo_id <= _ultimo_id:
+            novo_id = _ultimo_id + 1
+        _ultimo_id = novo_id
+        return novo_id
+
+class _SecaoLock:
+    """Bloco with que adquire e libera um dos modos do LockLeituraEscrita."""
+    __slots__ = ('_adquirir', '_liberar')
+    
+    def __init__(self, adquirir, liberar):
+        self._adquirir = adquirir
+        self._liberar = liberar
+    
+    def __enter__(self):
+        self._adquirir()
+        return self
+    
+    def __exit__(self, *exc):
+        self._liberar()
+        return False
+
+class LockLeituraEscrita:
+    """
+    Lock de leitura e escrita para as estruturas encapsuladas dos módulos.
+    
+    Várias threads podem ler ao mesmo tempo; a escrita é exclusiva e tem
+    preferência (novas leituras esperam enquanto houver escritor aguardando),
+    de modo que as escritas não sofrem inanição sob leitura contínua.
+    
+    A escrita é reentrante e a thread escritora também pode ler (observadores
+    notificados durante uma alteração podem consultar a estrutura). A leitura
+    é reentrante, mas não pode ser promovida a escrita.
+    
+    Usado diretamente em um bloco with, equivale a escrita().
+    """
+    
+    def __init__(self):
+        self._trava = threading.Lock()
+        self._condicao = threading.Condition(self._trava)
+        self._leitores = 0
+        self._escritor = None
+        self._profundidade_escrita = 0
+        self._escritores_aguardando = 0
+        self._local = threading.local()
+        self._secao_leitura = _SecaoLock(self.adquirir_leitura, self.liberar_leitura)
+        self._secao_escrita = _SecaoLock(self.adquirir_escrita, self.liberar_escrita)
+    
+    def adquirir_leitura(self) -> None:
+        """Adquire o lock para leitura (compartilhado)."""
+        local = self._local
+        leituras = getattr(local, 'leituras', 0)
+        if leituras:
+            local.leituras = leituras + 1
+            return
+        
+        with self._trava:
+            if self._escritor is None and not self._escritores_aguardando:
+                # Caminho rápido: nenhum escritor ativo ou aguardando
+                self._leitores += 1
+                local.leitura_compartilhada = True
+            elif self._escritor == threading.get_ident():
+                # A thread escritora já tem acesso exclusivo
+                local.leitura_compartilhada = False
+            else:
+                while self._escritor is not None or self._escritores_aguardando:
+                    self._condicao.wait()
+                self._leitores += 1
+                local.leitura_compartilhada = True
+        local.leituras = 1
+    
+    def liberar_leitura(self) -> None:
+        """Libera uma aquisição de leitura."""
+        local = self._local
+        local.leituras -= 1
+        if local.leituras or not local.leitura_compartilhada:
+            return
+        with self._trava:
+            self._leitores -= 1
+            if self._leitores == 0 and self._escritores_aguardando:
+                self._condicao.notify_all()
+    
+    def adquirir_escrita(self) -> None:
+        """
+        Adquire o lock para escrita (exclusivo).
+        
+        Raises:
+            RuntimeError: Se a thread tiver o lock apenas para leitura
+        """
+        eu = threading.get_ident()
+        with self._trava:
+            if self._escritor == eu:
+                self._profundidade_escrita += 1
+                return
+            if getattr(self._local, 'leituras', 0):
+                raise RuntimeError("Leitura não pode ser promovida a escrita")
+            self._escritores_aguardando += 1
+            try:
+                while self._escritor is not None or self._leitores:
+                    self._condicao.wait()
+            finally:
+                self._escritores_aguardando -= 1
+            self._escritor = eu
+            self._profundidade_escrita = 1
+    
+    def liberar_escrita(self) -> None:
+        """Libera uma aquisição de escrita."""
+        with self._trava:
+            if self._escritor != threading.get_ident():
+                raise RuntimeError("Escrita liberada por thread que não a possui")
+            self._profundidade_escrita -= 1
+            if self._profundidade_escrita == 0:
+                self._escritor = None
+                self._condicao.notify_all()
+    
+    def leitura(self) -> _SecaoLock:
+        """Bloco with com o lock adquirido para leitura."""
+        return self._secao_leitura
+    
+    def escrita(self) -> _SecaoLock:
+        """Bloco with com o lock adquirido para escrita."""
+        return self._secao_escrita
+    
+    def __enter__(self):
+        self.adquirir_escrita()
+        return self
+    
+    def __exit__(self, *exc):
+        self.liberar_escrita()
+        return False
 
 def formatar_data(data) -> str:
     """
@@ -152,29 +297,248 @@ def validar_string_nao_vazia(valor: str, nome_campo: str) -> bool:
         
     return True
 
-def log_operacao(modulo: str, operacao: str, detalhes: str = "") -> None:
+# Níveis do registro de operações (DESATIVADO é apenas limiar: nada é registrado)
+LOG_DEPURACAO = 10
+LOG_INFO = 20
+LOG_AVISO = 30
+LOG_ERRO = 40
+LOG_DESATIVADO = 100
+NIVEIS_LOG = {
+    'DEPURACAO': LOG_DEPURACAO,
+    'INFO': LOG_INFO,
+    'AVISO': LOG_AVISO,
+    'ERRO': LOG_ERRO,
+    'DESATIVADO': LOG_DESATIVADO
+}
+_NOMES_NIVEIS_LOG = {valor: nome for nome, valor in NIVEIS_LOG.items()}
+
+# Configuração vigente (ver log_configurar): limiar padrão, limiares por
+# módulo e amostragem por (módulo, operação) -> 1 a cada N registros
+_limiar_log = LOG_INFO
+_limiares_modulo_log: Dict[str, int] = {}
+_amostragem_log: Dict[tuple, int] = {}
+_formato_log = 'texto'
+_log_assincrono = True
+
+# Buffer circular dos registros ainda não escritos: (instante, nível,
+# módulo, operação, detalhes, amostragem). Cheio, descarta os mais antigos
+_buffer_log: deque = deque(maxlen=MAX_REGISTROS_BUFFER_LOG)
+_lock_buffer_log = threading.Lock()
+_lock_escrita_log = threading.Lock()
+_sinal_log = threading.Event()
+_thread_log: Optional[threading.Thread] = None
+_contadores_amostragem: Dict[tuple, int] = {}
+_estatisticas_log = {'registrados': 0, 'amostrados': 0, 'descartados': 0, 'escritos': 0}
+
+def log_configurar(nivel: Optional[str] = None, niveis_modulo: Optional[Dict[str, str]] = None,
+                   amostragem: Optional[Dict[str, int]] = None, formato: Optional[str] = None,
+                   assincrono: Optional[bool] = None) -> None:
+    """
+    Altera a configuração do registro de operações (inicialmente a de config.py).
+    Parâmetros omitidos mantêm o valor atual.
+    
+    Args:
+        nivel (str): Nível mínimo registrado (DEPURACAO, INFO, AVISO, ERRO ou DESATIVADO)
+        niveis_modulo (Dict[str, str]): Nível mínimo por módulo (substitui o padrão)
+        amostragem (Dict[str, int]): "Módulo: Operação" -> registra 1 a cada N ocorrências
+        formato (str): 'texto' (legível) ou 'json' (uma linha JSON por registro)
+        assincrono (bool): Se os registros são escritos por uma thread em segundo plano
+        
+    Raises:
+        ValueError: Se um nível, amostragem ou formato for inválido
+    """
+    global _limiar_log, _limiares_modulo_log, _amostragem_log, _formato_log, _log_assincrono
+    
+    def limiar(nome):
+        if nome not in NIVEIS_LOG:
+            raise ValueError(f"Nível de log inválido: {nome}")
+        return NIVEIS_LOG[nome]
+    
+    if formato is not None and formato not in ('texto', 'json'):
+        raise ValueError(f"Formato de log inválido: {formato}")
+    if amostragem is not None:
+        if any(not isinstance(n, int) or n < 1 for n in amostragem.values()):
+            raise ValueError("Amostragem de log deve ser um inteiro positivo")
+        novas_amostragens = {tuple(chave.split(': ', 1)): n for chave, n in amostragem.items() if n > 1}
+    
+    novo_limiar = limiar(nivel) if nivel is not None else _limiar_log
+    novos_limiares = ({modulo: limiar(n) for modulo, n in niveis_modulo.items()}
+                      if niveis_modulo is not None else _limiares_modulo_log)
+    
+    _limiar_log = novo_limiar
+    _limiares_modulo_log = novos_limiares
+    if amostragem is not None:
+        _amostragem_log = novas_amostragens
+        _contadores_amostragem.clear()
+    if formato is not None:
+        _formato_log = formato
+    if assincrono is not None:
+        _log_assincrono = assincrono
+        if not assincrono:
+            log_descarregar()
+
+def log_ativo(modulo: str, nivel: int = LOG_INFO) -> bool:
+    """
+    Verifica se registros do módulo no nível informado são emitidos.
+    
+    Em caminhos frequentes, evita montar os detalhes de um registro que
+    seria descartado.
+    
+    Args:
+        modulo (str): Nome do módulo
+        nivel (int): Nível do registro (LOG_DEPURACAO, LOG_INFO, LOG_AVISO ou LOG_ERRO)
+        
+    Returns:
+        bool: True se o registro seria emitido
+    """
+    return nivel >= _limiares_modulo_log.get(modulo, _limiar_log)
+
+def log_operacao(modulo: str, operacao: str, detalhes: str = "", nivel: Optional[int] = None) -> None:
     """
     Registra uma operação no log do sistema.
     
+    O registro é descartado se o nível estiver abaixo do configurado para o
+    módulo e pode ser amostrado (ver log_configurar). Os registros emitidos
+    vão para um buffer circular, escrito na saída padrão por uma thread em
+    segundo plano: quem registra não espera pela formatação nem pela E/S.
+    
     Args:
         modulo (str): Nome do módulo que executou a operação
         operacao (str): Tipo de operação realizada
         detalhes (str): Detalhes adicionais da operação
+        nivel (int, opcional): Nível do registro; por padrão, LOG_ERRO para
+            operações que começam com "Erro" e LOG_INFO para as demais
+    """
+    if nivel is None:
+        nivel = LOG_ERRO if operacao.startswith('Erro') else LOG_INFO
+    if nivel < _limiares_modulo_log.get(modulo, _limiar_log):
+        return
+    
+    amostragem = 1
+    if _amostragem_log:
+        chave = (modulo, operacao)
+        amostragem = _amostragem_log.get(chave, 1)
+        if amostragem > 1:
+            with _lock_buffer_log:
+                ocorrencia = _contadores_amostragem.get(chave, 0)
+                _contadores_amostragem[chave] = ocorrencia + 1
+                if ocorrencia % amostragem:
+                    _estatisticas_log['amostrados'] += 1
+                    return
+    
+    registro = (time.time(), nivel, modulo, operacao, detalhes, amostragem)
+    if not _log_assincrono:
+        with _lock_escrita_log:
+            _estatisticas_log['registrados'] += 1
+            _escrever_registros([registro])
+        return
+    
+    with _lock_buffer_log:
+        if len(_buffer_log) == _buffer_log.maxlen:
+            _estatisticas_log['descartados'] += 1
+        _buffer_log.append(registro)
+        _estatisticas_log['registrados'] += 1
+        pendentes = len(_buffer_log)
+    if _thread_log is None:
+        _iniciar_thread_log()
+    if pendentes >= _buffer_log.maxlen // 2:
+        _sinal_log.set()
+
+def log_descarregar() -> None:
+    """Escreve imediatamente os registros pendentes no buffer (encerramento, fork)."""
+    with _lock_escrita_log:
+        with _lock_buffer_log:
+            registros = list(_buffer_log)
+            _buffer_log.clear()
+        if registros:
+            _escrever_registros(registros)
+        else:
+            sys.stdout.flush()
+
+def log_estatisticas() -> Dict[str, int]:
     """
-    timestamp = datetime.now().strftime(DATE_FORMAT)
-    mensagem = f"[{timestamp}] {modulo}: {operacao}"
-    if detalhes:
-        mensagem += f" - {detalhes}"
+    Obtém os contadores do registro de operações.
     
-    # Por enquanto apenas print, futuramente pode ser arquivo de log
-    print(mensagem)
+    Returns:
+        Dict: registrados (aceitos no buffer), amostrados (omitidos pela
+        amostragem), descartados (buffer cheio), escritos e pendentes
+    """
+    with _lock_buffer_log:
+        return {**_estatisticas_log, 'pendentes': len(_buffer_log)}
+
+def _formatar_registros(registros: List[tuple]) -> str:
+    """Formata os registros no formato configurado (texto ou JSON por linha)."""
+    linhas = []
+    segundo_anterior, data_anterior = None, ''
+    for instante, nivel, modulo, operacao, detalhes, amostragem in registros:
+        segundo = int(instante)
+        if segundo != segundo_anterior:
+            segundo_anterior, data_anterior = segundo, datetime.fromtimestamp(segundo).strftime(DATE_FORMAT)
+        
+        if _formato_log == 'json':
+            campos = {'ts': f'{instante:.6f}', 'data': data_anterior, 'nivel': _NOMES_NIVEIS_LOG.get(nivel, str(nivel)),
+                      'modulo': modulo, 'operacao': operacao, 'detalhes': detalhes, 'pid': os.getpid()}
+            if amostragem > 1:
+                campos['amostragem'] = amostragem
+            linhas.append(json.dumps(campos, ensure_ascii=False))
+            continue
+        
+        prefixo = '' if nivel == LOG_INFO else f"{_NOMES_NIVEIS_LOG.get(nivel, nivel)} "
+        mensagem = f"[{data_anterior}] {prefixo}{modulo}: {operacao}"
+        if detalhes:
+            mensagem += f" - {detalhes}"
+        if amostragem > 1:
+            mensagem += f" (1 a cada {amostragem})"
+        linhas.append(mensagem)
+    return '\n'.join(linhas) + '\n'
+
+def _escrever_registros(registros: List[tuple]) -> None:
+    """Escreve os registros na saída padrão (chamada com _lock_escrita_log)."""
+    try:
+        sys.stdout.write(_formatar_registros(registros))
+        sys.stdout.flush()
+        _estatisticas_log['escritos'] += len(registros)
+    except Exception:
+        # A saída pode estar fechada no encerramento: os registros são perdidos
+        pass
+
+def _laco_log() -> None:
+    """Thread que escreve o buffer periodicamente (ou quando ele chega à metade)."""
+    while True:
+        _sinal_log.wait(INTERVALO_DESCARGA_LOG)
+        _sinal_log.clear()
+        log_descarregar()
+
+def _iniciar_thread_log() -> None:
+    """Inicia a thread de escrita do log (uma por processo)."""
+    global _thread_log
+    with _lock_buffer_log:
+        if _thread_log is not None:
+            return
+        _thread_log = threading.Thread(target=_laco_log, name="log", daemon=True)
+    _thread_log.start()
+
+def _reiniciar_log_no_filho() -> None:
+    """Após um fork, o processo filho recria os locks e a thread de escrita."""
+    global _lock_buffer_log, _lock_escrita_log, _sinal_log, _thread_log
+    _lock_buffer_log = threading.Lock()
+    _lock_escrita_log = threading.Lock()
+    _sinal_log = threading.Event()
+    _thread_log = None
+    _buffer_log.clear()
+
+# Os registros pendentes são escritos antes do fork (e não são duplicados no
+# filho) e ao término do processo
+os.register_at_fork(before=log_descarregar, after_in_child=_reiniciar_log_no_filho)
+atexit.register(log_descarregar)
+log_configurar(NIVEL_LOG, NIVEIS_LOG_MODULO, AMOSTRAGEM_LOG, FORMATO_LOG, LOG_ASSINCRONO)
 
-def exportar_para_csv(dados: List[Dict[str, Any]], nome_arquivo: str, cabecalhos: List[str]) -> bool:
+def exportar_para_csv(dados: Iterable[Dict[str, Any]], nome_arquivo: str, cabecalhos: List[str]) -> bool:
     """
     Exporta dados para arquivo CSV.
     
     Args:
-        dados (List[Dict]): Lista de dicionários com os dados
+        dados (Iterable[Dict]): Dicionários com os dados (lista ou gerador)
         nome_arquivo (str): Nome do arquivo CSV
         cabecalhos (List[str]): Lista com os nomes das colunas
         
@@ -184,7 +548,7 @@ def exportar_para_csv(dados: List[Dict[str, Any]], nome_arquivo: str, cabecalhos
     try:
         import csv
         criar_diretorios()
-        caminho_completo = os.path.join("exports", nome_arquivo)
+        caminho_completo = os.path.join(EXPORT_DIR, nome_arquivo)
         
         with open(caminho_completo, 'w', newline='', encoding='utf-8') as arquivo:
             writer = csv.DictWriter(arquivo, fieldnames=cabecalhos)
@@ -0,0 +1,32 @@
+"""
+Arquivo de entrada para a aplicação Flask em produção
+
+Executa a aplicação sem o modo debug nem o recarregador do servidor de
+desenvolvimento (app.py), em um de dois modos:
+
+- Threads (padrão): um processo com pool de threads (src/servidor.py)
+- Pré-fork (--processos N): N processos de leitura e um escritor que
+  compartilham os dados carregados por cópia na escrita (src/prefork.py)
+
+Uso:
+    python producao.py [--host HOST] [--port PORTA] [--threads N] [--processos N]
+"""
+import argparse
+
+from src.main import app
+from src.servidor import servidor_executar
+from src.prefork import prefork_executar
+from config import THREADS_SERVIDOR_WEB
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Task Manager Web (produção)")
+    parser.add_argument('--host', default='0.0.0.0', help="Endereço de escuta")
+    parser.add_argument('--port', type=int, default=5001, help="Porta de escuta")
+    parser.add_argument('--threads', type=int, default=THREADS_SERVIDOR_WEB, help="Threads do pool (por processo)")
+    parser.add_argument('--processos', type=int, default=0,
+                        help="Processos de leitura do modo pré-fork (0 = processo único com threads)")
+    args = parser.parse_args()
+    if args.processos > 0:
+        prefork_executar(app, args.host, args.port, args.processos, args.threads)
+    else:
+        servidor_executar(app, args.host, args.port, args.threads)
@@ -0,0 +1,15 @@
+"""
+Arquivo de entrada para servidores ASGI
+
+Expõe a variante ASGI da aplicação (src/asgi.py) para servidores como
+uvicorn ou hypercorn, que não fazem parte das dependências do projeto:
+
+    uvicorn producao_asgi:app --host 0.0.0.0 --port 5001
+
+As rotas da API são executadas em um pool de threads; as rotas nativas
+(conexões longas) são atendidas no loop de eventos do servidor.
+"""
+from src.main import app as app_wsgi
+from src.asgi import asgi_criar
+
+app = asgi_criar(app_wsgi)
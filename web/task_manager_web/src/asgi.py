@@ -0,0 +1,215 @@
+"""
+Variante ASGI da aplicação
+
+Adapta a aplicação Flask (WSGI) para servidores ASGI (uvicorn, hypercorn),
+sem dependências adicionais:
+
+- Rotas nativas (asgi_registrar_rota) são atendidas diretamente no loop de
+  eventos: conexões longas (long-poll, SSE) ficam suspensas em await, sem
+  ocupar uma thread cada, de modo que um processo atende milhares delas.
+- As demais rotas (os blueprints da API) são executadas em um pool fixo de
+  threads; o corpo da resposta é consumido bloco a bloco no pool e enviado
+  à medida que é gerado (respostas em fluxo continuam em fluxo).
+
+Funções principais:
+- asgi_criar: Cria a aplicação ASGI a partir da aplicação WSGI
+- asgi_registrar_rota: Registra um manipulador ASGI nativo para um caminho
+"""
+
+import asyncio
+import contextvars
+import io
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+# Adiciona o diretório raiz do Task Manager ao path
+task_manager_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if task_manager_path not in sys.path:
+    sys.path.insert(0, task_manager_path)
+
+from config import THREADS_SERVIDOR_WEB
+from utils import log_operacao
+
+__all__ = [
+    "asgi_criar",
+    "asgi_registrar_rota"
+]
+
+# Manipuladores ASGI nativos por caminho: async manipulador(scope, receive, send)
+_rotas_nativas: Dict[str, Callable] = {}
+
+# Marca o fim do corpo de uma resposta WSGI consumido no pool
+_FIM = object()
+
+def asgi_registrar_rota(caminho: str, manipulador: Callable) -> None:
+    """
+    Registra um manipulador ASGI nativo, atendido no loop de eventos em vez
+    do pool de threads (para conexões longas como long-poll e SSE).
+    
+    O manipulador recebe (scope, receive, send) e responde a qualquer método;
+    no servidor WSGI, a rota equivalente do blueprint continua sendo usada.
+    
+    Args:
+        caminho (str): Caminho exato da requisição (ex.: '/api/events')
+        manipulador (Callable): Corrotina manipulador(scope, receive, send)
+    """
+    _rotas_nativas[caminho] = manipulador
+
+def _ambiente_wsgi(scope: dict, corpo: bytes) -> dict:
+    """Monta o ambiente WSGI (PEP 3333) de uma requisição HTTP ASGI."""
+    servidor = scope.get('server') or ('localhost', 80)
+    cliente = scope.get('client') or ('', 0)
+    ambiente = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': servidor[0],
+        'SERVER_PORT': str(servidor[1]),
+        'REMOTE_ADDR': cliente[0],
+        'REMOTE_PORT': str(cliente[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'CONTENT_LENGTH': str(len(corpo)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(corpo),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False
+    }
+    for nome, valor in scope.get('headers', ()):
+        nome = nome.decode('latin-1').upper().replace('-', '_')
+        if nome == 'CONTENT_LENGTH':
+            continue  # o corpo já foi lido por completo
+        chave = nome if nome == 'CONTENT_TYPE' else f'HTTP_{nome}'
+        valor = valor.decode('latin-1')
+        ambiente[chave] = f'{ambiente[chave]},{valor}' if chave in ambiente else valor
+    return ambiente
+
+class _AplicacaoAsgi:
+    """Aplicação ASGI: rotas nativas no loop, demais rotas WSGI no pool de threads."""
+
+    def __init__(self, app, threads: int):
+        self.app = app
+        self.threads = threads
+        self._pool: Optional[ThreadPoolExecutor] = None
+    
+    def _obter_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="asgi")
+        return self._pool
+    
+    async def __call__(self, scope, receive, send):
+        tipo = scope['type']
+        if tipo == 'lifespan':
+            await self._ciclo_de_vida(receive, send)
+        elif tipo == 'http':
+            manipulador = _rotas_nativas.get(scope['path'])
+            if manipulador is not None:
+                await manipulador(scope, receive, send)
+            else:
+                await self._atender_wsgi(scope, receive, send)
+        elif tipo == 'websocket':
+            # Sem rotas WebSocket: a conexão é recusada
+            await receive()
+            await send({'type': 'websocket.close', 'code': 1000})
+    
+    async def _ciclo_de_vida(self, receive, send):
+        while True:
+            mensagem = await receive()
+            if mensagem['type'] == 'lifespan.startup':
+                self._obter_pool()
+                log_operacao("ASGI", "Iniciado", f"Threads WSGI: {self.threads}, Rotas nativas: {len(_rotas_nativas)}")
+                await send({'type': 'lifespan.startup.complete'})
+            elif mensagem['type'] == 'lifespan.shutdown':
+                if self._pool is not None:
+                    self._pool.shutdown(wait=True)
+                    self._pool = None
+                log_operacao("ASGI", "Encerrado")
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    
+    def _iniciar_wsgi(self, ambiente: dict):
+        """
+        Executa a aplicação WSGI até o primeiro bloco do corpo (no pool).
+        
+        Returns:
+            tuple: (status, cabeçalhos, resultado WSGI, iterador do corpo, primeiro bloco)
+        """
+        resposta = {}
+        escritos = []
+        
+        def start_response(status, cabecalhos, exc_info=None):
+            if exc_info and resposta:
+                raise exc_info[1].with_traceback(exc_info[2])
+            resposta['status'] = int(status.split(' ', 1)[0])
+            resposta['cabecalhos'] = [
+                (nome.lower().encode('latin-1'), valor.encode('latin-1')) for nome, valor in cabecalhos
+            ]
+            return escritos.append
+        
+        resultado = self.app(ambiente, start_response)
+        iterador = iter(resultado)
+        primeiro = next(iterador, _FIM)
+        if escritos:
+            primeiro = b''.join(escritos) + (b'' if primeiro is _FIM else primeiro)
+        return resposta['status'], resposta['cabecalhos'], resultado, iterador, primeiro
+    
+    async def _atender_wsgi(self, scope, receive, send):
+        corpo = bytearray()
+        while True:
+            mensagem = await receive()
+            if mensagem['type'] == 'http.disconnect':
+                return
+            corpo += mensagem.get('body', b'')
+            if not mensagem.get('more_body', False):
+                break
+        
+        loop = asyncio.get_running_loop()
+        pool = self._obter_pool()
+        # Um contexto por requisição: o corpo pode ser consumido em threads
+        # diferentes do pool, e o Flask guarda a requisição em variáveis de contexto
+        contexto = contextvars.Context()
+        try:
+            status, cabecalhos, resultado, iterador, bloco = await loop.run_in_executor(
+                pool, contexto.run, self._iniciar_wsgi, _ambiente_wsgi(scope, bytes(corpo))
+            )
+        except Exception as e:
+            log_operacao("ASGI", "Erro na aplicação WSGI", f"Caminho: {scope['path']}, Falha: {str(e)}")
+            await send({'type': 'http.response.start', 'status': 500,
+                        'headers': [(b'content-type', b'application/json')]})
+            await send({'type': 'http.response.body', 'body': b'{"error": "Erro interno"}'})
+            return
+        
+        await send({'type': 'http.response.start', 'status': status, 'headers': cabecalhos})
+        try:
+            while bloco is not _FIM:
+                if bloco:
+                    await send({'type': 'http.response.body', 'body': bloco, 'more_body': True})
+                bloco = await loop.run_in_executor(pool, contexto.run, next, iterador, _FIM)
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        finally:
+            fechar = getattr(resultado, 'close', None)
+            if fechar is not None:
+                await loop.run_in_executor(pool, contexto.run, fechar)
+
+def asgi_criar(app, threads: int = THREADS_SERVIDOR_WEB):
+    """
+    Cria a variante ASGI da aplicação.
+    
+    Args:
+        app: Aplicação WSGI (Flask)
+        threads (int): Threads do pool que executa as rotas WSGI
+    
+    Returns:
+        Callable: Aplicação ASGI (scope, receive, send)
+    
+    Raises:
+        ValueError: Se a quantidade de threads for menor que 1
+    """
+    if threads < 1:
+        raise ValueError("A quantidade de threads deve ser pelo menos 1")
+    return _AplicacaoAsgi(app, threads)
@@ -0,0 +1,228 @@
+"""
+Cache de respostas serializadas da API
+
+Guarda o JSON já codificado (bytes) das rotas de leitura mais frequentes,
+indexado pela rota e pela query string normalizada. Cada entrada registra as
+versões dos registros usados para montá-la: se alguma versão mudou desde
+então, a entrada é descartada na consulta, sem varreduras nem invalidação
+manual nas rotas de escrita.
+
+O tamanho é limitado por um orçamento de bytes, descartando as entradas usadas
+há mais tempo (LRU).
+
+Também guarda o fragmento JSON codificado de cada tarefa (por projeção de
+campos), validado pela data de modificação da tarefa, para que as listagens
+sejam montadas concatenando bytes em vez de serializar cada tarefa. Os
+fragmentos têm um orçamento de bytes próprio, também com descarte LRU.
+
+Funções principais:
+- cache_resposta_obter: Obtém o conteúdo de uma entrada ainda válida
+- cache_resposta_armazenar: Armazena o conteúdo de uma entrada
+- cache_resposta_metricas: Acertos, faltas, invalidações e ocupação do cache
+- cache_resposta_limpar: Descarta todas as entradas
+- cache_fragmento_obter / cache_fragmento_armazenar: Fragmentos JSON por tarefa
+- cache_fragmento_descartar: Descarta os fragmentos de uma tarefa (ou de todas)
+"""
+
+from collections import OrderedDict
+import threading
+import sys
+import os
+
+# Adiciona o diretório raiz do Task Manager ao path
+task_manager_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if task_manager_path not in sys.path:
+    sys.path.insert(0, task_manager_path)
+
+from config import MAX_BYTES_CACHE_RESPOSTAS, MAX_BYTES_CACHE_FRAGMENTOS
+
+__all__ = [
+    "cache_resposta_obter",
+    "cache_resposta_armazenar",
+    "cache_resposta_metricas",
+    "cache_resposta_limpar",
+    "cache_fragmento_obter",
+    "cache_fragmento_armazenar",
+    "cache_fragmento_descartar"
+]
+
+# chave -> (versões, conteúdo), da entrada usada há mais tempo para a mais recente
+_entradas = OrderedDict()
+_bytes_ocupados = 0
+_limite_bytes = MAX_BYTES_CACHE_RESPOSTAS
+_metricas = {'hits': 0, 'misses': 0, 'invalidacoes': 0, 'descartes': 0}
+_lock = threading.Lock()
+
+# (ID da tarefa, campos) -> (data de modificação, fragmento), do usado há mais
+# tempo para o mais recente; as projeções de cada tarefa permitem descartá-las
+# sem varrer o cache. Protegidos por _lock, como as respostas
+_fragmentos = OrderedDict()
+_projecoes_tarefa = {}
+_bytes_fragmentos = 0
+_limite_bytes_fragmentos = MAX_BYTES_CACHE_FRAGMENTOS
+_metricas_fragmentos = {'hits': 0, 'misses': 0, 'descartes': 0}
+
+def _remover(chave):
+    """Remove uma entrada e desconta seus bytes. Deve ser chamada com _lock adquirido."""
+    global _bytes_ocupados
+    _, conteudo = _entradas.pop(chave)
+    _bytes_ocupados -= len(conteudo)
+
+def cache_resposta_obter(chave, versoes):
+    """
+    Obtém o conteúdo armazenado para a chave, se ainda corresponder às versões atuais.
+    
+    Args:
+        chave (tuple): Rota e query string normalizada
+        versoes (tuple): Versões atuais dos registros usados pela resposta
+        
+    Returns:
+        bytes ou None: JSON codificado ou None se ausente ou desatualizado
+    """
+    with _lock:
+        entrada = _entradas.get(chave)
+        if entrada is None:
+            _metricas['misses'] += 1
+            return None
+        
+        if entrada[0] != versoes:
+            # Algum registro mudou desde que a resposta foi montada
+            _remover(chave)
+            _metricas['invalidacoes'] += 1
+            _metricas['misses'] += 1
+            return None
+        
+        _entradas.move_to_end(chave)
+        _metricas['hits'] += 1
+        return entrada[1]
+
+def cache_resposta_armazenar(chave, versoes, conteudo):
+    """
+    Armazena o conteúdo de uma resposta, descartando as entradas usadas há mais
+    tempo até que o total caiba no orçamento de bytes.
+    
+    Args:
+        chave (tuple): Rota e query string normalizada
+        versoes (tuple): Versões dos registros lidas antes de montar a resposta
+        conteudo (bytes): JSON codificado
+    """
+    global _bytes_ocupados
+    if len(conteudo) > _limite_bytes:
+        return  # Resposta maior que o orçamento inteiro não é armazenada
+    
+    with _lock:
+        if chave in _entradas:
+            _remover(chave)
+        _entradas[chave] = (versoes, conteudo)
+        _bytes_ocupados += len(conteudo)
+        
+        while _bytes_ocupados > _limite_bytes:
+            _remover(next(iter(_entradas)))
+            _metricas['descartes'] += 1
+
+def cache_resposta_metricas():
+    """
+    Obtém as métricas do cache.
+    
+    Returns:
+        Dict: hits, misses, invalidacoes (entradas desatualizadas), descartes
+        (por falta de espaço), taxa de acertos, entradas e bytes ocupados
+    """
+    with _lock:
+        consultas = _metricas['hits'] + _metricas['misses']
+        return dict(
+            _metricas,
+            taxa_acertos=round(_metricas['hits'] / consultas, 4) if consultas else 0.0,
+            entradas=len(_entradas),
+            bytes=_bytes_ocupados,
+            limite_bytes=_limite_bytes,
+            fragmentos=dict(
+                _metricas_fragmentos,
+                entradas=len(_fragmentos),
+                tarefas=len(_projecoes_tarefa),
+                bytes=_bytes_fragmentos,
+                limite_bytes=_limite_bytes_fragmentos
+            )
+        )
+
+def cache_resposta_limpar():
+    """Descarta todas as entradas (as métricas são mantidas)."""
+    global _bytes_ocupados
+    with _lock:
+        _entradas.clear()
+        _bytes_ocupados = 0
+
+def _remover_fragmento(tarefa_id, campos):
+    """Remove um fragmento e desconta seus bytes. Deve ser chamada com _lock adquirido."""
+    global _bytes_fragmentos
+    _, fragmento = _fragmentos.pop((tarefa_id, campos))
+    _bytes_fragmentos -= len(fragmento)
+    projecoes = _projecoes_tarefa[tarefa_id]
+    projecoes.discard(campos)
+    if not projecoes:
+        del _projecoes_tarefa[tarefa_id]
+
+def cache_fragmento_obter(tarefa_id, campos, modificacao):
+    """
+    Obtém o fragmento JSON de uma tarefa, se ainda corresponder à sua data de modificação.
+    
+    Args:
+        tarefa_id (int): ID da tarefa
+        campos (tuple): Projeção de campos do fragmento, na ordem canônica
+        modificacao (datetime): Data de modificação atual da tarefa
+        
+    Returns:
+        bytes ou None: Fragmento codificado ou None se ausente ou desatualizado
+    """
+    chave = (tarefa_id, campos)
+    with _lock:
+        entrada = _fragmentos.get(chave)
+        if entrada is None or entrada[0] != modificacao:
+            _metricas_fragmentos['misses'] += 1
+            return None
+        _fragmentos.move_to_end(chave)
+        _metricas_fragmentos['hits'] += 1
+        return entrada[1]
+
+def cache_fragmento_armazenar(tarefa_id, campos, modificacao, fragmento):
+    """
+    Armazena o fragmento JSON de uma tarefa, descartando os fragmentos usados
+    há mais tempo até que o total caiba no orçamento de bytes.
+    
+    Args:
+        tarefa_id (int): ID da tarefa
+        campos (tuple): Projeção de campos do fragmento, na ordem canônica
+        modificacao (datetime): Data de modificação da tarefa lida antes de codificá-la
+        fragmento (bytes): Tarefa codificada em JSON
+    """
+    global _bytes_fragmentos
+    if len(fragmento) > _limite_bytes_fragmentos:
+        return
+    
+    with _lock:
+        if (tarefa_id, campos) in _fragmentos:
+            _remover_fragmento(tarefa_id, campos)
+        _fragmentos[(tarefa_id, campos)] = (modificacao, fragmento)
+        _projecoes_tarefa.setdefault(tarefa_id, set()).add(campos)
+        _bytes_fragmentos += len(fragmento)
+        
+        while _bytes_fragmentos > _limite_bytes_fragmentos:
+            _remover_fragmento(*next(iter(_fragmentos)))
+            _metricas_fragmentos['descartes'] += 1
+
+def cache_fragmento_descartar(tarefa_id=None):
+    """
+    Descarta os fragmentos de uma tarefa ou, sem ID, de todas.
+    
+    Args:
+        tarefa_id (int, opcional): ID da tarefa
+    """
+    global _bytes_fragmentos
+    with _lock:
+        if tarefa_id is None:
+            _fragmentos.clear()
+            _projecoes_tarefa.clear()
+            _bytes_fragmentos = 0
+            return
+        for campos in list(_projecoes_tarefa.get(tarefa_id, ())):
+            _remover_fragmento(tarefa_id, campos)
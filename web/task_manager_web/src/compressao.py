@@ -0,0 +1,98 @@
+"""
+Compressão das respostas da API
+
+Negocia gzip ou deflate pelo cabeçalho Accept-Encoding e comprime as
+respostas de tipos textuais a partir de MIN_BYTES_COMPRESSAO bytes. Respostas
+em fluxo (exportações), já comprimidas ou sem corpo (304) são mantidas como estão.
+
+Funções principais:
+- codificacao_aceita: Escolhe a codificação aceita pelo cliente
+- comprimir: Comprime um conteúdo na codificação informada
+- compressao_aplicar: Comprime uma resposta (usada em after_request)
+"""
+
+import gzip
+import zlib
+import sys
+import os
+
+from flask import request
+
+# Adiciona o diretório raiz do Task Manager ao path
+task_manager_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if task_manager_path not in sys.path:
+    sys.path.insert(0, task_manager_path)
+
+from config import MIN_BYTES_COMPRESSAO, NIVEL_COMPRESSAO
+
+__all__ = [
+    "CODIFICACOES",
+    "codificacao_aceita",
+    "comprimir",
+    "compressao_aplicar"
+]
+
+# Codificações suportadas, em ordem de preferência
+CODIFICACOES = ('gzip', 'deflate')
+
+# Tipos que se beneficiam de compressão (os demais, como imagens, já são comprimidos)
+_TIPOS_COMPRIMIVEIS = ('text/', 'application/json', 'application/x-ndjson', 'application/javascript', 'image/svg+xml')
+
+def codificacao_aceita():
+    """
+    Escolhe a codificação da resposta a partir do Accept-Encoding da requisição.
+    
+    Returns:
+        str ou None: 'gzip', 'deflate' ou None (sem compressão)
+    """
+    return request.accept_encodings.best_match(CODIFICACOES)
+
+def comprimir(conteudo, codificacao, nivel=NIVEL_COMPRESSAO):
+    """
+    Comprime um conteúdo.
+    
+    Args:
+        conteudo (bytes): Conteúdo original
+        codificacao (str): 'gzip' ou 'deflate' (formato zlib, como definido no HTTP)
+        nivel (int): Nível de compressão (1 a 9)
+        
+    Returns:
+        bytes: Conteúdo comprimido
+    """
+    if codificacao == 'gzip':
+        # mtime fixo: o mesmo conteúdo sempre gera os mesmos bytes
+        return gzip.compress(conteudo, compresslevel=nivel, mtime=0)
+    return zlib.compress(conteudo, nivel)
+
+def compressao_aplicar(resposta):
+    """
+    Comprime a resposta se o cliente aceitar e valer a pena.
+    
+    Args:
+        resposta (Response): Resposta da rota
+        
+    Returns:
+        Response: A própria resposta, possivelmente comprimida
+    """
+    if (resposta.direct_passthrough or resposta.is_streamed
+            or 'Content-Encoding' in resposta.headers
+            or not (200 <= resposta.status_code < 300)
+            or not resposta.mimetype.startswith(_TIPOS_COMPRIMIVEIS)):
+        return resposta
+    
+    # A representação varia com o Accept-Encoding mesmo quando não é comprimida
+    resposta.vary.add('Accept-Encoding')
+    if resposta.content_length is not None and resposta.content_length < MIN_BYTES_COMPRESSAO:
+        return resposta
+    
+    codificacao = codificacao_aceita()
+    if codificacao is None:
+        return resposta
+    
+    conteudo = resposta.get_data()
+    if len(conteudo) < MIN_BYTES_COMPRESSAO:
+        return resposta
+    
+    resposta.set_data(comprimir(conteudo, codificacao))
+    resposta.headers['Content-Encoding'] = codificacao
+    return resposta
@@ -0,0 +1,124 @@
+"""
+Arquivos estáticos da interface web em memória
+
+Na inicialização, lê os arquivos da pasta static, calcula o hash do conteúdo
+de cada um e guarda as versões original, gzip e deflate. O index.html passa a
+referenciar os demais arquivos com ?v=<hash>, o que permite enviá-los com
+cache de longa duração: um arquivo alterado muda de URL.
+
+As requisições são atendidas sem acesso ao sistema de arquivos.
+
+Funções principais:
+- estaticos_carregar: Lê e comprime os arquivos da pasta informada
+- estaticos_resposta: Responde um arquivo (ou o index.html, para rotas da SPA)
+"""
+
+import hashlib
+import mimetypes
+import os
+
+from flask import current_app, request
+
+from src.compressao import CODIFICACOES, codificacao_aceita, comprimir
+
+__all__ = [
+    "estaticos_carregar",
+    "estaticos_resposta"
+]
+
+# Arquivo de entrada da SPA, servido para qualquer caminho desconhecido
+ARQUIVO_INDICE = 'index.html'
+
+# Cache dos arquivos versionados (URL com ?v=<hash>) e do índice (sempre revalidado)
+CACHE_VERSIONADO = 'public, max-age=31536000, immutable'
+CACHE_INDICE = 'no-cache'
+
+# caminho relativo -> {'hash', 'mimetype', 'conteudos': {codificação ou None: bytes}}
+_arquivos = {}
+
+def _registrar(caminho, conteudo):
+    """Guarda um arquivo com seu hash e as versões comprimidas. Deve ser usada na inicialização."""
+    mimetype = mimetypes.guess_type(caminho)[0] or 'application/octet-stream'
+    conteudos = {None: conteudo}
+    for codificacao in CODIFICACOES:
+        comprimido = comprimir(conteudo, codificacao, 9)
+        if len(comprimido) < len(conteudo):
+            conteudos[codificacao] = comprimido
+    _arquivos[caminho] = {
+        'hash': hashlib.sha256(conteudo).hexdigest()[:16],
+        'mimetype': mimetype,
+        'conteudos': conteudos
+    }
+
+def estaticos_carregar(diretorio):
+    """
+    Lê todos os arquivos da pasta, calcula os hashes e prepara as versões comprimidas.
+    
+    As referências do index.html aos demais arquivos recebem ?v=<hash>.
+    
+    Args:
+        diretorio (str): Pasta dos arquivos estáticos
+        
+    Returns:
+        int: Quantidade de arquivos carregados
+    """
+    _arquivos.clear()
+    conteudos = {}
+    for raiz, _, nomes in os.walk(diretorio):
+        for nome in nomes:
+            completo = os.path.join(raiz, nome)
+            caminho = os.path.relpath(completo, diretorio).replace(os.sep, '/')
+            with open(completo, 'rb') as arquivo:
+                conteudos[caminho] = arquivo.read()
+    
+    indice = conteudos.pop(ARQUIVO_INDICE, None)
+    for caminho, conteudo in conteudos.items():
+        _registrar(caminho, conteudo)
+    
+    if indice is not None:
+        texto = indice.decode('utf-8')
+        for caminho, arquivo in _arquivos.items():
+            for aspas in ('"', "'"):
+                texto = texto.replace(f'{aspas}{caminho}{aspas}', f'{aspas}{caminho}?v={arquivo["hash"]}{aspas}')
+        _registrar(ARQUIVO_INDICE, texto.encode('utf-8'))
+    
+    return len(_arquivos)
+
+def estaticos_resposta(caminho):
+    """
+    Responde um arquivo estático a partir da memória, na codificação aceita pelo cliente.
+    
+    Caminhos desconhecidos recebem o index.html (rotas da SPA).
+    
+    Args:
+        caminho (str): Caminho relativo solicitado
+        
+    Returns:
+        Response: Arquivo, 304 (If-None-Match) ou 404 se não houver index.html
+    """
+    arquivo = _arquivos.get(caminho)
+    if arquivo is None:
+        caminho = ARQUIVO_INDICE
+        arquivo = _arquivos.get(caminho)
+        if arquivo is None:
+            return "index.html not found", 404
+    
+    codificacao = codificacao_aceita()
+    if codificacao not in arquivo['conteudos']:
+        codificacao = None
+    
+    # Cada codificação é uma representação distinta, com ETag próprio
+    etag = arquivo['hash'] if codificacao is None else f"{arquivo['hash']}-{codificacao}"
+    versionado = caminho != ARQUIVO_INDICE and request.args.get('v') == arquivo['hash']
+    
+    if request.if_none_match.contains(etag):
+        resposta = current_app.response_class(status=304)
+    else:
+        resposta = current_app.response_class(arquivo['conteudos'][codificacao], mimetype=arquivo['mimetype'])
+        if codificacao is not None:
+            resposta.headers['Content-Encoding'] = codificacao
+    
+    resposta.set_etag(etag)
+    resposta.vary.add('Accept-Encoding')
+    resposta.headers['Cache-Control'] = CACHE_VERSIONADO if versionado else CACHE_INDICE
+    return resposta
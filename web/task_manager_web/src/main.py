@@ -18,24 +18,50 @@ sys.path.insert(0, task_manager_root)
 modules_dir = os.path.join(task_manager_root, 'modules')
 sys.path.insert(0, modules_dir)
 
-from flask import Flask, send_from_directory, jsonify
+from flask import Flask, jsonify
 from flask_cors import CORS
 from src.routes.task_routes import task_bp
 from src.routes.user_routes import user_bp
 from src.routes.tag_routes import tag_bp
 from src.routes.team_routes import team_bp
+from src.routes.job_routes import job_bp
+from src.routes.evento_routes import evento_bp
+from src.routes.sincronizacao_routes import sincronizacao_bp
+from src.routes.batch_routes import batch_bp
+from src.routes.metricas_routes import metricas_bp
+from src.cache import cache_resposta_metricas
+from src.compressao import compressao_aplicar
+from src.metricas import metricas_iniciar, metricas_registrar
+from src.estaticos import estaticos_carregar, estaticos_resposta
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = 'task_manager_secret_key_2024'
 
+# Mede a quantidade e a latência das requisições por rota (GET /api/metrics).
+# Registrado antes dos demais: o after_request registrado primeiro é o último
+# executado, e a latência inclui a compressão
+app.before_request(metricas_iniciar)
+app.after_request(metricas_registrar)
+
 # Habilita CORS para permitir requisições do frontend
 CORS(app)
 
+# Comprime as respostas (gzip/deflate) conforme o Accept-Encoding do cliente
+app.after_request(compressao_aplicar)
+
+# Carrega e comprime os arquivos estáticos uma única vez, na inicialização
+estaticos_carregar(app.static_folder)
+
 # Registra os blueprints da API
 app.register_blueprint(task_bp, url_prefix='/api')
 app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(tag_bp, url_prefix='/api')
 app.register_blueprint(team_bp, url_prefix='/api')
+app.register_blueprint(job_bp, url_prefix='/api')
+app.register_blueprint(evento_bp, url_prefix='/api')
+app.register_blueprint(sincronizacao_bp, url_prefix='/api')
+app.register_blueprint(batch_bp, url_prefix='/api')
+app.register_blueprint(metricas_bp, url_prefix='/api')
 
 # Variável global para o sistema GT
 _gt_system = None
@@ -102,20 +128,19 @@ def health_check():
         'gt_system': 'initialized'
     })
 
+@app.route('/api/cache/stats')
+def cache_stats():
+    """Métricas do cache de respostas serializadas (acertos, faltas, ocupação)"""
+    return jsonify({
+        'success': True,
+        'data': cache_resposta_metricas()
+    })
+
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve(path):
-    static_folder_path = app.static_folder
-    if static_folder_path is None:
-        return "Static folder not configured", 404
-    if path != "" and os.path.exists(os.path.join(static_folder_path, path)):
-        return send_from_directory(static_folder_path, path)
-    else:
-        index_path = os.path.join(static_folder_path, 'index.html')
-        if os.path.exists(index_path):
-            return send_from_directory(static_folder_path, 'index.html')
-        else:
-            return "index.html not found", 404
+    # Arquivos servidos da memória; caminhos desconhecidos recebem o index.html
+    return estaticos_resposta(path)
 
 @app.teardown_appcontext
 def cleanup_gt_system(error):
@@ -0,0 +1,184 @@
+"""
+Métricas da API no formato de exposição do Prometheus
+
+Registra, para cada rota (endpoint do Flask) e método, a quantidade de
+requisições por status e um histograma da latência. Os intervalos do
+histograma são log-lineares: cada década a partir de LATENCIA_MINIMA_METRICAS
+é dividida em 1, 2, ..., 9 × 10^k, o que limita o erro relativo a cada
+intervalo e fixa a memória por rota. As rotas são as da tabela do Flask (as
+requisições sem rota são agrupadas em uma só série) e os métodos fora de
+METODOS_METRICAS são agrupados em 'OTHER', de modo que o total de séries
+também é limitado e não depende do que o cliente envia.
+
+O registro de uma requisição custa uma busca binária nos limites e alguns
+incrementos sob um lock. Os medidores (tamanho dos registros, cache de
+respostas etc.) são lidos apenas quando as métricas são expostas.
+
+Funções principais:
+- metricas_iniciar: Marca o início da requisição (before_request)
+- metricas_registrar: Registra a requisição concluída (after_request)
+- metricas_adicionar_medidor: Registra um medidor lido a cada exposição
+- metricas_prometheus: Texto no formato de exposição do Prometheus
+- metricas_limpar: Zera as séries das requisições
+"""
+
+from bisect import bisect_left
+from time import perf_counter
+import threading
+import sys
+import os
+
+from flask import request
+
+# Adiciona o diretório raiz do Task Manager ao path
+task_manager_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if task_manager_path not in sys.path:
+    sys.path.insert(0, task_manager_path)
+
+from config import LATENCIA_MINIMA_METRICAS, DECADAS_LATENCIA_METRICAS
+
+__all__ = [
+    "LIMITES_LATENCIA",
+    "METODOS_METRICAS",
+    "metricas_iniciar",
+    "metricas_registrar",
+    "metricas_adicionar_medidor",
+    "metricas_prometheus",
+    "metricas_limpar"
+]
+
+# Limites superiores (segundos) dos intervalos do histograma; o último
+# intervalo (+Inf) recebe as latências acima do maior limite
+LIMITES_LATENCIA = tuple(
+    round(multiplo * LATENCIA_MINIMA_METRICAS * 10 ** decada, 12)
+    for decada in range(DECADAS_LATENCIA_METRICAS) for multiplo in range(1, 10)
+) + (round(LATENCIA_MINIMA_METRICAS * 10 ** DECADAS_LATENCIA_METRICAS, 12),)
+
+# Métodos com série própria; os demais (o Werkzeug aceita qualquer token
+# como método) são agrupados na série do método _OUTRO_METODO
+METODOS_METRICAS = ('GET', 'HEAD', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS')
+_OUTRO_METODO = 'OTHER'
+
+# Chave do ambiente WSGI com o instante de início da requisição
+_CHAVE_INICIO = 'task_manager.inicio'
+
+# Endpoint das requisições que não correspondem a nenhuma rota (404, 405)
+_SEM_ROTA = 'sem_rota'
+
+# (endpoint, método) -> [contagens por intervalo, soma das latências, {status: quantidade}]
+_series = {}
+_lock = threading.Lock()
+
+# nome -> (tipo, descrição, rótulo, obter)
+_medidores = {}
+
+def metricas_iniciar():
+    """Marca o início da requisição (registrada com app.before_request)."""
+    request.environ[_CHAVE_INICIO] = perf_counter()
+
+def metricas_registrar(resposta):
+    """
+    Registra a requisição concluída (registrada com app.after_request).
+    
+    Deve ser o último after_request executado (o primeiro registrado), para
+    que a latência inclua a compressão e os demais tratamentos da resposta.
+    
+    Args:
+        resposta (Response): Resposta da rota
+    
+    Returns:
+        Response: A própria resposta
+    """
+    inicio = request.environ.get(_CHAVE_INICIO)
+    if inicio is None:
+        return resposta
+    duracao = perf_counter() - inicio
+    metodo = request.method if request.method in METODOS_METRICAS else _OUTRO_METODO
+    chave = (request.endpoint or _SEM_ROTA, metodo)
+    intervalo = bisect_left(LIMITES_LATENCIA, duracao)
+    status = resposta.status_code
+    
+    with _lock:
+        serie = _series.get(chave)
+        if serie is None:
+            serie = _series[chave] = [[0] * (len(LIMITES_LATENCIA) + 1), 0.0, {}]
+        serie[0][intervalo] += 1
+        serie[1] += duracao
+        serie[2][status] = serie[2].get(status, 0) + 1
+    return resposta
+
+def metricas_adicionar_medidor(nome, descricao, obter, tipo='gauge', rotulo=None):
+    """
+    Registra um medidor lido a cada exposição das métricas.
+    
+    Args:
+        nome (str): Nome da métrica no Prometheus
+        descricao (str): Texto do HELP
+        obter (Callable): Retorna o valor ou, com rótulo, um dicionário valor do rótulo -> valor
+        tipo (str): 'gauge' ou 'counter'
+        rotulo (str, opcional): Nome do rótulo dos valores retornados por obter
+    """
+    _medidores[nome] = (tipo, descricao, rotulo, obter)
+
+def metricas_limpar():
+    """Zera as séries das requisições (os medidores são mantidos)."""
+    with _lock:
+        _series.clear()
+
+def _escapar(valor):
+    """Escapa o valor de um rótulo no formato de exposição."""
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _numero(valor):
+    """Formata um valor numérico (inteiros sem casas decimais)."""
+    return str(valor) if isinstance(valor, int) else repr(float(valor))
+
+def metricas_prometheus():
+    """
+    Monta o texto das métricas no formato de exposição do Prometheus (0.0.4).
+    
+    Medidores que falham na leitura são omitidos, sem impedir os demais.
+    
+    Returns:
+        str: Métricas das requisições seguidas dos medidores registrados
+    """
+    with _lock:
+        series = sorted((chave, (list(contagens), soma, dict(status)))
+                        for chave, (contagens, soma, status) in _series.items())
+    
+    linhas = [
+        '# HELP task_manager_http_requests_total Requisições atendidas por rota, método e status',
+        '# TYPE task_manager_http_requests_total counter'
+    ]
+    for (endpoint, metodo), (_, _, status) in series:
+        rotulos = f'endpoint="{_escapar(endpoint)}",method="{metodo}"'
+        for codigo, quantidade in sorted(status.items()):
+            linhas.append(f'task_manager_http_requests_total{{{rotulos},status="{codigo}"}} {quantidade}')
+    
+    linhas += [
+        '# HELP task_manager_http_request_duration_seconds Latência das requisições por rota e método',
+        '# TYPE task_manager_http_request_duration_seconds histogram'
+    ]
+    limites = [f'{limite:g}' for limite in LIMITES_LATENCIA] + ['+Inf']
+    for (endpoint, metodo), (contagens, soma, _) in series:
+        rotulos = f'endpoint="{_escapar(endpoint)}",method="{metodo}"'
+        acumulado = 0
+        for limite, contagem in zip(limites, contagens):
+            acumulado += contagem
+            linhas.append(f'task_manager_http_request_duration_seconds_bucket{{{rotulos},le="{limite}"}} {acumulado}')
+        linhas.append(f'task_manager_http_request_duration_seconds_sum{{{rotulos}}} {_numero(soma)}')
+        linhas.append(f'task_manager_http_request_duration_seconds_count{{{rotulos}}} {acumulado}')
+    
+    for nome, (tipo, descricao, rotulo, obter) in _medidores.items():
+        try:
+            valor = obter()
+        except Exception:
+            continue
+        linhas += [f'# HELP {nome} {descricao}', f'# TYPE {nome} {tipo}']
+        if rotulo is None:
+            linhas.append(f'{nome} {_numero(valor)}')
+            continue
+        for chave, item in valor.items():
+            linhas.append(f'{nome}{{{rotulo}="{_escapar(chave)}"}} {_numero(item)}')
+    
+    return '\n'.join(linhas) + '\n'
@@ -0,0 +1,486 @@
+"""
+Servidor de produção em modo pré-fork
+
+O processo mestre carrega os dados uma única vez (gt_inicializar, executado na
+importação de src.main), congela os objetos carregados com gc.freeze() e cria
+por fork um processo escritor e N processos de leitura. As estruturas
+encapsuladas são compartilhadas por cópia na escrita: como os objetos
+congelados não são percorridos pelo coletor de lixo, as páginas só deixam de
+ser compartilhadas quando os objetos são de fato alterados.
+
+- Os processos de leitura atendem as requisições HTTP no socket herdado do
+  mestre, cada um com seu pool de threads (src/servidor.py). Leituras (GET,
+  HEAD, OPTIONS e consultas por POST em /lookup) são atendidas localmente; as
+  demais requisições são encaminhadas ao escritor por um socket Unix local.
+  Requisições agrupadas (POST /api/batch) são desmembradas no processo de
+  leitura: cada sub-requisição segue a mesma regra.
+- O escritor executa as escritas uma de cada vez e publica a sequência de
+  alterações resultante (entidades alteradas ou removidas) para os processos
+  de leitura, que a aplicam com X_aplicar_replica. Antes de responder a uma
+  escrita, o processo de leitura aguarda ter aplicado as alterações dela, de
+  modo que o cliente sempre lê o que acabou de escrever.
+- Os jobs em segundo plano (/api/jobs) são executados e consultados apenas
+  no escritor, que publica as alterações feitas por eles a cada progresso e
+  ao término de cada job.
+- A sincronização incremental (/api/sync) também é atendida pelo escritor,
+  cujo registro de alterações define as versões. Leituras encaminhadas são
+  executadas sem aguardar as escritas em andamento.
+- Processos de leitura que terminam inesperadamente são recriados e recebem
+  do escritor o estado completo. Ao receber SIGINT ou SIGTERM, o mestre
+  encerra os processos de leitura (que concluem as requisições em andamento)
+  e depois o escritor, que salva os dados (gt_finalizar).
+
+Funções principais:
+- prefork_executar: Executa o mestre, o escritor e os processos de leitura
+"""
+
+import gc
+import io
+import json
+import os
+import pickle
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time as relogio
+from multiprocessing.connection import Listener, Client, AuthenticationError
+
+# Adiciona o diretório raiz do Task Manager ao path
+task_manager_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if task_manager_path not in sys.path:
+    sys.path.insert(0, task_manager_path)
+
+from config import THREADS_SERVIDOR_WEB, TEMPO_LIMITE_REPLICACAO
+from utils import log_operacao, log_descarregar
+from modules.gerenciamento_tarefas import gt_finalizar
+from modules.job import job_adicionar_observador, job_finalizar
+from modules.agendador import agendador_inicializar, agendador_finalizar
+from modules.tarefa import (
+    tarefa_listar_todas, tarefa_buscar_por_id, tarefa_aplicar_replica,
+    tarefa_adicionar_observador, tarefa_lock_registro
+)
+from modules.usuario import usuario_listar_todos, usuario_versao, usuario_aplicar_replica
+from modules.tag import tag_listar_todas, tag_versao, tag_aplicar_replica
+from modules.team import time_listar_todos, time_versao, time_aplicar_replica
+from src.servidor import servidor_criar
+
+__all__ = [
+    "prefork_executar"
+]
+
+# Processos de leitura que terminam antes deste tempo (s) não são recriados:
+# a falha está na inicialização e se repetiria
+TEMPO_MINIMO_PROCESSO = 1.0
+
+# Requisições atendidas pelos processos de leitura (as demais vão ao escritor)
+_METODOS_LEITURA = ('GET', 'HEAD', 'OPTIONS')
+_SUFIXOS_LEITURA_POST = ('/lookup',)
+
+# Requisições agrupadas: desmembradas localmente, as sub-requisições passam
+# novamente por _EncaminharEscritas (chave do ambiente lida por batch_routes)
+_CAMINHO_BATCH = '/api/batch'
+_CHAVE_DESPACHO = 'task_manager.despacho'
+
+# Requisições sempre encaminhadas ao escritor, qualquer que seja o método
+# (o estado dos jobs existe apenas no processo que os executa; as versões da
+# sincronização incremental são as do registro de alterações do escritor)
+_PREFIXOS_ESCRITOR = ('/api/jobs', '/api/sync')
+
+# Chaves do ambiente WSGI repassadas ao escritor (as demais são recriadas lá)
+_CHAVES_AMBIENTE = (
+    'REQUEST_METHOD', 'SCRIPT_NAME', 'PATH_INFO', 'QUERY_STRING', 'CONTENT_TYPE',
+    'CONTENT_LENGTH', 'SERVER_NAME', 'SERVER_PORT', 'SERVER_PROTOCOL', 'REMOTE_ADDR',
+    'REMOTE_PORT', 'wsgi.url_scheme'
+)
+
+# Estruturas replicadas, na ordem de aplicação: (versão, listagem, aplicação).
+# Usuários, tags e times são pequenos e enviados por completo quando mudam;
+# as tarefas são enviadas uma a uma, a partir dos observadores
+_REGISTROS = {
+    'usuarios': (usuario_versao, usuario_listar_todos, usuario_aplicar_replica),
+    'tags': (tag_versao, tag_listar_todas, tag_aplicar_replica),
+    'times': (time_versao, time_listar_todos, time_aplicar_replica),
+}
+_APLICACOES = tuple((nome, aplicar) for nome, (_, _, aplicar) in _REGISTROS.items()) + (('tarefas', tarefa_aplicar_replica),)
+
+# Estado do escritor: sequência da última alteração publicada, conexões dos
+# processos de leitura e alterações de tarefas da escrita em andamento (a
+# publicação feita pelos jobs pode ocorrer durante uma escrita, na mesma thread)
+_lock_escrita = threading.RLock()
+_sequencia = 0
+_assinantes = []
+_versoes_publicadas = {}
+_tarefas_alteradas = set()
+_tarefas_recarregadas = False
+
+# Estado do processo de leitura: última sequência de alterações aplicada
+_sequencia_aplicada = 0
+_condicao_sequencia = threading.Condition()
+
+def _copias(entidades):
+    """Copia as entidades registradas (ignorando as destruídas) indexadas pelo ID."""
+    return {entidade['id']: dict(entidade) for entidade in entidades if 'id' in entidade}
+
+def _estado_completo():
+    """Alterações que reproduzem todo o estado do escritor."""
+    alteracoes = {nome: (_copias(listar()), True) for nome, (_, listar, _) in _REGISTROS.items()}
+    alteracoes['tarefas'] = (_copias(tarefa_listar_todas()), True)
+    return alteracoes
+
+def _anotar_tarefa(evento, tarefa):
+    """Observador do escritor: anota as tarefas alteradas pela escrita em andamento."""
+    global _tarefas_recarregadas
+    if evento == 'recarregadas':
+        _tarefas_recarregadas = True
+    else:
+        _tarefas_alteradas.add(tarefa['id'])
+
+def _coletar_alteracoes():
+    """
+    Reúne as alterações feitas desde a última publicação. Executada com
+    _lock_escrita adquirido.
+    """
+    global _tarefas_recarregadas
+    alteracoes = {}
+    for nome, (versao, listar, _) in _REGISTROS.items():
+        if _versoes_publicadas.get(nome) != versao():
+            _versoes_publicadas[nome] = versao()
+            alteracoes[nome] = (_copias(listar()), True)
+    
+    # Os jobs alteram tarefas fora de _lock_escrita: as anotações são lidas com
+    # o lock das tarefas, sob o qual os observadores são chamados
+    with tarefa_lock_registro():
+        if _tarefas_recarregadas:
+            alteracoes['tarefas'] = (_copias(tarefa_listar_todas()), True)
+        elif _tarefas_alteradas:
+            tarefas = {}
+            for tarefa_id in _tarefas_alteradas:
+                tarefa = tarefa_buscar_por_id(tarefa_id)
+                tarefas[tarefa_id] = dict(tarefa) if tarefa else None
+            alteracoes['tarefas'] = (tarefas, False)
+        _tarefas_alteradas.clear()
+        _tarefas_recarregadas = False
+    return alteracoes
+
+def _publicar(alteracoes):
+    """
+    Envia as alterações a todos os processos de leitura, serializadas uma única
+    vez. Executada com _lock_escrita adquirido, o que mantém a ordem das alterações.
+    """
+    global _sequencia
+    _sequencia += 1
+    conteudo = pickle.dumps((_sequencia, alteracoes), protocol=pickle.HIGHEST_PROTOCOL)
+    for assinante in list(_assinantes):
+        try:
+            assinante.send_bytes(conteudo)
+        except OSError:
+            _assinantes.remove(assinante)
+
+def _publicar_alteracoes_job(evento, job):
+    """Observador dos jobs no escritor: publica as alterações feitas por eles."""
+    with _lock_escrita:
+        alteracoes = _coletar_alteracoes()
+        if alteracoes:
+            _publicar(alteracoes)
+
+def _executar_escrita(app, ambiente, corpo):
+    """
+    Executa uma requisição encaminhada por um processo de leitura e publica as
+    alterações resultantes.
+    
+    Returns:
+        tuple: (status, cabeçalhos, corpo, sequência a aguardar)
+    """
+    ambiente = dict(ambiente)
+    ambiente.update({
+        'wsgi.input': io.BytesIO(corpo),
+        'wsgi.errors': sys.stderr,
+        'wsgi.version': (1, 0),
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    })
+    resposta = {}
+    
+    def iniciar_resposta(status, cabecalhos, exc_info=None):
+        resposta['status'] = status
+        resposta['cabecalhos'] = cabecalhos
+    
+    def executar():
+        iterador = app(ambiente, iniciar_resposta)
+        try:
+            return b''.join(iterador)
+        finally:
+            if hasattr(iterador, 'close'):
+                iterador.close()
+    
+    # Leituras encaminhadas (jobs, sincronização) não alteram as estruturas:
+    # não esperam pelas escritas nem publicam alterações
+    if ambiente['REQUEST_METHOD'] in _METODOS_LEITURA:
+        conteudo = executar()
+        return resposta['status'], resposta['cabecalhos'], conteudo, _sequencia
+    
+    with _lock_escrita:
+        conteudo = executar()
+        alteracoes = _coletar_alteracoes()
+        if alteracoes:
+            _publicar(alteracoes)
+        return resposta['status'], resposta['cabecalhos'], conteudo, _sequencia
+
+def _atender_conexao(app, conexao):
+    """
+    Atende uma conexão de um processo de leitura: requisições encaminhadas ou
+    a assinatura da sequência de alterações.
+    """
+    try:
+        while True:
+            mensagem = conexao.recv()
+            if mensagem[0] == 'assinar':
+                with _lock_escrita:
+                    # Processo recriado (ou atrasado) recebe primeiro o estado completo
+                    if mensagem[1] != _sequencia:
+                        conexao.send_bytes(pickle.dumps((_sequencia, _estado_completo()),
+                                                        protocol=pickle.HIGHEST_PROTOCOL))
+                    _assinantes.append(conexao)
+                return
+            conexao.send(_executar_escrita(app, mensagem[1], mensagem[2]))
+    except (EOFError, OSError):
+        conexao.close()
+
+def _executar_escritor(app, ouvinte):
+    """Laço principal do processo escritor."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _interromper)
+    
+    for nome, (versao, _, _) in _REGISTROS.items():
+        _versoes_publicadas[nome] = versao()
+    tarefa_adicionar_observador(_anotar_tarefa)
+    job_adicionar_observador(_publicar_alteracoes_job)
+    log_operacao("PreFork", "Escritor iniciado", f"PID: {os.getpid()}")
+    
+    try:
+        while True:
+            try:
+                conexao = ouvinte.accept()
+            except AuthenticationError:
+                continue
+            threading.Thread(target=_atender_conexao, args=(app, conexao), daemon=True).start()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Aguarda a escrita em andamento e salva os dados, sem ser interrompido
+        # por outro SIGTERM (supervisores costumam sinalizar o grupo inteiro)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        # Os jobs publicam alterações com _lock_escrita: são encerrados antes
+        job_finalizar()
+        with _lock_escrita:
+            gt_finalizar(app.config['GT_SYSTEM'])
+        log_operacao("PreFork", "Escritor encerrado", f"PID: {os.getpid()}")
+
+def _aplicar_alteracoes(conexao):
+    """Thread do processo de leitura que aplica a sequência de alterações do escritor."""
+    global _sequencia_aplicada
+    while True:
+        try:
+            sequencia, alteracoes = pickle.loads(conexao.recv_bytes())
+        except (EOFError, OSError):
+            log_operacao("PreFork", "Sequência de alterações encerrada", f"PID: {os.getpid()}")
+            return
+        
+        for nome, aplicar in _APLICACOES:
+            if nome in alteracoes:
+                aplicar(*alteracoes[nome])
+        with _condicao_sequencia:
+            _sequencia_aplicada = sequencia
+            _condicao_sequencia.notify_all()
+
+def _aguardar_sequencia(sequencia):
+    """Aguarda a aplicação local das alterações até a sequência informada."""
+    with _condicao_sequencia:
+        return _condicao_sequencia.wait_for(lambda: _sequencia_aplicada >= sequencia,
+                                            TEMPO_LIMITE_REPLICACAO)
+
+class _EncaminharEscritas:
+    """
+    Aplicação WSGI dos processos de leitura: atende as leituras localmente e
+    encaminha as escritas ao processo escritor.
+    """
+
+    # Sub-requisições agrupadas com estes prefixos são atendidas pelo escritor
+    # e não podem ser fixadas no estado local (ver batch_routes)
+    prefixos_remotos = _PREFIXOS_ESCRITOR
+
+    def __init__(self, app, endereco, chave):
+        self.app = app
+        self._endereco = endereco
+        self._chave = chave
+        self._local = threading.local()
+    
+    def _conexao(self):
+        """Conexão da thread atual com o escritor (aberta sob demanda)."""
+        conexao = getattr(self._local, 'conexao', None)
+        if conexao is None:
+            conexao = Client(self._endereco, family='AF_UNIX', authkey=self._chave)
+            self._local.conexao = conexao
+        return conexao
+    
+    def __call__(self, ambiente, iniciar_resposta):
+        metodo = ambiente['REQUEST_METHOD']
+        caminho = ambiente.get('PATH_INFO', '')
+        local = metodo in _METODOS_LEITURA or (metodo == 'POST' and caminho.endswith(_SUFIXOS_LEITURA_POST))
+        if local and not caminho.startswith(_PREFIXOS_ESCRITOR):
+            return self.app(ambiente, iniciar_resposta)
+        if metodo == 'POST' and caminho.rstrip('/') == _CAMINHO_BATCH:
+            ambiente[_CHAVE_DESPACHO] = self
+            return self.app(ambiente, iniciar_resposta)
+        
+        repassado = {chave: valor for chave, valor in ambiente.items()
+                     if chave in _CHAVES_AMBIENTE or chave.startswith('HTTP_')}
+        tamanho = ambiente.get('CONTENT_LENGTH')
+        corpo = ambiente['wsgi.input'].read(int(tamanho)) if tamanho else b''
+        try:
+            conexao = self._conexao()
+            conexao.send(('requisicao', repassado, corpo))
+            status, cabecalhos, conteudo, sequencia = conexao.recv()
+        except (EOFError, OSError) as e:
+            self._local.conexao = None
+            log_operacao("PreFork", "Erro ao encaminhar escrita", f"Falha: {str(e)}")
+            conteudo = json.dumps({'error': 'Processo escritor indisponível'}).encode()
+            iniciar_resposta('503 SERVICE UNAVAILABLE', [('Content-Type', 'application/json'),
+                                                         ('Content-Length', str(len(conteudo)))])
+            return [conteudo]
+        
+        if not _aguardar_sequencia(sequencia):
+            log_operacao("PreFork", "Alterações ainda não aplicadas", f"Sequência: {sequencia}")
+        iniciar_resposta(status, cabecalhos)
+        return [conteudo]
+
+def _executar_leitor(app, soquete, endereco, chave, threads):
+    """Laço principal de um processo de leitura."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _interromper)
+    
+    # A thread do agendador não sobrevive ao fork: cada processo acompanha os prazos
+    agendador_inicializar()
+    
+    assinatura = Client(endereco, family='AF_UNIX', authkey=chave)
+    assinatura.send(('assinar', _sequencia_aplicada))
+    threading.Thread(target=_aplicar_alteracoes, args=(assinatura,), name="replicacao", daemon=True).start()
+    
+    host, port = soquete.getsockname()[:2]
+    servidor = servidor_criar(_EncaminharEscritas(app, endereco, chave), host, port, threads, fd=soquete.fileno())
+    log_operacao("PreFork", "Processo de leitura iniciado", f"PID: {os.getpid()}, Threads: {threads}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        servidor.server_close()
+
+def _interromper(sinal, quadro):
+    raise KeyboardInterrupt
+
+def _criar_processo(alvo, *args):
+    """Executa alvo em um processo filho (fork) e retorna o PID."""
+    pid = os.fork()
+    if pid:
+        return pid
+    codigo = 0
+    try:
+        alvo(*args)
+    except BaseException as e:
+        log_operacao("PreFork", "Erro no processo filho", f"PID: {os.getpid()}, Falha: {str(e)}")
+        codigo = 1
+    finally:
+        # Encerra sem os finalizadores herdados do mestre (atexit): o log
+        # pendente é escrito aqui
+        log_descarregar()
+        os._exit(codigo)
+
+def _encerrar_processos(pids):
+    """Envia SIGTERM aos processos e aguarda o término de todos."""
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in pids:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+def prefork_executar(app, host: str = '0.0.0.0', port: int = 5001, processos: int = 2,
+                     threads: int = THREADS_SERVIDOR_WEB) -> None:
+    """
+    Executa a aplicação em modo pré-fork até receber SIGINT ou SIGTERM.
+    
+    Deve ser chamada no processo que importou src.main (dados já carregados)
+    e não retorna: o mestre encerra com os._exit, sem os finalizadores da
+    aplicação, pois quem salva os dados é o escritor.
+    
+    Args:
+        app: Aplicação Flask
+        host (str): Endereço de escuta
+        port (int): Porta de escuta
+        processos (int): Quantidade de processos de leitura
+        threads (int): Threads do pool de cada processo de leitura
+    
+    Raises:
+        ValueError: Se a quantidade de processos ou de threads for menor que 1
+    """
+    if processos < 1 or threads < 1:
+        raise ValueError("As quantidades de processos e de threads devem ser pelo menos 1")
+    
+    soquete = socket.create_server((host, port), backlog=128)
+    diretorio = tempfile.mkdtemp(prefix='task_manager_')
+    endereco = os.path.join(diretorio, 'escritor.sock')
+    chave = os.urandom(32)
+    ouvinte = Listener(endereco, family='AF_UNIX', authkey=chave)
+    
+    # Nenhuma thread pode estar com locks adquiridos no fork: para o agendador
+    # (cada processo filho inicia o seu) e congela os objetos carregados
+    agendador_finalizar()
+    gc.collect()
+    gc.freeze()
+    
+    escritor = _criar_processo(_executar_escritor, app, ouvinte)
+    # PID de cada processo de leitura -> instante de criação
+    leitores = {_criar_processo(_executar_leitor, app, soquete, endereco, chave, threads): relogio.monotonic()
+                for _ in range(processos)}
+    log_operacao("PreFork", "Iniciado", f"http://{host}:{soquete.getsockname()[1]}, "
+                 f"Processos de leitura: {processos}, Threads: {threads}")
+    
+    signal.signal(signal.SIGINT, _interromper)
+    signal.signal(signal.SIGTERM, _interromper)
+    try:
+        while True:
+            pid, _ = os.wait()
+            if pid == escritor:
+                log_operacao("PreFork", "Escritor terminou inesperadamente", f"PID: {pid}")
+                escritor = None
+                break
+            if pid in leitores:
+                inicio = leitores.pop(pid)
+                if relogio.monotonic() - inicio < TEMPO_MINIMO_PROCESSO:
+                    log_operacao("PreFork", "Processo de leitura falhou ao iniciar", f"PID: {pid}")
+                    break
+                log_operacao("PreFork", "Processo de leitura terminou, recriando", f"PID: {pid}")
+                leitores[_criar_processo(_executar_leitor, app, soquete, endereco, chave, threads)] = relogio.monotonic()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        _encerrar_processos(leitores)
+        if escritor is not None:
+            _encerrar_processos([escritor])
+        soquete.close()
+        shutil.rmtree(diretorio, ignore_errors=True)
+        log_operacao("PreFork", "Encerrado")
+        log_descarregar()
+        os._exit(0)
@@ -0,0 +1,160 @@
+"""
+Rotas da API para requisições agrupadas
+
+POST /api/batch recebe uma lista de sub-requisições (método, caminho e corpo)
+e as executa no próprio processo, pela tabela de rotas do Flask, sem uma
+ida e volta HTTP por sub-requisição. As respostas voltam juntas, na ordem
+recebida.
+
+Quando todas as sub-requisições são leituras, elas veem um único estado das
+tarefas, usuários, tags e times (gt_leitura_consistente): nenhuma alteração é
+aplicada entre uma e outra. Com escritas, as sub-requisições são executadas
+em sequência, cada uma vendo as alterações das anteriores.
+"""
+
+from flask import Blueprint, request, jsonify, current_app
+from werkzeug.test import EnvironBuilder, run_wsgi_app
+from contextlib import nullcontext
+import json
+import sys
+import os
+
+# Adiciona o path do Task Manager
+task_manager_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
+sys.path.insert(0, task_manager_path)
+
+# Adiciona o diretório modules ao path
+modules_path = os.path.join(task_manager_path, 'modules')
+sys.path.insert(0, modules_path)
+
+try:
+    from modules.gerenciamento_tarefas import gt_leitura_consistente
+    from config import MAX_SUBREQUISICOES_BATCH
+except ImportError as e:
+    print(f"Erro ao importar módulos do Task Manager: {e}")
+
+from src.utils import get_gt_system
+
+batch_bp = Blueprint('batch', __name__)
+
+# Chave do ambiente WSGI com a aplicação que atende as sub-requisições (o
+# servidor pré-fork informa a que encaminha as escritas ao processo escritor;
+# o atributo prefixos_remotos dela lista as rotas atendidas em outro processo)
+CHAVE_DESPACHO = 'task_manager.despacho'
+
+# Métodos das sub-requisições e os que são leituras
+METODOS_BATCH = ('GET', 'HEAD', 'POST', 'PUT', 'DELETE')
+METODOS_LEITURA = ('GET', 'HEAD')
+
+# Rotas que não podem ser agrupadas (fluxo contínuo e o próprio agrupamento)
+CAMINHOS_EXCLUIDOS = ('/api/batch', '/api/events')
+
+# Chaves do ambiente da requisição original repassadas às sub-requisições
+CHAVES_AMBIENTE = ('REMOTE_ADDR', 'REMOTE_PORT', 'SERVER_NAME', 'SERVER_PORT', 'SERVER_PROTOCOL',
+                   'wsgi.url_scheme', CHAVE_DESPACHO)
+
+# Cabeçalhos das sub-requisições descartados: o corpo de cada sub-resposta é
+# incluído como JSON na resposta agrupada, que já é comprimida como um todo
+CABECALHOS_DESCARTADOS = ('accept-encoding',)
+
+def validar_subrequisicao(sub):
+    """
+    Valida uma sub-requisição.
+    
+    Returns:
+        str ou None: Mensagem de erro ou None se válida
+    """
+    if not isinstance(sub, dict):
+        return 'Sub-requisição deve ser um objeto'
+    if sub.get('method', 'GET').upper() not in METODOS_BATCH:
+        return f'Método inválido. Use {"|".join(METODOS_BATCH)}'
+    caminho = sub.get('path')
+    if not isinstance(caminho, str) or not caminho.startswith('/api/'):
+        return 'Campo path deve ser um caminho da API (/api/...)'
+    rota = caminho.split('?', 1)[0].rstrip('/')
+    if any(rota == excluido or rota.startswith(excluido + '/') for excluido in CAMINHOS_EXCLUIDOS):
+        return 'Caminho não pode ser agrupado'
+    if 'headers' in sub and not isinstance(sub['headers'], dict):
+        return 'Campo headers deve ser um objeto'
+    return None
+
+def executar_subrequisicao(aplicacao, sub):
+    """Executa uma sub-requisição na aplicação WSGI e monta o resultado."""
+    caminho, _, consulta = sub['path'].partition('?')
+    cabecalhos_sub = {nome: valor for nome, valor in (sub.get('headers') or {}).items()
+                      if str(nome).lower() not in CABECALHOS_DESCARTADOS}
+    construtor = EnvironBuilder(
+        path=caminho,
+        query_string=consulta,
+        method=sub.get('method', 'GET').upper(),
+        headers=cabecalhos_sub,
+        json=sub['body'] if sub.get('body') is not None else None,
+        environ_base={chave: request.environ[chave] for chave in CHAVES_AMBIENTE if chave in request.environ}
+    )
+    try:
+        iterador, status, cabecalhos = run_wsgi_app(aplicacao, construtor.get_environ(), buffered=True)
+        conteudo = b''.join(iterador)
+    finally:
+        construtor.close()
+    
+    if cabecalhos.get('Content-Type', '').startswith('application/json') and conteudo:
+        corpo = json.loads(conteudo)
+    else:
+        corpo = conteudo.decode('utf-8', errors='replace')
+    return {
+        'status': int(status.split(' ', 1)[0]),
+        'headers': {nome: valor for nome, valor in cabecalhos.items() if nome != 'Content-Length'},
+        'body': corpo
+    }
+
+@batch_bp.route('/batch', methods=['POST'])
+def executar_batch():
+    """
+    Executa várias sub-requisições em uma única chamada.
+    
+    Corpo: lista de sub-requisições ou {"requests": [...], "snapshot": true}, cada
+    uma {"method": "GET", "path": "/api/tasks?limit=10", "body": {...}, "headers": {...}}.
+    Com "snapshot": false, as leituras não são fixadas em um único estado.
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        data = request.get_json(silent=True)
+        subrequisicoes = data.get('requests') if isinstance(data, dict) else data
+        if not isinstance(subrequisicoes, list) or not subrequisicoes:
+            return jsonify({'error': 'Corpo deve ser uma lista de sub-requisições ou {"requests": [...]}'}), 400
+        if len(subrequisicoes) > MAX_SUBREQUISICOES_BATCH:
+            return jsonify({'error': f'Máximo de {MAX_SUBREQUISICOES_BATCH} sub-requisições'}), 400
+        
+        erros = [validar_subrequisicao(sub) for sub in subrequisicoes]
+        aplicacao = request.environ.get(CHAVE_DESPACHO) or current_app.wsgi_app
+        remotos = getattr(aplicacao, 'prefixos_remotos', ())
+        fixar = (not isinstance(data, dict) or data.get('snapshot', True)) and all(
+            erro is None and sub.get('method', 'GET').upper() in METODOS_LEITURA
+            and not sub['path'].startswith(remotos)
+            for sub, erro in zip(subrequisicoes, erros)
+        )
+        
+        resultados = []
+        with gt_leitura_consistente(gt) if fixar else nullcontext():
+            for indice, (sub, erro) in enumerate(zip(subrequisicoes, erros)):
+                if erro is not None:
+                    resultados.append({'index': indice, 'status': 400, 'headers': {}, 'body': {'error': erro}})
+                    continue
+                # Uma sub-resposta que não pode ser montada não derruba as demais
+                try:
+                    resultados.append({'index': indice, **executar_subrequisicao(aplicacao, sub)})
+                except Exception as e:
+                    resultados.append({'index': indice, 'status': 500, 'headers': {}, 'body': {'error': str(e)}})
+        
+        return jsonify({
+            'success': True,
+            'data': resultados,
+            'count': len(resultados),
+            'snapshot': fixar
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
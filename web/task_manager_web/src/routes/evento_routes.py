@@ -0,0 +1,148 @@
+"""
+Rotas da API para o fluxo de eventos de alteração
+
+GET /api/events mantém a conexão aberta e envia, em Server-Sent Events, um
+evento compacto a cada alteração de tarefa, usuário, tag ou time (ver
+modules/eventos.py). O cliente aplica as diferenças às listagens já
+carregadas; ao receber 'reset', recarrega as listagens.
+
+No servidor WSGI, cada conexão ocupa uma thread do pool: as conexões são
+limitadas (MAX_CONEXOES_EVENTOS_WSGI) e encerradas após
+TEMPO_CONEXAO_EVENTOS_WSGI (o navegador reconecta com Last-Event-ID, sem
+perder eventos). Na variante ASGI, a rota é atendida no loop de eventos,
+sem esses limites.
+"""
+
+from flask import Blueprint, request, jsonify, Response
+import asyncio
+import threading
+import time as relogio
+import json
+from urllib.parse import parse_qsl
+import sys
+import os
+
+# Adiciona o path do Task Manager
+task_manager_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
+sys.path.insert(0, task_manager_path)
+
+# Adiciona o diretório modules ao path
+modules_path = os.path.join(task_manager_path, 'modules')
+sys.path.insert(0, modules_path)
+
+try:
+    from modules.eventos import eventos_assinar, eventos_aguardar, eventos_obter, eventos_cancelar_assinatura
+    from config import INTERVALO_BATIMENTO_EVENTOS, TEMPO_CONEXAO_EVENTOS_WSGI, MAX_CONEXOES_EVENTOS_WSGI
+except ImportError as e:
+    print(f"Erro ao importar módulos do Task Manager: {e}")
+
+from src.asgi import asgi_registrar_rota
+
+evento_bp = Blueprint('eventos', __name__)
+
+# Conexões simultâneas atendidas pelo servidor WSGI neste processo
+_conexoes_wsgi = threading.BoundedSemaphore(MAX_CONEXOES_EVENTOS_WSGI)
+
+# Cabeçalhos do fluxo (X-Accel-Buffering desativa o buffer de proxies nginx)
+CABECALHOS_EVENTOS = {
+    'Cache-Control': 'no-cache',
+    'X-Accel-Buffering': 'no'
+}
+
+# Intervalo sugerido ao navegador para reconectar (milissegundos)
+RECONEXAO_MS = 2000
+
+def formatar_eventos(eventos):
+    """Formata os eventos no protocolo SSE (o 'id' é usado como Last-Event-ID na reconexão)."""
+    return ''.join(
+        f"id: {evento['seq']}\ndata: {json.dumps(evento, ensure_ascii=False)}\n\n" for evento in eventos
+    ).encode('utf-8')
+
+def ultimo_evento_recebido(cabecalhos, parametros):
+    """Obtém o último evento recebido pelo cliente (cabeçalho Last-Event-ID ou ?last_event_id=)."""
+    return cabecalhos.get('Last-Event-ID') or parametros.get('last_event_id') or None
+
+@evento_bp.route('/events', methods=['GET'])
+def fluxo_eventos():
+    """Fluxo SSE das alterações (conexão limitada no servidor WSGI; ver módulo)"""
+    if not _conexoes_wsgi.acquire(blocking=False):
+        resposta = jsonify({'error': 'Limite de conexões de eventos atingido'})
+        resposta.headers['Retry-After'] = str(RECONEXAO_MS // 1000)
+        return resposta, 503
+    
+    assinatura_id = eventos_assinar(ultimo_evento_recebido(request.headers, request.args))
+    if assinatura_id is None:
+        _conexoes_wsgi.release()
+        return jsonify({'error': 'Falha ao assinar os eventos'}), 500
+    
+    def gerar():
+        try:
+            yield f"retry: {RECONEXAO_MS}\n\n".encode('utf-8')
+            fim = relogio.monotonic() + TEMPO_CONEXAO_EVENTOS_WSGI
+            while True:
+                restante = fim - relogio.monotonic()
+                if restante <= 0:
+                    return
+                eventos = eventos_aguardar(assinatura_id, min(restante, INTERVALO_BATIMENTO_EVENTOS))
+                if eventos is None:
+                    return
+                yield formatar_eventos(eventos) if eventos else b": batimento\n\n"
+        finally:
+            eventos_cancelar_assinatura(assinatura_id)
+            _conexoes_wsgi.release()
+    
+    return Response(gerar(), mimetype='text/event-stream', headers=CABECALHOS_EVENTOS)
+
+async def fluxo_eventos_asgi(scope, receive, send):
+    """Fluxo SSE das alterações atendido no loop de eventos (variante ASGI)"""
+    if scope['method'] != 'GET':
+        await send({'type': 'http.response.start', 'status': 405,
+                    'headers': [(b'content-type', b'application/json'), (b'allow', b'GET')]})
+        await send({'type': 'http.response.body', 'body': '{"error": "Método não permitido"}'.encode('utf-8')})
+        return
+    
+    cabecalhos = {nome.decode('latin-1').title(): valor.decode('latin-1') for nome, valor in scope['headers']}
+    parametros = dict(parse_qsl(scope.get('query_string', b'').decode('latin-1')))
+    loop = asyncio.get_running_loop()
+    sinal = asyncio.Event()
+    assinatura_id = eventos_assinar(ultimo_evento_recebido(cabecalhos, parametros),
+                                    lambda: loop.call_soon_threadsafe(sinal.set))
+    if assinatura_id is None:
+        await send({'type': 'http.response.start', 'status': 500,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': b'{"error": "Falha ao assinar os eventos"}'})
+        return
+    
+    async def aguardar_desconexao():
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+    
+    desconexao = asyncio.ensure_future(aguardar_desconexao())
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [
+            (b'content-type', b'text/event-stream; charset=utf-8')
+        ] + [(nome.lower().encode('latin-1'), valor.encode('latin-1')) for nome, valor in CABECALHOS_EVENTOS.items()]})
+        await send({'type': 'http.response.body', 'body': f"retry: {RECONEXAO_MS}\n\n".encode('utf-8'), 'more_body': True})
+        while not desconexao.done():
+            # O sinal é limpo antes de retirar os eventos: um aviso posterior não se perde
+            sinal.clear()
+            eventos = eventos_obter(assinatura_id)
+            if eventos is None:
+                break
+            if eventos:
+                await send({'type': 'http.response.body', 'body': formatar_eventos(eventos), 'more_body': True})
+                continue
+            
+            espera = asyncio.ensure_future(sinal.wait())
+            await asyncio.wait([espera, desconexao], timeout=INTERVALO_BATIMENTO_EVENTOS,
+                               return_when=asyncio.FIRST_COMPLETED)
+            espera.cancel()
+            if not sinal.is_set() and not desconexao.done():
+                await send({'type': 'http.response.body', 'body': b": batimento\n\n", 'more_body': True})
+        if not desconexao.done():
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+    finally:
+        desconexao.cancel()
+        eventos_cancelar_assinatura(assinatura_id)
+
+asgi_registrar_rota('/api/events', fluxo_eventos_asgi)
@@ -0,0 +1,177 @@
+"""
+Rotas da API para jobs em segundo plano
+
+Este módulo contém as rotas que agendam as operações demoradas (exportação,
+importação e salvamento dos dados) como jobs e as que consultam e cancelam
+os jobs. As rotas de agendamento respondem imediatamente (202) com o job
+criado; o progresso é acompanhado em GET /api/jobs/<id>.
+"""
+
+from flask import Blueprint, request, jsonify
+from datetime import datetime
+import shutil
+import tempfile
+import sys
+import os
+
+# Adiciona o path do Task Manager
+task_manager_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
+sys.path.insert(0, task_manager_path)
+
+# Adiciona o diretório modules ao path
+modules_path = os.path.join(task_manager_path, 'modules')
+sys.path.insert(0, modules_path)
+
+try:
+    from modules.gerenciamento_tarefas import (
+        gt_agendar_exportacao, gt_agendar_importacao_arquivo, gt_agendar_salvamento,
+        FORMATOS_EXPORTACAO, FORMATOS_IMPORTACAO
+    )
+    from modules.job import job_obter, job_listar_todos, job_cancelar, job_to_dict
+except ImportError as e:
+    print(f"Erro ao importar módulos do Task Manager: {e}")
+
+from src.utils import get_gt_system
+
+job_bp = Blueprint('jobs', __name__)
+
+def job_agendado(job):
+    """Resposta de uma rota de agendamento: 202 com o job criado."""
+    if job is None:
+        return jsonify({'error': 'Falha ao agendar job'}), 500
+    return jsonify({
+        'success': True,
+        'data': job_to_dict(job),
+        'message': 'Job agendado'
+    }), 202
+
+@job_bp.route('/jobs', methods=['GET'])
+def listar_jobs():
+    """Lista os jobs, dos mais recentes para os mais antigos (?limit= restringe a quantidade)"""
+    try:
+        limite = request.args.get('limit', type=int)
+        jobs_dict = [job_to_dict(job) for job in job_listar_todos(limite)]
+        
+        return jsonify({
+            'success': True,
+            'data': jobs_dict,
+            'count': len(jobs_dict)
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@job_bp.route('/jobs/<int:job_id>', methods=['GET'])
+def obter_job(job_id):
+    """Obtém o status, o progresso e o resultado de um job"""
+    try:
+        job = job_obter(job_id)
+        if job is None:
+            return jsonify({'error': 'Job não encontrado'}), 404
+        
+        return jsonify({
+            'success': True,
+            'data': job_to_dict(job)
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@job_bp.route('/jobs/<int:job_id>/cancel', methods=['POST'])
+def cancelar_job(job_id):
+    """Cancela um job pendente ou solicita o cancelamento de um job em execução"""
+    try:
+        job = job_obter(job_id)
+        if job is None:
+            return jsonify({'error': 'Job não encontrado'}), 404
+        
+        if job_cancelar(job_id) != 0:
+            return jsonify({'error': 'Job já encerrado'}), 409
+        
+        return jsonify({
+            'success': True,
+            'data': job_to_dict(job),
+            'message': 'Cancelamento solicitado'
+        })
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@job_bp.route('/jobs/export', methods=['POST'])
+def agendar_exportacao():
+    """
+    Agenda a exportação das tarefas para um arquivo em EXPORT_DIR.
+    
+    Corpo opcional: {"nome_arquivo": ..., "formato": "csv" | "jsonl"}.
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        data = request.get_json(silent=True) or {}
+        formato = data.get('formato', 'csv')
+        if formato not in FORMATOS_EXPORTACAO:
+            return jsonify({'error': f'Formato inválido. Use {"|".join(FORMATOS_EXPORTACAO)}'}), 400
+        nome_arquivo = data.get('nome_arquivo', f'tarefas_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{formato}')
+        
+        return job_agendado(gt_agendar_exportacao(gt, nome_arquivo, formato))
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@job_bp.route('/jobs/import', methods=['POST'])
+def agendar_importacao():
+    """
+    Agenda a importação de tarefas de um arquivo JSONL ou CSV.
+    
+    Aceita upload multipart (campo 'arquivo') ou o conteúdo no corpo da
+    requisição, como POST /api/tasks/import. O conteúdo é copiado para um
+    arquivo temporário, removido ao fim do job.
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        arquivo = request.files.get('arquivo') or request.files.get('file')
+        formato = request.args.get('format')
+        if arquivo is not None:
+            fluxo = arquivo.stream
+            if not formato and arquivo.filename:
+                extensao = os.path.splitext(arquivo.filename)[1].lower().lstrip('.')
+                formato = 'jsonl' if extensao in ('jsonl', 'ndjson') else extensao
+        else:
+            fluxo = request.stream
+        
+        if formato not in FORMATOS_IMPORTACAO:
+            return jsonify({'error': f'Formato inválido. Use ?format={"|".join(FORMATOS_IMPORTACAO)}'}), 400
+        
+        descritor, caminho = tempfile.mkstemp(prefix='importacao_', suffix=f'.{formato}')
+        with os.fdopen(descritor, 'wb') as destino:
+            shutil.copyfileobj(fluxo, destino)
+        
+        tamanho_lote = request.args.get('batch_size', type=int)
+        if tamanho_lote:
+            job = gt_agendar_importacao_arquivo(gt, caminho, formato, tamanho_lote, remover_arquivo=True)
+        else:
+            job = gt_agendar_importacao_arquivo(gt, caminho, formato, remover_arquivo=True)
+        if job is None:
+            os.remove(caminho)
+        return job_agendado(job)
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@job_bp.route('/jobs/save', methods=['POST'])
+def agendar_salvamento():
+    """Agenda o salvamento dos dados de todas as entidades nos JSONs"""
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        return job_agendado(gt_agendar_salvamento(gt))
+    
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
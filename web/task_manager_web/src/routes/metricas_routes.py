@@ -0,0 +1,101 @@
+"""
+Rotas da API para métricas
+
+GET /api/metrics expõe, no formato de texto do Prometheus, a quantidade e a
+latência das requisições por rota (src/metricas.py) e medidores lidos no
+momento da consulta: tamanho dos registros, cache de respostas, assinantes
+do fluxo de eventos e registro de operações.
+
+As métricas são do processo que atende a consulta: no modo pré-fork, cada
+processo de leitura tem as suas, e as escritas são medidas no escritor.
+"""
+
+from flask import Blueprint, Response
+import sys
+import os
+
+# Adiciona o path do Task Manager
+task_manager_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
+sys.path.insert(0, task_manager_path)
+
+# Adiciona o diretório modules ao path
+modules_path = os.path.join(task_manager_path, 'modules')
+sys.path.insert(0, modules_path)
+
+try:
+    from modules.tarefa import tarefa_qtd_registradas
+    from modules.usuario import usuario_qtd_registrados
+    from modules.tag import tag_qtd_registradas
+    from modules.team import time_qtd_registrados
+    from modules.eventos import eventos_qtd_assinantes
+    from utils import log_estatisticas
+except ImportError as e:
+    print(f"Erro ao importar módulos do Task Manager: {e}")
+
+from src.cache import cache_resposta_metricas
+from src.metricas import metricas_adicionar_medidor, metricas_prometheus
+
+metricas_bp = Blueprint('metricas', __name__)
+
+# Tipo de conteúdo do formato de exposição em texto do Prometheus
+TIPO_PROMETHEUS = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _taxa_acertos(metricas):
+    """Fração das consultas atendidas pelo cache"""
+    consultas = metricas['hits'] + metricas['misses']
+    return metricas['hits'] / consultas if consultas else 0.0
+
+def _entidades_registradas():
+    """Quantidade de entidades em cada registro"""
+    return {'tasks': tarefa_qtd_registradas(), 'users': usuario_qtd_registrados(),
+            'tags': tag_qtd_registradas(), 'teams': time_qtd_registrados()}
+
+def _consultas_cache(metricas):
+    """Acertos e faltas de um cache"""
+    return {'hit': metricas['hits'], 'miss': metricas['misses']}
+
+def _descartes_cache():
+    """Entradas do cache de respostas descartadas por desatualização ou por falta de espaço"""
+    metricas = cache_resposta_metricas()
+    return {'stale': metricas['invalidacoes'], 'size': metricas['descartes']}
+
+def _registros_log():
+    """Registros de operações escritos, omitidos pela amostragem e descartados (buffer cheio)"""
+    estatisticas = log_estatisticas()
+    return {'written': estatisticas['escritos'], 'sampled_out': estatisticas['amostrados'],
+            'dropped': estatisticas['descartados']}
+
+# Medidores lidos a cada consulta: (nome, descrição, leitura, tipo, rótulo)
+MEDIDORES = (
+    ('task_manager_registry_entities', 'Entidades registradas em memória',
+     _entidades_registradas, 'gauge', 'entity'),
+    ('task_manager_response_cache_lookups_total', 'Consultas ao cache de respostas serializadas',
+     lambda: _consultas_cache(cache_resposta_metricas()), 'counter', 'result'),
+    ('task_manager_response_cache_hit_ratio', 'Fração das consultas atendidas pelo cache de respostas',
+     lambda: _taxa_acertos(cache_resposta_metricas()), 'gauge', None),
+    ('task_manager_response_cache_evictions_total', 'Entradas descartadas do cache de respostas',
+     _descartes_cache, 'counter', 'reason'),
+    ('task_manager_response_cache_bytes', 'Bytes ocupados pelo cache de respostas',
+     lambda: cache_resposta_metricas()['bytes'], 'gauge', None),
+    ('task_manager_fragment_cache_lookups_total', 'Consultas ao cache de fragmentos JSON das tarefas',
+     lambda: _consultas_cache(cache_resposta_metricas()['fragmentos']), 'counter', 'result'),
+    ('task_manager_fragment_cache_hit_ratio', 'Fração das consultas atendidas pelo cache de fragmentos',
+     lambda: _taxa_acertos(cache_resposta_metricas()['fragmentos']), 'gauge', None),
+    ('task_manager_fragment_cache_evictions_total', 'Fragmentos descartados por falta de espaço',
+     lambda: cache_resposta_metricas()['fragmentos']['descartes'], 'counter', None),
+    ('task_manager_fragment_cache_bytes', 'Bytes ocupados pelo cache de fragmentos',
+     lambda: cache_resposta_metricas()['fragmentos']['bytes'], 'gauge', None),
+    ('task_manager_event_subscribers', 'Clientes conectados ao fluxo de eventos',
+     eventos_qtd_assinantes, 'gauge', None),
+    ('task_manager_log_records_total', 'Registros de operações por destino',
+     _registros_log, 'counter', 'outcome'),
+)
+
+for nome, descricao, obter, tipo, rotulo in MEDIDORES:
+    metricas_adicionar_medidor(nome, descricao, obter, tipo, rotulo)
+
+@metricas_bp.route('/metrics', methods=['GET'])
+def expor_metricas():
+    """Métricas no formato de texto do Prometheus"""
+    return Response(metricas_prometheus(), content_type=TIPO_PROMETHEUS,
+                    headers={'Cache-Control': 'no-store'})
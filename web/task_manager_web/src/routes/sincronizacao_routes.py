@@ -0,0 +1,80 @@
+"""
+Rotas da API para sincronização incremental
+
+GET /api/sync?since=<versão> retorna apenas as tarefas, usuários, tags e
+times criados, alterados ou removidos após a versão informada (a 'version'
+da resposta anterior), para clientes que mantêm uma cópia local dos dados.
+Sem 'since', ou se o cliente ficou para trás além do registro de alterações,
+a resposta traz todas as entidades com "full": true.
+"""
+
+from flask import Blueprint, request, jsonify
+import sys
+import os
+
+# Adiciona o path do Task Manager
+task_manager_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))))
+sys.path.insert(0, task_manager_path)
+
+# Adiciona o diretório modules ao path
+modules_path = os.path.join(task_manager_path, 'modules')
+sys.path.insert(0, modules_path)
+
+try:
+    from modules.gerenciamento_tarefas import gt_sincronizar
+except ImportError as e:
+    print(f"Erro ao importar módulos do Task Manager: {e}")
+
+from src.utils import get_gt_system
+from src.routes.task_routes import tarefa_to_dict
+from src.routes.user_routes import usuario_to_dict
+from src.routes.tag_routes import tag_to_dict
+from src.routes.team_routes import time_to_dict
+
+sincronizacao_bp = Blueprint('sincronizacao', __name__)
+
+# Entidades da resposta: (chave no JSON, conversão da entidade)
+ENTIDADES_RESPOSTA = {
+    'task': ('tasks', tarefa_to_dict),
+    'user': ('users', usuario_to_dict),
+    'tag': ('tags', tag_to_dict),
+    'team': ('teams', time_to_dict)
+}
+
+@sincronizacao_bp.route('/sync', methods=['GET'])
+def sincronizar():
+    """Entidades criadas, alteradas ou removidas após ?since= (todas, sem ?since=)"""
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+
+        versao = request.args.get('since')
+        if versao is not None:
+            try:
+                versao = int(versao)
+            except ValueError:
+                return jsonify({'error': 'Parâmetro since deve ser um número inteiro'}), 400
+
+        resultado = gt_sincronizar(gt, versao)
+        if resultado is None:
+            return jsonify({'error': 'Falha ao sincronizar'}), 500
+
+        dados = {'version': resultado['versao'], 'full': resultado['completo']}
+        total = 0
+        for entidade, (chave, converter) in ENTIDADES_RESPOSTA.items():
+            alteracoes = resultado['entidades'][entidade]
+            dados[chave] = {
+                'upserted': [converter(e) for e in alteracoes['alteradas']],
+                'deleted': alteracoes['removidas']
+            }
+            total += len(alteracoes['alteradas']) + len(alteracoes['removidas'])
+
+        return jsonify({
+            'success': True,
+            'data': dados,
+            'count': total
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
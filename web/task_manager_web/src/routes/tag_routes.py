@@ -21,14 +21,18 @@ try:
         gt_registrar_tag, gt_listar_todas_tags
     )
     from modules.tag import (
-        tag_criar, tag_destruir, tag_to_dict, tag_from_dict,
+        tag_criar, tag_destruir, tag_remover, tag_to_dict, tag_from_dict,
         tag_get_id, tag_get_nome, tag_get_cor,
-        tag_set_nome, tag_set_cor, tag_listar_todas
+        tag_set_nome, tag_set_cor, tag_listar_todas,
+        tag_buscar_por_ids, tag_buscar_por_id, tag_versao
     )
 except ImportError as e:
     print(f"Erro ao importar módulos do Task Manager: {e}")
 
-from src.utils import get_gt_system
+from src.utils import (
+    get_gt_system, parse_ids, etag_recurso, ultima_modificacao,
+    com_validadores, resposta_nao_modificada, resposta_versionada, resposta_lookup
+)
 
 tag_bp = Blueprint('tags', __name__)
 
@@ -43,6 +47,28 @@ def tag_to_dict(tag):
         'cor': tag_get_cor(tag)
     }
 
+def dados_listagem():
+    """
+    Monta o corpo da listagem, restrito aos IDs de ?ids= se informado.
+    
+    Raises:
+        ValueError: Se ?ids= for inválido
+    """
+    # ?ids=1,2,3 restringe a listagem aos IDs informados (busca direta por ID)
+    ids = request.args.get('ids')
+    if ids:
+        tags = tag_buscar_por_ids(parse_ids(ids))
+    else:
+        # Usa a função do módulo tag diretamente
+        tags = tag_listar_todas()
+    tags_dict = [tag_to_dict(tag) for tag in tags]
+    
+    return {
+        'success': True,
+        'data': tags_dict,
+        'count': len(tags_dict)
+    }
+
 @tag_bp.route('/tags', methods=['GET'])
 def listar_tags():
     """Lista todas as tags"""
@@ -51,19 +77,21 @@ def listar_tags():
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        # Usa a função do módulo tag diretamente
-        tags = tag_listar_todas()
-        tags_dict = [tag_to_dict(tag) for tag in tags]
-        
-        return jsonify({
-            'success': True,
-            'data': tags_dict,
-            'count': len(tags_dict)
-        })
+        # A listagem só muda com a versão do registro (e com a query string);
+        # o JSON codificado fica em cache enquanto a versão não mudar
+        try:
+            return resposta_versionada('tags', (tag_versao(),), dados_listagem)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@tag_bp.route('/tags/lookup', methods=['POST'])
+def buscar_tags_por_ids():
+    """Obtém várias tags pelos IDs informados no corpo ({"ids": [...]})"""
+    return resposta_lookup(tag_buscar_por_ids, tag_to_dict)
+
 @tag_bp.route('/tags', methods=['POST'])
 def criar_tag():
     """Cria uma nova tag"""
@@ -108,17 +136,22 @@ def obter_tag(tag_id):
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        # Usa a função do módulo tag diretamente
-        tags = tag_listar_todas()
-        tag = next((t for t in tags if tag_get_id(t) == tag_id), None)
+        # Busca direta por ID
+        tag = tag_buscar_por_id(tag_id)
         
         if not tag:
             return jsonify({'error': 'Tag não encontrada'}), 404
         
-        return jsonify({
+        modificacao = ultima_modificacao(tag['data_modificacao'])
+        etag = etag_recurso('tags', tag_id, tag['data_modificacao'])
+        nao_modificada = resposta_nao_modificada(etag, modificacao)
+        if nao_modificada:
+            return nao_modificada
+        
+        return com_validadores(jsonify({
             'success': True,
             'data': tag_to_dict(tag)
-        })
+        }), etag, modificacao)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -180,7 +213,9 @@ def deletar_tag(tag_id):
         if not tag:
             return jsonify({'error': 'Tag não encontrada'}), 404
         
-        # Remove a tag (destrói a instância)
+        # Remove a tag do registro e destrói a instância (sem a remoção,
+        # o dicionário vazio continuaria registrado)
+        tag_remover(tag_id)
         tag_destruir(tag)
         
         return jsonify({
@@ -5,8 +5,10 @@ Este módulo contém todas as rotas relacionadas ao CRUD de tarefas
 e operações do sistema de gerenciamento.
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, Response, stream_with_context
 from datetime import datetime
+from itertools import islice
+import io
 import sys
 import os
 
@@ -20,41 +22,401 @@ sys.path.insert(0, modules_path)
 
 try:
     from modules.gerenciamento_tarefas import (
-        gt_criar_tarefa, gt_remover_tarefa, gt_listar_todas_tarefas,
+        gt_criar_tarefa, gt_remover_tarefa,
         gt_listar_todos_usuarios, gt_listar_todas_tags, gt_listar_todos_times,
-        gt_exportar_tarefas_csv
+        gt_exportar_tarefas_csv, gt_aplicar_lote_tarefas, gt_importar_tarefas,
+        FORMATOS_IMPORTACAO, gt_exportar_tarefas_fluxo, FORMATOS_EXPORTACAO,
+        gt_agregar_tarefas, AGRUPAMENTOS_AGREGACAO
     )
     from modules.tarefa import (
         tarefa_criar, tarefa_destruir, tarefa_to_dict, tarefa_from_dict,
         tarefa_get_id, tarefa_get_titulo, tarefa_get_descricao, tarefa_get_status,
         tarefa_get_usuario_responsavel_id, tarefa_get_prazo, tarefa_get_tags_ids,
         tarefa_set_status, tarefa_add_tag, tarefa_remover_tag, tarefa_listar_todas,
-        tarefa_set_titulo, tarefa_set_descricao, tarefa_set_prazo, StatusTarefa
+        tarefa_set_titulo, tarefa_set_descricao, tarefa_set_prazo, StatusTarefa,
+        tarefa_listar_ordenadas, CAMPOS_ORDENACAO, tarefa_buscar_por_ids,
+        tarefa_contagem_por_status, tarefa_serie_temporal, tarefa_buscar_por_id, tarefa_versao,
+        tarefa_adicionar_observador, tarefa_snapshot
     )
-    from modules.usuario import usuario_listar_todos, usuario_get_id
-    from modules.tag import tag_listar_todas, tag_get_id
-    from modules.team import time_listar_todos, time_get_id
+    from modules.agendador import agendador_tarefas_atrasadas, agendador_versao
+    from modules.usuario import (
+        usuario_get_id, usuario_buscar_por_id, usuario_buscar_por_ids,
+        usuario_get_nome, usuario_get_email, usuario_versao
+    )
+    from modules.tag import (
+        tag_listar_todas, tag_get_id, tag_buscar_por_id, tag_buscar_por_ids, tag_get_nome, tag_get_cor,
+        tag_versao
+    )
+    from modules.team import (
+        time_listar_todos, time_get_id, time_buscar_por_id, time_buscar_por_ids,
+        time_get_nome, time_get_membros, time_qtd_membros, time_versao
+    )
+    from config import MAX_OPERACOES_LOTE
 except ImportError as e:
     print(f"Erro ao importar módulos do Task Manager: {e}")
 
-from src.utils import get_gt_system
+from src.cache import cache_fragmento_obter, cache_fragmento_armazenar, cache_fragmento_descartar
+from src.utils import (
+    get_gt_system, parse_ids, etag_colecao, etag_recurso, ultima_modificacao,
+    com_validadores, resposta_nao_modificada, resposta_versionada, resposta_lookup,
+    json_compacto
+)
 
 task_bp = Blueprint('tasks', __name__)
 
-def tarefa_to_dict(tarefa):
-    """Converte uma tarefa para dicionário para JSON"""
-    if not tarefa:
+# Campos disponíveis para projeção via ?fields= e como cada um é obtido da tarefa
+_CAMPOS_TAREFA = {
+    'id': tarefa_get_id,
+    'titulo': tarefa_get_titulo,
+    'descricao': tarefa_get_descricao,
+    'status': lambda tarefa: _valor_status(tarefa_get_status(tarefa)),
+    'usuario_responsavel_id': tarefa_get_usuario_responsavel_id,
+    'prazo': lambda tarefa: _texto_prazo(tarefa_get_prazo(tarefa)),
+    'tags': tarefa_get_tags_ids
+}
+
+# Projeção completa (rotas de item) e projeção padrão das listagens (sem a descrição)
+CAMPOS_TAREFA = tuple(_CAMPOS_TAREFA)
+CAMPOS_LISTAGEM_PADRAO = tuple(campo for campo in CAMPOS_TAREFA if campo != 'descricao')
+
+def _valor_status(status):
+    """Retorna o valor serializável de um status (ou None)"""
+    return status.value if status else None
+
+def _texto_prazo(prazo):
+    """Retorna o prazo como string (ou None)"""
+    return str(prazo) if prazo else None
+
+def campos_da_requisicao(padrao):
+    """
+    Obtém a projeção de campos solicitada em ?fields=.
+    
+    Args:
+        padrao (tuple): Campos usados quando o parâmetro não é informado
+        
+    Returns:
+        tuple: Campos solicitados, sem repetições e na ordem de CAMPOS_TAREFA
+        (a mesma projeção sempre reaproveita o mesmo fragmento em cache)
+        
+    Raises:
+        ValueError: Se algum campo solicitado não existir
+    """
+    parametro = request.args.get('fields')
+    if not parametro:
+        return padrao
+    
+    campos = set()
+    for campo in parametro.split(','):
+        campo = campo.strip()
+        if not campo:
+            continue
+        if campo not in _CAMPOS_TAREFA:
+            raise ValueError(f'Campo inválido: {campo}')
+        campos.add(campo)
+    return tuple(campo for campo in CAMPOS_TAREFA if campo in campos) or padrao
+
+def _inteiro_da_requisicao(nome):
+    """Lê um parâmetro inteiro opcional da query string (ValueError se inválido)"""
+    valor = request.args.get(nome)
+    if valor is None or valor == '':
         return None
+    try:
+        return int(valor)
+    except ValueError:
+        raise ValueError(f'Parâmetro {nome} deve ser um inteiro')
+
+def tarefas_candidatas():
+    """
+    Obtém as tarefas candidatas da listagem: as de ?ids= (busca direta por ID),
+    as atrasadas com ?overdue=true (conjunto mantido pelo agendador, em ordem
+    de prazo e, no empate, de ID) ou todas.
+    
+    Returns:
+        List[Dict]: Tarefas candidatas
+        
+    Raises:
+        ValueError: Se ?ids= ou ?overdue= forem inválidos
+    """
+    ids = request.args.get('ids')
+    atrasadas = request.args.get('overdue')
+    if atrasadas is not None and atrasadas not in ('true', 'false'):
+        raise ValueError('Parâmetro overdue deve ser true ou false')
+    
+    if atrasadas == 'true':
+        ids_atrasadas = agendador_tarefas_atrasadas()
+        if ids:
+            ids_atrasadas.intersection_update(parse_ids(ids))
+        # O conjunto não tem ordem: ordena por ID e, de forma estável, por prazo
+        por_id = sorted(tarefa_buscar_por_ids(ids_atrasadas), key=tarefa_get_id)
+        return tarefa_listar_ordenadas('prazo', tarefas=por_id)
+    
+    if ids:
+        tarefas = tarefa_buscar_por_ids(parse_ids(ids))
+    else:
+        # Fotografia imutável: percorrida sem lock, sem bloquear as escritas
+        tarefas = tarefa_snapshot().tarefas
+    
+    if atrasadas == 'false':
+        ids_atrasadas = agendador_tarefas_atrasadas()
+        tarefas = [tarefa for tarefa in tarefas if tarefa_get_id(tarefa) not in ids_atrasadas]
+    return tarefas
+
+def filtrar_tarefas(tarefas):
+    """
+    Aplica os filtros da query string (?status=, ?usuario_responsavel_id=, ?tag=)
+    sobre as tarefas informadas.
+    
+    Args:
+        tarefas (Iterable[Dict]): Tarefas candidatas
+        
+    Returns:
+        Iterable[Dict]: Tarefas que satisfazem todos os filtros
+        
+    Raises:
+        ValueError: Se algum filtro for inválido
+    """
+    status = request.args.get('status')
+    if status:
+        try:
+            status_enum = StatusTarefa(status)
+        except ValueError:
+            raise ValueError('Status inválido')
+        tarefas = (t for t in tarefas if tarefa_get_status(t) == status_enum)
+    
+    usuario_id = _inteiro_da_requisicao('usuario_responsavel_id')
+    if usuario_id is not None:
+        tarefas = (t for t in tarefas if tarefa_get_usuario_responsavel_id(t) == usuario_id)
+    
+    tag_id = _inteiro_da_requisicao('tag')
+    if tag_id is not None:
+        tarefas = (t for t in tarefas if tag_id in t['tags'])
+    
+    return tarefas
+
+def ordenar_tarefas(tarefas):
+    """
+    Aplica ?sort=campo (ou -campo para ordem decrescente) e ?limit=N.
+    
+    Com limite, a ordenação seleciona as N primeiras em O(N log k) em vez de
+    ordenar todas as tarefas filtradas.
+    
+    Args:
+        tarefas (Iterable[Dict]): Tarefas já filtradas
+        
+    Returns:
+        Iterable[Dict]: Tarefas ordenadas e limitadas (sem ?sort=, são
+        consumidas sob demanda, na ordem original)
+        
+    Raises:
+        ValueError: Se a ordenação ou o limite forem inválidos
+    """
+    limite = _inteiro_da_requisicao('limit')
+    if limite is not None and limite < 0:
+        raise ValueError('Parâmetro limit não pode ser negativo')
+    
+    ordenacao = request.args.get('sort')
+    if not ordenacao:
+        return tarefas if limite is None else islice(tarefas, limite)
     
-    return {
-        'id': tarefa_get_id(tarefa),
-        'titulo': tarefa_get_titulo(tarefa),
-        'descricao': tarefa_get_descricao(tarefa),
-        'status': tarefa_get_status(tarefa).value if tarefa_get_status(tarefa) else None,
-        'usuario_responsavel_id': tarefa_get_usuario_responsavel_id(tarefa),
-        'prazo': str(tarefa_get_prazo(tarefa)) if tarefa_get_prazo(tarefa) else None,
-        'tags': tarefa_get_tags_ids(tarefa)
+    decrescente = ordenacao.startswith('-')
+    campo = ordenacao[1:] if decrescente else ordenacao
+    if campo not in CAMPOS_ORDENACAO:
+        raise ValueError(f'Ordenação inválida. Use: {", ".join(CAMPOS_ORDENACAO)}')
+    
+    return tarefa_listar_ordenadas(campo, limite, decrescente, tarefas)
+
+# Relações que podem ser incorporadas à resposta via ?expand= e a forma
+# resumida de cada objeto incorporado
+_RELACOES_TAREFA = {
+    'usuario': lambda usuario: {
+        'id': usuario_get_id(usuario),
+        'nome': usuario_get_nome(usuario),
+        'email': usuario_get_email(usuario)
+    },
+    'tags': lambda tag: {
+        'id': tag_get_id(tag),
+        'nome': tag_get_nome(tag),
+        'cor': tag_get_cor(tag)
+    },
+    'team': lambda time: {
+        'id': time_get_id(time),
+        'nome': time_get_nome(time),
+        'qtd_membros': time_qtd_membros(time)
     }
+}
+
+def relacoes_da_requisicao():
+    """
+    Obtém as relações solicitadas em ?expand= (usuario, tags, team).
+    
+    Returns:
+        tuple: Relações solicitadas, sem repetições (vazia se não informado)
+        
+    Raises:
+        ValueError: Se alguma relação solicitada não existir
+    """
+    relacoes = []
+    for relacao in request.args.get('expand', '').split(','):
+        relacao = relacao.strip()
+        if not relacao or relacao in relacoes:
+            continue
+        if relacao not in _RELACOES_TAREFA:
+            raise ValueError(f'Relação inválida: {relacao}. Use: {", ".join(_RELACOES_TAREFA)}')
+        relacoes.append(relacao)
+    return tuple(relacoes)
+
+# Versão de cada registro do qual dependem os objetos incorporados
+_VERSOES_RELACOES = {
+    'usuario': usuario_versao,
+    'tags': tag_versao,
+    'team': time_versao
+}
+
+def versoes_relacionadas(relacoes):
+    """
+    Obtém as versões dos registros de que a resposta depende além das tarefas:
+    os das relações incorporadas e, com ?overdue=, o conjunto de atrasadas
+    (que muda com o passar do tempo, sem alterar as tarefas).
+    
+    Args:
+        relacoes (tuple): Relações solicitadas em ?expand=
+        
+    Returns:
+        List[int]: Versões, em ordem fixa
+    """
+    versoes = [_VERSOES_RELACOES[relacao]() for relacao in relacoes]
+    if 'overdue' in request.args:
+        versoes.append(agendador_versao())
+    return versoes
+
+def _times_por_usuario():
+    """Monta o mapa ID do usuário -> IDs dos times de que participa"""
+    times_do_usuario = {}
+    for time in time_listar_todos():
+        if not time:
+            continue  # time já destruído
+        for usuario_id in time_get_membros(time):
+            times_do_usuario.setdefault(usuario_id, []).append(time_get_id(time))
+    return times_do_usuario
+
+def incluir_relacoes(tarefas, relacoes):
+    """
+    Resolve as relações das tarefas em uma única passagem e monta a seção
+    'included' da resposta, com cada objeto relacionado uma única vez.
+    
+    Com 'team', retorna também os IDs dos times do responsável de cada
+    tarefa (campo 'times' da tarefa na resposta), pois a tarefa não guarda o time.
+    
+    Args:
+        tarefas (List[Dict]): Tarefas da resposta
+        relacoes (tuple): Relações solicitadas em ?expand=
+        
+    Returns:
+        Tuple[Dict, Optional[List[List[int]]]]: Objetos incorporados por relação,
+        na ordem da primeira referência, e os times de cada tarefa (None sem 'team')
+    """
+    ids = {relacao: {} for relacao in relacoes}
+    times_do_usuario = _times_por_usuario() if 'team' in relacoes else None
+    times = [] if times_do_usuario is not None else None
+    
+    # Acesso direto aos campos: esta passagem percorre todas as tarefas da resposta
+    for tarefa in tarefas:
+        usuario_id = tarefa['usuario_responsavel_id']
+        if 'usuario' in ids:
+            ids['usuario'][usuario_id] = None
+        if 'tags' in ids:
+            ids['tags'].update(dict.fromkeys(tarefa['tags']))
+        if times is not None:
+            times.append(times_do_usuario.get(usuario_id, ()))
+            ids['team'].update(dict.fromkeys(times[-1]))
+    
+    # Usuários, tags e times já destruídos (dicionários vazios) ficam de fora
+    buscas = {'usuario': usuario_buscar_por_ids, 'tags': tag_buscar_por_ids, 'team': time_buscar_por_ids}
+    incluidos = {
+        relacao: [_RELACOES_TAREFA[relacao](objeto) for objeto in buscas[relacao](ids[relacao]) if objeto]
+        for relacao in relacoes
+    }
+    return incluidos, times
+
+def _descartar_fragmentos(evento, tarefa):
+    """Observador do módulo Tarefa: descarta os fragmentos de tarefas alteradas, removidas ou recarregadas"""
+    if evento == 'recarregadas':
+        cache_fragmento_descartar()
+    elif evento != 'registrada':
+        cache_fragmento_descartar(tarefa['id'])
+
+tarefa_adicionar_observador(_descartar_fragmentos)
+
+def fragmento_tarefa(tarefa, campos):
+    """
+    Obtém a tarefa codificada em JSON na projeção informada, reaproveitando o
+    fragmento armazenado enquanto a data de modificação da tarefa não mudar.
+    
+    Args:
+        tarefa (Dict): Tarefa
+        campos (tuple): Projeção de campos
+        
+    Returns:
+        bytes: Fragmento JSON da tarefa
+    """
+    # A data é lida antes de codificar: uma alteração concorrente apenas
+    # deixa o fragmento armazenado desatualizado para a próxima consulta
+    modificacao = tarefa['data_modificacao']
+    fragmento = cache_fragmento_obter(tarefa['id'], campos, modificacao)
+    if fragmento is None:
+        fragmento = json_compacto(tarefa_to_dict(tarefa, campos))
+        cache_fragmento_armazenar(tarefa['id'], campos, modificacao, fragmento)
+    return fragmento
+
+def dados_listagem(tarefas, campos, relacoes, **extras):
+    """
+    Monta o corpo JSON de uma listagem de tarefas, com a seção 'included'
+    quando há relações solicitadas.
+    
+    As tarefas não são serializadas a cada requisição: o corpo é a
+    concatenação dos fragmentos codificados de cada tarefa.
+    
+    Args:
+        tarefas (Iterable[Dict]): Tarefas da resposta
+        campos (tuple): Projeção de campos
+        relacoes (tuple): Relações solicitadas em ?expand=
+        **extras: Campos adicionais da resposta
+        
+    Returns:
+        bytes: Corpo da resposta codificado
+    """
+    tarefas = list(tarefas)
+    resposta = {
+        'success': True,
+        'count': len(tarefas)
+    }
+    resposta.update(extras)
+    times = None
+    if relacoes:
+        resposta['included'], times = incluir_relacoes(tarefas, relacoes)
+    
+    fragmentos = [fragmento_tarefa(tarefa, campos) for tarefa in tarefas]
+    if times is not None:
+        # Os times vêm do responsável, não da tarefa: são acrescentados ao
+        # fragmento, codificando cada lista de times (uma por responsável) uma vez
+        codificados = {}
+        for ids in times:
+            if id(ids) not in codificados:
+                codificados[id(ids)] = json_compacto(ids)
+        fragmentos = [
+            b'%s,"times":%s}' % (fragmento[:-1], codificados[id(ids)])
+            for fragmento, ids in zip(fragmentos, times)
+        ]
+    
+    envelope = json_compacto(resposta)
+    return b''.join((envelope[:-1], b',"data":[', b','.join(fragmentos), b']}\n'))
+
+def tarefa_to_dict(tarefa, campos=CAMPOS_TAREFA):
+    """Converte uma tarefa para dicionário para JSON, contendo apenas os campos informados"""
+    if not tarefa:
+        return None
+    
+    return {campo: _CAMPOS_TAREFA[campo](tarefa) for campo in campos}
 
 @task_bp.route('/tasks', methods=['GET'])
 def listar_tarefas():
@@ -64,19 +426,33 @@ def listar_tarefas():
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        # Usa a função do módulo tarefa diretamente
-        tarefas = tarefa_listar_todas()
-        tarefas_dict = [tarefa_to_dict(tarefa) for tarefa in tarefas]
+        def montar():
+            # ?ids=1,2,3 restringe os candidatos aos IDs informados (busca direta por ID)
+            tarefas = tarefas_candidatas()
+            tarefas = ordenar_tarefas(filtrar_tarefas(tarefas))
+            return dados_listagem(tarefas, campos, relacoes)
         
-        return jsonify({
-            'success': True,
-            'data': tarefas_dict,
-            'count': len(tarefas_dict)
-        })
+        try:
+            campos = campos_da_requisicao(CAMPOS_LISTAGEM_PADRAO)
+            relacoes = relacoes_da_requisicao()
+            # 304 ou JSON do cache, sem filtrar nem serializar, enquanto as versões não mudarem
+            versoes = (tarefa_versao(), *versoes_relacionadas(relacoes))
+            return resposta_versionada('tasks', versoes, montar)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@task_bp.route('/tasks/lookup', methods=['POST'])
+def buscar_tarefas_por_ids():
+    """Obtém várias tarefas pelos IDs informados no corpo ({"ids": [...]})"""
+    def montar(tarefas, ausentes):
+        campos = campos_da_requisicao(CAMPOS_LISTAGEM_PADRAO)
+        return dados_listagem(tarefas, campos, relacoes_da_requisicao(), missing=ausentes)
+    
+    return resposta_lookup(tarefa_buscar_por_ids, montar=montar)
+
 @task_bp.route('/tasks', methods=['POST'])
 def criar_tarefa():
     """Cria uma nova tarefa"""
@@ -96,8 +472,7 @@ def criar_tarefa():
                 return jsonify({'error': f'Campo obrigatório: {field}'}), 400
         
         # Busca o usuário responsável
-        usuarios = usuario_listar_todos()
-        usuario = next((u for u in usuarios if usuario_get_id(u) == data['usuario_responsavel_id']), None)
+        usuario = usuario_buscar_por_id(data['usuario_responsavel_id'])
         
         if not usuario:
             return jsonify({'error': 'Usuário responsável não encontrado'}), 404
@@ -111,17 +486,15 @@ def criar_tarefa():
         # Busca o time (opcional)
         time = None
         if 'time_id' in data:
-            times = time_listar_todos()
-            time = next((t for t in times if time_get_id(t) == data['time_id']), None)
+            time = time_buscar_por_id(data['time_id'])
             if not time:
                 return jsonify({'error': 'Time não encontrado'}), 404
         
         # Busca as tags (opcional)
         tags = []
         if 'tags' in data and isinstance(data['tags'], list):
-            todas_tags = tag_listar_todas()
             for tag_id in data['tags']:
-                tag = next((t for t in todas_tags if tag_get_id(t) == tag_id), None)
+                tag = tag_buscar_por_id(tag_id)
                 if tag:
                     tags.append(tag)
         
@@ -141,6 +514,43 @@ def criar_tarefa():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@task_bp.route('/tasks/bulk', methods=['POST'])
+def operacoes_em_lote():
+    """
+    Aplica um lote de criações, alterações e remoções de tarefas.
+    
+    Corpo: {"operations": [{"op": "create"|"update"|"delete", ...}, ...]}
+    Com ?atomic=true nada é aplicado se alguma operação for inválida.
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        data = request.get_json()
+        operacoes = data.get('operations') if isinstance(data, dict) else data
+        if not isinstance(operacoes, list):
+            return jsonify({'error': 'Campo obrigatório: operations (lista de operações)'}), 400
+        
+        if len(operacoes) > MAX_OPERACOES_LOTE:
+            return jsonify({'error': f'Lote muito grande (máximo de {MAX_OPERACOES_LOTE} operações)'}), 413
+        
+        atomico = request.args.get('atomic', '').lower() in ('1', 'true')
+        resultados = gt_aplicar_lote_tarefas(gt, operacoes, atomico)
+        if resultados is None:
+            return jsonify({'error': 'Falha ao aplicar lote'}), 500
+        
+        falhas = sum(1 for resultado in resultados if not resultado['success'])
+        return jsonify({
+            'success': falhas == 0,
+            'data': resultados,
+            'count': len(resultados),
+            'errors': falhas
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @task_bp.route('/tasks/<int:task_id>', methods=['GET'])
 def obter_tarefa(task_id):
     """Obtém uma tarefa específica"""
@@ -149,17 +559,35 @@ def obter_tarefa(task_id):
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        # Usa a função do módulo tarefa diretamente
-        tarefas = tarefa_listar_todas()
-        tarefa = next((t for t in tarefas if tarefa_get_id(t) == task_id), None)
+        try:
+            campos = campos_da_requisicao(CAMPOS_TAREFA)
+            relacoes = relacoes_da_requisicao()
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        # Busca direta por ID
+        tarefa = tarefa_buscar_por_id(task_id)
         
         if not tarefa:
             return jsonify({'error': 'Tarefa não encontrada'}), 404
         
-        return jsonify({
+        # Com relações incorporadas, a data de modificação da tarefa não basta
+        # como Last-Modified; o ETag inclui as versões dos registros relacionados
+        modificacao = None if relacoes else ultima_modificacao(tarefa['data_modificacao'])
+        etag = etag_recurso('tasks', task_id, tarefa['data_modificacao'], *versoes_relacionadas(relacoes))
+        nao_modificada = resposta_nao_modificada(etag, modificacao)
+        if nao_modificada:
+            return nao_modificada
+        
+        resposta = {
             'success': True,
-            'data': tarefa_to_dict(tarefa)
-        })
+            'data': tarefa_to_dict(tarefa, campos)
+        }
+        if relacoes:
+            resposta['included'], times = incluir_relacoes([tarefa], relacoes)
+            if times is not None:
+                resposta['data']['times'] = times[0]
+        return com_validadores(jsonify(resposta), etag, modificacao)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -342,20 +770,65 @@ def listar_tarefas_por_status(status):
         except:
             return jsonify({'error': 'Status inválido'}), 400
         
-        # Lista todas as tarefas e filtra por status
-        tarefas = tarefa_listar_todas()
-        tarefas_status = [
-            tarefa for tarefa in tarefas 
-            if tarefa_get_status(tarefa) == status_enum
-        ]
+        def montar():
+            # Filtra a fotografia das tarefas por status
+            tarefas = tarefa_snapshot().tarefas
+            tarefas_status = [
+                tarefa for tarefa in tarefas 
+                if tarefa_get_status(tarefa) == status_enum
+            ]
+            return dados_listagem(ordenar_tarefas(tarefas_status), campos, relacoes)
         
-        tarefas_dict = [tarefa_to_dict(tarefa) for tarefa in tarefas_status]
+        try:
+            campos = campos_da_requisicao(CAMPOS_LISTAGEM_PADRAO)
+            relacoes = relacoes_da_requisicao()
+            versoes = (tarefa_versao(), *versoes_relacionadas(relacoes))
+            return resposta_versionada(f'tasks-{status}', versoes, montar)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        return jsonify({
-            'success': True,
-            'data': tarefas_dict,
-            'count': len(tarefas_dict)
-        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Tipo de conteúdo de cada formato da exportação em fluxo
+_MIMETYPES_EXPORTACAO = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8'
+}
+
+@task_bp.route('/tasks/export', methods=['GET'])
+def exportar_tarefas_fluxo():
+    """
+    Exporta tarefas em CSV ou JSONL (?format=csv|jsonl) como resposta em fluxo.
+    
+    Aceita os mesmos filtros e ordenação da listagem; as linhas são geradas
+    à medida que são enviadas, sem arquivo intermediário no servidor.
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        formato = request.args.get('format', 'csv')
+        if formato not in FORMATOS_EXPORTACAO:
+            return jsonify({'error': f'Formato inválido. Use ?format={"|".join(FORMATOS_EXPORTACAO)}'}), 400
+        
+        try:
+            tarefas = tarefas_candidatas()
+            tarefas = ordenar_tarefas(filtrar_tarefas(tarefas))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        blocos = gt_exportar_tarefas_fluxo(gt, formato, tarefas)
+        if blocos is None:
+            return jsonify({'error': 'Falha ao exportar tarefas'}), 500
+        
+        nome_arquivo = f'tarefas_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{formato}'
+        return Response(
+            stream_with_context(blocos),
+            content_type=_MIMETYPES_EXPORTACAO[formato],
+            headers={'Content-Disposition': f'attachment; filename="{nome_arquivo}"'}
+        )
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -387,6 +860,52 @@ def exportar_tarefas():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@task_bp.route('/tasks/import', methods=['POST'])
+def importar_tarefas():
+    """
+    Importa tarefas de um arquivo JSONL ou CSV.
+    
+    Aceita upload multipart (campo 'arquivo') ou o conteúdo no corpo da
+    requisição; o formato vem de ?format= ou da extensão do arquivo enviado.
+    O conteúdo é lido sob demanda e registrado em lotes.
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        arquivo = request.files.get('arquivo') or request.files.get('file')
+        formato = request.args.get('format')
+        if arquivo is not None:
+            fluxo = arquivo.stream
+            if not formato and arquivo.filename:
+                extensao = os.path.splitext(arquivo.filename)[1].lower().lstrip('.')
+                formato = 'jsonl' if extensao in ('jsonl', 'ndjson') else extensao
+        else:
+            fluxo = request.stream
+        
+        if formato not in FORMATOS_IMPORTACAO:
+            return jsonify({'error': f'Formato inválido. Use ?format={"|".join(FORMATOS_IMPORTACAO)}'}), 400
+        
+        tamanho_lote = request.args.get('batch_size', type=int)
+        linhas = io.TextIOWrapper(fluxo, encoding='utf-8-sig', newline='')
+        if tamanho_lote:
+            resumo = gt_importar_tarefas(gt, linhas, formato, tamanho_lote)
+        else:
+            resumo = gt_importar_tarefas(gt, linhas, formato)
+        
+        if resumo is None:
+            return jsonify({'error': 'Falha ao importar tarefas'}), 500
+        
+        return jsonify({
+            'success': resumo['failed'] == 0,
+            'data': resumo,
+            'message': f"{resumo['imported']} tarefas importadas"
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @task_bp.route('/tasks/stats', methods=['GET'])
 def estatisticas_tarefas():
     """Retorna estatísticas das tarefas"""
@@ -395,29 +914,92 @@ def estatisticas_tarefas():
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        tarefas = gt_listar_todas_tarefas(gt)
+        etag = etag_colecao('tasks-stats', tarefa_versao())
+        nao_modificada = resposta_nao_modificada(etag)
+        if nao_modificada:
+            return nao_modificada
         
-        # Conta por status
-        stats = {
-            'total': len(tarefas),
-            'aberta': 0,
-            'em_progresso': 0,
-            'concluida': 0,
-            'cancelada': 0
-        }
+        # Conta por status (contagens mantidas pelo módulo Tarefa)
+        contagens = tarefa_contagem_por_status()
+        stats = {'total': sum(contagens.values())}
+        for status, quantidade in contagens.items():
+            stats[status.value] = quantidade
         
-        for tarefa in tarefas:
-            status = tarefa_get_status(tarefa)
-            if status:
-                status_value = status.value
-                if status_value in stats:
-                    stats[status_value] += 1
+        return com_validadores(jsonify({
+            'success': True,
+            'data': stats
+        }), etag)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@task_bp.route('/tasks/aggregate', methods=['GET'])
+def agregar_tarefas():
+    """
+    Conta as tarefas agrupadas pelos critérios de ?group_by= (separados por vírgula),
+    ex.: ?group_by=status,tag ou ?group_by=team,week(prazo)
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        agrupamentos = [a.strip() for a in request.args.get('group_by', '').split(',') if a.strip()]
+        if not agrupamentos:
+            return jsonify({'error': f'Parâmetro obrigatório: group_by ({", ".join(AGRUPAMENTOS_AGREGACAO)})'}), 400
+        
+        invalidos = [a for a in agrupamentos if a not in AGRUPAMENTOS_AGREGACAO]
+        if invalidos or len(set(agrupamentos)) != len(agrupamentos):
+            return jsonify({'error': f'Agrupamento inválido. Use: {", ".join(AGRUPAMENTOS_AGREGACAO)}'}), 400
+        
+        grupos = gt_agregar_tarefas(gt, agrupamentos)
+        if grupos is None:
+            return jsonify({'error': 'Falha ao agregar tarefas'}), 500
         
         return jsonify({
             'success': True,
-            'data': stats
+            'data': grupos,
+            'count': len(grupos),
+            'group_by': agrupamentos
         })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@task_bp.route('/tasks/timeseries', methods=['GET'])
+def serie_temporal_tarefas():
+    """
+    Retorna a quantidade de tarefas criadas ou concluídas por intervalo
+    (?metric=created|completed&interval=hour|day&from=&to=, datas em ISO 8601)
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        metrica = request.args.get('metric', 'created')
+        intervalo = request.args.get('interval', 'day')
+        try:
+            periodo = {}
+            for parametro in ('from', 'to'):
+                valor = request.args.get(parametro)
+                if valor:
+                    try:
+                        periodo[parametro] = datetime.fromisoformat(valor.replace('Z', '+00:00'))
+                    except ValueError:
+                        raise ValueError(f'Data inválida em {parametro}: {valor}')
+            serie = tarefa_serie_temporal(metrica, intervalo, periodo.get('from'), periodo.get('to'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return jsonify({
+            'success': True,
+            'data': serie,
+            'count': len(serie),
+            'metric': metrica,
+            'interval': intervalo,
+            'total': sum(ponto['count'] for ponto in serie)
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
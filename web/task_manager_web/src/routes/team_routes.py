@@ -21,15 +21,19 @@ try:
         gt_registrar_time, gt_listar_todos_times
     )
     from modules.team import (
-        time_criar, time_destruir, time_to_dict, time_from_dict,
+        time_criar, time_destruir, time_remover, time_to_dict, time_from_dict,
         time_get_id, time_get_nome, time_get_membros, time_qtd_membros,
-        time_set_nome, time_adicionar_usuario, time_remover_usuario, time_listar_todos
+        time_set_nome, time_adicionar_usuario, time_remover_usuario, time_listar_todos,
+        time_buscar_por_ids, time_buscar_por_id, time_versao
     )
     from modules.usuario import usuario_listar_todos, usuario_get_id
 except ImportError as e:
     print(f"Erro ao importar módulos do Task Manager: {e}")
 
-from src.utils import get_gt_system
+from src.utils import (
+    get_gt_system, parse_ids, etag_recurso, ultima_modificacao,
+    com_validadores, resposta_nao_modificada, resposta_versionada, resposta_lookup
+)
 
 team_bp = Blueprint('teams', __name__)
 
@@ -45,6 +49,28 @@ def time_to_dict(time):
         'qtd_membros': time_qtd_membros(time)
     }
 
+def dados_listagem():
+    """
+    Monta o corpo da listagem, restrito aos IDs de ?ids= se informado.
+    
+    Raises:
+        ValueError: Se ?ids= for inválido
+    """
+    # ?ids=1,2,3 restringe a listagem aos IDs informados (busca direta por ID)
+    ids = request.args.get('ids')
+    if ids:
+        times = time_buscar_por_ids(parse_ids(ids))
+    else:
+        # Usa a função do módulo team diretamente
+        times = time_listar_todos()
+    times_dict = [time_to_dict(time) for time in times]
+    
+    return {
+        'success': True,
+        'data': times_dict,
+        'count': len(times_dict)
+    }
+
 @team_bp.route('/teams', methods=['GET'])
 def listar_times():
     """Lista todos os times"""
@@ -53,19 +79,21 @@ def listar_times():
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        # Usa a função do módulo team diretamente
-        times = time_listar_todos()
-        times_dict = [time_to_dict(time) for time in times]
-        
-        return jsonify({
-            'success': True,
-            'data': times_dict,
-            'count': len(times_dict)
-        })
+        # A listagem só muda com a versão do registro (e com a query string);
+        # o JSON codificado fica em cache enquanto a versão não mudar
+        try:
+            return resposta_versionada('teams', (time_versao(),), dados_listagem)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@team_bp.route('/teams/lookup', methods=['POST'])
+def buscar_times_por_ids():
+    """Obtém vários times pelos IDs informados no corpo ({"ids": [...]})"""
+    return resposta_lookup(time_buscar_por_ids, time_to_dict)
+
 @team_bp.route('/teams', methods=['POST'])
 def criar_time():
     """Cria um novo time"""
@@ -110,17 +138,22 @@ def obter_time(team_id):
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        # Usa a função do módulo team diretamente
-        times = time_listar_todos()
-        time = next((t for t in times if time_get_id(t) == team_id), None)
+        # Busca direta por ID
+        time = time_buscar_por_id(team_id)
         
         if not time:
             return jsonify({'error': 'Time não encontrado'}), 404
         
-        return jsonify({
+        modificacao = ultima_modificacao(time['data_modificacao'])
+        etag = etag_recurso('teams', team_id, time['data_modificacao'])
+        nao_modificada = resposta_nao_modificada(etag, modificacao)
+        if nao_modificada:
+            return nao_modificada
+        
+        return com_validadores(jsonify({
             'success': True,
             'data': time_to_dict(time)
-        })
+        }), etag, modificacao)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -174,7 +207,9 @@ def deletar_time(team_id):
         if not time:
             return jsonify({'error': 'Time não encontrado'}), 404
         
-        # Remove o time (destrói a instância)
+        # Remove o time do registro e destrói a instância (sem a remoção,
+        # o dicionário vazio continuaria registrado)
+        time_remover(team_id)
         time_destruir(time)
         
         return jsonify({
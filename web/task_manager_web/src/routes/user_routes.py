@@ -21,14 +21,18 @@ try:
         gt_registrar_usuario, gt_listar_todos_usuarios
     )
     from modules.usuario import (
-        usuario_criar, usuario_destruir, usuario_to_dict, usuario_from_dict,
+        usuario_criar, usuario_destruir, usuario_remover, usuario_to_dict, usuario_from_dict,
         usuario_get_id, usuario_get_nome, usuario_get_email,
-        usuario_set_nome, usuario_set_email, usuario_listar_todos
+        usuario_set_nome, usuario_set_email, usuario_listar_todos,
+        usuario_buscar_por_ids, usuario_buscar_por_id, usuario_versao
     )
 except ImportError as e:
     print(f"Erro ao importar módulos do Task Manager: {e}")
 
-from src.utils import get_gt_system
+from src.utils import (
+    get_gt_system, parse_ids, etag_recurso, ultima_modificacao,
+    com_validadores, resposta_nao_modificada, resposta_versionada, resposta_lookup
+)
 
 user_bp = Blueprint('users', __name__)
 
@@ -47,6 +51,28 @@ def usuario_to_dict(usuario):
         'email': usuario_get_email(usuario)
     }
 
+def dados_listagem():
+    """
+    Monta o corpo da listagem, restrito aos IDs de ?ids= se informado.
+    
+    Raises:
+        ValueError: Se ?ids= for inválido
+    """
+    # ?ids=1,2,3 restringe a listagem aos IDs informados (busca direta por ID)
+    ids = request.args.get('ids')
+    if ids:
+        usuarios = usuario_buscar_por_ids(parse_ids(ids))
+    else:
+        # Usa a função do módulo usuario diretamente
+        usuarios = usuario_listar_todos()
+    usuarios_dict = [usuario_to_dict(usuario) for usuario in usuarios]
+    
+    return {
+        'success': True,
+        'data': usuarios_dict,
+        'count': len(usuarios_dict)
+    }
+
 @user_bp.route('/users', methods=['GET'])
 def listar_usuarios():
     """Lista todos os usuários"""
@@ -55,19 +81,21 @@ def listar_usuarios():
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        # Usa a função do módulo usuario diretamente
-        usuarios = usuario_listar_todos()
-        usuarios_dict = [usuario_to_dict(usuario) for usuario in usuarios]
-        
-        return jsonify({
-            'success': True,
-            'data': usuarios_dict,
-            'count': len(usuarios_dict)
-        })
+        # A listagem só muda com a versão do registro (e com a query string);
+        # o JSON codificado fica em cache enquanto a versão não mudar
+        try:
+            return resposta_versionada('users', (usuario_versao(),), dados_listagem)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@user_bp.route('/users/lookup', methods=['POST'])
+def buscar_usuarios_por_ids():
+    """Obtém vários usuários pelos IDs informados no corpo ({"ids": [...]})"""
+    return resposta_lookup(usuario_buscar_por_ids, usuario_to_dict)
+
 @user_bp.route('/users', methods=['POST'])
 def criar_usuario():
     """Cria um novo usuário"""
@@ -112,17 +140,22 @@ def obter_usuario(user_id):
         if gt is None:
             return jsonify({'error': 'Sistema não inicializado'}), 500
         
-        # Usa a função do módulo usuario diretamente
-        usuarios = usuario_listar_todos()
-        usuario = next((u for u in usuarios if usuario_get_id(u) == user_id), None)
+        # Busca direta por ID
+        usuario = usuario_buscar_por_id(user_id)
         
         if not usuario:
             return jsonify({'error': 'Usuário não encontrado'}), 404
         
-        return jsonify({
+        modificacao = ultima_modificacao(usuario['data_modificacao'])
+        etag = etag_recurso('users', user_id, usuario['data_modificacao'])
+        nao_modificada = resposta_nao_modificada(etag, modificacao)
+        if nao_modificada:
+            return nao_modificada
+        
+        return com_validadores(jsonify({
             'success': True,
             'data': usuario_to_dict(usuario)
-        })
+        }), etag, modificacao)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -184,7 +217,9 @@ def deletar_usuario(user_id):
         if not usuario:
             return jsonify({'error': 'Usuário não encontrado'}), 404
         
-        # Remove o usuário (destrói a instância)
+        # Remove o usuário do registro e destrói a instância (sem a remoção,
+        # o dicionário vazio continuaria registrado)
+        usuario_remover(user_id)
         usuario_destruir(usuario)
         
         return jsonify({
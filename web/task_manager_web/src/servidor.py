@@ -0,0 +1,121 @@
+"""
+Servidor HTTP de produção da API
+
+Substitui o servidor de desenvolvimento do Flask (app.run com debug e
+recarregador) por um servidor WSGI com um pool fixo de threads: cada conexão
+é atendida por uma thread do pool, de modo que requisições de leitura são
+processadas em paralelo sem criar uma thread por conexão.
+
+As estruturas encapsuladas dos módulos são protegidas por locks de leitura e
+escrita (LockLeituraEscrita), o que permite atender as requisições em threads.
+
+Funções principais:
+- servidor_criar: Cria o servidor com o pool de threads
+- servidor_executar: Executa o servidor até SIGINT/SIGTERM
+"""
+
+import signal
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+# Adiciona o diretório raiz do Task Manager ao path
+task_manager_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if task_manager_path not in sys.path:
+    sys.path.insert(0, task_manager_path)
+
+from config import THREADS_SERVIDOR_WEB
+from utils import log_operacao
+from modules.eventos import eventos_finalizar
+
+__all__ = [
+    "servidor_criar",
+    "servidor_executar"
+]
+
+class _Requisicao(WSGIRequestHandler):
+    """Atende uma requisição por conexão, liberando a thread do pool ao final."""
+    protocol_version = "HTTP/1.0"
+
+class _ServidorPool(BaseWSGIServer):
+    """Servidor WSGI que atende as conexões em um pool fixo de threads."""
+    multithread = True
+
+    def __init__(self, host, port, app, threads, fd=None):
+        self._pool = None
+        super().__init__(host, port, app, handler=_Requisicao, fd=fd)
+        self.threads = threads
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="http")
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._atender, request, client_address)
+
+    def _atender(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        # Com fd, o construtor fecha o socket criado por padrão antes de haver pool
+        if self._pool is not None:
+            # Encerra os fluxos de eventos abertos: a espera pelo pool não
+            # depende da duração das conexões SSE
+            eventos_finalizar()
+            self._pool.shutdown(wait=True)
+
+def servidor_criar(app, host: str = '0.0.0.0', port: int = 5001, threads: int = THREADS_SERVIDOR_WEB,
+                   fd: Optional[int] = None) -> BaseWSGIServer:
+    """
+    Cria o servidor de produção para a aplicação.
+    
+    Args:
+        app: Aplicação WSGI (Flask)
+        host (str): Endereço de escuta
+        port (int): Porta de escuta (0 escolhe uma porta livre)
+        threads (int): Quantidade de threads do pool
+        fd (int, optional): Socket já aberto e em escuta (herdado no modo pré-fork)
+    
+    Returns:
+        BaseWSGIServer: Servidor criado (use serve_forever e server_close)
+    
+    Raises:
+        ValueError: Se a quantidade de threads for menor que 1
+    """
+    if threads < 1:
+        raise ValueError("A quantidade de threads deve ser pelo menos 1")
+    return _ServidorPool(host, port, app, threads, fd)
+
+def servidor_executar(app, host: str = '0.0.0.0', port: int = 5001, threads: int = THREADS_SERVIDOR_WEB) -> None:
+    """
+    Executa o servidor de produção até receber SIGINT ou SIGTERM.
+    
+    O encerramento aguarda as requisições em andamento; a finalização do
+    sistema GT (salvamento dos dados) fica a cargo do atexit da aplicação.
+    
+    Args:
+        app: Aplicação WSGI (Flask)
+        host (str): Endereço de escuta
+        port (int): Porta de escuta
+        threads (int): Quantidade de threads do pool
+    """
+    servidor = servidor_criar(app, host, port, threads)
+
+    def encerrar(sinal, quadro):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, encerrar)
+    
+    log_operacao("Servidor", "Iniciado", f"http://{host}:{servidor.server_port}, Threads: {threads}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        log_operacao("Servidor", "Encerrado")
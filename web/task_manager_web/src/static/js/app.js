@@ -8,6 +8,12 @@
 // Configuração da API
 const API_BASE_URL = '/api';
 
+// Campos das tarefas usados pelas listagens (a API omite a descrição por padrão)
+const TASK_LIST_FIELDS = 'id,titulo,descricao,status,usuario_responsavel_id,prazo,tags';
+
+// Relações incorporadas pela API à listagem de tarefas (evita buscar usuários, tags e times)
+const TASK_LIST_EXPAND = 'usuario,tags,team';
+
 // Estado global da aplicação
 let appState = {
     currentSection: 'dashboard',
@@ -15,6 +21,12 @@ let appState = {
     users: [],
     teams: [],
     tags: [],
+    // Objetos incorporados à listagem de tarefas (?expand=), indexados por ID
+    included: {
+        usuario: {},
+        tags: {},
+        team: {}
+    },
     stats: {},
     selectedTags: [],
     activeFilters: {
@@ -100,9 +112,24 @@ const api = {
         }
     },
     
+    // Executa várias leituras em uma única requisição (sobre o mesmo estado dos dados)
+    async batch(paths) {
+        const response = await api.request('/batch', {
+            method: 'POST',
+            body: JSON.stringify(paths.map(path => ({ method: 'GET', path: `${API_BASE_URL}${path}` })))
+        });
+        
+        return response.data.map(result => {
+            if (result.status >= 400) {
+                throw new Error((result.body && result.body.error) || 'Erro na requisição');
+            }
+            return result.body;
+        });
+    },
+    
     // Tasks
     tasks: {
-        list: () => api.request('/tasks'),
+        list: (expand = '') => api.request(`/tasks?fields=${TASK_LIST_FIELDS}${expand ? `&expand=${expand}` : ''}`),
         create: (task) => api.request('/tasks', {
             method: 'POST',
             body: JSON.stringify(task)
@@ -291,13 +318,13 @@ async function loadSectionData(sectionName) {
 
 async function loadDashboardData() {
     try {
-        // Carrega todas as entidades necessárias
-        const [tasksResponse, usersResponse, teamsResponse, tagsResponse, statsResponse] = await Promise.all([
-            api.tasks.list(),
-            api.users.list(),
-            api.teams.list(),
-            api.tags.list(),
-            api.tasks.stats()
+        // Carrega todas as entidades necessárias em uma única requisição
+        const [tasksResponse, usersResponse, teamsResponse, tagsResponse, statsResponse] = await api.batch([
+            `/tasks?fields=${TASK_LIST_FIELDS}`,
+            '/users',
+            '/teams',
+            '/tags',
+            '/tasks/stats'
         ]);
         
         // Atualiza o estado apenas se os dados mudaram
@@ -346,18 +373,16 @@ async function loadDashboardData() {
 
 async function loadTasksData() {
     try {
-        // Carrega todas as entidades necessárias
-        const [tasksResponse, usersResponse, teamsResponse, tagsResponse] = await Promise.all([
-            api.tasks.list(),
-            api.users.list(),
-            api.teams.list(),
-            api.tags.list()
-        ]);
+        // Usuários, tags e times das tarefas vêm incorporados na própria resposta
+        const tasksResponse = await api.tasks.list(TASK_LIST_EXPAND);
         
         appState.tasks = tasksResponse.data || [];
-        appState.users = usersResponse.data || [];
-        appState.teams = teamsResponse.data || [];
-        appState.tags = tagsResponse.data || [];
+        const included = tasksResponse.included || {};
+        Object.keys(appState.included).forEach(relation => {
+            appState.included[relation] = Object.fromEntries(
+                (included[relation] || []).map(item => [item.id, item])
+            );
+        });
         
         // Popula filtros
         populateTaskFilters();
@@ -514,10 +539,10 @@ function renderTasks() {
             return false;
         }
         
-        // Filtro por time - temporariamente desabilitado até implementação no backend
-        // if (appState.activeFilters.team && task.time_id !== parseInt(appState.activeFilters.team)) {
-        //     return false;
-        // }
+        // Filtro por time (times do responsável, incorporados com expand=team)
+        if (appState.activeFilters.team && !(task.times || []).includes(parseInt(appState.activeFilters.team))) {
+            return false;
+        }
         
         return true;
     });
@@ -535,8 +560,8 @@ function renderTasks() {
     }
     
     container.innerHTML = filteredTasks.map(task => {
-        const user = appState.users.find(u => u.id === task.usuario_responsavel_id);
-        const taskTags = appState.tags.filter(tag => task.tags_ids && task.tags_ids.includes(tag.id));
+        const user = appState.included.usuario[task.usuario_responsavel_id];
+        const taskTags = (task.tags || []).map(tagId => appState.included.tags[tagId]).filter(Boolean);
         
         return `
             <div class="bg-white p-6 rounded-lg shadow card-hover">
@@ -701,7 +726,15 @@ function renderTags() {
 }
 
 // Modal Functions
-function openTaskModal() {
+async function openTaskModal() {
+    // As listas completas só são necessárias no formulário de criação
+    try {
+        await loadTaskFormData();
+    } catch (error) {
+        ui.showToast(`Erro ao carregar dados: ${error.message}`, 'error');
+        return;
+    }
+    
     // Popula selects
     populateTaskModal();
     document.getElementById('task-modal').classList.remove('hidden');
@@ -867,6 +900,18 @@ async function handleTagForm(event) {
 }
 
 // Helper Functions
+async function loadTaskFormData() {
+    const [usersResponse, teamsResponse, tagsResponse] = await Promise.all([
+        api.users.list(),
+        api.teams.list(),
+        api.tags.list()
+    ]);
+    
+    appState.users = usersResponse.data || [];
+    appState.teams = teamsResponse.data || [];
+    appState.tags = tagsResponse.data || [];
+}
+
 function populateTaskModal() {
     // Popula usuários
     const userSelect = document.getElementById('task-user');
@@ -895,17 +940,17 @@ function populateTaskModal() {
 }
 
 function populateTaskFilters() {
-    // Popula filtro de usuários
+    // Popula filtro de usuários (responsáveis das tarefas listadas)
     const userFilter = document.getElementById('user-filter');
     userFilter.innerHTML = '<option value="">Todos os Usuários</option>';
-    appState.users.forEach(user => {
+    Object.values(appState.included.usuario).forEach(user => {
         userFilter.innerHTML += `<option value="${user.id}">${user.nome}</option>`;
     });
     
     // Popula filtro de times
     const teamFilter = document.getElementById('team-filter');
     teamFilter.innerHTML = '<option value="">Todos os Times</option>';
-    appState.teams.forEach(team => {
+    Object.values(appState.included.team).forEach(team => {
         teamFilter.innerHTML += `<option value="${team.id}">${team.nome}</option>`;
     });
 }
@@ -1100,6 +1145,109 @@ async function viewUserTasks(userId) {
     }
 }
 
+// Fluxo de eventos de alteração (GET /api/events)
+// Cada evento traz a entidade, o ID, os campos alterados e a versão; as
+// listagens já carregadas são atualizadas sem baixar as coleções novamente.
+const EVENT_COLLECTIONS = {
+    task: 'tasks',
+    user: 'users',
+    team: 'teams',
+    tag: 'tags'
+};
+
+// Seções que exibem cada coleção
+const EVENT_SECTIONS = {
+    tasks: ['dashboard', 'tasks'],
+    users: ['dashboard', 'users'],
+    teams: ['dashboard', 'teams'],
+    tags: ['dashboard', 'tags']
+};
+
+let eventSource = null;
+
+// Debounce da renderização após uma sequência de eventos
+let eventRenderTimeout = null;
+
+function applyChangeEvent(change) {
+    const collection = EVENT_COLLECTIONS[change.entity];
+    if (!collection) {
+        return false;
+    }
+    
+    const items = appState[collection];
+    const index = items.findIndex(item => item.id === change.id);
+    if (change.op === 'deleted') {
+        if (index >= 0) {
+            items.splice(index, 1);
+        }
+    } else if (index >= 0) {
+        Object.assign(items[index], change.data);
+    } else {
+        items.push({ ...change.data });
+    }
+    
+    const item = items.find(item => item.id === change.id);
+    if (item && change.entity === 'team') {
+        item.qtd_membros = (item.membros || []).length;
+    }
+    if (item && change.entity === 'task' && !item.times) {
+        // Times do responsável (incorporados com expand=team) vêm de outra tarefa dele
+        const sibling = items.find(other => other !== item && other.usuario_responsavel_id === item.usuario_responsavel_id);
+        item.times = sibling ? sibling.times : [];
+    }
+    return EVENT_SECTIONS[collection].includes(appState.currentSection);
+}
+
+function renderCurrentSection() {
+    switch (appState.currentSection) {
+        case 'dashboard':
+            document.getElementById('total-tasks').textContent = appState.tasks.length;
+            document.getElementById('total-users').textContent = appState.users.length;
+            document.getElementById('total-teams').textContent = appState.teams.length;
+            document.getElementById('total-tags').textContent = appState.tags.length;
+            renderStatusChart();
+            renderRecentTasks();
+            break;
+        case 'tasks':
+            renderTasks();
+            break;
+        case 'users':
+            renderUsers();
+            break;
+        case 'teams':
+            renderTeams();
+            break;
+        case 'tags':
+            renderTags();
+            break;
+    }
+}
+
+function handleChangeEvent(message) {
+    const change = JSON.parse(message.data);
+    
+    // 'reset': eventos foram perdidos (conexão lenta ou reinício do servidor)
+    if (change.op === 'reset') {
+        loadSectionData(appState.currentSection);
+        return;
+    }
+    
+    if (applyChangeEvent(change)) {
+        clearTimeout(eventRenderTimeout);
+        eventRenderTimeout = setTimeout(renderCurrentSection, 100);
+    }
+}
+
+function connectChangeEvents() {
+    if (!window.EventSource || eventSource) {
+        return;
+    }
+    
+    // O navegador reconecta sozinho, enviando o Last-Event-ID recebido
+    eventSource = new EventSource(`${API_BASE_URL}/events`);
+    eventSource.onmessage = handleChangeEvent;
+}
+
 // Event Listeners
 document.addEventListener('DOMContentLoaded', function() {
     // Inicializa ícones Lucide
@@ -1128,6 +1276,7 @@ document.addEventListener('DOMContentLoaded', function() {
     // Carrega dados iniciais com pequeno delay para garantir DOM carregado
     setTimeout(() => {
         showSection('dashboard');
+        connectChangeEvents();
     }, 100);
 });
 
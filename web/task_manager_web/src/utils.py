@@ -1,4 +1,18 @@
-from flask import current_app
+from datetime import timezone
+import hashlib
+import os
+import time
+
+from flask import current_app, request, jsonify
+
+from src.cache import cache_resposta_obter, cache_resposta_armazenar
+from src.compressao import codificacao_aceita, comprimir
+from config import MIN_BYTES_COMPRESSAO
+from utils import log_operacao, LOG_AVISO
+
+# Identifica a instância do servidor nos ETags de coleções: as versões dos
+# registros recomeçam a cada inicialização e não podem ser confundidas entre execuções
+_INSTANCIA = f'{os.getpid():x}.{time.time_ns():x}'
 
 def get_gt_system():
     """
@@ -8,18 +22,233 @@ def get_gt_system():
         Dict ou None: Sistema GT em formato dicionário ou None se não estiver disponível
     """
     try:
-        # Obtém o sistema GT da configuração
         gt_system = current_app.config.get('GT_SYSTEM')
-        
-        # Debug: imprime informações sobre o estado
         if gt_system is None:
-            print(f"⚠️  GT_SYSTEM é None na configuração")
-            print(f"📋 Configurações disponíveis: {list(current_app.config.keys())}")
-        else:
-            print(f"✅ GT_SYSTEM encontrado: {type(gt_system)}")
-            
+            log_operacao("Web", "GT_SYSTEM ausente na configuração", nivel=LOG_AVISO)
         return gt_system
     except Exception as e:
         # Se não conseguir acessar current_app, retorna None
-        print(f"❌ Erro ao acessar current_app: {e}")
-        return None 
\ No newline at end of file
+        log_operacao("Web", "Erro ao acessar current_app", str(e))
+        return None
+
+def json_compacto(valor):
+    """
+    Codifica o valor em JSON sem espaços entre os itens, como o jsonify
+    (fora do modo de depuração), para os corpos montados já codificados.
+    
+    Args:
+        valor: Valor serializável pelo provedor JSON da aplicação
+        
+    Returns:
+        bytes: JSON codificado em UTF-8
+    """
+    return current_app.json.dumps(valor, separators=(',', ':')).encode('utf-8')
+
+def parse_ids(valores):
+    """
+    Converte IDs informados pelo cliente em uma lista de inteiros sem repetições.
+    
+    Args:
+        valores (str ou list): IDs separados por vírgula (query string) ou lista JSON
+        
+    Returns:
+        List[int]: IDs na ordem informada
+        
+    Raises:
+        ValueError: Se algum ID não for um inteiro
+    """
+    if isinstance(valores, str):
+        valores = [valor for valor in valores.split(',') if valor.strip()]
+    if not isinstance(valores, list):
+        raise ValueError('IDs devem ser uma lista')
+    
+    try:
+        return list(dict.fromkeys(int(valor) for valor in valores))
+    except (TypeError, ValueError):
+        raise ValueError('IDs devem ser inteiros')
+
+def resposta_lookup(buscar, converter=None, montar=None):
+    """
+    Atende uma rota POST /<coleção>/lookup: obtém as entidades dos IDs
+    informados no corpo ({"ids": [...]}) e lista em 'missing' os não encontrados.
+    
+    Args:
+        buscar (Callable[[List[int]], List[Dict]]): Busca por IDs do registro (ex.: usuario_buscar_por_ids)
+        converter (Callable[[Dict], Dict], optional): Converte cada entidade para o
+            corpo padrão ({'success', 'data', 'count', 'missing'})
+        montar (Callable[[List[Dict], List[int]], Dict ou bytes], optional): Monta o
+            corpo a partir das entidades e dos IDs ausentes, já codificado ou não
+            (pode lançar ValueError); substitui o corpo padrão
+        
+    Returns:
+        Response: Resposta JSON (400 se o corpo ou os parâmetros forem inválidos)
+    """
+    try:
+        gt = get_gt_system()
+        if gt is None:
+            return jsonify({'error': 'Sistema não inicializado'}), 500
+        
+        data = request.get_json()
+        if not data or 'ids' not in data:
+            return jsonify({'error': 'Campo obrigatório: ids'}), 400
+        
+        try:
+            ids = parse_ids(data['ids'])
+            entidades = buscar(ids)
+            encontrados = {entidade['id'] for entidade in entidades}
+            ausentes = [item_id for item_id in ids if item_id not in encontrados]
+            
+            if montar is not None:
+                corpo = montar(entidades, ausentes)
+            else:
+                dados = [converter(entidade) for entidade in entidades]
+                corpo = {'success': True, 'data': dados, 'count': len(dados), 'missing': ausentes}
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return resposta_json(corpo) if isinstance(corpo, bytes) else jsonify(corpo)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def _resumo_consulta():
+    """Resumo curto da query string, que também define a representação (fields, expand, filtros)"""
+    return hashlib.blake2b(request.query_string, digest_size=6).hexdigest()
+
+def etag_colecao(prefixo, *versoes):
+    """
+    Monta o ETag de uma listagem a partir das versões dos registros envolvidos.
+    
+    As versões devem ser lidas antes de montar a resposta: se o registro mudar
+    no meio do caminho, o ETag apenas fica mais antigo que o conteúdo e a
+    próxima requisição condicional recebe a listagem completa.
+    
+    Args:
+        prefixo (str): Nome da coleção
+        *versoes (int): Versões dos registros usados na resposta
+        
+    Returns:
+        str: ETag (sem aspas)
+    """
+    return f'{prefixo}-{_INSTANCIA}-{"-".join(map(str, versoes))}-{_resumo_consulta()}'
+
+def etag_recurso(prefixo, recurso_id, data_modificacao, *versoes):
+    """
+    Monta o ETag de um recurso a partir da sua data de modificação.
+    
+    Args:
+        prefixo (str): Nome da coleção
+        recurso_id (int): ID do recurso
+        data_modificacao (datetime): Data da última modificação do recurso
+        *versoes (int): Versões de registros relacionados incluídos na resposta
+        
+    Returns:
+        str: ETag (sem aspas)
+    """
+    partes = [prefixo, str(recurso_id), f'{data_modificacao.timestamp():.6f}', *map(str, versoes)]
+    return f'{"-".join(partes)}-{_resumo_consulta()}'
+
+def ultima_modificacao(data_modificacao):
+    """Converte a data de modificação (horário local) para o Last-Modified (UTC)"""
+    return data_modificacao.astimezone(timezone.utc)
+
+def com_validadores(resposta, etag, modificacao=None):
+    """
+    Inclui ETag (fraco) e, se informado, Last-Modified na resposta.
+    
+    Args:
+        resposta (Response): Resposta da rota
+        etag (str): ETag da representação
+        modificacao (datetime, opcional): Last-Modified em UTC
+        
+    Returns:
+        Response: A própria resposta
+    """
+    resposta.set_etag(etag, weak=True)
+    if modificacao is not None:
+        resposta.last_modified = modificacao
+    # Permite cache no cliente, sempre revalidado com requisição condicional
+    resposta.headers['Cache-Control'] = 'no-cache'
+    return resposta
+
+def resposta_nao_modificada(etag, modificacao=None):
+    """
+    Verifica If-None-Match (ou, na ausência dele, If-Modified-Since).
+    
+    Deve ser chamada antes de montar a resposta, para que uma representação
+    ainda válida no cliente não seja serializada.
+    
+    Args:
+        etag (str): ETag da representação atual
+        modificacao (datetime, opcional): Last-Modified atual em UTC
+        
+    Returns:
+        Response ou None: Resposta 304 ou None se a resposta completa deve ser enviada
+    """
+    if request.if_none_match:
+        valida = request.if_none_match.contains_weak(etag)
+    elif modificacao is not None and request.if_modified_since:
+        valida = request.if_modified_since >= modificacao.replace(microsecond=0)
+    else:
+        valida = False
+    
+    if not valida:
+        return None
+    return com_validadores(current_app.response_class(status=304), etag, modificacao)
+
+def _chave_cache():
+    """Chave do cache de respostas: rota e query string normalizada (parâmetros ordenados)"""
+    return (request.path, tuple(sorted(request.args.items(multi=True))))
+
+def resposta_versionada(prefixo, versoes, montar):
+    """
+    Responde uma rota de leitura cujo conteúdo depende apenas das versões
+    informadas e da query string: 304 se o cliente já tem a representação,
+    o JSON já codificado do cache se ainda for válido, ou o resultado de
+    montar(), que é então armazenado no cache.
+    
+    A versão comprimida na codificação aceita pelo cliente também fica no
+    cache, para que um acerto não precise comprimir a resposta novamente.
+    
+    Args:
+        prefixo (str): Nome da coleção (usado no ETag)
+        versoes (tuple): Versões dos registros usados, lidas antes de montar a resposta
+        montar (Callable[[], Dict ou bytes]): Monta o corpo da resposta, já
+            codificado ou não (pode lançar ValueError)
+        
+    Returns:
+        Response: Resposta JSON com ETag
+    """
+    etag = etag_colecao(prefixo, *versoes)
+    nao_modificada = resposta_nao_modificada(etag)
+    if nao_modificada:
+        return nao_modificada
+    
+    chave = _chave_cache()
+    codificacao = codificacao_aceita()
+    if codificacao is not None:
+        comprimido = cache_resposta_obter(chave + (codificacao,), versoes)
+        if comprimido is not None:
+            return com_validadores(resposta_json(comprimido, codificacao), etag)
+    
+    conteudo = cache_resposta_obter(chave, versoes)
+    if conteudo is None:
+        conteudo = montar()
+        if not isinstance(conteudo, bytes):
+            conteudo = json_compacto(conteudo) + b'\n'
+        cache_resposta_armazenar(chave, versoes, conteudo)
+    
+    if codificacao is None or len(conteudo) < MIN_BYTES_COMPRESSAO:
+        return com_validadores(resposta_json(conteudo), etag)
+    
+    comprimido = comprimir(conteudo, codificacao)
+    cache_resposta_armazenar(chave + (codificacao,), versoes, comprimido)
+    return com_validadores(resposta_json(comprimido, codificacao), etag)
+
+def resposta_json(conteudo, codificacao=None):
+    """Monta a resposta de um corpo JSON já codificado (bytes), possivelmente comprimido"""
+    resposta = current_app.response_class(conteudo, mimetype=current_app.json.mimetype)
+    if codificacao is not None:
+        resposta.headers['Content-Encoding'] = codificacao
+        resposta.vary.add('Accept-Encoding')
+    return resposta